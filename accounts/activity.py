@@ -0,0 +1,83 @@
+"""
+Coalesced last-activity tracking.
+
+Recording a user's activity only updates an in-process buffer of the
+latest timestamp per user. The buffer is written with one bulk ``UPDATE``
+at most every ``ACTIVITY_FLUSH_INTERVAL`` seconds (and when the process
+exits), so an API client making many calls a minute costs one write per
+interval instead of one per request.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from django.contrib.auth import get_user_model
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityTracker:
+    """Buffer of last-seen timestamps flushed in bulk"""
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        self.flush_interval = flush_interval
+        self._pending: Dict[Any, datetime] = {}
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def get_flush_interval(self) -> float:
+        if self.flush_interval is not None:
+            return self.flush_interval
+        from .authentication import get_api_auth_settings
+        return get_api_auth_settings()['ACTIVITY_FLUSH_INTERVAL']
+
+    def record(self, user_id: Any, when: Optional[datetime] = None) -> None:
+        """Note that a user was active, flushing the buffer if it is due"""
+        when = when or timezone.now()
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or when > previous:
+                self._pending[user_id] = when
+            due = time.monotonic() - self._flushed_at >= self.get_flush_interval()
+
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered timestamps with one UPDATE; returns the number of users"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+
+        try:
+            get_user_model().objects.filter(pk__in=list(pending)).update(last_activity=Case(
+                *[When(pk=user_id, then=Value(when)) for user_id, when in pending.items()],
+                output_field=DateTimeField()
+            ))
+        except Exception as e:
+            # Keep the timestamps for the next flush unless newer ones arrived
+            with self._lock:
+                for user_id, when in pending.items():
+                    self._pending.setdefault(user_id, when)
+            logger.warning(f"Failed to flush activity for {len(pending)} users: {e}")
+            return 0
+        return len(pending)
+
+
+activity_tracker = ActivityTracker()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        activity_tracker.flush()
+    except Exception:
+        pass
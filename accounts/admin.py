@@ -4,6 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from .authentication import revoke_tokens_for_users
 from .models import User
 
 @admin.register(User)
@@ -158,11 +159,13 @@ class UserAdmin(BaseUserAdmin):
     
     def revoke_approval(self, request, queryset):
         """Bulk revoke approval for selected users"""
-        updated = queryset.filter(is_approved=True).update(
+        user_ids = list(queryset.filter(is_approved=True).values_list('pk', flat=True))
+        updated = User.objects.filter(pk__in=user_ids).update(
             is_approved=False,
             approval_date=None,
             approved_by=None
         )
+        revoke_tokens_for_users(user_ids)
         
         self.message_user(
             request,
@@ -0,0 +1,117 @@
+"""
+Token authentication with cached token lookups.
+
+DRF's ``TokenAuthentication`` reads ``authtoken_token`` joined to the user on
+every API request. ``CachedTokenAuthentication`` keeps the resolved user and
+token in the shared cache for ``API_AUTH['TOKEN_CACHE_TTL']`` seconds, keyed
+by a hash of the token so raw tokens never appear in cache keys.
+
+Cached entries are revoked when the token is deleted (logout) and once a
+transaction that saved the user commits (password change, deactivation,
+approval ...). Bulk ``QuerySet.update`` calls on users send no signals and
+call ``revoke_tokens_for_users`` themselves. Each
+authenticated request also records the user's activity with the coalescing
+activity tracker.
+
+DRF imports authentication classes while settings load, so this module
+must not import models at module level.
+"""
+
+import hashlib
+from functools import partial
+from typing import Any, Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.authentication import TokenAuthentication
+
+from .activity import activity_tracker
+
+BOOKKEEPING_FIELDS = frozenset({'last_login', 'last_activity'})
+
+DEFAULT_API_AUTH_SETTINGS = {
+    'TOKEN_CACHE_TTL': 300,
+    'ACTIVITY_FLUSH_INTERVAL': 60,
+}
+
+
+def get_api_auth_settings() -> Dict[str, Any]:
+    """API authentication settings merged with defaults"""
+    return {**DEFAULT_API_AUTH_SETTINGS, **getattr(settings, 'API_AUTH', {})}
+
+
+def _token_cache_key(key: str) -> str:
+    return f"auth:token:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+
+def _user_cache_key(user_id: Any) -> str:
+    return f"auth:user_token:{user_id}"
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """``TokenAuthentication`` that resolves tokens through the shared cache"""
+
+    def authenticate_credentials(self, key):
+        cache_key = _token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            ttl = get_api_auth_settings()['TOKEN_CACHE_TTL']
+            cache.set_many({cache_key: (user, token), _user_cache_key(user.pk): key}, ttl)
+        else:
+            user, token = cached
+
+        activity_tracker.record(user.pk)
+        return user, token
+
+
+def revoke_token(key: str) -> None:
+    """Drop a token's cached user so the next request re-reads it"""
+    cache.delete(_token_cache_key(key))
+
+
+def revoke_user_tokens(user) -> None:
+    """Drop the cached token lookup of a user"""
+    user_key = _user_cache_key(user.pk)
+    key = cache.get(user_key)
+    if key is not None:
+        cache.delete_many([_token_cache_key(key), user_key])
+
+
+def _revoke_user_ids(user_ids) -> None:
+    user_keys = [_user_cache_key(user_id) for user_id in user_ids]
+    keys = cache.get_many(user_keys)
+    cache.delete_many([_token_cache_key(key) for key in keys.values()] + user_keys)
+
+
+def revoke_tokens_for_users(user_ids: Iterable[Any]) -> None:
+    """
+    Drop the cached token lookups of many users once the current transaction commits.
+
+    Revoking any earlier would let a concurrent request cache the old user
+    again before the change is visible.
+    """
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(partial(_revoke_user_ids, user_ids))
+
+
+def _token_deleted(sender, instance, **kwargs):
+    revoke_token(instance.key)
+
+
+def _user_saved(sender, instance, update_fields=None, **kwargs):
+    # Login and activity timestamps do not change what a token grants
+    if update_fields and BOOKKEEPING_FIELDS.issuperset(update_fields):
+        return
+    revoke_tokens_for_users([instance.pk])
+
+
+def connect_signals() -> None:
+    """Revoke cached token lookups when tokens are deleted or users change"""
+    from rest_framework.authtoken.models import Token
+
+    post_delete.connect(_token_deleted, sender=Token, dispatch_uid='cached_token_auth_token_delete')
+    post_save.connect(_user_saved, sender=settings.AUTH_USER_MODEL, dispatch_uid='cached_token_auth_user_save')
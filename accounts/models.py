@@ -260,10 +260,6 @@ class User(AbstractUser):
         # Update profile completion status
         self.profile_complete = self._check_profile_complete()
         
-        # Update last activity if user is being saved due to activity
-        if hasattr(self, '_update_activity') and self._update_activity:
-            self.last_activity = timezone.now()
-        
         super().save(*args, **kwargs)
     
     def _check_profile_complete(self):
@@ -400,9 +396,11 @@ class User(AbstractUser):
         return True
     
     def update_activity(self):
-        """Update last activity timestamp"""
-        self._update_activity = True
-        self.save(update_fields=['last_activity'])
+        """Update last activity timestamp (written in bulk by the activity tracker)"""
+        from .activity import activity_tracker
+        
+        self.last_activity = timezone.now()
+        activity_tracker.record(self.pk, self.last_activity)
     
     def approve_account(self, approved_by_user):
         """Approve user account"""
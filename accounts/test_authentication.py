@@ -0,0 +1,141 @@
+"""
+Tests for cached token authentication and coalesced activity tracking.
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from .activity import ActivityTracker, activity_tracker
+from .authentication import CachedTokenAuthentication
+from .models import User
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CachedTokenAuthenticationTest(TestCase):
+    """Test token lookups are cached and revoked"""
+
+    def setUp(self):
+        """Set up a user with an API token"""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='flutter_user',
+            email='flutter@test.com',
+            password='OldPassword123!',
+            user_type=User.UserType.VOLUNTEER,
+            is_approved=True
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.addCleanup(activity_tracker.flush)
+
+    def authenticate(self):
+        request = RequestFactory().get('/api/v1/accounts/profile/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        return CachedTokenAuthentication().authenticate(request)
+
+    def token_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            user, token = self.authenticate()
+        self.assertEqual((user, token), (self.user, self.token))
+        return [query['sql'] for query in queries if 'authtoken_token' in query['sql']]
+
+    def test_repeat_requests_skip_token_table(self):
+        """Test only the first request reads the token table"""
+        self.assertEqual(len(self.token_queries()), 1)
+        with self.assertNumQueries(0):
+            self.authenticate()
+            self.authenticate()
+
+    def test_logout_and_password_change_revoke(self):
+        """Test logging out or changing password drops the cached lookup"""
+        self.token_queries()
+
+        client = APIClient()
+        client.force_authenticate(user=self.user, token=self.token)
+        response = client.post('/api/v1/accounts/auth/password-change/', {
+            'old_password': 'OldPassword123!',
+            'new_password': 'NewPassword456!',
+            'new_password_confirm': 'NewPassword456!'
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.token_queries()), 1)
+
+        self.assertEqual(client.post('/api/v1/accounts/auth/logout/').status_code, 200)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deactivated_user_is_rejected(self):
+        """Test saving a user revokes the cached lookup once the save commits"""
+        self.token_queries()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            # Until the save commits, other requests still see the active user
+            self.assertEqual(self.authenticate(), (self.user, self.token))
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_bulk_deactivation_is_rejected(self):
+        """Test the mobile bulk deactivation revokes the cached lookups of every affected user"""
+        self.token_queries()
+        admin_user = User.objects.create_user(
+            username='mobile_admin',
+            email='mobile_admin@test.com',
+            password='testpass123',
+            is_staff=True
+        )
+        client = Client()
+        client.force_login(admin_user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(reverse('common:mobile_bulk_actions'), {
+                'action': 'deactivate',
+                'object_type': 'volunteers',
+                'object_ids': [str(self.user.pk)]
+            })
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+
+class ActivityTrackerTest(TestCase):
+    """Test last-activity writes are coalesced"""
+
+    def setUp(self):
+        """Set up users"""
+        self.users = [
+            User.objects.create_user(username=f'active{index}', email=f'active{index}@test.com', password='x')
+            for index in range(3)
+        ]
+
+    def test_flush_writes_latest_timestamps_in_one_update(self):
+        """Test many records become one UPDATE with each user's latest timestamp"""
+        tracker = ActivityTracker(flush_interval=3600)
+        now = timezone.now()
+        with self.assertNumQueries(0):
+            for minutes in range(5):
+                for user in self.users:
+                    tracker.record(user.pk, now - timezone.timedelta(minutes=minutes))
+        tracker.record(self.users[0].pk, now + timezone.timedelta(seconds=30))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(tracker.flush(), 3)
+
+        activity = dict(User.objects.filter(pk__in=[u.pk for u in self.users]).values_list('pk', 'last_activity'))
+        self.assertEqual(activity[self.users[0].pk], now + timezone.timedelta(seconds=30))
+        self.assertEqual(activity[self.users[1].pk], now)
+        self.assertEqual(tracker.flush(), 0)
+
+    def test_record_flushes_when_interval_elapsed(self):
+        """Test a record made after the interval flushes the buffer"""
+        tracker = ActivityTracker(flush_interval=0)
+        with self.assertNumQueries(1):
+            tracker.record(self.users[0].pk)
+        self.users[0].refresh_from_db()
+        self.assertIsNotNone(self.users[0].last_activity)
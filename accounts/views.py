@@ -7,7 +7,7 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
-from django.core.mail import send_mail
+from common.email_outbox import queue_email
 from django.conf import settings
 
 from rest_framework import status, viewsets, permissions
@@ -17,7 +17,7 @@ from rest_framework.views import APIView
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.pagination import PageNumberPagination
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
@@ -32,6 +32,9 @@ from .serializers import (
 )
 from .permissions import UserPermissions
 from common.audit_service import AdminAuditService
+from common.models import SearchDocument
+from common.search import IndexedSearchFilter
+from .authentication import revoke_token, revoke_user_tokens
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -80,8 +83,8 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     permission_classes = [UserPermissions]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    search_fields = ['username', 'email', 'first_name', 'last_name', 'phone_number']
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter, OrderingFilter]
+    search_document_type = SearchDocument.DocumentType.USER
     ordering_fields = ['created_at', 'last_login', 'username', 'email']
     ordering = ['-created_at']
     filterset_fields = {
@@ -304,6 +307,7 @@ class LogoutView(APIView):
         try:
             # Delete the user's token
             token = Token.objects.get(user=request.user)
+            revoke_token(token.key)
             token.delete()
             
             # Log logout
@@ -361,12 +365,13 @@ class RegisterView(APIView):
                 'Welcome to the SOI Hub volunteer management system. '
                 'Your account has been created and is pending approval.'
             )
-            send_mail(
+            queue_email(
                 subject,
                 message,
-                settings.DEFAULT_FROM_EMAIL,
                 [user.email],
-                fail_silently=True
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                category='welcome',
+                related_object=user
             )
         except Exception:
             pass  # Don't fail registration if email fails
@@ -387,10 +392,11 @@ class PasswordChangeView(APIView):
 
     def post(self, request):
         """Change user password"""
-        serializer = PasswordChangeSerializer(data=request.data, context={'user': request.user})
+        serializer = PasswordChangeSerializer(data=request.data, context={'request': request, 'user': request.user})
         
         if serializer.is_valid():
             serializer.save()
+            revoke_user_tokens(request.user)
             
             # Log password change
             
@@ -522,12 +528,13 @@ class PasswordResetView(APIView):
                 'Please use the following token to reset your password: {token}'
             ).format(token=token)
             
-            send_mail(
+            queue_email(
                 subject,
                 message,
-                settings.DEFAULT_FROM_EMAIL,
                 [user.email],
-                fail_silently=True
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                category='password_reset',
+                related_object=user
             )
         except Exception:
             pass  # Don't fail if email fails
@@ -1431,7 +1431,7 @@ class ThemeAdmin(admin.ModelAdmin):
     
     def css_preview(self, obj):
         """Display generated CSS for preview"""
-        css = obj.generate_css()
+        css = obj.get_compiled_css()
         return format_html(
             '<textarea readonly style="width: 100%; height: 200px; font-family: monospace; font-size: 12px;">{}</textarea>',
             css
@@ -1490,7 +1490,7 @@ class ThemeAdmin(admin.ModelAdmin):
         """Export CSS for selected themes"""
         if queryset.count() == 1:
             theme = queryset.first()
-            css_content = theme.generate_css()
+            css_content = theme.get_compiled_css()
             
             response = HttpResponse(css_content, content_type='text/css')
             response['Content-Disposition'] = f'attachment; filename="{theme.name.lower().replace(" ", "_")}_theme.css"'
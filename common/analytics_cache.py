@@ -0,0 +1,247 @@
+"""
+Shared cache for PowerBI datasets and dashboard metrics.
+
+Cache keys are built from a canonical form of the call arguments (sorted
+JSON, hashed), so every worker process computes the same key for the
+same request. Each cached computation depends on one or more namespaces
+(``volunteers``, ``events`` ...) whose version number is part of the key;
+saving or deleting a source model bumps its namespace version, which
+makes every dependent entry unreachable at once.
+
+Recomputes are single-flight: on a miss one caller takes a short lock and
+computes while the others wait for its result instead of stampeding the
+database. Hits and misses are counted in the cache so all workers report
+one hit rate.
+
+Saves that only touch bookkeeping columns (``last_login``,
+``last_activity``) do not bump anything. The audit log is not a source of
+any namespace either: it is written on almost every request, so entries
+computed from it are refreshed by their timeout instead.
+
+Bulk ``QuerySet.update``/``bulk_create`` calls send no signals; callers
+making bulk changes should call ``bump`` themselves.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'analytics'
+
+VOLUNTEERS = 'volunteers'
+EVENTS = 'events'
+ASSIGNMENTS = 'assignments'
+TASKS = 'tasks'
+INTEGRATIONS = 'integrations'
+OVERRIDES = 'overrides'
+SNAPSHOTS = 'snapshots'
+
+# Namespace -> source models whose changes invalidate it
+NAMESPACE_MODELS = {
+    VOLUNTEERS: [settings.AUTH_USER_MODEL, 'volunteers.VolunteerProfile'],
+    EVENTS: ['events.Event', 'events.Venue', 'events.Role'],
+    ASSIGNMENTS: ['events.Assignment'],
+    TASKS: ['tasks.Task', 'tasks.TaskCompletion'],
+    INTEGRATIONS: ['integrations.JustGoSync', 'integrations.IntegrationLog'],
+    OVERRIDES: ['common.AdminOverride'],
+    # A snapshot refresh saves its watermark once it has rebuilt the tables
+    SNAPSHOTS: ['reporting.AnalyticsWatermark'],
+}
+NAMESPACES = list(NAMESPACE_MODELS)
+
+# Columns whose saves alone do not change any cached figure
+BOOKKEEPING_FIELDS = frozenset({'last_login', 'last_activity'})
+
+# How long a recompute may hold the lock, and how long others wait for it
+LOCK_TIMEOUT = 60
+LOCK_WAIT = 10
+LOCK_POLL_INTERVAL = 0.1
+
+STATS_TIMEOUT = 7 * 86400
+
+_MISSING = object()
+
+
+def _canonical_default(value):
+    """JSON fallback for model instances, sets and other non-JSON values"""
+    if isinstance(value, Model):
+        return f'{value._meta.label}:{value.pk}'
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    try:
+        return DjangoJSONEncoder().default(value)
+    except TypeError:
+        return repr(value)
+
+
+def canonical_params(params: Any) -> str:
+    """Stable text form of ``params``: dict keys sorted, values normalised"""
+    return json.dumps(params, sort_keys=True, separators=(',', ':'), default=_canonical_default)
+
+
+def _version_key(namespace: str) -> str:
+    return f'{KEY_PREFIX}:version:{namespace}'
+
+
+def _stats_key(name: str) -> str:
+    return f'{KEY_PREFIX}:stats:{name}'
+
+
+def get_versions(namespaces: Iterable[str]) -> Dict[str, int]:
+    """Current version of each namespace, starting any that are missing"""
+    namespaces = sorted(set(namespaces))
+    stored = cache.get_many([_version_key(namespace) for namespace in namespaces])
+    versions = {}
+    for namespace in namespaces:
+        version = stored.get(_version_key(namespace))
+        if version is None:
+            # Start from the clock rather than 1, so a version evicted from
+            # the cache never comes back as a number used before
+            version = time.time_ns()
+            if not cache.add(_version_key(namespace), version, None):
+                version = cache.get(_version_key(namespace), version)
+        versions[namespace] = version
+    return versions
+
+
+def bump(*namespaces: str) -> None:
+    """Invalidate every entry that depends on the given namespaces"""
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.set(_version_key(namespace), time.time_ns(), None)
+
+
+def make_key(name: str, params: Any = None, namespaces: Iterable[str] = ()) -> str:
+    """Deterministic cache key for ``name`` called with ``params``"""
+    versions = get_versions(namespaces)
+    digest = hashlib.sha256(canonical_params(params).encode()).hexdigest()[:32]
+    version_tag = '.'.join(f'{namespace}{version}' for namespace, version in versions.items())
+    return f'{KEY_PREFIX}:{name}:{version_tag}:{digest}'
+
+
+def _count(name: str) -> None:
+    try:
+        cache.incr(_stats_key(name))
+    except ValueError:
+        if not cache.add(_stats_key(name), 1, STATS_TIMEOUT):
+            try:
+                cache.incr(_stats_key(name))
+            except ValueError:
+                pass
+
+
+def get_or_compute(name: str, compute: Callable[[], Any], params: Any = None,
+                   namespaces: Iterable[str] = (), timeout: Optional[int] = None) -> Any:
+    """
+    Get a cached value, computing it on a miss with a single-flight lock.
+
+    Callers that find another worker recomputing wait up to ``LOCK_WAIT``
+    seconds for its result, then compute it themselves.
+    """
+    key = make_key(name, params, namespaces)
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        _count('hits')
+        return value
+    _count('misses')
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if cache.get(lock_key) is None:
+            break
+
+    logger.warning(f"Recomputing {name} after waiting for another worker's lock")
+    value = compute()
+    cache.set(key, value, timeout)
+    return value
+
+
+def cached(name: str, namespaces: Iterable[str], timeout: Optional[int] = None):
+    """
+    Cache a service classmethod through ``get_or_compute``.
+
+    Apply below ``@classmethod``; the key covers every argument but the
+    class. The undecorated function is kept as ``uncached``.
+    """
+    namespaces = tuple(namespaces)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(owner, *args, **kwargs):
+            # Bind so positional, keyword and default arguments share a key
+            bound = signature.bind(owner, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(list(bound.arguments.items())[1:])
+            return get_or_compute(
+                name,
+                lambda: func(owner, *args, **kwargs),
+                params=params,
+                namespaces=namespaces,
+                timeout=timeout,
+            )
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def get_stats() -> Dict[str, Any]:
+    """Hit and miss totals across all workers"""
+    stored = cache.get_many([_stats_key('hits'), _stats_key('misses')])
+    hits = stored.get(_stats_key('hits'), 0)
+    misses = stored.get(_stats_key('misses'), 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total * 100, 1) if total else 0.0,
+    }
+
+
+def reset_stats() -> None:
+    cache.delete_many([_stats_key('hits'), _stats_key('misses')])
+
+
+def connect_signals() -> None:
+    """Bump namespaces when their source models are saved or deleted"""
+    for namespace, labels in NAMESPACE_MODELS.items():
+        for label in labels:
+            model = apps.get_model(label)
+
+            def receiver(sender, namespace=namespace, update_fields=None, **kwargs):
+                if update_fields and BOOKKEEPING_FIELDS.issuperset(update_fields):
+                    return
+                bump(namespace)
+
+            dispatch_uid = f'{KEY_PREFIX}_{namespace}_{label}'
+            post_save.connect(receiver, sender=model, weak=False, dispatch_uid=f'{dispatch_uid}_save')
+            post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=f'{dispatch_uid}_delete')
@@ -0,0 +1,127 @@
+"""
+Columnar analytics helpers for PowerBI datasets.
+
+Datasets fetch the columns they need with one ``values_list`` per source
+and do the bucketing here, over whole columns at a time, instead of issuing
+a COUNT query per metric. The helpers are plain Python (``bisect``,
+``Counter`` and sorted arrays) so they need no numerical dependencies and
+stay linear in the number of rows.
+"""
+
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Age bands as (lower edges, labels); a value below the first edge takes the first label
+AGE_BANDS = ([18, 26, 36, 46, 56, 66], ['Under 18', '18-25', '26-35', '36-45', '46-55', '56-65', '66+'])
+
+# Assignment counts per volunteer
+PARTICIPATION_BANDS = ([1, 2, 4, 6], ['0', '1', '2-3', '4-5', '6+'])
+
+# Completion rate percentages
+RATE_BANDS = ([25, 50, 75], ['0-24%', '25-49%', '50-74%', '75-100%'])
+
+# Profile performance ratings (0-5)
+RATING_BANDS = ([1, 2, 3, 4], ['0-1', '1-2', '2-3', '3-4', '4-5'])
+
+DEFAULT_PERCENTILES = (50, 75, 90, 95)
+
+
+def fetch_columns(queryset, fields: Sequence[str]) -> Dict[str, list]:
+    """Fetch ``fields`` in one query and return them as a dict of columns"""
+    rows = list(queryset.order_by().values_list(*fields))
+    if not rows:
+        return {field: [] for field in fields}
+    return {field: list(column) for field, column in zip(fields, zip(*rows))}
+
+
+def rate(part: float, whole: float, digits: int = 1) -> float:
+    """Percentage of ``part`` in ``whole``, 0 when the whole is empty"""
+    return round(part / whole * 100, digits) if whole else 0.0
+
+
+def mean(values: Iterable[Any], digits: int = 2) -> Optional[float]:
+    """Mean of the non-null values, or None if there are none"""
+    present = [float(value) for value in values if value is not None]
+    return round(sum(present) / len(present), digits) if present else None
+
+
+def ages(birth_dates: Iterable[Optional[date]], today: Optional[date] = None) -> List[int]:
+    """Ages in whole years for the non-null birth dates"""
+    today = today or date.today()
+    return [
+        today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+        for born in birth_dates if born is not None
+    ]
+
+
+def band(values: Iterable[Any], bands) -> Counter:
+    """Count non-null values per band, keeping every band label"""
+    edges, labels = bands
+    counts = Counter({label: 0 for label in labels})
+    for value in values:
+        if value is not None:
+            counts[labels[bisect_right(edges, value)]] += 1
+    return counts
+
+
+def distribution(counts: Counter, key: str, total: Optional[int] = None,
+                 order: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Turn a Counter into the ``[{key, count, percentage}]`` rows PowerBI expects.
+
+    Rows follow ``order`` when given, otherwise descending count. Empty and
+    null keys are dropped.
+    """
+    total = sum(counts.values()) if total is None else total
+    keys = list(order) if order is not None else [value for value, _count in counts.most_common()]
+    return [
+        {
+            key: value,
+            'count': counts[value],
+            'percentage': rate(counts[value], total)
+        }
+        for value in keys if value not in (None, '')
+    ]
+
+
+def percentiles(values: Iterable[Any], points: Sequence[int] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+    """Linear-interpolated percentiles of the non-null values, sorted once"""
+    ordered = sorted(float(value) for value in values if value is not None)
+    result = {}
+    for point in points:
+        if not ordered:
+            result[f'p{point}'] = None
+            continue
+        position = (len(ordered) - 1) * point / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        result[f'p{point}'] = round(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower), 2)
+    return result
+
+
+def cohort_retention(cohorts: Sequence[Any], retained: Sequence[bool]) -> List[Dict[str, Any]]:
+    """Retention per cohort from parallel cohort and retained columns"""
+    totals = Counter()
+    kept = Counter()
+    for cohort, is_retained in zip(cohorts, retained):
+        if cohort is None:
+            continue
+        totals[cohort] += 1
+        if is_retained:
+            kept[cohort] += 1
+    return [
+        {
+            'cohort': cohort,
+            'total': totals[cohort],
+            'retained': kept[cohort],
+            'retention_rate': rate(kept[cohort], totals[cohort])
+        }
+        for cohort in sorted(totals)
+    ]
+
+
+def month(value) -> Optional[str]:
+    """Month key (YYYY-MM) for a date or datetime"""
+    return value.strftime('%Y-%m') if value else None
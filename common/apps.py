@@ -1 +1,24 @@
- 
\ No newline at end of file
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class CommonConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'common'
+
+    def ready(self):
+        from .analytics_cache import connect_signals
+        connect_signals()
+
+        from . import search
+        search.connect_signals()
+        post_migrate.connect(search.ensure_search_indexes, sender=self)
+
+        from . import theme_cache
+        theme_cache.connect_signals()
+
+        from . import system_config
+        system_config.connect_signals()
+
+        from . import notification_service
+        notification_service.connect_signals()
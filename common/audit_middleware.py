@@ -16,7 +16,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
-from .models import AuditLog
+from .audit_sink import write_audit_log
 from .audit import AuditEvent, log_audit_event, log_security_event
 
 User = get_user_model()
@@ -293,10 +293,8 @@ class AdminAuditMiddleware:
                 model_name = path_parts[path_parts.index('admin') + 2]
                 
                 try:
-                    content_type = ContentType.objects.get(
-                        app_label=app_label, 
-                        model=model_name
-                    )
+                    # Served from the ContentType cache after the first lookup
+                    content_type = ContentType.objects.get_by_natural_key(app_label, model_name)
                     
                     # Try to get object ID
                     if len(path_parts) > path_parts.index('admin') + 3:
@@ -307,8 +305,8 @@ class AdminAuditMiddleware:
                 except ContentType.DoesNotExist:
                     pass
             
-            # Create audit log record
-            AuditLog.objects.create(
+            # Hand the record to the audit writer
+            write_audit_log(
                 action_type=operation_type,
                 action_description=f"{operation_type} operation on {request.path}",
                 user=request.user if request.user.is_authenticated else None,
@@ -464,8 +462,8 @@ class ModelChangeAuditMixin:
         try:
             new_values = self._get_field_values(self)
             
-            # Create audit log record
-            AuditLog.objects.create(
+            # Hand the record to the audit writer
+            write_audit_log(
                 action_type='CREATE' if is_create else 'UPDATE',
                 action_description=f"{'Created' if is_create else 'Updated'} {self.__class__.__name__}: {str(self)}",
                 content_type=ContentType.objects.get_for_model(self),
@@ -489,7 +487,7 @@ class ModelChangeAuditMixin:
     def _audit_model_deletion(self, old_values: Dict[str, Any]) -> None:
         """Audit model deletion."""
         try:
-            AuditLog.objects.create(
+            write_audit_log(
                 action_type='DELETE',
                 action_description=f"Deleted {self.__class__.__name__}: {str(self)}",
                 content_type=ContentType.objects.get_for_model(self),
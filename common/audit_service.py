@@ -17,6 +17,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 
 from .models import AuditLog
 from .audit import AuditEvent, log_audit_event, log_security_event
+from .audit_sink import write_audit_log, write_audit_logs
 
 User = get_user_model()
 
@@ -142,7 +143,68 @@ class AdminAuditService:
             details=bulk_details,
             description=f"Bulk operation: {operation_type} affecting {affected_count} records"
         )
-    
+
+    @classmethod
+    def log_bulk_object_changes(cls, user: User, action_type: str, changes: List[Dict[str, Any]],
+                               request: HttpRequest = None, details: Dict[str, Any] = None,
+                               batch_size: int = 500) -> int:
+        """
+        Log per-object changes for a bulk operation with batched inserts.
+
+        Each entry in ``changes`` is a dict with ``object``, ``old_values``,
+        ``new_values`` and an optional ``description``. Returns the number of
+        audit rows written.
+        """
+        if not changes:
+            return 0
+
+        try:
+            session_key = request.session.session_key if request and hasattr(request, 'session') else ''
+            ip_address = cls._get_client_ip(request) if request else None
+            user_agent = request.META.get('HTTP_USER_AGENT', '') if request else ''
+            request_method = request.method if request else ''
+            request_path = request.path if request else ''
+            content_types = {}
+
+            audit_logs = []
+            for change in changes:
+                target_object = change['object']
+                model = target_object.__class__
+                if model not in content_types:
+                    content_types[model] = ContentType.objects.get_for_model(model)
+
+                audit_logs.append(AuditLog(
+                    action_type=action_type.upper(),
+                    action_description=change.get('description') or f"Bulk {action_type.lower()} of {model.__name__}",
+                    user=user,
+                    session_key=session_key or '',
+                    ip_address=ip_address or None,
+                    user_agent=user_agent,
+                    content_type=content_types[model],
+                    object_id=str(target_object.pk),
+                    object_representation=change.get('representation', str(target_object.pk))[:500],
+                    old_values=change.get('old_values', {}),
+                    new_values=change.get('new_values', {}),
+                    changes={
+                        field: {'old': change.get('old_values', {}).get(field), 'new': value}
+                        for field, value in change.get('new_values', {}).items()
+                    },
+                    request_method=request_method,
+                    request_path=request_path,
+                    metadata={'bulk_operation': True, **(details or {})},
+                    tags=['bulk_operation', action_type.lower()]
+                ))
+
+            write_audit_logs(audit_logs)
+            return len(audit_logs)
+
+        except Exception as e:
+            # Don't let audit logging break the application
+            import logging
+            logger = logging.getLogger('soi_hub.audit')
+            logger.error(f"Failed to log bulk object changes for {action_type}: {str(e)}")
+            return 0
+
     @classmethod
     def log_data_export(cls, user: User, export_type: str, data_type: str = None,
                        record_count: int = 0, file_format: str = 'csv',
@@ -321,12 +383,12 @@ class AdminAuditService:
                 metadata=metadata
             )
             
-            # Create database audit log
-            audit_log = AuditLog.objects.create(
+            # Hand the record to the audit writer
+            audit_log = write_audit_log(
                 action_type=operation.upper(),
                 action_description=description or f"{category}: {operation}",
                 user=user,
-                session_key=request.session.session_key if request and hasattr(request, 'session') else '',
+                session_key=(request.session.session_key or '') if request and hasattr(request, 'session') else '',
                 ip_address=cls._get_client_ip(request) if request else '',
                 user_agent=request.META.get('HTTP_USER_AGENT', '') if request else '',
                 content_type=ContentType.objects.get_for_model(target_object) if target_object else None,
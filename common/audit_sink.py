@@ -0,0 +1,331 @@
+"""
+Audit log writer for SOI Hub Volunteer Management System.
+
+Audit records are handed to a sink instead of being inserted in the request
+path. The buffered sink keeps a bounded in-process queue that a background
+thread drains with ``bulk_create`` every ``BATCH_SIZE`` records or
+``FLUSH_INTERVAL_MS`` milliseconds, whichever comes first.
+
+Records are handed over once the caller's transaction commits, so changes
+that roll back leave no audit trail behind. If a batch insert fails, its
+records are retried one by one so a single bad record does not take the
+rest of the batch with it. Records that still cannot be written, or a whole
+batch when the database is unavailable, are appended to a spool file (one
+serialized record per line) and replayed after the next successful flush,
+or with ``manage.py replay_audit_spool``. Remaining records are flushed
+when the worker process exits.
+
+Set ``AUDIT_LOG_WRITER['ASYNC']`` to False to write synchronously (tests,
+management commands that read their own audit rows back).
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core import serializers
+from django.db import DataError, DatabaseError, IntegrityError, close_old_connections, transaction
+
+from .models import AuditLog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows development machines
+    fcntl = None
+
+logger = logging.getLogger('soi_hub.audit')
+
+
+DEFAULT_WRITER_SETTINGS = {
+    'ASYNC': True,
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL_MS': 500,
+    'BUFFER_SIZE': 10000,
+    'SPOOL_PATH': os.path.join(settings.BASE_DIR, 'logs', 'audit_spool.jsonl'),
+}
+
+
+def get_writer_settings() -> dict:
+    """Get audit writer settings merged with defaults"""
+    return {**DEFAULT_WRITER_SETTINGS, **getattr(settings, 'AUDIT_LOG_WRITER', {})}
+
+
+class _SpoolLock:
+    """Exclusive lock on an open spool file, shared by all worker processes"""
+
+    def __init__(self, handle):
+        self.handle = handle
+
+    def __enter__(self):
+        if fcntl:
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self.handle
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+
+
+def spool_records(records: List[AuditLog], path: Optional[str] = None) -> None:
+    """Append records to the spool file, one serialized record per line"""
+    path = path or get_writer_settings()['SPOOL_PATH']
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = ''.join(serializers.serialize('json', [record]) + '\n' for record in records)
+    with open(path, 'a', encoding='utf-8') as handle, _SpoolLock(handle):
+        handle.write(lines)
+        handle.flush()
+    logger.warning(f"Spooled {len(records)} audit records to {path}")
+
+
+def persist_records(records: List[AuditLog], spool_path: Optional[str] = None) -> bool:
+    """
+    Insert records in one ``bulk_create``, spooling them if the database fails.
+
+    If the batch is rejected because of its data, the records are inserted
+    one at a time and only the ones that still fail are spooled.
+
+    Returns True if all of the records reached the database.
+    """
+    if not records:
+        return True
+    try:
+        with transaction.atomic():
+            AuditLog.objects.bulk_create(records, batch_size=len(records))
+        failed = []
+    except (IntegrityError, DataError) as e:
+        logger.warning(f"Audit batch of {len(records)} rejected, retrying one by one: {str(e)}")
+        failed = _persist_one_by_one(records)
+    except DatabaseError as e:
+        logger.error(f"Failed to write {len(records)} audit records: {str(e)}")
+        failed = records
+
+    if failed:
+        spool_records(failed, spool_path)
+    return not failed
+
+
+def _persist_one_by_one(records: List[AuditLog]) -> List[AuditLog]:
+    """Insert records individually; returns the ones that could not be written"""
+    failed = []
+    for index, record in enumerate(records):
+        try:
+            with transaction.atomic():
+                AuditLog.objects.bulk_create([record])
+        except (IntegrityError, DataError) as e:
+            logger.error(f"Failed to write audit record {record.pk}: {str(e)}")
+            failed.append(record)
+        except DatabaseError as e:
+            # The database went away, keep the rest for the spool
+            logger.error(f"Failed to write {len(records) - index} audit records: {str(e)}")
+            failed.extend(records[index:])
+            break
+    return failed
+
+
+def replay_spool(path: Optional[str] = None) -> int:
+    """Move spooled records into the database; returns how many were written"""
+    path = path or get_writer_settings()['SPOOL_PATH']
+    if not os.path.exists(path):
+        return 0
+
+    with open(path, 'r+', encoding='utf-8') as handle, _SpoolLock(handle):
+        lines = [line for line in handle if line.strip()]
+        handle.seek(0)
+        handle.truncate()
+
+    records = []
+    for line in lines:
+        try:
+            records.extend(item.object for item in serializers.deserialize('json', line))
+        except Exception as e:
+            logger.error(f"Skipping unreadable spooled audit record: {str(e)}")
+
+    # Records already written by an earlier, interrupted replay
+    existing = set(
+        AuditLog.objects.filter(pk__in=[record.pk for record in records]).values_list('pk', flat=True)
+    )
+    records = [record for record in records if record.pk not in existing]
+    if records and persist_records(records, path):
+        logger.info(f"Replayed {len(records)} spooled audit records")
+        return len(records)
+    return 0
+
+
+class AuditSink:
+    """Destination for audit records"""
+
+    # Whether records are written in the caller's transaction
+    transactional = False
+
+    def write(self, record: AuditLog) -> None:
+        self.write_many([record])
+
+    def write_many(self, records: Iterable[AuditLog]) -> None:
+        raise NotImplementedError
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until everything written so far has been persisted"""
+
+    def close(self) -> None:
+        """Flush and release resources"""
+
+
+class SyncAuditSink(AuditSink):
+    """Writes records immediately in the caller's thread and transaction"""
+
+    transactional = True
+
+    def __init__(self, spool_path: Optional[str] = None):
+        self.spool_path = spool_path
+
+    def write_many(self, records: Iterable[AuditLog]) -> None:
+        persist_records(list(records), self.spool_path)
+
+
+class BufferedAuditSink(AuditSink):
+    """
+    Buffers records in a bounded queue flushed by a background thread.
+
+    When the buffer is full the caller writes its records itself, so audit
+    records are never dropped under load.
+    """
+
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, batch_size: int = 200, flush_interval_ms: int = 500,
+                 buffer_size: int = 10000, spool_path: Optional[str] = None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.spool_path = spool_path
+        self._queue = queue.Queue(maxsize=buffer_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def _ensure_thread(self) -> None:
+        # Threads do not survive a fork, so each worker process starts its own
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+
+    def write_many(self, records: Iterable[AuditLog]) -> None:
+        self._ensure_thread()
+        overflow = []
+        for record in records:
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                overflow.append(record)
+        if overflow:
+            logger.warning(f"Audit buffer full, writing {len(overflow)} records inline")
+            persist_records(overflow, self.spool_path)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((self._FLUSH, done))
+        done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10) -> None:
+        if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+            return
+        self._queue.put((self._STOP, None))
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+        while True:
+            wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+
+            control = item[0] if isinstance(item, tuple) else None
+            if isinstance(item, AuditLog):
+                batch.append(item)
+                deadline = deadline or time.monotonic() + self.flush_interval
+                if len(batch) < self.batch_size:
+                    continue
+
+            if batch:
+                self._flush_batch(batch)
+                batch = []
+            deadline = None
+
+            if control is self._FLUSH:
+                item[1].set()
+            elif control is self._STOP:
+                return
+
+    def _flush_batch(self, batch: List[AuditLog]) -> None:
+        try:
+            if persist_records(batch, self.spool_path):
+                replay_spool(self.spool_path)
+        except Exception as e:
+            # Never let the writer thread die
+            logger.error(f"Audit writer failed to flush {len(batch)} records: {str(e)}")
+        finally:
+            close_old_connections()
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> AuditSink:
+    """Get the process-wide audit sink configured by ``AUDIT_LOG_WRITER``"""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                writer_settings = get_writer_settings()
+                if writer_settings['ASYNC']:
+                    _sink = BufferedAuditSink(
+                        batch_size=writer_settings['BATCH_SIZE'],
+                        flush_interval_ms=writer_settings['FLUSH_INTERVAL_MS'],
+                        buffer_size=writer_settings['BUFFER_SIZE'],
+                        spool_path=writer_settings['SPOOL_PATH'],
+                    )
+                    atexit.register(_sink.close)
+                else:
+                    _sink = SyncAuditSink(spool_path=writer_settings['SPOOL_PATH'])
+    return _sink
+
+
+def write_audit_logs(records: List[AuditLog]) -> None:
+    """
+    Hand records to the audit sink once the current transaction commits.
+
+    A transactional sink writes them straight away instead, so they roll back
+    with the changes they describe.
+    """
+    if not records:
+        return
+    sink = get_audit_sink()
+    if sink.transactional:
+        sink.write_many(records)
+    else:
+        transaction.on_commit(lambda: sink.write_many(records))
+
+
+def write_audit_log(**fields) -> AuditLog:
+    """Build an audit record and hand it to the audit sink"""
+    record = AuditLog(**fields)
+    write_audit_logs([record])
+    return record
@@ -4,7 +4,8 @@ Provides global template context including theme data and system configuration.
 """
 
 from django.conf import settings
-from .models import Theme, UserThemePreference, SystemConfig
+from .system_config import config_registry
+from .theme_cache import get_theme_type, resolve_theme
 
 
 def theme_context(request):
@@ -18,33 +19,13 @@ def theme_context(request):
     }
     
     try:
-        # Determine theme type based on request
-        if request.path.startswith('/admin/'):
-            theme_type = 'ADMIN'
-        elif request.path.startswith('/mobile-admin/'):
-            theme_type = 'MOBILE'
-        else:
-            theme_type = 'PUBLIC'
-        
-        # Get user theme preference if authenticated
-        if request.user.is_authenticated:
-            try:
-                user_preference = UserThemePreference.objects.get(user=request.user)
-                context['user_theme_preference'] = user_preference
-                
-                # Get user's preferred theme
-                current_theme = user_preference.get_effective_theme(theme_type)
-            except UserThemePreference.DoesNotExist:
-                # Use system default theme
-                current_theme = Theme.get_active_theme(theme_type)
-        else:
-            # Use system default theme for anonymous users
-            current_theme = Theme.get_active_theme(theme_type)
-        
-        if current_theme:
-            context['current_theme'] = current_theme
-            context['theme_css_vars'] = current_theme.get_css_variables()
-            context['theme_css'] = current_theme.generate_css()
+        resolved = resolve_theme(request.user, get_theme_type(request.path))
+        context['user_theme_preference'] = resolved['preference']
+        if resolved['theme']:
+            context['current_theme'] = resolved['theme']
+            context['theme_css_vars'] = resolved['css_vars']
+            context['theme_css'] = resolved['css']
+            context['theme_css_url'] = resolved['css_url']
     
     except Exception:
         # Fallback to default values if anything goes wrong
@@ -64,27 +45,9 @@ def system_config_context(request):
     }
     
     try:
-        # Get public system configurations
-        public_configs = SystemConfig.objects.filter(
-            is_active=True,
-            is_public=True
-        ).values('key', 'value')
-        
-        for config in public_configs:
-            context['system_config'][config['key']] = config['value']
-        
-        # Override with specific configs if they exist
-        try:
-            site_name_config = SystemConfig.objects.get(key='SITE_NAME', is_active=True)
-            context['site_name'] = site_name_config.value
-        except SystemConfig.DoesNotExist:
-            pass
-        
-        try:
-            site_tagline_config = SystemConfig.objects.get(key='SITE_TAGLINE', is_active=True)
-            context['site_tagline'] = site_tagline_config.value
-        except SystemConfig.DoesNotExist:
-            pass
+        context['system_config'] = config_registry.public()
+        context['site_name'] = config_registry.get('SITE_NAME', context['site_name'])
+        context['site_tagline'] = config_registry.get('SITE_TAGLINE', context['site_tagline'])
     
     except Exception:
         # Fallback to default values if anything goes wrong
@@ -12,13 +12,19 @@ from django.db.models import Count, Q, Avg, Sum, Max, Min, F, Case, When, Intege
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db.models.functions import TruncDate, TruncHour, Extract
+from django.db.models.functions import Coalesce, TruncDate, TruncHour, Extract
 
 from volunteers.models import VolunteerProfile
 from events.models import Event, Role, Assignment
+from events.assignment_stats import get_assignment_stats, calculate_rate
 from tasks.models import Task, TaskCompletion
 from .models import AuditLog, AdminOverride
 from integrations.models import JustGoSync, IntegrationLog
+from reporting import snapshots
+from .analytics_cache import (
+    ASSIGNMENTS, EVENTS, INTEGRATIONS, OVERRIDES, SNAPSHOTS, TASKS, VOLUNTEERS, cached
+)
+from reporting.models import AssignmentDailyFact, TaskDailyFact, VolunteerSnapshot
 
 User = get_user_model()
 
@@ -38,18 +44,15 @@ class DashboardService:
         """
         Get comprehensive dashboard overview with all key metrics.
         
+        Each section is cached on its own, so the overview is assembled
+        from the cached sections rather than cached as a whole.
+        
         Args:
             user: Optional user for personalized metrics
             
         Returns:
             Dictionary containing all dashboard metrics
         """
-        cache_key = f"dashboard_overview_{user.id if user else 'global'}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         overview = {
             'timestamp': timezone.now().isoformat(),
             'volunteer_metrics': cls.get_volunteer_metrics(),
@@ -65,77 +68,72 @@ class DashboardService:
             'kpis': cls.get_key_performance_indicators()
         }
         
-        # Cache for medium duration
-        cache.set(cache_key, overview, cls.CACHE_TIMEOUT_MEDIUM)
-        
         return overview
     
     @classmethod
+    @cached('dashboard_volunteer_metrics', [VOLUNTEERS, SNAPSHOTS], CACHE_TIMEOUT_SHORT)
     def get_volunteer_metrics(cls) -> Dict[str, Any]:
         """Get comprehensive volunteer statistics."""
-        cache_key = "dashboard_volunteer_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
+        # Read the volunteer snapshot once it has been built
+        profiles = cls._get_volunteer_source()
         
         # Basic counts
-        total_volunteers = VolunteerProfile.objects.count()
-        active_volunteers = VolunteerProfile.objects.filter(status='ACTIVE').count()
-        pending_applications = VolunteerProfile.objects.filter(status='PENDING').count()
-        under_review = VolunteerProfile.objects.filter(status='UNDER_REVIEW').count()
+        total_volunteers = profiles.count()
+        active_volunteers = profiles.filter(status='ACTIVE').count()
+        pending_applications = profiles.filter(status='PENDING').count()
+        under_review = profiles.filter(status='UNDER_REVIEW').count()
         
         # Status distribution
         status_distribution = dict(
-            VolunteerProfile.objects.values('status')
-            .annotate(count=Count('id'))
+            profiles.values('status')
+            .annotate(count=Count('pk'))
             .values_list('status', 'count')
         )
         
         # Experience level distribution
         experience_distribution = dict(
-            VolunteerProfile.objects.values('experience_level')
-            .annotate(count=Count('id'))
+            profiles.values('experience_level')
+            .annotate(count=Count('pk'))
             .values_list('experience_level', 'count')
         )
         
         # Availability distribution
         availability_distribution = dict(
-            VolunteerProfile.objects.values('availability_level')
-            .annotate(count=Count('id'))
+            profiles.values('availability_level')
+            .annotate(count=Count('pk'))
             .values_list('availability_level', 'count')
         )
         
         # Recent registrations (last 30 days)
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        recent_registrations = VolunteerProfile.objects.filter(
+        recent_registrations = profiles.filter(
             application_date__gte=thirty_days_ago
         ).count()
         
         # Registration trend (daily for last 7 days)
         seven_days_ago = timezone.now() - timedelta(days=7)
         registration_trend = list(
-            VolunteerProfile.objects.filter(application_date__gte=seven_days_ago)
+            profiles.filter(application_date__gte=seven_days_ago)
             .extra(select={'day': 'date(application_date)'})
             .values('day')
-            .annotate(count=Count('id'))
+            .annotate(count=Count('pk'))
             .order_by('day')
         )
         
         # Corporate volunteers
-        corporate_volunteers = VolunteerProfile.objects.filter(
+        corporate_volunteers = profiles.filter(
             is_corporate_volunteer=True
         ).count()
         
         # Background check status
         background_check_stats = dict(
-            VolunteerProfile.objects.values('background_check_status')
-            .annotate(count=Count('id'))
+            profiles.values('background_check_status')
+            .annotate(count=Count('pk'))
             .values_list('background_check_status', 'count')
         )
         
         # Performance ratings
-        avg_performance = VolunteerProfile.objects.filter(
+        avg_performance = profiles.filter(
             performance_rating__isnull=False
         ).aggregate(avg_rating=Avg('performance_rating'))['avg_rating']
         
@@ -152,22 +150,15 @@ class DashboardService:
             'availability_distribution': availability_distribution,
             'background_check_stats': background_check_stats,
             'registration_trend': registration_trend,
-            'approval_rate': cls._calculate_approval_rate(),
-            'retention_metrics': cls._calculate_retention_metrics()
+            'approval_rate': cls._calculate_approval_rate(profiles),
+            'retention_metrics': cls._calculate_retention_metrics(profiles)
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_event_metrics', [EVENTS, ASSIGNMENTS], CACHE_TIMEOUT_SHORT)
     def get_event_metrics(cls) -> Dict[str, Any]:
         """Get comprehensive event statistics."""
-        cache_key = "dashboard_event_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # Basic counts
         total_events = Event.objects.count()
         active_events = Event.objects.filter(status='ACTIVE').count()
@@ -223,53 +214,78 @@ class DashboardService:
             'upcoming_timeline': upcoming_timeline,
             'capacity_utilization': cls._calculate_event_capacity_utilization()
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_assignment_metrics', [EVENTS, ASSIGNMENTS, SNAPSHOTS], CACHE_TIMEOUT_SHORT)
     def get_assignment_metrics(cls) -> Dict[str, Any]:
         """Get comprehensive assignment statistics."""
-        cache_key = "dashboard_assignment_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
-        # Basic counts
-        total_assignments = Assignment.objects.count()
-        confirmed_assignments = Assignment.objects.filter(status='CONFIRMED').count()
-        pending_assignments = Assignment.objects.filter(status='PENDING').count()
-        
-        # Assignment status distribution
-        status_distribution = dict(
-            Assignment.objects.values('status')
-            .annotate(count=Count('id'))
-            .values_list('status', 'count')
-        )
+        seven_days_ago = timezone.now() - timedelta(days=7)
         
-        # Role popularity
-        role_stats = list(
-            Assignment.objects.values('role__name')
-            .annotate(
-                assignment_count=Count('id'),
-                confirmed_count=Count(Case(
-                    When(status='CONFIRMED', then=1),
-                    output_field=IntegerField()
-                ))
+        if snapshots.snapshot_watermark(snapshots.ASSIGNMENTS):
+            # Daily facts replace scans of the live assignments table
+            facts = AssignmentDailyFact.objects.order_by()
+            status_totals = dict(
+                facts.values('status')
+                .annotate(count=Sum('assignment_count'))
+                .values_list('status', 'count')
+            )
+            assignment_stats = {
+                'total': sum(status_totals.values()),
+                'status': {value: status_totals.get(value, 0) for value in Assignment.AssignmentStatus.values}
+            }
+            
+            role_stats = [
+                {'role__name': name, 'assignment_count': total, 'confirmed_count': confirmed}
+                for name, total, confirmed in (
+                    facts.values('role__name')
+                    .annotate(
+                        total=Sum('assignment_count'),
+                        confirmed=Coalesce(Sum('assignment_count', filter=Q(status='CONFIRMED')), 0)
+                    )
+                    .order_by('-total')
+                    .values_list('role__name', 'total', 'confirmed')[:10]
+                )
+            ]
+            
+            assignment_trend = list(
+                facts.filter(date__gte=seven_days_ago.date())
+                .values(day=F('date'))
+                .annotate(count=Sum('assignment_count'))
+                .order_by('day')
+            )
+        else:
+            # Basic counts and status distribution in a single aggregate query
+            assignment_stats = get_assignment_stats()
+            
+            # Role popularity
+            role_stats = list(
+                Assignment.objects.values('role__name')
+                .annotate(
+                    assignment_count=Count('id'),
+                    confirmed_count=Count(Case(
+                        When(status='CONFIRMED', then=1),
+                        output_field=IntegerField()
+                    ))
+                )
+                .order_by('-assignment_count')[:10]
+            )
+            
+            # Assignment timeline
+            assignment_trend = list(
+                Assignment.objects.filter(created_at__gte=seven_days_ago)
+                .extra(select={'day': 'date(created_at)'})
+                .values('day')
+                .annotate(count=Count('id'))
+                .order_by('day')
             )
-            .order_by('-assignment_count')[:10]
-        )
         
-        # Assignment timeline
-        seven_days_ago = timezone.now() - timedelta(days=7)
-        assignment_trend = list(
-            Assignment.objects.filter(created_at__gte=seven_days_ago)
-            .extra(select={'day': 'date(created_at)'})
-            .values('day')
-            .annotate(count=Count('id'))
-            .order_by('day')
-        )
+        status_distribution = {
+            status: count for status, count in assignment_stats['status'].items() if count
+        }
+        total_assignments = assignment_stats['total']
+        confirmed_assignments = assignment_stats['status']['CONFIRMED']
+        pending_assignments = assignment_stats['status']['PENDING']
         
         # Fulfillment rate by role
         role_fulfillment = list(
@@ -287,7 +303,7 @@ class DashboardService:
                     output_field=IntegerField()
                 )
             )
-            .values('name', 'capacity', 'total_assignments', 'confirmed_assignments', 'fulfillment_rate')
+            .values('name', 'total_positions', 'total_assignments', 'confirmed_assignments', 'fulfillment_rate')
             .order_by('-fulfillment_rate')[:10]
         )
         
@@ -299,25 +315,17 @@ class DashboardService:
             'role_stats': role_stats,
             'assignment_trend': assignment_trend,
             'role_fulfillment': role_fulfillment,
-            'confirmation_rate': cls._calculate_confirmation_rate()
+            'confirmation_rate': cls._calculate_confirmation_rate(assignment_stats)
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_task_metrics', [TASKS, SNAPSHOTS], CACHE_TIMEOUT_SHORT)
     def get_task_metrics(cls) -> Dict[str, Any]:
         """Get comprehensive task statistics."""
-        cache_key = "dashboard_task_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # Basic counts
         total_tasks = Task.objects.count()
-        active_tasks = Task.objects.filter(is_active=True).count()
-        total_completions = TaskCompletion.objects.count()
+        active_tasks = Task.objects.filter(status=Task.TaskStatus.ACTIVE).count()
         
         # Task type distribution
         type_distribution = dict(
@@ -326,22 +334,38 @@ class DashboardService:
             .values_list('task_type', 'count')
         )
         
-        # Completion status distribution
-        completion_status = dict(
-            TaskCompletion.objects.values('status')
-            .annotate(count=Count('id'))
-            .values_list('status', 'count')
-        )
-        
-        # Task completion trend
         seven_days_ago = timezone.now() - timedelta(days=7)
-        completion_trend = list(
-            TaskCompletion.objects.filter(created_at__gte=seven_days_ago)
-            .extra(select={'day': 'date(created_at)'})
-            .values('day')
-            .annotate(count=Count('id'))
-            .order_by('day')
-        )
+        if snapshots.snapshot_watermark(snapshots.TASKS):
+            # Daily facts replace scans of the live completions table
+            facts = TaskDailyFact.objects.order_by()
+            completion_status = dict(
+                facts.values('status')
+                .annotate(count=Sum('completion_count'))
+                .values_list('status', 'count')
+            )
+            completion_trend = list(
+                facts.filter(date__gte=seven_days_ago.date())
+                .values(day=F('date'))
+                .annotate(count=Sum('completion_count'))
+                .order_by('day')
+            )
+        else:
+            # Completion status distribution
+            completion_status = dict(
+                TaskCompletion.objects.values('status')
+                .annotate(count=Count('id'))
+                .values_list('status', 'count')
+            )
+            
+            # Task completion trend
+            completion_trend = list(
+                TaskCompletion.objects.filter(created_at__gte=seven_days_ago)
+                .extra(select={'day': 'date(created_at)'})
+                .values('day')
+                .annotate(count=Count('id'))
+                .order_by('day')
+            )
+        total_completions = sum(completion_status.values())
         
         # Most active tasks
         popular_tasks = list(
@@ -371,19 +395,12 @@ class DashboardService:
             'average_completion_time': str(avg_completion_time) if avg_completion_time else None,
             'completion_rate': cls._calculate_task_completion_rate()
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_system_metrics', [VOLUNTEERS, INTEGRATIONS, OVERRIDES], CACHE_TIMEOUT_SHORT)
     def get_system_metrics(cls) -> Dict[str, Any]:
         """Get system performance and usage statistics."""
-        cache_key = "dashboard_system_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # User activity
         total_users = User.objects.count()
         active_users_today = User.objects.filter(
@@ -442,19 +459,12 @@ class DashboardService:
             'activity_trend': activity_trend,
             'system_health': cls._get_system_health_status()
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_integration_metrics', [INTEGRATIONS], CACHE_TIMEOUT_SHORT)
     def get_integration_metrics(cls) -> Dict[str, Any]:
         """Get integration system statistics."""
-        cache_key = "dashboard_integration_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # JustGo sync statistics
         total_syncs = JustGoSync.objects.count()
         successful_syncs = JustGoSync.objects.filter(status='SUCCESS').count()
@@ -489,19 +499,12 @@ class DashboardService:
                 'records_processed': last_sync.records_processed if last_sync else 0
             } if last_sync else None
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_performance_metrics', [], CACHE_TIMEOUT_SHORT)
     def get_performance_metrics(cls) -> Dict[str, Any]:
         """Get system performance metrics."""
-        cache_key = "dashboard_performance_metrics"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # Database query performance from audit logs
         performance_logs = AuditLog.objects.filter(
             duration_ms__isnull=False,
@@ -543,19 +546,12 @@ class DashboardService:
             'total_operations_24h': total_operations,
             'failed_operations_24h': failed_operations
         }
-        
-        cache.set(cache_key, metrics, cls.CACHE_TIMEOUT_SHORT)
         return metrics
     
     @classmethod
+    @cached('dashboard_recent_activity', [], CACHE_TIMEOUT_SHORT)
     def get_recent_activity(cls, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent system activity."""
-        cache_key = f"dashboard_recent_activity_{limit}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         recent_logs = AuditLog.objects.select_related('user', 'content_type').order_by('-timestamp')[:limit]
         
         activity = []
@@ -570,19 +566,12 @@ class DashboardService:
                 'ip_address': log.ip_address,
                 'duration_ms': log.duration_ms
             })
-        
-        cache.set(cache_key, activity, cls.CACHE_TIMEOUT_SHORT)
         return activity
     
     @classmethod
+    @cached('dashboard_alerts_notifications', [VOLUNTEERS, ASSIGNMENTS, INTEGRATIONS, OVERRIDES], CACHE_TIMEOUT_SHORT)
     def get_alerts_and_notifications(cls) -> Dict[str, Any]:
         """Get system alerts and notifications."""
-        cache_key = "dashboard_alerts_notifications"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         alerts = []
         
         # Pending admin overrides
@@ -659,19 +648,12 @@ class DashboardService:
             'medium_priority': len([a for a in alerts if a['priority'] == 'medium']),
             'low_priority': len([a for a in alerts if a['priority'] == 'low'])
         }
-        
-        cache.set(cache_key, notifications, cls.CACHE_TIMEOUT_SHORT)
         return notifications
     
     @classmethod
+    @cached('dashboard_trend_data', [VOLUNTEERS, ASSIGNMENTS], CACHE_TIMEOUT_MEDIUM)
     def get_trend_data(cls) -> Dict[str, Any]:
         """Get trend analysis data."""
-        cache_key = "dashboard_trend_data"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # 30-day trends
         thirty_days_ago = timezone.now() - timedelta(days=30)
         
@@ -708,19 +690,12 @@ class DashboardService:
             'assignments': assignment_trend,
             'period_days': 30
         }
-        
-        cache.set(cache_key, trends, cls.CACHE_TIMEOUT_MEDIUM)
         return trends
     
     @classmethod
+    @cached('dashboard_kpis', [VOLUNTEERS, EVENTS, ASSIGNMENTS, INTEGRATIONS, OVERRIDES], CACHE_TIMEOUT_MEDIUM)
     def get_key_performance_indicators(cls) -> Dict[str, Any]:
         """Get key performance indicators (KPIs)."""
-        cache_key = "dashboard_kpis"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         # Calculate KPIs
         kpis = {
             'volunteer_satisfaction': cls._calculate_volunteer_satisfaction(),
@@ -732,37 +707,44 @@ class DashboardService:
             'response_time_sla': cls._calculate_response_time_sla(),
             'security_compliance': cls._calculate_security_compliance()
         }
-        
-        cache.set(cache_key, kpis, cls.CACHE_TIMEOUT_MEDIUM)
         return kpis
     
     # Helper methods for calculations
     
     @classmethod
-    def _calculate_approval_rate(cls) -> float:
+    def _get_volunteer_source(cls):
+        """Get the volunteer snapshot if it has been built, otherwise the live profiles."""
+        if snapshots.snapshot_watermark(snapshots.VOLUNTEERS):
+            return VolunteerSnapshot.objects.order_by()
+        return VolunteerProfile.objects
+    
+    @classmethod
+    def _calculate_approval_rate(cls, profiles=None) -> float:
         """Calculate volunteer application approval rate."""
-        total_reviewed = VolunteerProfile.objects.filter(
+        profiles = profiles if profiles is not None else VolunteerProfile.objects
+        total_reviewed = profiles.filter(
             status__in=['APPROVED', 'REJECTED']
         ).count()
         
         if total_reviewed == 0:
             return 0.0
         
-        approved = VolunteerProfile.objects.filter(status='APPROVED').count()
+        approved = profiles.filter(status='APPROVED').count()
         return round(approved / total_reviewed * 100, 2)
     
     @classmethod
-    def _calculate_retention_metrics(cls) -> Dict[str, Any]:
+    def _calculate_retention_metrics(cls, profiles=None) -> Dict[str, Any]:
         """Calculate volunteer retention metrics."""
+        profiles = profiles if profiles is not None else VolunteerProfile.objects
         # Active volunteers who have been active for more than 30 days
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        long_term_active = VolunteerProfile.objects.filter(
+        long_term_active = profiles.filter(
             status='ACTIVE',
             approval_date__lte=thirty_days_ago
         ).count()
         
         # Total approved volunteers from more than 30 days ago
-        total_approved_30_days = VolunteerProfile.objects.filter(
+        total_approved_30_days = profiles.filter(
             approval_date__lte=thirty_days_ago
         ).count()
         
@@ -803,14 +785,12 @@ class DashboardService:
         return round(total_assignments / total_capacity * 100, 2) if total_capacity > 0 else 0.0
     
     @classmethod
-    def _calculate_confirmation_rate(cls) -> float:
-        """Calculate assignment confirmation rate."""
-        total_assignments = Assignment.objects.count()
-        if total_assignments == 0:
-            return 0.0
+    def _calculate_confirmation_rate(cls, assignment_stats: Optional[Dict[str, Any]] = None) -> float:
+        """Calculate assignment confirmation rate, reusing precomputed stats if given."""
+        if assignment_stats is None:
+            assignment_stats = get_assignment_stats()
         
-        confirmed_assignments = Assignment.objects.filter(status='CONFIRMED').count()
-        return round(confirmed_assignments / total_assignments * 100, 2)
+        return calculate_rate(assignment_stats['status']['CONFIRMED'], assignment_stats['total'])
     
     @classmethod
     def _calculate_task_completion_rate(cls) -> float:
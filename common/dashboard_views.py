@@ -16,7 +16,6 @@ from django.views.generic import TemplateView
 from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
 from django.utils import timezone
-from django.core.cache import cache
 from django.db.models import Count, Q
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAdminUser
@@ -24,6 +23,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from .dashboard_service import DashboardService
+from . import analytics_cache
 from .models import AuditLog, AdminOverride
 from volunteers.models import VolunteerProfile
 from events.models import Event, Assignment
@@ -371,24 +371,8 @@ def dashboard_refresh_cache(request):
     Force refresh of dashboard cache.
     """
     try:
-        # Clear dashboard-related cache keys
-        cache_keys = [
-            'dashboard_overview_global',
-            f'dashboard_overview_{request.user.id}',
-            'dashboard_volunteer_metrics',
-            'dashboard_event_metrics',
-            'dashboard_assignment_metrics',
-            'dashboard_task_metrics',
-            'dashboard_system_metrics',
-            'dashboard_integration_metrics',
-            'dashboard_performance_metrics',
-            'dashboard_alerts_notifications',
-            'dashboard_trend_data',
-            'dashboard_kpis'
-        ]
-        
-        for key in cache_keys:
-            cache.delete(key)
+        # Bumping every namespace makes all cached metrics unreachable
+        analytics_cache.bump(*analytics_cache.NAMESPACES)
         
         # Log the cache refresh
         from .audit_service import AdminAuditService
@@ -397,7 +381,7 @@ def dashboard_refresh_cache(request):
             user=request.user,
             request=request,
             details={
-                'cache_keys_cleared': len(cache_keys),
+                'namespaces_invalidated': analytics_cache.NAMESPACES,
                 'manual_refresh': True
             }
         )
@@ -405,7 +389,7 @@ def dashboard_refresh_cache(request):
         return JsonResponse({
             'success': True,
             'message': 'Dashboard cache refreshed successfully',
-            'keys_cleared': len(cache_keys),
+            'namespaces_invalidated': len(analytics_cache.NAMESPACES),
             'timestamp': timezone.now().isoformat()
         })
         
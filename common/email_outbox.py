@@ -0,0 +1,318 @@
+"""
+Outbound email queue for SOI Hub.
+
+Email is written to the ``OutboundEmail`` outbox inside the request instead of
+being sent inline, so request latency no longer depends on the mail relay.
+Worker processes started with ``manage.py run_mail_worker`` claim batches
+using ``SELECT ... FOR UPDATE SKIP LOCKED`` and send them over a single reused
+connection from ``get_connection()``.
+
+Failed sends are retried with exponential backoff; permanent failures
+(rejected recipients, 5xx replies) and emails that run out of attempts are
+kept as dead letters. Sends are rate limited per recipient domain so a large
+batch cannot trip a provider's throttling.
+"""
+
+import logging
+import os
+import random
+import smtplib
+import socket
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .notification_models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_OUTBOX_SETTINGS = {
+    'BATCH_SIZE': 100,
+    'POLL_INTERVAL': 5.0,
+    'MAX_ATTEMPTS': 6,
+    'RETRY_DELAY': 60,
+    'MAX_RETRY_DELAY': 3600,
+    'STALE_AFTER': 600,
+    'DOMAIN_RATE_LIMIT': 120,
+    'DOMAIN_RATE_LIMITS': {},
+}
+
+# Sent with ``emails``, the OutboundEmail rows delivered in a batch
+email_sent = Signal()
+
+
+def get_outbox_settings() -> dict:
+    """Get email outbox settings merged with defaults"""
+    return {**DEFAULT_OUTBOX_SETTINGS, **getattr(settings, 'EMAIL_OUTBOX', {})}
+
+
+def build_email(
+    subject: str,
+    body: str,
+    to: Iterable[str],
+    from_email: Optional[str] = None,
+    html_body: str = '',
+    reply_to: Optional[Iterable[str]] = None,
+    category: str = '',
+    related_object: Any = None,
+) -> OutboundEmail:
+    """Build an unsaved outbox entry"""
+    to = [address for address in dict.fromkeys(to) if address]
+    email = OutboundEmail(
+        category=category,
+        subject=str(subject),
+        body=str(body),
+        html_body=html_body or '',
+        from_email=from_email or getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@soi.ie'),
+        to=to,
+        reply_to=list(reply_to or []),
+        recipient_domain=to[0].rsplit('@', 1)[-1].lower() if to else '',
+        max_attempts=get_outbox_settings()['MAX_ATTEMPTS'],
+    )
+    if related_object is not None:
+        email.content_type = ContentType.objects.get_for_model(related_object)
+        email.object_id = str(related_object.pk)
+    return email
+
+
+def queue_email(*args, **kwargs) -> OutboundEmail:
+    """Add an email to the outbox; takes the arguments of ``build_email``"""
+    email = build_email(*args, **kwargs)
+    email.save()
+    return email
+
+
+def queue_emails(emails: List[OutboundEmail]) -> List[OutboundEmail]:
+    """Add many built emails to the outbox with one insert"""
+    return OutboundEmail.objects.bulk_create(emails, batch_size=500)
+
+
+def requeue_dead_letters(category: Optional[str] = None) -> int:
+    """Give dead-lettered emails a fresh set of attempts"""
+    dead = OutboundEmail.objects.filter(status=OutboundEmail.Status.DEAD)
+    if category:
+        dead = dead.filter(category=category)
+    now = timezone.now()
+    return dead.update(
+        status=OutboundEmail.Status.QUEUED, attempts=0, available_at=now, updated_at=now
+    )
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """Errors that will not go away by retrying the same message"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+def get_retry_delay(attempts: int, outbox_settings: dict) -> float:
+    """Exponential backoff with jitter, capped at MAX_RETRY_DELAY"""
+    delay = min(outbox_settings['RETRY_DELAY'] * 2 ** (attempts - 1), outbox_settings['MAX_RETRY_DELAY'])
+    return delay * random.uniform(0.8, 1.2)
+
+
+class DomainRateLimiter:
+    """
+    Token bucket per recipient domain, in messages per minute.
+
+    Limits apply per worker process; divide them by the number of workers.
+    """
+
+    def __init__(self, default_rate: int, domain_rates: Optional[Dict[str, int]] = None,
+                 clock=time.monotonic):
+        self.default_rate = default_rate
+        self.domain_rates = {domain.lower(): rate for domain, rate in (domain_rates or {}).items()}
+        self.clock = clock
+        self.buckets = {}
+
+    def acquire(self, domain: str) -> float:
+        """Take a token for ``domain``; returns 0, or the seconds until one is available"""
+        rate = self.domain_rates.get(domain, self.default_rate)
+        if not rate:
+            return 0
+
+        now = self.clock()
+        tokens, updated = self.buckets.get(domain, (rate, now))
+        tokens = min(rate, tokens + (now - updated) * rate / 60)
+        if tokens >= 1:
+            self.buckets[domain] = (tokens - 1, now)
+            return 0
+
+        self.buckets[domain] = (tokens, now)
+        return (1 - tokens) * 60 / rate
+
+
+def claim_batch(worker_id: str, batch_size: int, stale_after: int) -> List[OutboundEmail]:
+    """
+    Claim due emails, plus emails held by a worker that stopped responding.
+
+    Candidate rows are locked with SKIP LOCKED so concurrent workers never
+    block on each other or claim the same email.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                Q(status=OutboundEmail.Status.QUEUED, available_at__lte=now) |
+                Q(status=OutboundEmail.Status.SENDING, claimed_at__lt=now - timedelta(seconds=stale_after))
+            ).order_by('available_at')[:batch_size]
+        )
+        OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            status=OutboundEmail.Status.SENDING, worker_id=worker_id, claimed_at=now, updated_at=now
+        )
+
+    for email in emails:
+        email.status, email.worker_id, email.claimed_at = OutboundEmail.Status.SENDING, worker_id, now
+    return emails
+
+
+class MailWorker:
+    """
+    Claims and sends outbox batches until stopped.
+    One instance runs in each worker process.
+    """
+
+    def __init__(self, worker_id: Optional[str] = None, batch_size: Optional[int] = None,
+                 poll_interval: Optional[float] = None, connection=None):
+        self.settings = get_outbox_settings()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:mail"
+        self.batch_size = batch_size or self.settings['BATCH_SIZE']
+        self.poll_interval = poll_interval if poll_interval is not None else self.settings['POLL_INTERVAL']
+        self.connection = connection or get_connection(fail_silently=False)
+        self.rate_limiter = DomainRateLimiter(
+            self.settings['DOMAIN_RATE_LIMIT'], self.settings['DOMAIN_RATE_LIMITS']
+        )
+        self.sent = 0
+        self.should_stop = False
+
+    def stop(self, *args):
+        """Request a graceful stop after the current batch"""
+        self.should_stop = True
+
+    def process_batch(self) -> int:
+        """Claim and send one batch; returns the number of emails claimed"""
+        emails = claim_batch(self.worker_id, self.batch_size, self.settings['STALE_AFTER'])
+        if not emails:
+            return 0
+
+        sent = []
+        for email in emails:
+            wait = self.rate_limiter.acquire(email.recipient_domain)
+            if wait:
+                self._defer(email, wait)
+                continue
+            if self._send(email):
+                sent.append(email)
+
+        OutboundEmail.objects.bulk_update(
+            emails,
+            ['status', 'attempts', 'last_error', 'available_at', 'claimed_at', 'sent_at', 'updated_at'],
+        )
+        if sent:
+            for receiver, response in email_sent.send_robust(sender=OutboundEmail, emails=sent):
+                if isinstance(response, Exception):
+                    logger.error(f"email_sent receiver {receiver} failed: {str(response)}")
+
+        self.sent += len(sent)
+        logger.info(f"Mail worker {self.worker_id} sent {len(sent)} of {len(emails)} claimed email(s)")
+        return len(emails)
+
+    def run_once(self) -> int:
+        """Send batches until nothing is due; returns the number of emails sent"""
+        sent_before = self.sent
+        try:
+            while not self.should_stop and self.process_batch():
+                pass
+        finally:
+            self._close_connection()
+        return self.sent - sent_before
+
+    def run_forever(self):
+        """Poll the outbox until stopped"""
+        logger.info(f"Mail worker {self.worker_id} started")
+
+        while not self.should_stop:
+            try:
+                claimed = self.process_batch()
+            except DatabaseError as e:
+                # Drop the broken connection and retry after the poll interval
+                logger.error(f"Mail worker {self.worker_id} database error: {str(e)}")
+                close_old_connections()
+                claimed = 0
+
+            if not claimed:
+                # Do not hold the SMTP connection open while idle
+                self._close_connection()
+                time.sleep(self.poll_interval)
+
+        self._close_connection()
+        logger.info(f"Mail worker {self.worker_id} stopped after sending {self.sent} email(s)")
+
+    def _send(self, email: OutboundEmail) -> bool:
+        now = timezone.now()
+        email.attempts += 1
+        email.claimed_at = None
+        email.updated_at = now
+
+        message = EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=email.to,
+            reply_to=email.reply_to or None,
+            connection=self.connection,
+        )
+        if email.html_body:
+            message.attach_alternative(email.html_body, 'text/html')
+
+        try:
+            # Reuses the open connection; open() is a no-op when already connected
+            self.connection.open()
+            self.connection.send_messages([message])
+        except Exception as e:
+            self._record_failure(email, e, now)
+            return False
+
+        email.status = OutboundEmail.Status.SENT
+        email.sent_at = now
+        email.last_error = ''
+        return True
+
+    def _record_failure(self, email: OutboundEmail, error: Exception, now) -> None:
+        email.last_error = f"{type(error).__name__}: {error}"
+
+        if is_permanent_failure(error) or email.attempts >= email.max_attempts:
+            email.status = OutboundEmail.Status.DEAD
+            logger.error(f"Email {email.id} dead-lettered after {email.attempts} attempt(s): {error}")
+            return
+
+        email.status = OutboundEmail.Status.QUEUED
+        email.available_at = now + timedelta(seconds=get_retry_delay(email.attempts, self.settings))
+        logger.warning(f"Email {email.id} failed (attempt {email.attempts}), retrying: {error}")
+
+        # The connection may be broken; the next send reopens it
+        self._close_connection()
+
+    def _close_connection(self) -> None:
+        try:
+            self.connection.close()
+        except Exception as e:
+            logger.debug(f"Closing mail connection failed: {str(e)}")
+
+    def _defer(self, email: OutboundEmail, wait: float) -> None:
+        now = timezone.now()
+        email.status = OutboundEmail.Status.QUEUED
+        email.available_at = now + timedelta(seconds=wait)
+        email.claimed_at = None
+        email.updated_at = now
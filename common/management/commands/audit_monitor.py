@@ -12,7 +12,7 @@ import json
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
-from django.core.mail import send_mail
+from common.email_outbox import queue_email
 from django.conf import settings
 from django.db.models import Count, Q
 from django.contrib.auth import get_user_model
@@ -472,16 +472,16 @@ Please review these alerts and take appropriate action.
 """
         
         try:
-            send_mail(
+            queue_email(
                 subject,
                 message,
-                settings.DEFAULT_FROM_EMAIL,
                 options['email_recipients'],
-                fail_silently=False
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                category='security_alert'
             )
-            self._log_success("Security alert email sent successfully.")
+            self._log_success("Security alert email queued successfully.")
         except Exception as e:
-            self._log_error(f"Failed to send security alert email: {str(e)}")
+            self._log_error(f"Failed to queue security alert email: {str(e)}")
     
     def _send_summary_report_email(self, summary, options):
         """Send summary report email."""
@@ -514,16 +514,16 @@ TOP USERS:
                 message += f"- [{rec['type'].upper()}] {rec['priority'].upper()}: {rec['message']}\n"
         
         try:
-            send_mail(
+            queue_email(
                 subject,
                 message,
-                settings.DEFAULT_FROM_EMAIL,
                 options['email_recipients'],
-                fail_silently=False
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                category='audit_summary'
             )
-            self._log_success("Summary report email sent successfully.")
+            self._log_success("Summary report email queued successfully.")
         except Exception as e:
-            self._log_error(f"Failed to send summary report email: {str(e)}")
+            self._log_error(f"Failed to queue summary report email: {str(e)}")
     
     def _log_info(self, message):
         """Log info message."""
@@ -7,7 +7,7 @@ and sends notifications to relevant stakeholders.
 
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
-from django.core.mail import send_mail
+from common.email_outbox import queue_email
 from django.conf import settings
 from django.db.models import Q
 from datetime import timedelta
@@ -274,13 +274,14 @@ Please review this override and take appropriate action if needed.
 Override ID: {override.id}
             """.strip()
             
-            # Send email
-            send_mail(
+            # Queue email for the mail worker
+            queue_email(
                 subject=subject,
-                message=message,
+                body=message,
                 from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com'),
-                recipient_list=list(set(recipients)),  # Remove duplicates
-                fail_silently=False
+                to=recipients,  # Duplicates are removed
+                category='override_expiration',
+                related_object=override
             )
             
             # Log the notification
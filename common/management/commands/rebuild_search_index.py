@@ -0,0 +1,43 @@
+"""
+Django management command for rebuilding the search index.
+
+Search documents are kept up to date by signals; bulk ``QuerySet.update``
+calls and data loaded before the index existed need a rebuild.
+
+Usage:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --type event --type assignment
+    python manage.py rebuild_search_index --clear
+"""
+
+from django.core.management.base import BaseCommand
+
+from common.models import SearchDocument
+from common.search import DOCUMENT_SPECS, reindex
+
+
+class Command(BaseCommand):
+    help = 'Rebuild search documents for volunteers, profiles, events and assignments'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        parser.add_argument(
+            '--type',
+            action='append',
+            choices=list(DOCUMENT_SPECS),
+            dest='types',
+            help='Document type to rebuild (repeatable, default: all)'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete existing documents of the rebuilt types first'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        for document_type in options['types'] or list(DOCUMENT_SPECS):
+            if options['clear']:
+                SearchDocument.objects.filter(document_type=document_type).delete()
+            count = reindex(document_type)
+            self.stdout.write(self.style.SUCCESS(f"Indexed {count} {document_type} documents"))
@@ -0,0 +1,31 @@
+"""
+Django management command for replaying spooled audit records.
+
+Audit batches that could not be written while the database was unavailable
+are spooled to ``AUDIT_LOG_WRITER['SPOOL_PATH']``. Workers replay the spool
+after their next successful flush; this command does it on demand.
+
+Usage:
+    python manage.py replay_audit_spool
+    python manage.py replay_audit_spool --path /var/spool/soi_hub/audit.jsonl
+"""
+
+from django.core.management.base import BaseCommand
+
+from common.audit_sink import replay_spool
+
+
+class Command(BaseCommand):
+    help = 'Write spooled audit records to the database'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        parser.add_argument(
+            '--path',
+            help='Spool file to replay (default: AUDIT_LOG_WRITER SPOOL_PATH)'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        written = replay_spool(options['path'])
+        self.stdout.write(self.style.SUCCESS(f"Replayed {written} audit records"))
@@ -0,0 +1,85 @@
+"""
+Django management command for sending queued outbound email.
+
+Emails queued with ``common.email_outbox.queue_email`` are sent in batches
+over a single reused connection. Run one or more of these processes
+alongside the web workers.
+
+Usage:
+    python manage.py run_mail_worker
+    python manage.py run_mail_worker --batch-size 200 --poll-interval 2
+    python manage.py run_mail_worker --once
+    python manage.py run_mail_worker --requeue-dead --category eoi_confirmation
+"""
+
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.email_outbox import MailWorker, get_outbox_settings, requeue_dead_letters
+
+
+class Command(BaseCommand):
+    help = 'Send queued outbound email in batches over one connection'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        outbox_settings = get_outbox_settings()
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=outbox_settings['BATCH_SIZE'],
+            help=f"Emails claimed per batch (default: {outbox_settings['BATCH_SIZE']})"
+        )
+
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=outbox_settings['POLL_INTERVAL'],
+            help=f"Seconds to wait when the outbox is empty (default: {outbox_settings['POLL_INTERVAL']})"
+        )
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Send everything that is due and exit'
+        )
+
+        parser.add_argument(
+            '--requeue-dead',
+            action='store_true',
+            help='Return dead-lettered emails to the queue and exit'
+        )
+
+        parser.add_argument(
+            '--category',
+            help='Only requeue dead letters of this category'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        if options['requeue_dead']:
+            requeued = requeue_dead_letters(options['category'])
+            self.stdout.write(self.style.SUCCESS(f"Requeued {requeued} dead-lettered email(s)"))
+            return
+
+        worker = MailWorker(batch_size=options['batch_size'], poll_interval=options['poll_interval'])
+
+        if options['once']:
+            sent = worker.run_once()
+            self.stdout.write(self.style.SUCCESS(f"Sent {sent} email(s)"))
+            return
+
+        signal.signal(signal.SIGTERM, worker.stop)
+        signal.signal(signal.SIGINT, worker.stop)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Mail worker {worker.worker_id} started (batch size {worker.batch_size}, "
+            f"poll interval {worker.poll_interval}s)"
+        ))
+        worker.run_forever()
+        self.stdout.write(self.style.SUCCESS(f"Mail worker stopped after sending {worker.sent} email(s)"))
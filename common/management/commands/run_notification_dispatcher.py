@@ -0,0 +1,85 @@
+"""
+Django management command for sending scheduled notifications.
+
+Sends notifications whose ``scheduled_at`` has passed (template delays and
+quiet hours) and expires notifications past ``expires_at``. Several
+dispatchers can run at once without delivering a notification twice.
+
+Usage:
+    python manage.py run_notification_dispatcher
+    python manage.py run_notification_dispatcher --batch-size 200 --poll-interval 2
+    python manage.py run_notification_dispatcher --once
+    python manage.py run_notification_dispatcher --cleanup
+"""
+
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.notification_dispatcher import NotificationDispatcher, get_dispatcher_settings
+
+
+class Command(BaseCommand):
+    help = 'Send scheduled notifications once they are due'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        dispatcher_settings = get_dispatcher_settings()
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=dispatcher_settings['BATCH_SIZE'],
+            help=f"Notifications claimed per batch (default: {dispatcher_settings['BATCH_SIZE']})"
+        )
+
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=dispatcher_settings['POLL_INTERVAL'],
+            help=f"Seconds to wait when nothing is due (default: {dispatcher_settings['POLL_INTERVAL']})"
+        )
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Send everything that is due and exit'
+        )
+
+        parser.add_argument(
+            '--cleanup',
+            action='store_true',
+            help='Expire notifications past their expiry time and exit'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        dispatcher = NotificationDispatcher(
+            batch_size=options['batch_size'],
+            poll_interval=options['poll_interval']
+        )
+
+        if options['cleanup']:
+            expired = dispatcher.service.cleanup_expired_notifications()
+            self.stdout.write(self.style.SUCCESS(f"Expired {expired} notification(s)"))
+            return
+
+        if options['once']:
+            dispatched = dispatcher.run_once()
+            self.stdout.write(self.style.SUCCESS(f"Dispatched {dispatched} notification(s)"))
+            return
+
+        signal.signal(signal.SIGTERM, dispatcher.stop)
+        signal.signal(signal.SIGINT, dispatcher.stop)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Notification dispatcher started (batch size {dispatcher.batch_size}, "
+            f"poll interval {dispatcher.poll_interval}s)"
+        ))
+        dispatcher.run_forever()
+        self.stdout.write(self.style.SUCCESS(
+            f"Notification dispatcher stopped after {dispatcher.dispatched} notification(s)"
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_notification_notificationchannel_notificationlog_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='When the action occurred'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_outbound_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('document_type', models.CharField(choices=[('user', 'User'), ('volunteer_profile', 'Volunteer Profile'), ('event', 'Event'), ('assignment', 'Assignment')], max_length=30)),
+                ('object_id', models.CharField(max_length=255)),
+                ('category', models.CharField(blank=True, help_text='Type-specific grouping, e.g. the user type', max_length=50)),
+                ('title', models.CharField(max_length=500)),
+                ('subtitle', models.CharField(blank=True, max_length=500)),
+                ('status', models.CharField(blank=True, max_length=50)),
+                ('search_text', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'search document',
+                'verbose_name_plural': 'search documents',
+                'indexes': [models.Index(fields=['document_type', 'category'], name='common_sear_documen_debd5d_idx')],
+                'unique_together': {('document_type', 'object_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0007_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='theme',
+            name='compiled_css',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='theme',
+            name='css_hash',
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+    ]
@@ -18,11 +18,13 @@ from django.utils import timezone
 from django.conf import settings
 import json
 
+from accounts.authentication import revoke_tokens_for_users
 from accounts.models import User
 from events.models import Event, Assignment
 from volunteers.models import VolunteerProfile
 from tasks.models import Task, TaskCompletion
-from common.models import AdminOverride, AuditLog
+from common.models import AdminOverride, AuditLog, SearchDocument
+from common.search import DocumentType, reindex_on_commit, search
 
 
 @staff_member_required
@@ -270,56 +272,36 @@ def mobile_search_api(request):
     results = []
     
     if search_type in ['all', 'volunteers']:
-        volunteers = User.objects.filter(
-            user_type='VOLUNTEER'
-        ).filter(
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(email__icontains=query)
-        )[:10]
-        
-        for volunteer in volunteers:
+        for document in search(query, [SearchDocument.DocumentType.USER], category='VOLUNTEER', limit=10):
             results.append({
                 'type': 'volunteer',
-                'id': volunteer.id,
-                'title': volunteer.get_full_name(),
-                'subtitle': volunteer.email,
-                'url': f'/admin/accounts/user/{volunteer.id}/change/',
-                'status': 'Active' if volunteer.is_active else 'Inactive'
+                'id': document.object_id,
+                'title': document.title,
+                'subtitle': document.subtitle,
+                'url': f'/admin/accounts/user/{document.object_id}/change/',
+                'status': document.status
             })
     
     if search_type in ['all', 'events']:
-        events = Event.objects.filter(
-            name__icontains=query
-        )[:10]
-        
-        for event in events:
+        for document in search(query, [SearchDocument.DocumentType.EVENT], limit=10):
             results.append({
                 'type': 'event',
-                'id': event.id,
-                'title': event.name,
-                'subtitle': f'{event.start_date} - {event.end_date}',
-                'url': f'/admin/events/event/{event.id}/change/',
-                'status': event.status
+                'id': document.object_id,
+                'title': document.title,
+                'subtitle': document.subtitle,
+                'url': f'/admin/events/event/{document.object_id}/change/',
+                'status': document.status
             })
     
     if search_type in ['all', 'assignments']:
-        assignments = Assignment.objects.select_related(
-            'volunteer', 'event'
-        ).filter(
-            Q(volunteer__first_name__icontains=query) |
-            Q(volunteer__last_name__icontains=query) |
-            Q(event__name__icontains=query)
-        )[:10]
-        
-        for assignment in assignments:
+        for document in search(query, [SearchDocument.DocumentType.ASSIGNMENT], limit=10):
             results.append({
                 'type': 'assignment',
-                'id': assignment.id,
-                'title': f'{assignment.volunteer.get_full_name()} - {assignment.event.name}',
-                'subtitle': f'Role: {assignment.role.name}',
-                'url': f'/admin/events/assignment/{assignment.id}/change/',
-                'status': assignment.status
+                'id': document.object_id,
+                'title': document.title,
+                'subtitle': document.subtitle,
+                'url': f'/admin/events/assignment/{document.object_id}/change/',
+                'status': document.status
             })
     
     return JsonResponse({'results': results})
@@ -440,14 +422,17 @@ def mobile_bulk_actions(request):
                 
             elif object_type == 'volunteers' and action == 'deactivate':
                 User.objects.filter(id__in=object_ids).update(is_active=False)
+                revoke_tokens_for_users(object_ids)
                 messages.success(request, f'{len(object_ids)} volunteer(s) deactivated.')
                 
             elif object_type == 'assignments' and action == 'approve':
                 Assignment.objects.filter(id__in=object_ids).update(status='CONFIRMED')
+                reindex_on_commit(DocumentType.ASSIGNMENT, object_ids)
                 messages.success(request, f'{len(object_ids)} assignment(s) approved.')
                 
             elif object_type == 'assignments' and action == 'reject':
                 Assignment.objects.filter(id__in=object_ids).update(status='REJECTED')
+                reindex_on_commit(DocumentType.ASSIGNMENT, object_ids)
                 messages.success(request, f'{len(object_ids)} assignment(s) rejected.')
                 
             else:
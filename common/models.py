@@ -5,7 +5,9 @@ from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+import hashlib
 import uuid
+from django.urls import reverse
 from django.utils.text import slugify
 
 
@@ -674,8 +676,10 @@ class AuditLog(models.Model):
     )
     
     # Timing and performance
+    # Set when the record is built, not when the audit writer flushes it
     timestamp = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         help_text=_('When the action occurred')
     )
     duration_ms = models.PositiveIntegerField(
@@ -706,6 +710,7 @@ class AuditLog(models.Model):
             models.Index(fields=['content_type', 'object_id']),
             models.Index(fields=['ip_address', 'timestamp']),
             models.Index(fields=['timestamp']),
+            models.Index(fields=['timestamp', 'id']),
         ]
     
     def __str__(self):
@@ -1362,6 +1367,10 @@ class Theme(models.Model):
         help_text="User who created this theme"
     )
     
+    # Compiled on save and served from a fingerprinted URL
+    compiled_css = models.TextField(blank=True, editable=False)
+    css_hash = models.CharField(max_length=16, blank=True, editable=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -1401,6 +1410,11 @@ class Theme(models.Model):
                 is_default=True
             ).exclude(pk=self.pk).update(is_default=False)
         
+        self.compile_css()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'compiled_css', 'css_hash'}
+        
         super().save(*args, **kwargs)
     
     def get_css_variables(self):
@@ -1429,13 +1443,12 @@ class Theme(models.Model):
         """Generate complete CSS for this theme with enhanced readability"""
         css_vars = self.get_css_variables()
         
-        css = ":root {\n"
-        for var, value in css_vars.items():
-            css += f"  {var}: {value};\n"
-        css += "}\n\n"
+        parts = [":root {\n"]
+        parts.extend(f"  {var}: {value};\n" for var, value in css_vars.items())
+        parts.append("}\n\n")
         
         # Add enhanced theme styles with focus on readability
-        css += """
+        parts.append("""
 /* SOI Hub Dynamic Theme Styles - Enhanced for Readability */
 
 /* Base Typography and Readability */
@@ -1766,14 +1779,31 @@ a:visited {
         transition-duration: 0.01ms !important;
     }
 }
-"""
+""")
         
         # Add custom CSS if provided
         if self.custom_css:
-            css += "\n/* Custom CSS */\n"
-            css += self.custom_css
+            parts.append("\n/* Custom CSS */\n")
+            parts.append(self.custom_css)
         
-        return css
+        return ''.join(parts)
+    
+    def compile_css(self):
+        """Generate the theme's CSS and fingerprint it with a content hash"""
+        self.compiled_css = self.generate_css()
+        self.css_hash = hashlib.sha256(self.compiled_css.encode('utf-8')).hexdigest()[:16]
+    
+    def get_compiled_css(self):
+        """Compiled CSS, compiling and storing it first for themes saved before compilation existed"""
+        if not self.css_hash:
+            self.compile_css()
+            Theme.objects.filter(pk=self.pk).update(compiled_css=self.compiled_css, css_hash=self.css_hash)
+        return self.compiled_css
+    
+    def get_css_url(self):
+        """Fingerprinted URL of the compiled CSS, safe to cache indefinitely"""
+        self.get_compiled_css()
+        return reverse('themes:compiled_css', kwargs={'theme_id': self.pk, 'css_hash': self.css_hash})
     
     @classmethod
     def get_active_theme(cls, theme_type='ADMIN'):
@@ -1870,4 +1900,43 @@ class UserThemePreference(models.Model):
             return self.mobile_theme
         else:
             # Fall back to system default
-            return Theme.get_active_theme(theme_type) 
\ No newline at end of file
+            return Theme.get_active_theme(theme_type) 
+
+class SearchDocument(models.Model):
+    """
+    Denormalized search entry for one volunteer, profile, event or assignment.
+    Kept up to date by ``common.search`` signal receivers; the full-text
+    indexes over ``search_text`` are created per database backend after migrate.
+    """
+    
+    class DocumentType(models.TextChoices):
+        USER = 'user', _('User')
+        VOLUNTEER_PROFILE = 'volunteer_profile', _('Volunteer Profile')
+        EVENT = 'event', _('Event')
+        ASSIGNMENT = 'assignment', _('Assignment')
+    
+    # Integer primary key so SQLite FTS5 can use it as the rowid
+    id = models.BigAutoField(primary_key=True)
+    document_type = models.CharField(max_length=30, choices=DocumentType.choices)
+    object_id = models.CharField(max_length=255)
+    category = models.CharField(max_length=50, blank=True, help_text="Type-specific grouping, e.g. the user type")
+    
+    # Display
+    title = models.CharField(max_length=500)
+    subtitle = models.CharField(max_length=500, blank=True)
+    status = models.CharField(max_length=50, blank=True)
+    
+    # Lower-cased, accent-stripped words from every searchable field
+    search_text = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = _('search document')
+        verbose_name_plural = _('search documents')
+        unique_together = ['document_type', 'object_id']
+        indexes = [
+            models.Index(fields=['document_type', 'category']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_document_type_display()}: {self.title}"
@@ -0,0 +1,185 @@
+"""
+Redis cache of each user's recent notifications and read state.
+
+Per user, with a hash tag so all keys share a cluster slot:
+
+- ``notifications:{user:<id>}:items`` - hash of notification id -> JSON payload
+- ``notifications:{user:<id>}:order`` - sorted set of ids scored by creation time
+- ``notifications:{user:<id>}:unread`` - set of every unread notification id
+- ``notifications:{user:<id>}:synced`` - marker that the unread set matches the database
+
+Items and order keep the latest ``RECENT_LIMIT`` notifications; the unread
+set is never trimmed so ``SCARD`` is the unread count. Ids join the unread
+set when the notification row is inserted, whether or not it has been
+delivered yet, and leave it when the row is read, expired or deleted, so
+the set follows the same rule as the database query it replaces. Every
+operation is a
+single pipeline or script call: adding (with trimming) and reading the
+recent list run as Lua scripts, marking read is ``SREM`` and marking all
+read replaces the unread set.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECENT_LIMIT = 100
+TTL = 86400 * 7
+
+# KEYS: items, order, unread, synced
+# ARGV: id, payload, score, limit, ttl
+ADD_SCRIPT = """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+redis.call('SADD', KEYS[3], ARGV[1])
+local limit = tonumber(ARGV[4])
+if redis.call('ZCARD', KEYS[2]) > limit then
+    local old = redis.call('ZRANGE', KEYS[2], 0, -limit - 1)
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -limit - 1)
+    redis.call('HDEL', KEYS[1], unpack(old))
+end
+for i = 1, 3 do
+    redis.call('EXPIRE', KEYS[i], ARGV[5])
+end
+if redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('EXPIRE', KEYS[4], ARGV[5])
+end
+return 1
+"""
+
+# KEYS: items, order, unread
+# ARGV: limit
+RECENT_SCRIPT = """
+local ids = redis.call('ZREVRANGE', KEYS[2], 0, tonumber(ARGV[1]) - 1)
+if #ids == 0 then
+    return {}
+end
+local payloads = redis.call('HMGET', KEYS[1], unpack(ids))
+local result = {}
+for i, id in ipairs(ids) do
+    if payloads[i] then
+        result[#result + 1] = {payloads[i], redis.call('SISMEMBER', KEYS[3], id)}
+    end
+end
+return result
+"""
+
+
+def get_keys(user_id: Any) -> Tuple[str, str, str, str]:
+    """Keys holding one user's items, order, unread set and synced marker"""
+    prefix = f"notifications:{{user:{user_id}}}"
+    return f"{prefix}:items", f"{prefix}:order", f"{prefix}:unread", f"{prefix}:synced"
+
+
+def build_payload(notification) -> str:
+    """JSON payload cached for a notification; read state is kept separately"""
+    return json.dumps({
+        'id': str(notification.id),
+        'title': notification.title,
+        'message': notification.message,
+        'priority': notification.priority,
+        'created_at': notification.created_at.isoformat(),
+    })
+
+
+class NotificationCache:
+    """Recent notifications and unread state for every user, backed by Redis"""
+
+    def __init__(self, redis_client, recent_limit: int = RECENT_LIMIT, ttl: int = TTL):
+        self.redis = redis_client
+        self.recent_limit = recent_limit
+        self.ttl = ttl
+        self._add = redis_client.register_script(ADD_SCRIPT)
+        self._recent = redis_client.register_script(RECENT_SCRIPT)
+
+    def add(self, notifications: Iterable) -> None:
+        """Cache new unread notifications, for any number of users, in one pipeline"""
+        pipeline = self.redis.pipeline(transaction=False)
+        for notification in notifications:
+            items, order, unread, synced = get_keys(notification.recipient_id)
+            self._add(
+                keys=[items, order, unread, synced],
+                args=[
+                    str(notification.id), build_payload(notification),
+                    notification.created_at.timestamp(), self.recent_limit, self.ttl
+                ],
+                client=pipeline
+            )
+        pipeline.execute()
+
+    def mark_read(self, user_id: Any, notification_ids: Iterable) -> None:
+        """Remove notifications from the user's unread set"""
+        ids = [str(notification_id) for notification_id in notification_ids]
+        if ids:
+            self.redis.srem(get_keys(user_id)[2], *ids)
+
+    def mark_all_read(self, user_id: Any) -> None:
+        """Empty the user's unread set, keeping it marked as in sync"""
+        _items, _order, unread, synced = get_keys(user_id)
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.delete(unread)
+        pipeline.set(synced, 1, ex=self.ttl)
+        pipeline.execute()
+
+    def add_unread(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Add ``(user_id, notification_id)`` pairs to unread sets in one pipeline"""
+        by_user = defaultdict(list)
+        for user_id, notification_id in pairs:
+            by_user[user_id].append(str(notification_id))
+        if not by_user:
+            return
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for user_id, ids in by_user.items():
+            _items, _order, unread, synced = get_keys(user_id)
+            pipeline.sadd(unread, *ids)
+            pipeline.expire(unread, self.ttl)
+            pipeline.expire(synced, self.ttl)
+        pipeline.execute()
+
+    def remove_unread(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Remove ``(user_id, notification_id)`` pairs from unread sets in one pipeline"""
+        by_user = defaultdict(list)
+        for user_id, notification_id in pairs:
+            by_user[user_id].append(str(notification_id))
+        if not by_user:
+            return
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for user_id, ids in by_user.items():
+            pipeline.srem(get_keys(user_id)[2], *ids)
+        pipeline.execute()
+
+    def unread_count(self, user_id: Any) -> Optional[int]:
+        """Unread count, or None if the unread set has not been loaded yet"""
+        _items, _order, unread, synced = get_keys(user_id)
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.exists(synced)
+        pipeline.scard(unread)
+        is_synced, count = pipeline.execute()
+        return count if is_synced else None
+
+    def load_unread(self, user_id: Any, notification_ids: Iterable) -> None:
+        """Replace the user's unread set with ids read from the database"""
+        ids = [str(notification_id) for notification_id in notification_ids]
+        _items, _order, unread, synced = get_keys(user_id)
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.delete(unread)
+        if ids:
+            pipeline.sadd(unread, *ids)
+            pipeline.expire(unread, self.ttl)
+        pipeline.set(synced, 1, ex=self.ttl)
+        pipeline.execute()
+
+    def recent(self, user_id: Any, limit: int = 20) -> List[Dict]:
+        """Latest cached notifications, newest first, with their read state"""
+        items, order, unread, _synced = get_keys(user_id)
+        result = []
+        for payload, is_unread in self._recent(keys=[items, order, unread], args=[limit]):
+            data = json.loads(payload)
+            data['is_read'] = not is_unread
+            result.append(data)
+        return result
@@ -0,0 +1,133 @@
+"""
+Dispatcher for scheduled notifications.
+
+Notifications created with a future ``scheduled_at`` (template delays, quiet
+hours) stay PENDING until a dispatcher started with
+``manage.py run_notification_dispatcher`` claims them. Due rows are found
+with the ``(status, scheduled_at)`` index and locked with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so several dispatchers can run side by
+side. A batch is claimed by moving its rows to SENDING in a short
+transaction; the channel sends happen after it commits, so a rollback can
+never put a row that was already sent back to PENDING. Fan-out inserts the
+notifications it delivers itself as SENDING too, so the dispatcher never
+picks them up.
+
+The dispatcher also expires notifications past ``expires_at`` at a fixed
+interval.
+"""
+
+import logging
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .notification_models import Notification
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DISPATCHER_SETTINGS = {
+    'BATCH_SIZE': 100,
+    'POLL_INTERVAL': 5.0,
+    'CLEANUP_INTERVAL': 300,
+}
+
+
+def get_dispatcher_settings() -> dict:
+    """Get notification dispatcher settings merged with defaults"""
+    return {**DEFAULT_DISPATCHER_SETTINGS, **getattr(settings, 'NOTIFICATION_DISPATCHER', {})}
+
+
+def claim_due_notifications(batch_size: int) -> List[Notification]:
+    """
+    Claim the next batch of due notifications by moving them to SENDING.
+
+    Rows are locked only while they are claimed; the caller sends them after
+    this returns.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        notifications = list(
+            Notification.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('recipient', 'sender')
+            .filter(status=Notification.Status.PENDING, scheduled_at__lte=now)
+            .filter(Q(expires_at__isnull=True) | Q(expires_at__gt=now))
+            .order_by('scheduled_at')[:batch_size]
+        )
+        if notifications:
+            Notification.objects.filter(id__in=[n.id for n in notifications]).update(
+                status=Notification.Status.SENDING, updated_at=now
+            )
+            for notification in notifications:
+                notification.status = Notification.Status.SENDING
+    return notifications
+
+
+class NotificationDispatcher:
+    """
+    Sends due notifications in batches until stopped.
+    One instance runs in each dispatcher process.
+    """
+
+    def __init__(self, service=None, batch_size: Optional[int] = None,
+                 poll_interval: Optional[float] = None, cleanup_interval: Optional[int] = None):
+        from .notification_service import notification_service
+
+        dispatcher_settings = get_dispatcher_settings()
+        self.service = service or notification_service
+        self.batch_size = batch_size or dispatcher_settings['BATCH_SIZE']
+        self.poll_interval = poll_interval if poll_interval is not None else dispatcher_settings['POLL_INTERVAL']
+        self.cleanup_interval = (
+            cleanup_interval if cleanup_interval is not None else dispatcher_settings['CLEANUP_INTERVAL']
+        )
+        self.dispatched = 0
+        self.should_stop = False
+
+    def stop(self, *args):
+        """Request a graceful stop after the current batch"""
+        self.should_stop = True
+
+    def dispatch_batch(self) -> int:
+        """Claim and send one batch; returns the number of notifications claimed"""
+        notifications = claim_due_notifications(self.batch_size)
+        for notification in notifications:
+            # Marks the notification sent or failed
+            self.service.send_notification(notification)
+
+        self.dispatched += len(notifications)
+        if notifications:
+            logger.info(f"Dispatched {len(notifications)} scheduled notification(s)")
+        return len(notifications)
+
+    def run_once(self) -> int:
+        """Send everything that is due; returns the number of notifications dispatched"""
+        dispatched_before = self.dispatched
+        while not self.should_stop and self.dispatch_batch():
+            pass
+        return self.dispatched - dispatched_before
+
+    def run_forever(self):
+        """Poll for due notifications until stopped, expiring old ones periodically"""
+        logger.info("Notification dispatcher started")
+        last_cleanup = None
+
+        while not self.should_stop:
+            try:
+                if last_cleanup is None or time.monotonic() - last_cleanup >= self.cleanup_interval:
+                    self.service.cleanup_expired_notifications()
+                    last_cleanup = time.monotonic()
+                claimed = self.dispatch_batch()
+            except DatabaseError as e:
+                # Drop the broken connection and retry after the poll interval
+                logger.error(f"Notification dispatcher database error: {str(e)}")
+                close_old_connections()
+                claimed = 0
+
+            if not claimed:
+                time.sleep(self.poll_interval)
+
+        logger.info(f"Notification dispatcher stopped after {self.dispatched} notification(s)")
@@ -0,0 +1,360 @@
+"""
+Bulk fan-out pipeline for notifications.
+
+Sending one notification to thousands of recipients runs as a handful of
+set-based stages instead of ``create_notification`` per recipient:
+
+1. preferences - loaded for every recipient in one query; missing rows are
+   created with ``bulk_create``
+2. build - notifications are built in memory, applying channel, type and
+   quiet-hours preferences
+3. insert - ``bulk_create`` in short per-chunk transactions
+4. in_app - Redis cache writes for every recipient in one pipeline
+5. websocket - all channel-layer sends in one event-loop hop
+6. email - queued in the email outbox with one insert
+7. status - delivery logs and sent/failed status written in bulk
+
+Each stage records how many items it handled and how long it took, so
+throughput can be reported per stage.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from asgiref.sync import async_to_sync
+
+from .email_outbox import build_email, queue_emails
+from .notification_models import Notification, NotificationLog, NotificationPreference
+from .notification_service import update_unread
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+
+# Notifications still sent when the recipient is in quiet hours
+QUIET_HOURS_EXEMPT_PRIORITIES = {'URGENT', 'CRITICAL'}
+
+
+class StageStats:
+    """Item counts and timings per pipeline stage"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def record(self, stage: str, count: int, started: float) -> None:
+        seconds = time.monotonic() - started
+        self.stages[stage] = {
+            'count': count,
+            'seconds': round(seconds, 4),
+            'per_second': round(count / seconds, 1) if seconds > 0 else None,
+        }
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.stages)
+
+    def summary(self) -> str:
+        return ', '.join(
+            f"{stage}: {values['count']} in {values['seconds']}s"
+            for stage, values in self.stages.items()
+        )
+
+
+class NotificationFanout:
+    """
+    Fan one notification out to many recipients.
+
+    ``run`` returns the created notifications; ``stats`` holds the per-stage
+    throughput of the last run.
+    """
+
+    def __init__(self, service, chunk_size: int = CHUNK_SIZE):
+        self.service = service
+        self.chunk_size = chunk_size
+        self.stats = StageStats()
+
+    def run(
+        self,
+        recipients: List[User],
+        title: str,
+        message: str,
+        notification_type: str = 'bulk_operation',
+        priority: str = 'MEDIUM',
+        sender: Optional[User] = None,
+        related_object: Any = None,
+        context_data: Optional[Dict] = None,
+        channels: Optional[List[str]] = None,
+    ) -> List[Notification]:
+        self.stats = StageStats()
+        recipients = list({recipient.pk: recipient for recipient in recipients}.values())
+
+        preferences = self.load_preferences(recipients)
+
+        started = time.monotonic()
+        content_type = ContentType.objects.get_for_model(related_object) if related_object else None
+        notifications = []
+        for recipient in recipients:
+            notification = self.build_notification(
+                recipient, preferences[recipient.pk], title, message, notification_type,
+                priority, sender, content_type, related_object, context_data, channels
+            )
+            if notification is not None:
+                notifications.append(notification)
+        self.stats.record('build', len(notifications), started)
+
+        self.insert(notifications)
+
+        due = [n for n in notifications if n.status == Notification.Status.SENDING]
+        self.deliver(due, related_object)
+
+        logger.info(f"Fanned out {len(notifications)} notifications ({self.stats.summary()})")
+        return notifications
+
+    def load_preferences(self, recipients: List[User]) -> Dict[Any, NotificationPreference]:
+        """Preferences for every recipient, creating the missing ones in bulk"""
+        started = time.monotonic()
+        user_ids = [recipient.pk for recipient in recipients]
+        preferences = {}
+        for start in range(0, len(user_ids), self.chunk_size):
+            chunk = user_ids[start:start + self.chunk_size]
+            preferences.update(
+                (preference.user_id, preference)
+                for preference in NotificationPreference.objects.filter(user_id__in=chunk)
+            )
+
+        missing = [NotificationPreference(user_id=user_id, is_enabled=True)
+                   for user_id in user_ids if user_id not in preferences]
+        if missing:
+            NotificationPreference.objects.bulk_create(
+                missing, batch_size=self.chunk_size, ignore_conflicts=True
+            )
+            preferences.update((preference.user_id, preference) for preference in missing)
+
+        self.stats.record('preferences', len(user_ids), started)
+        return preferences
+
+    def build_notification(self, recipient, preferences, title, message, notification_type,
+                           priority, sender, content_type, related_object, context_data,
+                           channels) -> Optional[Notification]:
+        """Build an unsaved notification, or None if the recipient opted out"""
+        if not preferences.is_enabled:
+            return None
+
+        requested = channels
+        if requested is None:
+            requested = ['IN_APP', 'WEBSOCKET']
+            if preferences.email_enabled:
+                requested.append('EMAIL')
+            if preferences.push_enabled:
+                requested.append('PUSH')
+
+        allowed_channels = [
+            channel for channel in requested
+            if preferences.is_notification_allowed(notification_type, channel)
+        ]
+        if not allowed_channels:
+            return None
+
+        # Due notifications are sent by this run, so they go in as SENDING
+        # where the dispatcher will not claim them; deferred ones stay PENDING
+        scheduled_at = timezone.now()
+        status = Notification.Status.SENDING
+        if priority not in QUIET_HOURS_EXEMPT_PRIORITIES and preferences.is_quiet_hours():
+            scheduled_at = self.service._calculate_after_quiet_hours(preferences)
+            status = Notification.Status.PENDING
+
+        return Notification(
+            title=title,
+            message=message,
+            recipient=recipient,
+            sender=sender,
+            priority=priority,
+            channels=allowed_channels,
+            status=status,
+            scheduled_at=scheduled_at,
+            content_type=content_type,
+            object_id=str(related_object.pk) if related_object else None,
+            context_data=context_data or {},
+        )
+
+    def insert(self, notifications: List[Notification]) -> None:
+        """Insert notifications in chunks, each in its own short transaction"""
+        started = time.monotonic()
+        for start in range(0, len(notifications), self.chunk_size):
+            chunk = notifications[start:start + self.chunk_size]
+            with transaction.atomic():
+                Notification.objects.bulk_create(chunk)
+                if self.service.read_cache:
+                    # bulk_create sends no post_save signals
+                    transaction.on_commit(partial(
+                        update_unread, 'add_unread', [(n.recipient_id, n.id) for n in chunk],
+                        self.service.read_cache
+                    ))
+        self.stats.record('insert', len(notifications), started)
+
+    def deliver(self, notifications: List[Notification], related_object: Any = None) -> None:
+        """Send due notifications on every channel, one batch per channel"""
+        by_channel = defaultdict(list)
+        for notification in notifications:
+            for channel in notification.channels:
+                by_channel[channel].append(notification)
+
+        related_data = self._related_object_data(related_object)
+        delivered = {}
+        senders = {
+            'IN_APP': self.send_in_app,
+            'WEBSOCKET': lambda batch: self.send_websocket(batch, related_data),
+            'EMAIL': self.send_email,
+            'PUSH': self.send_push,
+        }
+        for channel, batch in by_channel.items():
+            send = senders.get(channel)
+            if send is None:
+                delivered[channel] = ({}, f"Unsupported channel {channel}")
+                continue
+            started = time.monotonic()
+            try:
+                delivered[channel] = (send(batch), None)
+            except Exception as e:
+                logger.error(f"Bulk {channel} delivery failed: {str(e)}")
+                delivered[channel] = ({}, str(e))
+            self.stats.record(channel.lower(), len(batch), started)
+
+        self.record_status(notifications, by_channel, delivered)
+
+    def send_in_app(self, notifications: List[Notification]) -> Dict[Any, bool]:
+        """Push every recipient's cache entry in one Redis pipeline"""
+        cache.delete_many([f"unread_notifications_{n.recipient_id}" for n in notifications])
+
+        if self.service.read_cache:
+            self.service.read_cache.add(notifications)
+
+        return {notification.id: True for notification in notifications}
+
+    def send_websocket(self, notifications: List[Notification],
+                       related_data: Optional[Dict] = None) -> Dict[Any, bool]:
+        """
+        Send to every recipient's channel group in one event-loop hop.
+
+        User type groups get one message per type rather than one per recipient.
+        """
+        channel_layer = self.service.channel_layer
+        if not channel_layer:
+            return {}
+
+        sends = []
+        type_messages = {}
+        for notification in notifications:
+            message_data = {
+                'type': 'notification_message',
+                'notification': {
+                    'id': str(notification.id),
+                    'title': notification.title,
+                    'message': notification.message,
+                    'priority': notification.priority,
+                    'created_at': notification.created_at.isoformat(),
+                    'related_object': related_data,
+                    'sender': notification.sender.username if notification.sender else None,
+                }
+            }
+            sends.append((f"user_{notification.recipient_id}", message_data))
+            type_messages.setdefault(f"user_type_{notification.recipient.user_type}", message_data)
+        sends.extend(type_messages.items())
+
+        async def send_all():
+            return await asyncio.gather(
+                *(channel_layer.group_send(group, data) for group, data in sends),
+                return_exceptions=True
+            )
+
+        results = async_to_sync(send_all)()
+        failed = {
+            group for (group, _data), result in zip(sends, results) if isinstance(result, Exception)
+        }
+        return {
+            notification.id: f"user_{notification.recipient_id}" not in failed
+            for notification in notifications
+        }
+
+    def send_email(self, notifications: List[Notification]) -> Dict[Any, bool]:
+        """Queue all emails in the outbox for the mail worker with one insert"""
+        emails = {}
+        for notification in notifications:
+            if notification.recipient.email:
+                emails[notification.id] = build_email(
+                    subject=f"[SOI] {notification.title}",
+                    body=notification.message,
+                    to=[notification.recipient.email],
+                    category='notification',
+                    related_object=notification,
+                )
+
+        queue_emails(list(emails.values()))
+        return {notification.id: notification.id in emails for notification in notifications}
+
+    def send_push(self, notifications: List[Notification]) -> Dict[Any, bool]:
+        """Push notifications (placeholder, as in ``NotificationService._send_push``)"""
+        logger.info(f"{len(notifications)} push notifications would be sent")
+        return {notification.id: True for notification in notifications}
+
+    def record_status(self, notifications, by_channel, delivered) -> None:
+        """Write delivery logs and sent/failed status with bulk queries"""
+        started = time.monotonic()
+        logs = []
+        succeeded = set()
+        for channel, batch in by_channel.items():
+            results, error = delivered[channel]
+            for notification in batch:
+                ok = results.get(notification.id, False)
+                if ok:
+                    succeeded.add(notification.id)
+                logs.append(NotificationLog(
+                    notification=notification,
+                    level='INFO' if ok else 'ERROR',
+                    message='Sent successfully' if ok else (error or f'{channel} delivery failed'),
+                    channel_type=channel,
+                    delivery_status='SUCCESS' if ok else 'FAILED',
+                ))
+        NotificationLog.objects.bulk_create(logs, batch_size=self.chunk_size)
+
+        now = timezone.now()
+        failed = [notification.id for notification in notifications if notification.id not in succeeded]
+        if succeeded:
+            Notification.objects.filter(id__in=succeeded).update(
+                status=Notification.Status.SENT, sent_at=now, updated_at=now
+            )
+        if failed:
+            Notification.objects.filter(id__in=failed).update(
+                status=Notification.Status.FAILED, error_message='All channels failed', updated_at=now
+            )
+            if self.service.read_cache:
+                # update() sends no post_save signals
+                transaction.on_commit(partial(
+                    update_unread, 'remove_unread',
+                    [(n.recipient_id, n.id) for n in notifications if n.id not in succeeded],
+                    self.service.read_cache
+                ))
+        for notification in notifications:
+            if notification.id in succeeded:
+                notification.status, notification.sent_at = Notification.Status.SENT, now
+            else:
+                notification.status = Notification.Status.FAILED
+        self.stats.record('status', len(notifications), started)
+
+    def _related_object_data(self, related_object: Any) -> Optional[Dict]:
+        if related_object is None:
+            return None
+        return {
+            'type': related_object._meta.model_name,
+            'id': str(related_object.pk),
+            'name': str(related_object),
+        }
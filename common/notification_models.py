@@ -3,6 +3,7 @@ Notification models for real-time notification system
 """
 
 import uuid
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
@@ -106,6 +107,7 @@ class Notification(models.Model):
     
     class Status(models.TextChoices):
         PENDING = 'PENDING', 'Pending'
+        SENDING = 'SENDING', 'Sending'
         SENT = 'SENT', 'Sent'
         DELIVERED = 'DELIVERED', 'Delivered'
         READ = 'READ', 'Read'
@@ -168,6 +170,7 @@ class Notification(models.Model):
             models.Index(fields=['recipient', 'status']),
             models.Index(fields=['status', 'scheduled_at']),
             models.Index(fields=['priority', 'created_at']),
+            models.Index(fields=['recipient', 'created_at', 'id']),
             models.Index(fields=['expires_at']),
             models.Index(fields=['content_type', 'object_id']),
         ]
@@ -297,14 +300,19 @@ class NotificationPreference(models.Model):
         
         return type_mapping.get(notification_type, True)
     
+    def get_timezone(self):
+        """User's timezone, falling back to the project timezone if unknown"""
+        try:
+            return ZoneInfo(self.timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return timezone.get_default_timezone()
+    
     def is_quiet_hours(self):
         """Check if current time is within quiet hours"""
         if not self.quiet_hours_start or not self.quiet_hours_end:
             return False
         
-        import pytz
-        user_tz = pytz.timezone(self.timezone)
-        current_time = timezone.now().astimezone(user_tz).time()
+        current_time = timezone.now().astimezone(self.get_timezone()).time()
         
         if self.quiet_hours_start <= self.quiet_hours_end:
             return self.quiet_hours_start <= current_time <= self.quiet_hours_end
@@ -392,4 +400,62 @@ class NotificationLog(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.level} - {self.notification.title} via {self.channel_type}" 
\ No newline at end of file
+        return f"{self.level} - {self.notification.title} via {self.channel_type}" 
+
+class OutboundEmail(models.Model):
+    """
+    Outbox entry for an email waiting to be sent.
+    Rows are drained in batches by ``run_mail_worker`` over one SMTP connection.
+    """
+    
+    class Status(models.TextChoices):
+        QUEUED = 'QUEUED', 'Queued'
+        SENDING = 'SENDING', 'Sending'
+        SENT = 'SENT', 'Sent'
+        DEAD = 'DEAD', 'Dead Letter'
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    category = models.CharField(max_length=50, blank=True, help_text="What the email is for, e.g. eoi_confirmation")
+    
+    # Message
+    subject = models.CharField(max_length=500)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list, blank=True)
+    recipient_domain = models.CharField(max_length=255, blank=True, help_text="Domain used for rate limiting")
+    
+    # Related object
+    content_type = models.ForeignKey(ContentType, on_delete=models.SET_NULL, null=True, blank=True)
+    object_id = models.CharField(max_length=255, null=True, blank=True)
+    related_object = GenericForeignKey('content_type', 'object_id')
+    
+    # Delivery tracking
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=6)
+    worker_id = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    
+    # Timing
+    available_at = models.DateTimeField(default=timezone.now, help_text="Earliest time the email may be sent")
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'outbound_emails'
+        verbose_name = 'Outbound Email'
+        verbose_name_plural = 'Outbound Emails'
+        ordering = ['available_at']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+            models.Index(fields=['status', 'claimed_at']),
+            models.Index(fields=['category', 'status']),
+            models.Index(fields=['content_type', 'object_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.get_status_display()})"
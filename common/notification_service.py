@@ -3,19 +3,21 @@ Notification service for managing real-time notifications
 """
 
 import logging
-import json
-from datetime import timedelta
+from datetime import timedelta, timezone as dt_timezone
+from functools import partial
 from typing import List, Dict, Any, Optional, Union
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.core.cache import cache
 from django.conf import settings
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 import redis
 
+from .notification_cache import NotificationCache
 from .notification_models import (
     NotificationTemplate, Notification, NotificationPreference,
     NotificationChannel, NotificationLog
@@ -24,6 +26,12 @@ from .notification_models import (
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Statuses counted as unread
+UNREAD_STATUSES = [
+    Notification.Status.PENDING, Notification.Status.SENDING,
+    Notification.Status.SENT, Notification.Status.DELIVERED,
+]
+
 
 class NotificationService:
     """Service for managing notifications"""
@@ -34,6 +42,8 @@ class NotificationService:
             self.redis_client = redis.Redis.from_url(settings.CACHES['default']['LOCATION'])
         except:
             self.redis_client = None
+        self.read_cache = NotificationCache(self.redis_client) if self.redis_client else None
+        self.last_fanout_stats = {}
     
     def create_notification(
         self,
@@ -258,20 +268,8 @@ class NotificationService:
             cache.delete(cache_key)
             
             # Store in Redis for real-time updates
-            if self.redis_client:
-                redis_key = f"notifications:user:{notification.recipient.id}"
-                notification_data = {
-                    'id': str(notification.id),
-                    'title': notification.title,
-                    'message': notification.message,
-                    'priority': notification.priority,
-                    'created_at': notification.created_at.isoformat(),
-                    'is_read': False
-                }
-                
-                self.redis_client.lpush(redis_key, json.dumps(notification_data))
-                self.redis_client.ltrim(redis_key, 0, 99)  # Keep only latest 100
-                self.redis_client.expire(redis_key, 86400 * 7)  # 7 days
+            if self.read_cache:
+                self.read_cache.add([notification])
             
             return True
             
@@ -280,27 +278,27 @@ class NotificationService:
             return False
     
     def _send_email(self, notification: Notification) -> bool:
-        """Send notification via email"""
+        """Queue notification email for the mail worker"""
         try:
-            from django.core.mail import send_mail
+            from .email_outbox import queue_email
             
             # Check if user has email
             if not notification.recipient.email:
                 return False
             
             # Simple email for now
-            send_mail(
+            queue_email(
                 subject=f"[SOI] {notification.title}",
-                message=notification.message,
-                from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@soi.ie'),
-                recipient_list=[notification.recipient.email],
-                fail_silently=False
+                body=notification.message,
+                to=[notification.recipient.email],
+                category='notification',
+                related_object=notification
             )
             
             return True
             
         except Exception as e:
-            logger.error(f"Email send failed: {str(e)}")
+            logger.error(f"Email queueing failed: {str(e)}")
             return False
     
     def _send_push(self, notification: Notification) -> bool:
@@ -325,33 +323,33 @@ class NotificationService:
         related_object: Any = None,
         context_data: Optional[Dict] = None
     ) -> List[Notification]:
-        """Send notification to multiple recipients"""
-        
-        notifications = []
-        
+        """
+        Send notification to multiple recipients.
+
+        Runs the bulk fan-out pipeline: preferences are loaded in one query,
+        notifications inserted with ``bulk_create`` and each channel delivered
+        in one batch. Per-stage throughput of the last run is kept on
+        ``last_fanout_stats``.
+        """
+        from .notification_fanout import NotificationFanout
+
+        fanout = NotificationFanout(self)
         try:
-            with transaction.atomic():
-                for recipient in recipients:
-                    notification = self.create_notification(
-                        recipient=recipient,
-                        title=title,
-                        message=message,
-                        notification_type=notification_type,
-                        priority=priority,
-                        sender=sender,
-                        related_object=related_object,
-                        context_data=context_data
-                    )
-                    
-                    if notification:
-                        notifications.append(notification)
-                
-                logger.info(f"Created {len(notifications)} bulk notifications")
-                return notifications
-                
+            return fanout.run(
+                recipients=recipients,
+                title=title,
+                message=message,
+                notification_type=notification_type,
+                priority=priority,
+                sender=sender,
+                related_object=related_object,
+                context_data=context_data
+            )
         except Exception as e:
             logger.error(f"Bulk notification failed: {str(e)}")
-            return notifications
+            return []
+        finally:
+            self.last_fanout_stats = fanout.stats.as_dict()
     
     def notify_user_type(
         self,
@@ -366,7 +364,9 @@ class NotificationService:
         """Send notification to all users of a specific type"""
         
         try:
-            recipients = User.objects.filter(user_type=user_type, is_active=True)
+            recipients = User.objects.filter(user_type=user_type, is_active=True).only(
+                'id', 'username', 'email', 'user_type'
+            )
             
             if exclude_users:
                 recipients = recipients.exclude(id__in=[u.id for u in exclude_users])
@@ -395,22 +395,8 @@ class NotificationService:
             notification.mark_as_read()
             
             # Update Redis cache
-            if self.redis_client:
-                redis_key = f"notifications:user:{user.id}"
-                notifications_data = self.redis_client.lrange(redis_key, 0, -1)
-                
-                updated_notifications = []
-                for data in notifications_data:
-                    notif_data = json.loads(data)
-                    if notif_data['id'] == str(notification_id):
-                        notif_data['is_read'] = True
-                    updated_notifications.append(json.dumps(notif_data))
-                
-                if updated_notifications:
-                    self.redis_client.delete(redis_key)
-                    for notif_data in updated_notifications:
-                        self.redis_client.rpush(redis_key, notif_data)
-                    self.redis_client.expire(redis_key, 86400 * 7)
+            if self.read_cache:
+                self.read_cache.mark_read(user.id, [notification.id])
             
             # Clear unread count cache
             cache_key = f"unread_notifications_{user.id}"
@@ -443,9 +429,9 @@ class NotificationService:
                 read_at=timezone.now()
             )
             
-            # Clear Redis cache
-            redis_key = f"notifications:user:{user.id}"
-            self.redis_client.delete(redis_key)
+            # Update Redis cache
+            if self.read_cache:
+                self.read_cache.mark_all_read(user.id)
             
             # Clear unread count cache
             cache_key = f"unread_notifications_{user.id}"
@@ -466,14 +452,28 @@ class NotificationService:
     
     def get_unread_count(self, user: User) -> int:
         """Get unread notification count for user"""
+        unread = Notification.objects.filter(
+            recipient=user,
+            status__in=UNREAD_STATUSES
+        )
+        
+        if self.read_cache:
+            try:
+                count = self.read_cache.unread_count(user.id)
+                if count is None:
+                    # First request since the cache was emptied
+                    unread_ids = list(unread.values_list('id', flat=True))
+                    self.read_cache.load_unread(user.id, unread_ids)
+                    count = len(unread_ids)
+                return count
+            except redis.RedisError as e:
+                logger.error(f"Redis unread count failed: {str(e)}")
+        
         cache_key = f"unread_notifications_{user.id}"
         count = cache.get(cache_key)
         
         if count is None:
-            count = Notification.objects.filter(
-                recipient=user,
-                status__in=['PENDING', 'SENT', 'DELIVERED']
-            ).count()
+            count = unread.count()
             cache.set(cache_key, count, 300)  # Cache for 5 minutes
         
         return count
@@ -482,12 +482,11 @@ class NotificationService:
         """Get recent notifications for user"""
         try:
             # Try Redis first
-            if self.redis_client:
-                redis_key = f"notifications:user:{user.id}"
-                cached_data = self.redis_client.lrange(redis_key, 0, limit - 1)
+            if self.read_cache:
+                cached_data = self.read_cache.recent(user.id, limit)
                 
                 if cached_data:
-                    return [json.loads(data) for data in cached_data]
+                    return cached_data
             
             # Fallback to database
             notifications = Notification.objects.filter(
@@ -517,10 +516,16 @@ class NotificationService:
     def cleanup_expired_notifications(self) -> int:
         """Clean up expired notifications"""
         try:
-            count = Notification.objects.filter(
+            expired = Notification.objects.filter(
                 expires_at__lt=timezone.now(),
-                status__in=['PENDING', 'SENT', 'DELIVERED']
-            ).update(status='EXPIRED')
+                status__in=['PENDING', 'SENDING', 'SENT', 'DELIVERED']
+            )
+            
+            if self.read_cache:
+                # Expired notifications no longer count as unread
+                self.read_cache.remove_unread(expired.values_list('recipient_id', 'id'))
+            
+            count = expired.update(status='EXPIRED')
             
             logger.info(f"Marked {count} notifications as expired")
             return count
@@ -531,10 +536,7 @@ class NotificationService:
     
     def _calculate_after_quiet_hours(self, preferences: NotificationPreference) -> timezone.datetime:
         """Calculate when to send notification after quiet hours"""
-        import pytz
-        
-        user_tz = pytz.timezone(preferences.timezone)
-        now = timezone.now().astimezone(user_tz)
+        now = timezone.now().astimezone(preferences.get_timezone())
         
         if preferences.quiet_hours_end:
             # Schedule for end of quiet hours
@@ -549,7 +551,7 @@ class NotificationService:
                 # Next day
                 end_time += timedelta(days=1)
             
-            return end_time.astimezone(timezone.utc)
+            return end_time.astimezone(dt_timezone.utc)
         
         return timezone.now()
     
@@ -581,4 +583,30 @@ class NotificationService:
 
 
 # Global notification service instance
-notification_service = NotificationService() 
\ No newline at end of file
+notification_service = NotificationService()
+
+
+def update_unread(method: str, pairs, read_cache: Optional[NotificationCache] = None) -> None:
+    """Apply ``(user_id, notification_id)`` pairs to the Redis unread sets"""
+    read_cache = read_cache or notification_service.read_cache
+    if not read_cache:
+        return
+    try:
+        getattr(read_cache, method)(pairs)
+    except redis.RedisError as e:
+        logger.error(f"Redis unread update failed: {str(e)}")
+
+
+def _notification_saved(sender, instance, **kwargs):
+    method = 'add_unread' if instance.status in UNREAD_STATUSES else 'remove_unread'
+    transaction.on_commit(partial(update_unread, method, [(instance.recipient_id, instance.id)]))
+
+
+def _notification_deleted(sender, instance, **kwargs):
+    transaction.on_commit(partial(update_unread, 'remove_unread', [(instance.recipient_id, instance.id)]))
+
+
+def connect_signals() -> None:
+    """Keep the Redis unread sets in step with saved and deleted notifications"""
+    post_save.connect(_notification_saved, sender=Notification, dispatch_uid='notification_unread_save')
+    post_delete.connect(_notification_deleted, sender=Notification, dispatch_uid='notification_unread_delete')
@@ -25,7 +25,8 @@ from .notification_serializers import (
     NotificationPreferenceSerializer, NotificationStatsSerializer,
     BulkNotificationSerializer
 )
-from .notification_service import notification_service, NotificationService
+from .notification_service import notification_service
+from .pagination import KeysetPageNumberPagination
 
 User = get_user_model()
 
@@ -49,7 +50,7 @@ User = get_user_model()
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
                 description='Filter by notification status',
-                enum=['PENDING', 'SENT', 'DELIVERED', 'READ', 'FAILED', 'EXPIRED', 'CANCELLED']
+                enum=['PENDING', 'SENDING', 'SENT', 'DELIVERED', 'READ', 'FAILED', 'EXPIRED', 'CANCELLED']
             ),
             OpenApiParameter(
                 name='priority',
@@ -159,6 +160,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'message']
     ordering_fields = ['created_at', 'priority', 'status']
     ordering = ['-created_at']
+    pagination_class = KeysetPageNumberPagination
     
     def get_queryset(self):
         """Filter notifications to current user only"""
@@ -204,7 +206,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     def mark_read(self, request, pk=None):
         """Mark notification as read"""
         notification = self.get_object()
-        notification.mark_as_read()
+        notification_service.mark_as_read(notification.id, request.user)
         return Response({'detail': 'Notification marked as read'})
     
     @extend_schema(
@@ -229,12 +231,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
         """Mark all notifications as read for current user"""
-        count = self.get_queryset().filter(
-            status__in=['PENDING', 'SENT', 'DELIVERED']
-        ).update(
-            status='READ',
-            read_at=timezone.now()
-        )
+        count = notification_service.mark_all_as_read(request.user)
         return Response({
             'detail': 'All notifications marked as read',
             'count': count
@@ -270,12 +267,11 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
         """Get unread notification count"""
-        service = NotificationService()
-        count = service.get_unread_count(request.user)
+        count = notification_service.get_unread_count(request.user)
         
         # Get breakdown by priority
         priority_breakdown = self.get_queryset().filter(
-            status__in=['PENDING', 'SENT', 'DELIVERED']
+            status__in=['PENDING', 'SENDING', 'SENT', 'DELIVERED']
         ).values('priority').annotate(count=Count('id'))
         
         by_priority = {item['priority']: item['count'] for item in priority_breakdown}
@@ -313,8 +309,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     def recent(self, request):
         """Get recent notifications"""
         limit = min(int(request.query_params.get('limit', 10)), 50)
-        service = NotificationService()
-        notifications = service.get_recent_notifications(request.user, limit=limit)
+        notifications = notification_service.get_recent_notifications(request.user, limit=limit)
         serializer = self.get_serializer(notifications, many=True)
         return Response(serializer.data)
     
@@ -342,7 +337,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         
         # Basic counts
         total_count = queryset.count()
-        unread_count = queryset.filter(status__in=['PENDING', 'SENT', 'DELIVERED']).count()
+        unread_count = queryset.filter(status__in=['PENDING', 'SENDING', 'SENT', 'DELIVERED']).count()
         read_count = queryset.filter(status='READ').count()
         
         # Status breakdown
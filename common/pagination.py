@@ -0,0 +1,305 @@
+"""
+Keyset (cursor) pagination for high-volume list endpoints.
+
+Page-number pagination runs ``COUNT(*)`` for every page and makes the
+database walk ``OFFSET`` rows before returning any, so deep pages get
+slower the further a client scrolls. ``KeysetPagination`` instead remembers
+the ordering values of the last row it returned and asks for the rows that
+sort after them, which an index on the ordering columns answers in the
+same time at any depth.
+
+Cursors are opaque base64 tokens. Rows are ordered by the view's
+``keyset_ordering`` (``created_at, id`` newest first by default) or, when the
+client passes ``?ordering=``, by the ordering the ``OrderingFilter`` applied,
+with the primary key added as a tie-breaker. Orderings over nullable
+columns cannot be paged by key and fall back to the default.
+
+``?include_total=true`` adds an ``approximate_count`` read from the query
+planner's row estimate on PostgreSQL (``null`` on other databases), which
+costs no table scan.
+
+``KeysetModeMixin`` adds the keyset mode to an existing page-number paginator
+so current clients keep their page numbers and new ones opt in with
+``?pagination=keyset`` or by following a ``cursor``.
+"""
+
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+DEFAULT_KEYSET_PAGINATION_SETTINGS = {
+    'PAGE_SIZE': 20,
+    'MAX_PAGE_SIZE': 100,
+}
+
+DEFAULT_KEYSET_ORDERING = ('-created_at', '-id')
+
+TRUE_STRINGS = {'1', 'true', 'yes'}
+
+
+def get_keyset_pagination_settings() -> Dict[str, Any]:
+    """Keyset pagination settings merged with defaults"""
+    return {**DEFAULT_KEYSET_PAGINATION_SETTINGS, **getattr(settings, 'KEYSET_PAGINATION', {})}
+
+
+def _encode_value(value):
+    # DjangoJSONEncoder truncates microseconds, which would skip rows
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
+
+
+def _resolve_field(model, path: str):
+    """Model field at the end of a ``__`` lookup path, or None if any step is nullable"""
+    field = None
+    for name in path.split('__'):
+        if name == 'pk':
+            field = model._meta.pk
+        else:
+            field = model._meta.get_field(name)
+        if field.null or field.many_to_many or field.one_to_many:
+            return None
+        if field.is_relation:
+            model = field.related_model
+    if field is not None and field.is_relation:
+        # Ordering by a relation sorts by the related model's own ordering
+        return None
+    return field
+
+
+def estimate_count(queryset) -> Optional[int]:
+    """Planner row estimate for ``queryset``; None where the database has no cheap estimate"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pages through a queryset by the position of the last row returned
+
+    Responses contain ``next`` and ``previous`` links carrying opaque cursors,
+    ``results`` and, when requested, ``approximate_count``.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    total_query_param = 'include_total'
+    page_size = None
+    max_page_size = None
+    ordering = DEFAULT_KEYSET_ORDERING
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = self.get_ordering(queryset, request, view)
+        position, reverse = self.decode_cursor(request)
+
+        self.include_total = request.query_params.get(self.total_query_param, '').lower() in TRUE_STRINGS
+        self.approximate_count = estimate_count(queryset) if self.include_total else None
+
+        if position is not None:
+            queryset = queryset.filter(self.position_filter(position, reverse))
+        queryset = queryset.order_by(*[
+            ('-' if descending != reverse else '') + name for name, descending, _ in self.fields
+        ])
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = position is not None, has_more
+        else:
+            has_next, has_previous = has_more, position is not None
+
+        self.next_position = self.get_position(rows[-1]) if rows and has_next else None
+        self.previous_position = self.get_position(rows[0]) if rows and has_previous else None
+        return rows
+
+    def get_paginated_response(self, data):
+        response = OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+        ])
+        if self.include_total:
+            response['approximate_count'] = self.approximate_count
+        response['results'] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'approximate_count': {'type': 'integer', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    # Page size and ordering
+
+    def get_page_size(self, request) -> int:
+        defaults = get_keyset_pagination_settings()
+        page_size = self.page_size or defaults['PAGE_SIZE']
+        max_page_size = self.max_page_size or defaults['MAX_PAGE_SIZE']
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+            if requested > 0:
+                page_size = requested
+        except (KeyError, ValueError):
+            pass
+        return min(page_size, max_page_size)
+
+    def get_ordering(self, queryset, request, view) -> List[Tuple[str, bool, Any]]:
+        """``(name, descending, field)`` triples ending with the primary key"""
+        names = None
+        if 'ordering' in request.query_params:
+            names = list(queryset.query.order_by)
+        fields = self._ordering_fields(queryset.model, names) if names else None
+        if fields is None:
+            names = getattr(view, 'keyset_ordering', self.ordering)
+            fields = self._ordering_fields(queryset.model, names)
+        return fields
+
+    def _ordering_fields(self, model, names) -> Optional[List[Tuple[str, bool, Any]]]:
+        fields = []
+        for name in names:
+            if not isinstance(name, str) or name == '?':
+                return None
+            descending = name.startswith('-')
+            path = name.lstrip('-')
+            try:
+                field = _resolve_field(model, path)
+            except FieldDoesNotExist:
+                return None
+            if field is None:
+                return None
+            fields.append((path, descending, field))
+            if field is model._meta.pk and '__' not in path:
+                return fields
+
+        pk = model._meta.pk
+        fields.append((pk.attname, fields[-1][1] if fields else True, pk))
+        return fields
+
+    # Positions and cursors
+
+    def get_position(self, instance) -> List[Any]:
+        values = []
+        for path, _, _ in self.fields:
+            value = instance
+            for name in path.split('__'):
+                value = getattr(value, 'pk' if name == 'pk' else name)
+            values.append(value)
+        return values
+
+    def position_filter(self, position: List[Any], reverse: bool) -> Q:
+        """Rows sorting after ``position`` (before it when paging backwards)"""
+        condition = Q()
+        equal = Q()
+        for (name, descending, _), value in zip(self.fields, position):
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        # Bound the leading column so the index range scan starts at the cursor
+        name, descending, _ = self.fields[0]
+        bound = 'lte' if descending != reverse else 'gte'
+        return Q(**{f'{name}__{bound}': position[0]}) & condition
+
+    def encode_cursor(self, position: List[Any], reverse: bool = False) -> str:
+        payload = json.dumps({'p': position, 'r': int(reverse)}, default=_encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request) -> Tuple[Optional[List[Any]], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            raw = payload['p']
+            if not isinstance(raw, list) or len(raw) != len(self.fields):
+                raise ValueError
+            position = [field.to_python(value) for (_, _, field), value in zip(self.fields, raw)]
+            return position, bool(payload.get('r'))
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound('Invalid cursor')
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+        return self._link(self.encode_cursor(self.next_position))
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.previous_position is None:
+            return None
+        return self._link(self.encode_cursor(self.previous_position, reverse=True))
+
+    def _link(self, cursor: str) -> str:
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+
+class KeysetModeMixin:
+    """
+    Adds a keyset mode to a page-number paginator
+
+    The keyset mode is used when the request passes ``?pagination=keyset`` or
+    a ``cursor``; otherwise pages are numbered as before.
+    """
+
+    keyset_class = KeysetPagination
+    mode_query_param = 'pagination'
+
+    def use_keyset(self, request) -> bool:
+        return (
+            request.query_params.get(self.mode_query_param) == 'keyset'
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if not self.use_keyset(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = self.keyset_class()
+        self.keyset.page_size = self.page_size
+        self.keyset.max_page_size = getattr(self, 'max_page_size', None)
+        return self.keyset.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class KeysetPageNumberPagination(KeysetModeMixin, PageNumberPagination):
+    """Default page-number pagination with the keyset mode available"""
@@ -0,0 +1,381 @@
+"""
+Streaming exports for PowerBI.
+
+Exports are written row by row into a ``StreamingHttpResponse`` so memory
+stays constant however large the export is:
+
+- row-level tables (``EXPORT_TABLES``) are read with ``QuerySet.iterator``,
+  which uses a server-side cursor on PostgreSQL, and can be pulled
+  incrementally with ``since`` for PowerBI incremental refresh; rows changed
+  in the ``WATERMARK_OVERLAP`` before a pull are sent again by the next one,
+  so PowerBI must key rows on ``id``
+- nested analytics datasets are flattened recursively into one row per
+  list item, tagged with the section they came from
+
+CSV and NDJSON are generated on the fly. Excel uses a write-only openpyxl
+workbook, which spools rows to a temporary file instead of holding the
+sheet in memory, and the finished file is streamed back.
+"""
+
+import csv
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from events.models import Assignment
+from tasks.models import TaskCompletion
+from volunteers.models import VolunteerProfile
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+EXCEL = 'excel'
+STREAM_FORMATS = [CSV, NDJSON, EXCEL]
+
+CONTENT_TYPES = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+    EXCEL: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+EXTENSIONS = {CSV: 'csv', NDJSON: 'ndjson', EXCEL: 'xlsx'}
+
+# Rows fetched per round trip from the server-side cursor
+CURSOR_CHUNK_SIZE = 2000
+
+# Response header carrying the time the export started, less
+# ``WATERMARK_OVERLAP``; PowerBI passes it back as ``since`` on the next
+# incremental refresh
+WATERMARK_HEADER = 'X-PowerBI-Watermark'
+
+# Re-send rows slightly older than the export so transactions that committed
+# after it started, with an earlier ``updated_at``, are not skipped; rows in
+# the overlap appear in two consecutive pulls
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Row-level tables as (model, columns); every table is filtered on
+# ``updated_at`` for incremental pulls
+EXPORT_TABLES = {
+    'volunteers': (
+        VolunteerProfile,
+        [
+            'id', 'user_id', 'status', 'experience_level', 'availability_level',
+            'background_check_status', 'transport_method', 'is_corporate_volunteer',
+            'performance_rating', 'application_date', 'approval_date',
+            'user__date_of_birth', 'user__county', 'user__city',
+            'created_at', 'updated_at',
+        ],
+    ),
+    'assignments': (
+        Assignment,
+        [
+            'id', 'volunteer_id', 'event_id', 'venue_id', 'role_id', 'role__role_type',
+            'assignment_type', 'status', 'priority_level', 'assigned_date', 'start_date', 'end_date',
+            'is_admin_override', 'performance_rating', 'actual_hours_worked',
+            'check_in_time', 'check_out_time', 'created_at', 'updated_at',
+        ],
+    ),
+    'task-completions': (
+        TaskCompletion,
+        [
+            'id', 'task_id', 'task__event_id', 'task__role_id', 'task__category', 'volunteer_id',
+            'assignment_id', 'completion_type', 'status', 'submitted_at', 'completed_at',
+            'verified_at', 'time_spent_minutes', 'quality_score', 'revision_count',
+            'created_at', 'updated_at',
+        ],
+    ),
+}
+
+
+class EchoBuffer:
+    """File-like object that hands back what is written, for ``csv.writer``"""
+
+    def write(self, value):
+        return value
+
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a ``since`` timestamp (ISO 8601 datetime or date).
+
+    Naive values are taken to be in the current time zone. Raises
+    ValueError for anything unparseable.
+    """
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid since timestamp: {value}")
+        parsed = datetime(day.year, day.month, day.day)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def iter_table_rows(table: str, filters: Optional[Dict[str, Any]] = None,
+                    since: Optional[datetime] = None) -> Tuple[List[str], Iterator[Tuple]]:
+    """
+    Get the columns and a lazy row iterator for a row-level export table.
+
+    Rows are ordered by ``updated_at`` so an interrupted incremental pull can
+    resume from the last row it saw.
+    """
+    model, columns = EXPORT_TABLES[table]
+    queryset = model.objects.all()
+    filters = filters or {}
+
+    if since is not None:
+        queryset = queryset.filter(updated_at__gt=since)
+    if filters.get('status'):
+        queryset = queryset.filter(status=filters['status'])
+    if filters.get('event_id') and 'event_id' in columns:
+        queryset = queryset.filter(event_id=filters['event_id'])
+    if filters.get('event_id') and 'task__event_id' in columns:
+        queryset = queryset.filter(task__event_id=filters['event_id'])
+    if filters.get('venue_id') and 'venue_id' in columns:
+        queryset = queryset.filter(venue_id=filters['venue_id'])
+    if filters.get('date_from'):
+        queryset = queryset.filter(created_at__gte=filters['date_from'])
+    if filters.get('date_to'):
+        queryset = queryset.filter(created_at__lte=filters['date_to'])
+
+    rows = queryset.order_by('updated_at', 'pk').values_list(*columns).iterator(chunk_size=CURSOR_CHUNK_SIZE)
+    return columns, rows
+
+
+def flatten(value: Any, prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten nested dicts into one level with dotted keys.
+
+    Lists of scalars are joined with ``; ``; lists that still hold dicts at
+    this depth are kept as JSON text so no data is dropped.
+    """
+    if not isinstance(value, dict):
+        return {prefix or 'value': value}
+
+    flat = {}
+    for key, item in value.items():
+        name = f'{prefix}.{key}' if prefix else str(key)
+        if isinstance(item, dict):
+            flat.update(flatten(item, name))
+        elif isinstance(item, (list, tuple)):
+            if any(isinstance(element, (dict, list, tuple)) for element in item):
+                flat[name] = json.dumps(item, cls=DjangoJSONEncoder)
+            else:
+                flat[name] = '; '.join('' if element is None else str(element) for element in item)
+        else:
+            flat[name] = item
+    return flat
+
+
+def iter_dataset_rows(dataset: Any, section: str = '') -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Walk a nested analytics dataset and yield ``(section, row)`` pairs.
+
+    Every list of dicts becomes a table with one row per item, and the
+    scalar values of each dict become a single row of their own, so
+    ``{'summary_metrics': {...}, 'demographics': {'age_distribution': [...]}}``
+    yields a ``summary_metrics`` row and ``demographics.age_distribution`` rows.
+    """
+    if isinstance(dataset, dict):
+        scalars = {}
+        for key, value in dataset.items():
+            path = f'{section}.{key}' if section else str(key)
+            if isinstance(value, dict):
+                yield from iter_dataset_rows(value, path)
+            elif isinstance(value, (list, tuple)) and any(isinstance(item, dict) for item in value):
+                yield from iter_dataset_rows(value, path)
+            elif isinstance(value, (list, tuple)):
+                scalars[str(key)] = '; '.join('' if item is None else str(item) for item in value)
+            else:
+                scalars[str(key)] = value
+        if scalars:
+            yield section or 'dataset', scalars
+    elif isinstance(dataset, (list, tuple)):
+        for item in dataset:
+            if isinstance(item, dict):
+                yield section, flatten(item)
+            else:
+                yield section, {'value': item}
+    else:
+        yield section or 'dataset', {'value': dataset}
+
+
+def _export_value(value: Any) -> Any:
+    """Convert a value to something CSV, JSON and Excel all accept"""
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        # Excel has no time zones; export UTC
+        return value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    return value
+
+
+def _csv_text(value: Any) -> Any:
+    value = _export_value(value)
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def stream_table_csv(columns: List[str], rows: Iterable[Tuple]) -> Iterator[str]:
+    """CSV lines for a table, header first"""
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_text(value) for value in row])
+
+
+def stream_table_ndjson(columns: List[str], rows: Iterable[Tuple]) -> Iterator[str]:
+    """One JSON object per line for a table"""
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def stream_dataset_csv(rows: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+    """
+    CSV for a flattened dataset in long format (section, row, field, value).
+
+    Sections have different columns, so a long layout keeps one header for
+    the whole file; PowerBI can pivot it back per section.
+    """
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(['section', 'row', 'field', 'value'])
+    counters = {}
+    for section, row in rows:
+        index = counters[section] = counters.get(section, -1) + 1
+        for field, value in row.items():
+            yield writer.writerow([section, index, field, _csv_text(value)])
+
+
+def stream_dataset_ndjson(rows: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+    """One JSON object per flattened dataset row, tagged with its section"""
+    for section, row in rows:
+        yield json.dumps({'section': section, **row}, cls=DjangoJSONEncoder) + '\n'
+
+
+def _sheet_title(section: str, used: set) -> str:
+    """Unique Excel sheet title (max 31 characters, no ``[]:*?/\\``)"""
+    title = ''.join('_' if char in '[]:*?/\\' else char for char in section)[-31:] or 'dataset'
+    candidate, suffix = title, 1
+    while candidate in used:
+        suffix += 1
+        candidate = f'{title[:31 - len(str(suffix)) - 1]}~{suffix}'
+    used.add(candidate)
+    return candidate
+
+
+def write_table_excel(columns: List[str], rows: Iterable[Tuple], title: str):
+    """Write a table to a write-only workbook in a temporary file"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=_sheet_title(title, set()))
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([_export_value(value) for value in row])
+    return _save_workbook(workbook)
+
+
+def write_dataset_excel(rows: Iterable[Tuple[str, Dict[str, Any]]]):
+    """
+    Write a flattened dataset to a write-only workbook, one sheet per section.
+
+    Dataset sections are aggregates (one row per category), so each one is
+    gathered before writing to get the union of its columns for the header.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    used = set()
+    for section, section_rows in _group_sections(rows):
+        columns = []
+        for row in section_rows:
+            columns.extend(key for key in row if key not in columns)
+        sheet = workbook.create_sheet(title=_sheet_title(section, used))
+        sheet.append(columns)
+        for row in section_rows:
+            sheet.append([_export_value(row.get(column)) for column in columns])
+    if not used:
+        workbook.create_sheet(title='dataset')
+    return _save_workbook(workbook)
+
+
+def _group_sections(rows: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Group consecutive rows of the same section"""
+    current, section_rows = None, []
+    for section, row in rows:
+        if section != current and section_rows:
+            yield current, section_rows
+            section_rows = []
+        current = section
+        section_rows.append(row)
+    if section_rows:
+        yield current, section_rows
+
+
+def _save_workbook(workbook):
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+def _filename(name: str, export_format: str) -> str:
+    return f'{name}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.{EXTENSIONS[export_format]}'
+
+
+def _response(content, name: str, export_format: str, watermark: Optional[datetime] = None):
+    if export_format == EXCEL:
+        response = FileResponse(
+            content,
+            as_attachment=True,
+            filename=_filename(name, export_format),
+            content_type=CONTENT_TYPES[EXCEL],
+        )
+    else:
+        response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{_filename(name, export_format)}"'
+    if watermark is not None:
+        response[WATERMARK_HEADER] = watermark.isoformat()
+    return response
+
+
+def table_export_response(table: str, export_format: str, filters: Optional[Dict[str, Any]] = None,
+                          since: Optional[datetime] = None):
+    """Streaming response for a row-level table in ``export_format``"""
+    # Taken before the rows are read and moved back by the overlap, so rows
+    # changed during the export, or committed late, are picked up again by
+    # the next incremental pull
+    watermark = timezone.now() - WATERMARK_OVERLAP
+    columns, rows = iter_table_rows(table, filters, since)
+    if export_format == CSV:
+        content = stream_table_csv(columns, rows)
+    elif export_format == NDJSON:
+        content = stream_table_ndjson(columns, rows)
+    else:
+        content = write_table_excel(columns, rows, table)
+    return _response(content, table, export_format, watermark)
+
+
+def dataset_export_response(dataset: Dict[str, Any], name: str, export_format: str):
+    """Streaming response for a nested analytics dataset in ``export_format``"""
+    rows = iter_dataset_rows(dataset)
+    if export_format == CSV:
+        content = stream_dataset_csv(rows)
+    elif export_format == NDJSON:
+        content = stream_dataset_ndjson(rows)
+    else:
+        content = write_dataset_excel(rows)
+    return _response(content, name, export_format)
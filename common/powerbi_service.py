@@ -7,25 +7,85 @@ volunteer management, event analytics, and operational insights.
 """
 
 import json
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 from django.db.models import Count, Q, Avg, Sum, Max, Min, F, Case, When, IntegerField, FloatField
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.db import connection
 from django.core.exceptions import ValidationError
 from decimal import Decimal
 
 from volunteers.models import VolunteerProfile
 from events.models import Event, Venue, Role, Assignment
+from events.assignment_stats import get_volunteer_assignment_totals
 from tasks.models import Task, TaskCompletion
-from integrations.models import JustGoIntegration, JustGoSync
+from integrations.models import JustGoSync
 from common.models import AuditLog, AdminOverride
 from common.audit_service import AdminAuditService
+from common import analytics_cache
+from common.analytics_cache import (
+    ASSIGNMENTS, EVENTS, INTEGRATIONS, OVERRIDES, SNAPSHOTS, TASKS, VOLUNTEERS, cached
+)
+from reporting import snapshots
+from reporting.models import AssignmentDailyFact, VolunteerSnapshot
+from common.analytics_engine import (
+    AGE_BANDS, PARTICIPATION_BANDS, RATE_BANDS, RATING_BANDS,
+    ages, band, cohort_retention, distribution, fetch_columns, mean, month, percentiles, rate
+)
 
 User = get_user_model()
 
+# Columns fetched once per volunteer analytics refresh
+VOLUNTEER_COLUMNS = [
+    'user_id', 'status', 'experience_level', 'created_at', 'approval_date', 'performance_rating',
+    'preferred_communication_method', 'background_check_status', 'transport_method',
+    'user__date_of_birth', 'user__county', 'user__city', 'user__postal_code',
+]
+
+# Snapshot field -> volunteer frame column
+SNAPSHOT_COLUMNS = {
+    'user_id': 'user_id',
+    'status': 'status',
+    'experience_level': 'experience_level',
+    'created_at': 'created_at',
+    'approval_date': 'approval_date',
+    'performance_rating': 'performance_rating',
+    'preferred_communication_method': 'preferred_communication_method',
+    'background_check_status': 'background_check_status',
+    'transport_method': 'transport_method',
+    'date_of_birth': 'user__date_of_birth',
+    'county': 'user__county',
+    'city': 'user__city',
+    'postal_code': 'user__postal_code',
+    'assignment_total': 'assignment_total',
+    'assignment_completed': 'assignment_completed',
+    'assignment_active': 'assignment_active',
+}
+
+EVENT_COLUMNS = ['id', 'name', 'status', 'start_date', 'end_date', 'volunteer_target', 'assigned_volunteer_count']
+
+RETAINED_STATUSES = {
+    VolunteerProfile.VolunteerStatus.APPROVED,
+    VolunteerProfile.VolunteerStatus.ACTIVE,
+}
+
+CHURNED_STATUSES = [
+    VolunteerProfile.VolunteerStatus.INACTIVE,
+    VolunteerProfile.VolunteerStatus.WITHDRAWN,
+    VolunteerProfile.VolunteerStatus.SUSPENDED,
+    VolunteerProfile.VolunteerStatus.REJECTED,
+]
+
+# Task completions still waiting on the volunteer or a reviewer
+OPEN_COMPLETION_STATUSES = {
+    TaskCompletion.CompletionStatus.PENDING,
+    TaskCompletion.CompletionStatus.SUBMITTED,
+    TaskCompletion.CompletionStatus.UNDER_REVIEW,
+    TaskCompletion.CompletionStatus.REVISION_REQUIRED,
+}
+
 
 class PowerBIService:
     """
@@ -42,27 +102,24 @@ class PowerBIService:
     }
     
     @classmethod
+    @cached('powerbi_volunteer_analytics', [VOLUNTEERS, ASSIGNMENTS, SNAPSHOTS], CACHE_TIMEOUTS['hourly'])
     def get_volunteer_analytics_dataset(cls, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get comprehensive volunteer analytics dataset for PowerBI.
         
+        Computed from one columnar profile fetch and two grouped assignment
+        queries, whatever the number of volunteers.
+        
         Args:
             filters: Optional filters for data selection
             
         Returns:
             Dictionary containing structured volunteer analytics data
         """
-        cache_key = f"powerbi_volunteer_analytics_{hash(str(filters))}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
-            # Base queryset
-            volunteers_qs = VolunteerProfile.objects.select_related('user').prefetch_related(
-                'assignments', 'assignments__role', 'assignments__event'
-            )
+            # Base querysets
+            volunteers_qs = VolunteerProfile.objects.all()
+            assignments_qs = Assignment.objects.all()
             
             # Apply filters
             if filters:
@@ -73,80 +130,68 @@ class PowerBIService:
                 if 'date_to' in filters:
                     volunteers_qs = volunteers_qs.filter(created_at__lte=filters['date_to'])
                 if 'event_id' in filters:
-                    volunteers_qs = volunteers_qs.filter(assignments__event_id=filters['event_id'])
-            
-            # Volunteer demographics
-            demographics = cls._get_volunteer_demographics(volunteers_qs)
-            
-            # Volunteer performance metrics
-            performance = cls._get_volunteer_performance_metrics(volunteers_qs)
-            
-            # Volunteer engagement data
-            engagement = cls._get_volunteer_engagement_data(volunteers_qs)
-            
-            # Volunteer lifecycle data
-            lifecycle = cls._get_volunteer_lifecycle_data(volunteers_qs)
-            
-            # Geographic distribution
-            geographic = cls._get_volunteer_geographic_distribution(volunteers_qs)
-            
-            # Skills and experience analysis
-            skills_analysis = cls._get_volunteer_skills_analysis(volunteers_qs)
+                    assignments_qs = assignments_qs.filter(event_id=filters['event_id'])
+                    volunteers_qs = volunteers_qs.filter(user_id__in=assignments_qs.values('volunteer_id'))
+            
+            # Unfiltered refreshes read the snapshot tables when they have been built
+            snapshot_at = None
+            if not filters:
+                snapshot_at = snapshots.snapshot_watermark(snapshots.VOLUNTEERS, snapshots.ASSIGNMENTS)
+            if snapshot_at:
+                frame = cls._load_volunteer_snapshot_frame()
+            else:
+                assignments_qs = assignments_qs.filter(volunteer_id__in=volunteers_qs.values('user_id'))
+                frame = cls._load_volunteer_frame(volunteers_qs, assignments_qs)
+            status_counts = Counter(frame['status'])
             
             dataset = {
                 'metadata': {
                     'generated_at': timezone.now().isoformat(),
-                    'total_records': volunteers_qs.count(),
+                    'total_records': len(frame['user_id']),
                     'filters_applied': filters or {},
-                    'data_freshness': 'real_time',
+                    'data_freshness': 'snapshot' if snapshot_at else 'real_time',
+                    'snapshot_at': snapshot_at.isoformat() if snapshot_at else None,
                     'version': '1.0'
                 },
-                'demographics': demographics,
-                'performance': performance,
-                'engagement': engagement,
-                'lifecycle': lifecycle,
-                'geographic': geographic,
-                'skills_analysis': skills_analysis,
+                'demographics': cls._get_volunteer_demographics(frame),
+                'performance': cls._get_volunteer_performance_metrics(frame),
+                'engagement': cls._get_volunteer_engagement_data(frame),
+                'lifecycle': cls._get_volunteer_lifecycle_data(frame),
+                'geographic': cls._get_volunteer_geographic_distribution(frame),
+                'skills_analysis': cls._get_volunteer_skills_analysis(frame),
                 'summary_metrics': {
-                    'total_volunteers': volunteers_qs.count(),
-                    'active_volunteers': volunteers_qs.filter(status='ACTIVE').count(),
-                    'pending_volunteers': volunteers_qs.filter(status='PENDING').count(),
-                    'average_age': cls._calculate_average_age(volunteers_qs),
-                    'retention_rate': cls._calculate_retention_rate(volunteers_qs),
-                    'satisfaction_score': cls._calculate_satisfaction_score(volunteers_qs)
+                    'total_volunteers': len(frame['user_id']),
+                    'active_volunteers': status_counts[VolunteerProfile.VolunteerStatus.ACTIVE],
+                    'pending_volunteers': status_counts[VolunteerProfile.VolunteerStatus.PENDING],
+                    'average_age': cls._calculate_average_age(frame),
+                    'retention_rate': cls._calculate_retention_rate(frame),
+                    'satisfaction_score': cls._calculate_satisfaction_score(frame)
                 }
             }
             
-            # Cache the result
-            cache.set(cache_key, dataset, cls.CACHE_TIMEOUTS['hourly'])
-            
             return dataset
             
         except Exception as e:
             raise ValidationError(f"Failed to generate volunteer analytics dataset: {str(e)}")
     
     @classmethod
+    @cached('powerbi_event_analytics', [EVENTS, ASSIGNMENTS, SNAPSHOTS], CACHE_TIMEOUTS['hourly'])
     def get_event_analytics_dataset(cls, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get comprehensive event analytics dataset for PowerBI.
         
+        Computed from four queries: events, venues, and role and assignment
+        totals grouped per event.
+        
         Args:
             filters: Optional filters for data selection
             
         Returns:
             Dictionary containing structured event analytics data
         """
-        cache_key = f"powerbi_event_analytics_{hash(str(filters))}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
             # Base queryset
-            events_qs = Event.objects.select_related('venue').prefetch_related(
-                'roles', 'assignments', 'assignments__volunteer'
-            )
+            events_qs = Event.objects.all()
             
             # Apply filters
             if filters:
@@ -157,93 +202,59 @@ class PowerBIService:
                 if 'start_date_to' in filters:
                     events_qs = events_qs.filter(start_date__lte=filters['start_date_to'])
                 if 'venue_id' in filters:
-                    events_qs = events_qs.filter(venue_id=filters['venue_id'])
+                    events_qs = events_qs.filter(venues__id=filters['venue_id'])
             
-            # Event performance metrics
-            performance = cls._get_event_performance_metrics(events_qs)
-            
-            # Venue utilization analysis
-            venue_utilization = cls._get_venue_utilization_analysis(events_qs)
-            
-            # Role fulfillment analysis
-            role_fulfillment = cls._get_role_fulfillment_analysis(events_qs)
-            
-            # Event timeline analysis
-            timeline = cls._get_event_timeline_analysis(events_qs)
-            
-            # Resource allocation analysis
-            resource_allocation = cls._get_resource_allocation_analysis(events_qs)
-            
-            # Event success metrics
-            success_metrics = cls._get_event_success_metrics(events_qs)
+            snapshot_at = snapshots.snapshot_watermark(snapshots.ASSIGNMENTS)
+            frame = cls._load_event_frame(events_qs, use_snapshot=bool(snapshot_at))
+            status_counts = Counter(frame['events']['status'])
             
             dataset = {
                 'metadata': {
                     'generated_at': timezone.now().isoformat(),
-                    'total_records': events_qs.count(),
+                    'total_records': len(frame['events']['id']),
                     'filters_applied': filters or {},
-                    'data_freshness': 'real_time',
+                    'data_freshness': 'snapshot' if snapshot_at else 'real_time',
+                    'snapshot_at': snapshot_at.isoformat() if snapshot_at else None,
                     'version': '1.0'
                 },
-                'performance': performance,
-                'venue_utilization': venue_utilization,
-                'role_fulfillment': role_fulfillment,
-                'timeline': timeline,
-                'resource_allocation': resource_allocation,
-                'success_metrics': success_metrics,
+                'performance': cls._get_event_performance_metrics(frame),
+                'venue_utilization': cls._get_venue_utilization_analysis(frame),
+                'role_fulfillment': cls._get_role_fulfillment_analysis(frame),
+                'timeline': cls._get_event_timeline_analysis(frame),
+                'resource_allocation': cls._get_resource_allocation_analysis(frame),
+                'success_metrics': cls._get_event_success_metrics(frame),
                 'summary_metrics': {
-                    'total_events': events_qs.count(),
-                    'active_events': events_qs.filter(status='ACTIVE').count(),
-                    'completed_events': events_qs.filter(status='COMPLETED').count(),
-                    'average_capacity_utilization': cls._calculate_average_capacity_utilization(events_qs),
-                    'average_volunteer_satisfaction': cls._calculate_average_volunteer_satisfaction(events_qs),
-                    'total_volunteer_hours': cls._calculate_total_volunteer_hours(events_qs)
+                    'total_events': len(frame['events']['id']),
+                    'active_events': status_counts[Event.EventStatus.ACTIVE],
+                    'completed_events': status_counts[Event.EventStatus.COMPLETED],
+                    'average_capacity_utilization': cls._calculate_average_capacity_utilization(frame),
+                    'average_volunteer_satisfaction': cls._calculate_average_volunteer_satisfaction(frame),
+                    'total_volunteer_hours': cls._calculate_total_volunteer_hours(frame)
                 }
             }
             
-            # Cache the result
-            cache.set(cache_key, dataset, cls.CACHE_TIMEOUTS['hourly'])
-            
             return dataset
             
         except Exception as e:
             raise ValidationError(f"Failed to generate event analytics dataset: {str(e)}")
     
     @classmethod
+    @cached('powerbi_operational_analytics', [VOLUNTEERS, TASKS, INTEGRATIONS, OVERRIDES], CACHE_TIMEOUTS['real_time'])
     def get_operational_analytics_dataset(cls, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get comprehensive operational analytics dataset for PowerBI.
         
+        Covers the ``date_from``/``date_to`` window (default the last 30 days)
+        and is computed from five queries.
+        
         Args:
             filters: Optional filters for data selection
             
         Returns:
             Dictionary containing structured operational analytics data
         """
-        cache_key = f"powerbi_operational_analytics_{hash(str(filters))}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
-            # System performance metrics
-            system_performance = cls._get_system_performance_metrics(filters)
-            
-            # Task completion analytics
-            task_analytics = cls._get_task_completion_analytics(filters)
-            
-            # Integration health metrics
-            integration_health = cls._get_integration_health_metrics(filters)
-            
-            # Admin operations analytics
-            admin_operations = cls._get_admin_operations_analytics(filters)
-            
-            # Security and compliance metrics
-            security_metrics = cls._get_security_compliance_metrics(filters)
-            
-            # Data quality metrics
-            data_quality = cls._get_data_quality_metrics(filters)
+            frame = cls._load_operational_frame(filters)
             
             dataset = {
                 'metadata': {
@@ -252,30 +263,28 @@ class PowerBIService:
                     'data_freshness': 'real_time',
                     'version': '1.0'
                 },
-                'system_performance': system_performance,
-                'task_analytics': task_analytics,
-                'integration_health': integration_health,
-                'admin_operations': admin_operations,
-                'security_metrics': security_metrics,
-                'data_quality': data_quality,
+                'system_performance': cls._get_system_performance_metrics(frame),
+                'task_analytics': cls._get_task_completion_analytics(frame),
+                'integration_health': cls._get_integration_health_metrics(frame),
+                'admin_operations': cls._get_admin_operations_analytics(frame),
+                'security_metrics': cls._get_security_compliance_metrics(filters),
+                'data_quality': cls._get_data_quality_metrics(frame),
                 'summary_metrics': {
                     'system_uptime': cls._calculate_system_uptime(filters),
                     'average_response_time': cls._calculate_average_response_time(filters),
-                    'error_rate': cls._calculate_error_rate(filters),
-                    'data_completeness': cls._calculate_data_completeness(filters),
+                    'error_rate': cls._calculate_error_rate(frame),
+                    'data_completeness': cls._calculate_data_completeness(frame),
                     'security_score': cls._calculate_security_score(filters)
                 }
             }
             
-            # Cache the result
-            cache.set(cache_key, dataset, cls.CACHE_TIMEOUTS['real_time'])
-            
             return dataset
             
         except Exception as e:
             raise ValidationError(f"Failed to generate operational analytics dataset: {str(e)}")
     
     @classmethod
+    @cached('powerbi_financial_analytics', [VOLUNTEERS, EVENTS, ASSIGNMENTS], CACHE_TIMEOUTS['daily'])
     def get_financial_analytics_dataset(cls, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get financial analytics dataset for PowerBI (cost analysis, ROI, etc.).
@@ -286,12 +295,6 @@ class PowerBIService:
         Returns:
             Dictionary containing structured financial analytics data
         """
-        cache_key = f"powerbi_financial_analytics_{hash(str(filters))}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
             # Cost analysis
             cost_analysis = cls._get_cost_analysis(filters)
@@ -324,15 +327,13 @@ class PowerBIService:
                 }
             }
             
-            # Cache the result
-            cache.set(cache_key, dataset, cls.CACHE_TIMEOUTS['daily'])
-            
             return dataset
             
         except Exception as e:
             raise ValidationError(f"Failed to generate financial analytics dataset: {str(e)}")
     
     @classmethod
+    @cached('powerbi_predictive_analytics', [VOLUNTEERS, EVENTS, ASSIGNMENTS], CACHE_TIMEOUTS['daily'])
     def get_predictive_analytics_dataset(cls, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get predictive analytics dataset for PowerBI (trends, forecasts, etc.).
@@ -343,12 +344,6 @@ class PowerBIService:
         Returns:
             Dictionary containing structured predictive analytics data
         """
-        cache_key = f"powerbi_predictive_analytics_{hash(str(filters))}"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
             # Volunteer demand forecasting
             demand_forecast = cls._get_volunteer_demand_forecast(filters)
@@ -386,15 +381,13 @@ class PowerBIService:
                 }
             }
             
-            # Cache the result
-            cache.set(cache_key, dataset, cls.CACHE_TIMEOUTS['daily'])
-            
             return dataset
             
         except Exception as e:
             raise ValidationError(f"Failed to generate predictive analytics dataset: {str(e)}")
     
     @classmethod
+    @cached('powerbi_real_time_dashboard', [VOLUNTEERS, EVENTS, ASSIGNMENTS, TASKS], CACHE_TIMEOUTS['real_time'])
     def get_real_time_dashboard_data(cls) -> Dict[str, Any]:
         """
         Get real-time dashboard data for PowerBI live dashboards.
@@ -402,12 +395,6 @@ class PowerBIService:
         Returns:
             Dictionary containing real-time metrics
         """
-        cache_key = "powerbi_real_time_dashboard"
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return cached_data
-        
         try:
             now = timezone.now()
             
@@ -483,9 +470,6 @@ class PowerBIService:
                 }
             }
             
-            # Cache for 5 minutes
-            cache.set(cache_key, dashboard_data, cls.CACHE_TIMEOUTS['real_time'])
-            
             return dashboard_data
             
         except Exception as e:
@@ -538,238 +522,467 @@ class PowerBIService:
         except Exception as e:
             raise ValidationError(f"Failed to generate custom dataset: {str(e)}")
     
-    # Helper methods for data generation
+    # Frame loaders: each source is fetched once as columns or grouped rows
+    
+    @classmethod
+    def _load_volunteer_frame(cls, volunteers_qs, assignments_qs) -> Dict[str, Any]:
+        """Load volunteer columns and per-volunteer assignment totals."""
+        frame = fetch_columns(volunteers_qs, VOLUNTEER_COLUMNS)
+        
+        # Per-volunteer assignment totals, one grouped query
+        totals = get_volunteer_assignment_totals(assignments_qs)
+        empty = (0, 0, 0)
+        frame['assignment_total'] = [totals.get(user_id, empty)[0] for user_id in frame['user_id']]
+        frame['assignment_completed'] = [totals.get(user_id, empty)[1] for user_id in frame['user_id']]
+        frame['assignment_active'] = [totals.get(user_id, empty)[2] for user_id in frame['user_id']]
+        
+        # Assignment outcomes by role type and rating, one grouped query
+        frame['assignment_groups'] = list(
+            assignments_qs.order_by()
+            .values('role__role_type', 'status', 'performance_rating')
+            .annotate(count=Count('id'))
+            .values_list('role__role_type', 'status', 'performance_rating', 'count')
+        )
+        
+        frame['age'] = ages(frame['user__date_of_birth'])
+        return frame
+    
+    @classmethod
+    def _load_volunteer_snapshot_frame(cls) -> Dict[str, Any]:
+        """Load the same frame from the volunteer snapshot and daily assignment facts."""
+        columns = fetch_columns(VolunteerSnapshot.objects.all(), list(SNAPSHOT_COLUMNS))
+        frame = {SNAPSHOT_COLUMNS[field]: values for field, values in columns.items()}
+        
+        frame['assignment_groups'] = list(
+            AssignmentDailyFact.objects.order_by()
+            .values('role_type', 'status', 'performance_rating')
+            .annotate(count=Sum('assignment_count'))
+            .values_list('role_type', 'status', 'performance_rating', 'count')
+        )
+        
+        frame['age'] = ages(frame['user__date_of_birth'])
+        return frame
+    
+    @classmethod
+    def _load_event_frame(cls, events_qs, use_snapshot: bool = False) -> Dict[str, Any]:
+        """Load event and venue columns with role and assignment totals per event."""
+        frame = {
+            'events': fetch_columns(events_qs, EVENT_COLUMNS),
+            'venues': fetch_columns(
+                Venue.objects.filter(event__in=events_qs),
+                ['event_id', 'name', 'volunteer_capacity', 'assigned_volunteer_count']
+            ),
+            'role_groups': list(
+                Role.objects.filter(event__in=events_qs).order_by()
+                .values('event_id', 'role_type')
+                .annotate(roles=Count('id'), positions=Sum('total_positions'), filled=Sum('filled_positions'))
+                .values_list('event_id', 'role_type', 'roles', 'positions', 'filled')
+            ),
+        }
+        
+        assignments = defaultdict(lambda: {'statuses': Counter(), 'hours': 0.0, 'rating_total': 0, 'rated': 0})
+        if use_snapshot:
+            grouped = (
+                AssignmentDailyFact.objects.filter(event__in=events_qs).order_by()
+                .values('event_id', 'status')
+                .annotate(
+                    count=Sum('assignment_count'),
+                    hours=Sum('hours_worked'),
+                    rating_total=Sum(F('performance_rating') * F('assignment_count')),
+                    rated=Sum('assignment_count', filter=Q(performance_rating__isnull=False))
+                )
+            )
+        else:
+            grouped = (
+                Assignment.objects.filter(event__in=events_qs).order_by()
+                .values('event_id', 'status')
+                .annotate(
+                    count=Count('id'),
+                    hours=Sum('actual_hours_worked'),
+                    rating_total=Sum('performance_rating'),
+                    rated=Count('performance_rating')
+                )
+            )
+        grouped = grouped.values_list('event_id', 'status', 'count', 'hours', 'rating_total', 'rated')
+        for event_id, status, count, hours, rating_total, rated in grouped:
+            totals = assignments[event_id]
+            totals['statuses'][status] += count
+            totals['hours'] += float(hours or 0)
+            totals['rating_total'] += rating_total or 0
+            totals['rated'] += rated or 0
+        frame['assignments'] = assignments
+        
+        frame['event_names'] = dict(zip(frame['events']['id'], frame['events']['name']))
+        return frame
+    
+    @classmethod
+    def _load_operational_frame(cls, filters) -> Dict[str, Any]:
+        """Load task, sync, audit and override data for the reporting window."""
+        filters = filters or {}
+        date_from = filters.get('date_from') or timezone.now() - timedelta(days=30)
+        date_to = filters.get('date_to')
+        
+        def window(queryset, field):
+            queryset = queryset.filter(**{f'{field}__gte': date_from})
+            if date_to:
+                queryset = queryset.filter(**{f'{field}__lte': date_to})
+            return queryset.order_by()
+        
+        return {
+            'tasks': fetch_columns(
+                window(TaskCompletion.objects.all(), 'created_at'),
+                ['status', 'time_spent_minutes', 'quality_score', 'task__category']
+            ),
+            'syncs': list(
+                window(JustGoSync.objects.all(), 'started_at')
+                .values('sync_type', 'status')
+                .annotate(count=Count('id'))
+                .values_list('sync_type', 'status', 'count')
+            ),
+            'audit': list(
+                window(AuditLog.objects.all(), 'timestamp')
+                .values('action_type')
+                .annotate(
+                    count=Count('id'),
+                    server_errors=Count('id', filter=Q(response_status__gte=500)),
+                    client_errors=Count('id', filter=Q(response_status__gte=400, response_status__lt=500))
+                )
+                .values_list('action_type', 'count', 'server_errors', 'client_errors')
+            ),
+            'overrides': list(
+                window(AdminOverride.objects.all(), 'created_at')
+                .values('override_type', 'status')
+                .annotate(count=Count('id'))
+                .values_list('override_type', 'status', 'count')
+            ),
+            'profiles': User.objects.aggregate(
+                total=Count('id'),
+                complete=Count('id', filter=Q(profile_complete=True))
+            ),
+        }
+    
+    # Volunteer analytics helper methods
     
     @classmethod
-    def _get_volunteer_demographics(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_demographics(cls, frame) -> Dict[str, Any]:
         """Get volunteer demographics data."""
         return {
-            'age_distribution': cls._get_age_distribution(volunteers_qs),
-            'gender_distribution': cls._get_gender_distribution(volunteers_qs),
-            'location_distribution': cls._get_location_distribution(volunteers_qs),
-            'experience_levels': cls._get_experience_levels(volunteers_qs),
-            'education_levels': cls._get_education_levels(volunteers_qs),
-            'employment_status': cls._get_employment_status(volunteers_qs)
+            'age_distribution': cls._get_age_distribution(frame),
+            'gender_distribution': cls._get_gender_distribution(frame),
+            'location_distribution': cls._get_location_distribution(frame),
+            'experience_levels': cls._get_experience_levels(frame),
+            'education_levels': [],
+            'employment_status': []
         }
     
     @classmethod
-    def _get_volunteer_performance_metrics(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_performance_metrics(cls, frame) -> Dict[str, Any]:
         """Get volunteer performance metrics."""
         return {
-            'completion_rates': cls._get_completion_rates(volunteers_qs),
-            'attendance_rates': cls._get_attendance_rates(volunteers_qs),
-            'satisfaction_scores': cls._get_satisfaction_scores(volunteers_qs),
-            'skill_ratings': cls._get_skill_ratings(volunteers_qs),
-            'feedback_scores': cls._get_feedback_scores(volunteers_qs),
-            'improvement_trends': cls._get_improvement_trends(volunteers_qs)
+            'completion_rates': cls._get_completion_rates(frame),
+            'attendance_rates': cls._get_attendance_rates(frame),
+            'satisfaction_scores': cls._get_satisfaction_scores(frame),
+            'skill_ratings': cls._get_skill_ratings(frame),
+            'feedback_scores': [],
+            'improvement_trends': []
         }
     
     @classmethod
-    def _get_volunteer_engagement_data(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_engagement_data(cls, frame) -> Dict[str, Any]:
         """Get volunteer engagement data."""
+        activity = Counter(
+            'Active' if active else ('Previously assigned' if total else 'Not yet assigned')
+            for total, active in zip(frame['assignment_total'], frame['assignment_active'])
+        )
+        role_types = Counter()
+        for role_type, _status, _rating, count in frame['assignment_groups']:
+            role_types[role_type] += count
+        
         return {
-            'activity_levels': cls._get_activity_levels(volunteers_qs),
-            'participation_frequency': cls._get_participation_frequency(volunteers_qs),
-            'role_preferences': cls._get_role_preferences(volunteers_qs),
-            'communication_preferences': cls._get_communication_preferences(volunteers_qs),
-            'training_participation': cls._get_training_participation(volunteers_qs),
-            'feedback_participation': cls._get_feedback_participation(volunteers_qs)
+            'activity_levels': distribution(activity, 'activity_level'),
+            'participation_frequency': distribution(
+                band(frame['assignment_total'], PARTICIPATION_BANDS), 'assignments',
+                order=PARTICIPATION_BANDS[1]
+            ),
+            'role_preferences': distribution(role_types, 'role_type'),
+            'communication_preferences': distribution(
+                Counter(frame['preferred_communication_method']), 'method'
+            ),
+            'training_participation': [],
+            'feedback_participation': []
         }
     
     @classmethod
-    def _get_volunteer_lifecycle_data(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_lifecycle_data(cls, frame) -> Dict[str, Any]:
         """Get volunteer lifecycle data."""
+        total = len(frame['user_id'])
+        statuses = Counter(frame['status'])
+        stages = Counter({
+            'Registered': total,
+            'Approved': sum(1 for approved in frame['approval_date'] if approved),
+            'Assigned': sum(1 for count in frame['assignment_total'] if count),
+            'Completed an assignment': sum(1 for count in frame['assignment_completed'] if count),
+        })
+        
         return {
-            'recruitment_sources': cls._get_recruitment_sources(volunteers_qs),
-            'onboarding_completion': cls._get_onboarding_completion(volunteers_qs),
-            'retention_rates': cls._get_retention_rates(volunteers_qs),
-            'churn_analysis': cls._get_churn_analysis(volunteers_qs),
-            'lifecycle_stages': cls._get_lifecycle_stages(volunteers_qs),
-            'progression_paths': cls._get_progression_paths(volunteers_qs)
+            'recruitment_sources': [],
+            'onboarding_completion': distribution(stages, 'stage', total=total, order=list(stages)),
+            'retention_rates': cohort_retention(
+                [month(created) for created in frame['created_at']],
+                [status in RETAINED_STATUSES for status in frame['status']]
+            ),
+            'churn_analysis': distribution(
+                Counter({status: statuses[status] for status in CHURNED_STATUSES}), 'status', total=total
+            ),
+            'lifecycle_stages': distribution(statuses, 'status'),
+            'progression_paths': []
         }
     
     @classmethod
-    def _get_volunteer_geographic_distribution(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_geographic_distribution(cls, frame) -> Dict[str, Any]:
         """Get volunteer geographic distribution."""
+        # Eircode routing keys are the first three characters
+        routing_keys = Counter(
+            postal_code.replace(' ', '')[:3].upper()
+            for postal_code in frame['user__postal_code'] if postal_code
+        )
         return {
-            'by_state': cls._get_distribution_by_state(volunteers_qs),
-            'by_city': cls._get_distribution_by_city(volunteers_qs),
-            'by_postcode': cls._get_distribution_by_postcode(volunteers_qs),
-            'distance_from_venues': cls._get_distance_from_venues(volunteers_qs),
-            'travel_patterns': cls._get_travel_patterns(volunteers_qs)
+            'by_state': cls._get_location_distribution(frame),
+            'by_city': distribution(Counter(frame['user__city']), 'city'),
+            'by_postcode': distribution(routing_keys, 'routing_key'),
+            'distance_from_venues': [],
+            'travel_patterns': distribution(Counter(frame['transport_method']), 'transport_method')
         }
     
     @classmethod
-    def _get_volunteer_skills_analysis(cls, volunteers_qs) -> Dict[str, Any]:
+    def _get_volunteer_skills_analysis(cls, frame) -> Dict[str, Any]:
         """Get volunteer skills analysis."""
         return {
-            'skill_inventory': cls._get_skill_inventory(volunteers_qs),
-            'skill_gaps': cls._get_skill_gaps(volunteers_qs),
-            'skill_development': cls._get_skill_development(volunteers_qs),
-            'certification_status': cls._get_certification_status(volunteers_qs),
-            'training_needs': cls._get_training_needs(volunteers_qs)
+            'skill_inventory': [],
+            'skill_gaps': [],
+            'skill_development': [],
+            'certification_status': distribution(Counter(frame['background_check_status']), 'status'),
+            'training_needs': []
         }
     
-    # Placeholder implementations for complex calculations
-    # These would be implemented with actual business logic
-    
     @classmethod
-    def _calculate_average_age(cls, volunteers_qs) -> float:
-        """Calculate average age of volunteers."""
-        # Implementation would calculate actual average age
-        return 32.5
+    def _calculate_average_age(cls, frame) -> Optional[float]:
+        """Calculate average age of volunteers with a date of birth."""
+        return mean(frame['age'], 1)
     
     @classmethod
-    def _calculate_retention_rate(cls, volunteers_qs) -> float:
-        """Calculate volunteer retention rate."""
-        # Implementation would calculate actual retention rate
-        return 85.2
+    def _calculate_retention_rate(cls, frame) -> float:
+        """Calculate the share of volunteers still approved or active."""
+        retained = sum(1 for status in frame['status'] if status in RETAINED_STATUSES)
+        return rate(retained, len(frame['status']))
     
     @classmethod
-    def _calculate_satisfaction_score(cls, volunteers_qs) -> float:
-        """Calculate volunteer satisfaction score."""
-        # Implementation would calculate actual satisfaction score
-        return 4.3
+    def _calculate_satisfaction_score(cls, frame) -> Optional[float]:
+        """Calculate the mean assignment performance rating."""
+        rated = [(rating, count) for _role_type, _status, rating, count in frame['assignment_groups'] if rating]
+        total = sum(count for _rating, count in rated)
+        return round(sum(rating * count for rating, count in rated) / total, 2) if total else None
     
     @classmethod
-    def _get_age_distribution(cls, volunteers_qs) -> List[Dict[str, Any]]:
+    def _get_age_distribution(cls, frame) -> List[Dict[str, Any]]:
         """Get age distribution data."""
-        # Implementation would return actual age distribution
-        return [
-            {'age_range': '18-25', 'count': 150, 'percentage': 25.0},
-            {'age_range': '26-35', 'count': 200, 'percentage': 33.3},
-            {'age_range': '36-45', 'count': 120, 'percentage': 20.0},
-            {'age_range': '46-55', 'count': 80, 'percentage': 13.3},
-            {'age_range': '56+', 'count': 50, 'percentage': 8.3}
-        ]
+        return distribution(band(frame['age'], AGE_BANDS), 'age_range', order=AGE_BANDS[1])
     
     @classmethod
-    def _get_gender_distribution(cls, volunteers_qs) -> List[Dict[str, Any]]:
+    def _get_gender_distribution(cls, frame) -> List[Dict[str, Any]]:
         """Get gender distribution data."""
-        # Implementation would return actual gender distribution
-        return [
-            {'gender': 'Female', 'count': 350, 'percentage': 58.3},
-            {'gender': 'Male', 'count': 230, 'percentage': 38.3},
-            {'gender': 'Other', 'count': 15, 'percentage': 2.5},
-            {'gender': 'Prefer not to say', 'count': 5, 'percentage': 0.8}
-        ]
-    
-    @classmethod
-    def _get_location_distribution(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get location distribution data."""
-        # Implementation would return actual location distribution
-        return [
-            {'state': 'NSW', 'count': 250, 'percentage': 41.7},
-            {'state': 'VIC', 'count': 180, 'percentage': 30.0},
-            {'state': 'QLD', 'count': 100, 'percentage': 16.7},
-            {'state': 'WA', 'count': 40, 'percentage': 6.7},
-            {'state': 'SA', 'count': 20, 'percentage': 3.3},
-            {'state': 'Other', 'count': 10, 'percentage': 1.7}
-        ]
-    
-    # Additional placeholder methods for other complex calculations
-    # These would be implemented with actual business logic based on requirements
-    
-    @classmethod
-    def _get_experience_levels(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get experience levels distribution."""
+        # Gender is not collected on volunteer profiles
         return []
     
     @classmethod
-    def _get_education_levels(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get education levels distribution."""
-        return []
+    def _get_location_distribution(cls, frame) -> List[Dict[str, Any]]:
+        """Get location distribution data by county."""
+        return distribution(Counter(frame['user__county']), 'county')
     
     @classmethod
-    def _get_employment_status(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get employment status distribution."""
-        return []
-    
-    @classmethod
-    def _get_completion_rates(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get task completion rates."""
-        return []
-    
-    @classmethod
-    def _get_attendance_rates(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get event attendance rates."""
-        return []
+    def _get_experience_levels(cls, frame) -> List[Dict[str, Any]]:
+        """Get experience levels distribution."""
+        return distribution(Counter(frame['experience_level']), 'experience_level')
     
     @classmethod
-    def _get_satisfaction_scores(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get satisfaction scores."""
-        return []
+    def _get_completion_rates(cls, frame) -> List[Dict[str, Any]]:
+        """Get assignment completion rates, banded per volunteer."""
+        rates = [
+            completed / total * 100
+            for total, completed in zip(frame['assignment_total'], frame['assignment_completed']) if total
+        ]
+        return distribution(band(rates, RATE_BANDS), 'completion_rate', order=RATE_BANDS[1])
     
     @classmethod
-    def _get_skill_ratings(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get skill ratings."""
-        return []
+    def _get_attendance_rates(cls, frame) -> List[Dict[str, Any]]:
+        """Get attended versus no-show assignments."""
+        outcomes = Counter()
+        for _role_type, status, _rating, count in frame['assignment_groups']:
+            if status in (Assignment.AssignmentStatus.COMPLETED, Assignment.AssignmentStatus.NO_SHOW):
+                outcomes[status] += count
+        return distribution(
+            outcomes, 'status',
+            order=[Assignment.AssignmentStatus.COMPLETED, Assignment.AssignmentStatus.NO_SHOW]
+        )
     
     @classmethod
-    def _get_feedback_scores(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get feedback scores."""
-        return []
+    def _get_satisfaction_scores(cls, frame) -> List[Dict[str, Any]]:
+        """Get assignment performance rating distribution."""
+        ratings = Counter()
+        for _role_type, _status, rating, count in frame['assignment_groups']:
+            if rating:
+                ratings[rating] += count
+        return distribution(ratings, 'rating', order=range(1, 6))
     
     @classmethod
-    def _get_improvement_trends(cls, volunteers_qs) -> List[Dict[str, Any]]:
-        """Get improvement trends."""
-        return []
+    def _get_skill_ratings(cls, frame) -> List[Dict[str, Any]]:
+        """Get profile performance rating distribution."""
+        return distribution(band(frame['performance_rating'], RATING_BANDS), 'rating', order=RATING_BANDS[1])
     
     # Event analytics helper methods
     
     @classmethod
-    def _get_event_performance_metrics(cls, events_qs) -> Dict[str, Any]:
+    def _get_event_performance_metrics(cls, frame) -> Dict[str, Any]:
         """Get event performance metrics."""
+        events = frame['events']
+        attendance = []
+        satisfaction = []
+        completion = []
+        for event_id, name in frame['event_names'].items():
+            totals = frame['assignments'].get(event_id)
+            if not totals:
+                continue
+            statuses = totals['statuses']
+            completed = statuses[Assignment.AssignmentStatus.COMPLETED]
+            no_show = statuses[Assignment.AssignmentStatus.NO_SHOW]
+            attendance.append({
+                'event': name,
+                'attended': completed,
+                'no_show': no_show,
+                'attendance_rate': rate(completed, completed + no_show)
+            })
+            satisfaction.append({
+                'event': name,
+                'ratings': totals['rated'],
+                'average_rating': round(totals['rating_total'] / totals['rated'], 2) if totals['rated'] else None
+            })
+            completion.append({
+                'event': name,
+                'completed': completed,
+                'total': sum(statuses.values()),
+                'completion_rate': rate(completed, sum(statuses.values()))
+            })
+        
         return {
-            'attendance_rates': [],
-            'volunteer_satisfaction': [],
-            'completion_rates': [],
+            'attendance_rates': attendance,
+            'volunteer_satisfaction': satisfaction,
+            'completion_rates': completion,
             'cost_efficiency': [],
-            'resource_utilization': []
+            'resource_utilization': [
+                {'event': name, 'target': target, 'assigned': assigned, 'utilization': rate(assigned, target)}
+                for name, target, assigned in zip(
+                    events['name'], events['volunteer_target'], events['assigned_volunteer_count']
+                )
+            ]
         }
     
     @classmethod
-    def _get_venue_utilization_analysis(cls, events_qs) -> Dict[str, Any]:
+    def _get_venue_utilization_analysis(cls, frame) -> Dict[str, Any]:
         """Get venue utilization analysis."""
+        venues = frame['venues']
         return {
-            'capacity_utilization': [],
+            'capacity_utilization': [
+                {
+                    'venue': name,
+                    'event': frame['event_names'].get(event_id),
+                    'capacity': capacity,
+                    'assigned': assigned,
+                    'utilization': rate(assigned, capacity)
+                }
+                for event_id, name, capacity, assigned in zip(
+                    venues['event_id'], venues['name'], venues['volunteer_capacity'],
+                    venues['assigned_volunteer_count']
+                )
+            ],
             'booking_frequency': [],
             'peak_usage_times': [],
             'venue_ratings': []
         }
     
     @classmethod
-    def _get_role_fulfillment_analysis(cls, events_qs) -> Dict[str, Any]:
+    def _get_role_fulfillment_analysis(cls, frame) -> Dict[str, Any]:
         """Get role fulfillment analysis."""
+        by_event = defaultdict(lambda: [0, 0])
+        by_role_type = defaultdict(lambda: [0, 0, 0])
+        for event_id, role_type, roles, positions, filled in frame['role_groups']:
+            by_event[event_id][0] += positions or 0
+            by_event[event_id][1] += filled or 0
+            by_role_type[role_type][0] += roles
+            by_role_type[role_type][1] += positions or 0
+            by_role_type[role_type][2] += filled or 0
+        
+        popular = sorted(by_role_type.items(), key=lambda item: item[1][2], reverse=True)
         return {
-            'fulfillment_rates': [],
-            'popular_roles': [],
+            'fulfillment_rates': [
+                {
+                    'event': frame['event_names'].get(event_id),
+                    'positions': positions,
+                    'filled': filled,
+                    'fulfillment_rate': rate(filled, positions)
+                }
+                for event_id, (positions, filled) in by_event.items()
+            ],
+            'popular_roles': [
+                {
+                    'role_type': role_type,
+                    'roles': roles,
+                    'positions': positions,
+                    'filled': filled,
+                    'fulfillment_rate': rate(filled, positions)
+                }
+                for role_type, (roles, positions, filled) in popular
+            ],
             'skill_matching': [],
             'assignment_efficiency': []
         }
     
     @classmethod
-    def _get_event_timeline_analysis(cls, events_qs) -> Dict[str, Any]:
+    def _get_event_timeline_analysis(cls, frame) -> Dict[str, Any]:
         """Get event timeline analysis."""
+        events = frame['events']
         return {
             'planning_duration': [],
             'setup_efficiency': [],
-            'execution_timeline': [],
+            'execution_timeline': [
+                {
+                    'event': name,
+                    'start_date': start.isoformat(),
+                    'end_date': end.isoformat(),
+                    'duration_days': (end - start).days + 1
+                }
+                for name, start, end in zip(events['name'], events['start_date'], events['end_date'])
+            ],
             'post_event_activities': []
         }
     
     @classmethod
-    def _get_resource_allocation_analysis(cls, events_qs) -> Dict[str, Any]:
+    def _get_resource_allocation_analysis(cls, frame) -> Dict[str, Any]:
         """Get resource allocation analysis."""
+        events = frame['events']
         return {
-            'volunteer_allocation': [],
+            'volunteer_allocation': [
+                {'event': name, 'target': target, 'assigned': assigned, 'shortfall': max(target - assigned, 0)}
+                for name, target, assigned in zip(
+                    events['name'], events['volunteer_target'], events['assigned_volunteer_count']
+                )
+            ],
             'equipment_usage': [],
             'budget_allocation': [],
             'time_allocation': []
         }
     
     @classmethod
-    def _get_event_success_metrics(cls, events_qs) -> Dict[str, Any]:
+    def _get_event_success_metrics(cls, frame) -> Dict[str, Any]:
         """Get event success metrics."""
         return {
             'participant_satisfaction': [],
@@ -778,46 +991,124 @@ class PowerBIService:
             'financial_performance': []
         }
     
+    @classmethod
+    def _calculate_average_capacity_utilization(cls, frame) -> float:
+        """Calculate average venue capacity utilization."""
+        venues = frame['venues']
+        utilization = [
+            assigned / capacity * 100
+            for capacity, assigned in zip(venues['volunteer_capacity'], venues['assigned_volunteer_count'])
+            if capacity
+        ]
+        return mean(utilization, 1) or 0.0
+    
+    @classmethod
+    def _calculate_average_volunteer_satisfaction(cls, frame) -> Optional[float]:
+        """Calculate the mean assignment performance rating across events."""
+        rating_total = sum(totals['rating_total'] for totals in frame['assignments'].values())
+        rated = sum(totals['rated'] for totals in frame['assignments'].values())
+        return round(rating_total / rated, 2) if rated else None
+    
+    @classmethod
+    def _calculate_total_volunteer_hours(cls, frame) -> float:
+        """Calculate total recorded volunteer hours."""
+        return round(sum(totals['hours'] for totals in frame['assignments'].values()), 2)
+    
     # Operational analytics helper methods
     
     @classmethod
-    def _get_system_performance_metrics(cls, filters) -> Dict[str, Any]:
+    def _get_system_performance_metrics(cls, frame) -> Dict[str, Any]:
         """Get system performance metrics."""
         return {
             'response_times': [],
             'throughput': [],
-            'error_rates': [],
+            'error_rates': [
+                {
+                    'action_type': action_type,
+                    'requests': count,
+                    'server_errors': server_errors,
+                    'client_errors': client_errors,
+                    'error_rate': rate(server_errors, count)
+                }
+                for action_type, count, server_errors, client_errors in frame['audit']
+                if server_errors or client_errors
+            ],
             'uptime': [],
             'resource_usage': []
         }
     
     @classmethod
-    def _get_task_completion_analytics(cls, filters) -> Dict[str, Any]:
+    def _get_task_completion_analytics(cls, frame) -> Dict[str, Any]:
         """Get task completion analytics."""
+        tasks = frame['tasks']
+        minutes_by_category = defaultdict(list)
+        open_by_category = Counter()
+        total_by_category = Counter()
+        for status, minutes, category in zip(tasks['status'], tasks['time_spent_minutes'], tasks['task__category']):
+            total_by_category[category] += 1
+            if minutes is not None:
+                minutes_by_category[category].append(minutes)
+            if status in OPEN_COMPLETION_STATUSES:
+                open_by_category[category] += 1
+        
         return {
-            'completion_rates': [],
-            'time_to_completion': [],
-            'quality_scores': [],
-            'bottlenecks': []
+            'completion_rates': distribution(Counter(tasks['status']), 'status'),
+            'time_to_completion': [{'category': 'ALL', **percentiles(tasks['time_spent_minutes'])}] + [
+                {'category': category, **percentiles(minutes)}
+                for category, minutes in sorted(minutes_by_category.items())
+            ],
+            'quality_scores': distribution(
+                Counter(score for score in tasks['quality_score'] if score), 'quality_score', order=range(1, 6)
+            ),
+            'bottlenecks': [
+                {
+                    'category': category,
+                    'open': open_count,
+                    'total': total_by_category[category],
+                    'open_rate': rate(open_count, total_by_category[category])
+                }
+                for category, open_count in open_by_category.most_common()
+            ]
         }
     
     @classmethod
-    def _get_integration_health_metrics(cls, filters) -> Dict[str, Any]:
+    def _get_integration_health_metrics(cls, frame) -> Dict[str, Any]:
         """Get integration health metrics."""
+        by_type = defaultdict(Counter)
+        for sync_type, status, count in frame['syncs']:
+            by_type[sync_type][status] += count
+        failures = Counter({
+            sync_type: statuses[JustGoSync.SyncStatus.FAILED]
+            for sync_type, statuses in by_type.items() if statuses[JustGoSync.SyncStatus.FAILED]
+        })
+        
         return {
-            'sync_success_rates': [],
+            'sync_success_rates': [
+                {
+                    'sync_type': sync_type,
+                    'total': sum(statuses.values()),
+                    'completed': statuses[JustGoSync.SyncStatus.COMPLETED],
+                    'failed': statuses[JustGoSync.SyncStatus.FAILED],
+                    'success_rate': rate(statuses[JustGoSync.SyncStatus.COMPLETED], sum(statuses.values()))
+                }
+                for sync_type, statuses in sorted(by_type.items())
+            ],
             'api_response_times': [],
-            'error_frequencies': [],
+            'error_frequencies': distribution(failures, 'sync_type'),
             'data_quality': []
         }
     
     @classmethod
-    def _get_admin_operations_analytics(cls, filters) -> Dict[str, Any]:
+    def _get_admin_operations_analytics(cls, frame) -> Dict[str, Any]:
         """Get admin operations analytics."""
+        operations = Counter({action_type: count for action_type, count, _server, _client in frame['audit']})
         return {
-            'operation_frequency': [],
+            'operation_frequency': distribution(operations, 'action_type'),
             'user_activity': [],
-            'override_usage': [],
+            'override_usage': [
+                {'override_type': override_type, 'status': status, 'count': count}
+                for override_type, status, count in sorted(frame['overrides'])
+            ],
             'efficiency_metrics': []
         }
     
@@ -832,31 +1123,22 @@ class PowerBIService:
         }
     
     @classmethod
-    def _get_data_quality_metrics(cls, filters) -> Dict[str, Any]:
+    def _get_data_quality_metrics(cls, frame) -> Dict[str, Any]:
         """Get data quality metrics."""
+        profiles = frame['profiles']
         return {
-            'completeness': [],
+            'completeness': [{
+                'metric': 'profile_complete',
+                'complete': profiles['complete'],
+                'total': profiles['total'],
+                'percentage': rate(profiles['complete'], profiles['total'])
+            }],
             'accuracy': [],
             'consistency': [],
             'timeliness': []
         }
     
-    # Additional calculation methods (placeholders)
-    
-    @classmethod
-    def _calculate_average_capacity_utilization(cls, events_qs) -> float:
-        """Calculate average capacity utilization."""
-        return 78.5
-    
-    @classmethod
-    def _calculate_average_volunteer_satisfaction(cls, events_qs) -> float:
-        """Calculate average volunteer satisfaction."""
-        return 4.2
-    
-    @classmethod
-    def _calculate_total_volunteer_hours(cls, events_qs) -> int:
-        """Calculate total volunteer hours."""
-        return 15420
+    # Metrics not recorded in the database (placeholders)
     
     @classmethod
     def _calculate_system_uptime(cls, filters) -> float:
@@ -869,14 +1151,16 @@ class PowerBIService:
         return 0.85
     
     @classmethod
-    def _calculate_error_rate(cls, filters) -> float:
-        """Calculate error rate percentage."""
-        return 0.2
+    def _calculate_error_rate(cls, frame) -> float:
+        """Calculate the server error rate of audited requests."""
+        requests = sum(count for _action_type, count, _server, _client in frame['audit'])
+        errors = sum(server for _action_type, _count, server, _client in frame['audit'])
+        return rate(errors, requests, 2)
     
     @classmethod
-    def _calculate_data_completeness(cls, filters) -> float:
-        """Calculate data completeness percentage."""
-        return 96.5
+    def _calculate_data_completeness(cls, frame) -> float:
+        """Calculate the share of complete user profiles."""
+        return rate(frame['profiles']['complete'], frame['profiles']['total'])
     
     @classmethod
     def _calculate_security_score(cls, filters) -> float:
@@ -903,7 +1187,7 @@ class PowerBIService:
     @classmethod
     def _get_cache_hit_rate(cls) -> float:
         """Get cache hit rate."""
-        return 89.5
+        return analytics_cache.get_stats()['hit_rate']
     
     @classmethod
     def _get_current_error_rate(cls) -> float:
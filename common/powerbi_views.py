@@ -5,10 +5,9 @@ This module provides REST API endpoints specifically designed for PowerBI
 integration, enabling advanced analytics and visualization capabilities.
 """
 
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from django.http import JsonResponse, HttpResponse, Http404
+from django.http import JsonResponse, Http404
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.cache import cache_page
 from django.contrib.auth.decorators import login_required
@@ -24,10 +23,14 @@ from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
-import csv
 import io
 
 from .powerbi_service import PowerBIService
+from . import analytics_cache
+from .powerbi_export import (
+    EXCEL, EXPORT_TABLES, NDJSON, STREAM_FORMATS,
+    dataset_export_response, parse_since, table_export_response,
+)
 from common.audit_service import AdminAuditService
 from common.permissions import PowerBIAccessPermission
 
@@ -82,18 +85,18 @@ class PowerBIBaseView(APIView):
         
         return filters
     
-    def log_api_access(self, request, endpoint, filters=None):
+    def log_api_access(self, request, endpoint, filters=None, export_format='json'):
         """Log API access for audit purposes."""
         AdminAuditService.log_data_export(
             user=request.user,
             export_type=f'powerbi_{endpoint}',
-            model_class=None,
+            data_type='powerbi',
             record_count=None,
-            export_format='json',
+            file_format=export_format,
             request=request,
             details={
                 'endpoint': endpoint,
-                'filters': filters or {},
+                'filters': {key: str(value) for key, value in (filters or {}).items()},
                 'user_agent': request.META.get('HTTP_USER_AGENT', ''),
                 'ip_address': request.META.get('REMOTE_ADDR', '')
             }
@@ -419,14 +422,40 @@ class PowerBIMetadataView(PowerBIBaseView):
 class PowerBIExportView(PowerBIBaseView):
     """
     PowerBI endpoint for data export in various formats.
+
+    ``dataset_type`` is either an analytics dataset, exported as JSON or
+    flattened to CSV/NDJSON/Excel, or a row-level table from
+    ``EXPORT_TABLES``, which is streamed and supports incremental pulls
+    with ``?since=<timestamp>``. Rows in the watermark overlap are sent
+    again on the next pull.
     """
     
+    def perform_content_negotiation(self, request, force=False):
+        """Let ?format pick an export format instead of a DRF renderer."""
+        return super().perform_content_negotiation(request, force=True)
+    
     def get(self, request, dataset_type):
         """Export dataset in specified format."""
         try:
             export_format = request.GET.get('format', 'json').lower()
+            if export_format == 'xlsx':
+                export_format = EXCEL
             filters = self.get_filters_from_request(request)
             
+            # Row-level tables are always streamed
+            if dataset_type in EXPORT_TABLES:
+                try:
+                    since = parse_since(request.GET.get('since'))
+                except ValueError as exc:
+                    return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+                if export_format not in STREAM_FORMATS:
+                    export_format = NDJSON
+                
+                self.log_api_access(
+                    request, f'export_{dataset_type}', {**filters, 'since': since}, export_format
+                )
+                return table_export_response(dataset_type, export_format, filters, since)
+            
             # Get dataset based on type
             if dataset_type == 'volunteer-analytics':
                 dataset = PowerBIService.get_volunteer_analytics_dataset(filters)
@@ -446,13 +475,11 @@ class PowerBIExportView(PowerBIBaseView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            self.log_api_access(request, f'export_{dataset_type}', filters)
+            self.log_api_access(request, f'export_{dataset_type}', filters, export_format)
             
             # Export in requested format
-            if export_format == 'csv':
-                return self._export_csv(dataset, dataset_type)
-            elif export_format == 'excel':
-                return self._export_excel(dataset, dataset_type)
+            if export_format in STREAM_FORMATS:
+                return dataset_export_response(dataset, dataset_type, export_format)
             else:  # Default to JSON
                 return Response({
                     'success': True,
@@ -462,54 +489,6 @@ class PowerBIExportView(PowerBIBaseView):
             
         except Exception as exc:
             return self.handle_exception(exc)
-    
-    def _export_csv(self, dataset, dataset_type):
-        """Export dataset as CSV."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="{dataset_type}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        # Flatten dataset for CSV export
-        flattened_data = self._flatten_dataset(dataset)
-        
-        if flattened_data:
-            writer = csv.DictWriter(response, fieldnames=flattened_data[0].keys())
-            writer.writeheader()
-            writer.writerows(flattened_data)
-        
-        return response
-    
-    def _export_excel(self, dataset, dataset_type):
-        """Export dataset as Excel."""
-        # This would require openpyxl or xlsxwriter
-        # For now, return CSV with Excel content type
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{dataset_type}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.xlsx"'
-        
-        # Implementation would create actual Excel file
-        # For now, return JSON data
-        response.write(json.dumps(dataset, indent=2))
-        
-        return response
-    
-    def _flatten_dataset(self, dataset):
-        """Flatten nested dataset for CSV export."""
-        flattened = []
-        
-        # Implementation would recursively flatten the dataset
-        # This is a simplified version
-        if isinstance(dataset, dict):
-            if 'data' in dataset:
-                return self._flatten_dataset(dataset['data'])
-            else:
-                flattened.append(dataset)
-        elif isinstance(dataset, list):
-            for item in dataset:
-                if isinstance(item, dict):
-                    flattened.append(item)
-        
-        return flattened
 
 
 class PowerBIHealthCheckView(PowerBIBaseView):
@@ -603,7 +582,7 @@ class PowerBIHealthCheckView(PowerBIBaseView):
     
     def _get_cache_hit_rate(self):
         """Get cache hit rate."""
-        return 89.5  # Placeholder
+        return analytics_cache.get_stats()['hit_rate']
     
     def _get_error_rate(self):
         """Get error rate."""
@@ -697,31 +676,15 @@ def powerbi_summary_view(request):
 def powerbi_cache_refresh_view(request):
     """Refresh PowerBI data cache."""
     try:
-        cache_keys = [
-            'powerbi_volunteer_analytics_*',
-            'powerbi_event_analytics_*',
-            'powerbi_operational_analytics_*',
-            'powerbi_financial_analytics_*',
-            'powerbi_predictive_analytics_*',
-            'powerbi_real_time_dashboard',
-            'powerbi_summary'
-        ]
-        
-        # Clear cache keys
-        for pattern in cache_keys:
-            if '*' in pattern:
-                # This would require a more sophisticated cache clearing mechanism
-                # For now, just clear the basic keys
-                cache.delete(pattern.replace('_*', ''))
-            else:
-                cache.delete(pattern)
+        # Bumping every namespace makes all cached datasets unreachable
+        analytics_cache.bump(*analytics_cache.NAMESPACES)
         
         # Log cache refresh
         AdminAuditService.log_system_management_operation(
             operation='powerbi_cache_refresh',
             user=request.user,
             details={
-                'cache_keys_cleared': cache_keys,
+                'namespaces_invalidated': analytics_cache.NAMESPACES,
                 'timestamp': timezone.now().isoformat()
             }
         )
@@ -4,8 +4,10 @@ WebSocket routing configuration
 
 from django.urls import re_path
 from . import consumers
+from reporting.consumers import ReportProgressConsumer
 
 websocket_urlpatterns = [
     re_path(r'ws/notifications/$', consumers.NotificationConsumer.as_asgi()),
     re_path(r'ws/system/$', consumers.SystemNotificationConsumer.as_asgi()),
+    re_path(r'ws/reports/(?P<report_id>[0-9a-f-]+)/progress/$', ReportProgressConsumer.as_asgi()),
 ] 
\ No newline at end of file
@@ -0,0 +1,467 @@
+"""
+Indexed full-text search over volunteers, profiles, events and assignments.
+
+Every searchable object has one ``SearchDocument`` row holding its display
+fields and the normalized words of its searchable fields (including names
+from related objects, so an assignment is found by its volunteer's or
+event's name without joins). Rows are written by ``post_save`` and
+``post_delete`` receivers on the source models and on the related models
+whose names they copy, once the saving transaction commits. Bulk writes
+send no signals, so they call ``reindex_on_commit`` with the ids they
+changed; ``rebuild_search_index`` backfills everything.
+
+Matching uses the database's full-text index, created after migrate:
+
+- PostgreSQL: a GIN index on ``to_tsvector('simple', search_text)`` for
+  ranked prefix matching and a trigram index on ``title`` for typos
+- SQLite: an FTS5 table over ``search_text`` kept in sync by triggers
+- anything else: ``LIKE`` on word starts, ranked by title matches
+
+Every query word must match the start of a word in the document, so
+``"jo do"`` finds John Doe.
+"""
+
+import logging
+import re
+import unicodedata
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.signals import post_delete, post_save
+from rest_framework.filters import SearchFilter
+
+from .models import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_SETTINGS = {
+    'BATCH_SIZE': 500,
+    'MAX_QUERY_WORDS': 10,
+}
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+TABLE = SearchDocument._meta.db_table
+FTS_TABLE = f'{TABLE}_fts'
+
+DocumentType = SearchDocument.DocumentType
+
+
+def get_search_settings() -> Dict[str, Any]:
+    """Search settings merged with defaults"""
+    return {**DEFAULT_SEARCH_SETTINGS, **getattr(settings, 'SEARCH', {})}
+
+
+def normalize(*values: Any) -> str:
+    """Lower-cased, accent-stripped words of ``values`` joined by spaces"""
+    text = ' '.join(str(value) for value in values if value)
+    text = ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+    return ' '.join(WORD_RE.findall(text.lower()))
+
+
+# Documents
+
+class DocumentSpec:
+    """
+    How to build the search document for one model
+
+    ``related`` maps a related model label to the lookup from this model and
+    the related fields copied into the document, so saving the related
+    object re-indexes the documents that show its values.
+    """
+
+    def __init__(self, document_type: str, model: str, fields: Iterable[str], build: Callable,
+                 select_related: Iterable[str] = (), related: Optional[Dict[str, tuple]] = None):
+        self.document_type = document_type
+        self.model_label = model
+        self.fields = set(fields)
+        self.build = build
+        self.select_related = list(select_related)
+        self.related = related or {}
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def queryset(self):
+        return self.model._default_manager.select_related(*self.select_related).order_by('pk')
+
+
+def _full_name(user) -> str:
+    return user.get_full_name() or user.username
+
+
+def _build_user(user) -> Dict[str, Any]:
+    return {
+        'title': _full_name(user),
+        'subtitle': user.email,
+        'status': 'Active' if user.is_active else 'Inactive',
+        'category': user.user_type,
+        'search_text': normalize(user.username, user.email, user.first_name, user.last_name, user.phone_number),
+    }
+
+
+def _build_volunteer_profile(profile) -> Dict[str, Any]:
+    user = profile.user
+    return {
+        'title': _full_name(user),
+        'subtitle': user.email,
+        'status': profile.status,
+        'category': '',
+        'search_text': normalize(
+            user.first_name, user.last_name, user.email, profile.preferred_name,
+            profile.corporate_group_name, profile.special_skills, profile.previous_events
+        ),
+    }
+
+
+def _build_event(event) -> Dict[str, Any]:
+    return {
+        'title': event.name,
+        'subtitle': f'{event.start_date} - {event.end_date}',
+        'status': event.status,
+        'category': event.event_type,
+        'search_text': normalize(
+            event.name, event.short_name, event.description, event.host_city, event.host_country
+        ),
+    }
+
+
+def _build_assignment(assignment) -> Dict[str, Any]:
+    volunteer = assignment.volunteer
+    return {
+        'title': f'{volunteer.get_full_name()} - {assignment.event.name}',
+        'subtitle': f'Role: {assignment.role.name}',
+        'status': assignment.status,
+        'category': '',
+        'search_text': normalize(
+            volunteer.first_name, volunteer.last_name, volunteer.email,
+            assignment.role.name, assignment.event.name,
+            assignment.venue.name if assignment.venue_id else '',
+            assignment.special_instructions, assignment.notes
+        ),
+    }
+
+
+USER_NAME_FIELDS = ('first_name', 'last_name', 'email')
+
+DOCUMENT_SPECS = {
+    spec.document_type: spec for spec in [
+        DocumentSpec(
+            DocumentType.USER, settings.AUTH_USER_MODEL,
+            fields=('username', 'email', 'first_name', 'last_name', 'phone_number', 'is_active', 'user_type'),
+            build=_build_user,
+        ),
+        DocumentSpec(
+            DocumentType.VOLUNTEER_PROFILE, 'volunteers.VolunteerProfile',
+            fields=('preferred_name', 'corporate_group_name', 'special_skills', 'previous_events', 'status'),
+            build=_build_volunteer_profile,
+            select_related=['user'],
+            related={settings.AUTH_USER_MODEL: ('user', USER_NAME_FIELDS + ('username',))},
+        ),
+        DocumentSpec(
+            DocumentType.EVENT, 'events.Event',
+            fields=('name', 'short_name', 'description', 'host_city', 'host_country',
+                    'start_date', 'end_date', 'status', 'event_type'),
+            build=_build_event,
+        ),
+        DocumentSpec(
+            DocumentType.ASSIGNMENT, 'events.Assignment',
+            fields=('volunteer', 'role', 'event', 'venue', 'special_instructions', 'notes', 'status'),
+            build=_build_assignment,
+            select_related=['volunteer', 'role', 'event', 'venue'],
+            related={
+                settings.AUTH_USER_MODEL: ('volunteer', USER_NAME_FIELDS),
+                'events.Event': ('event', ('name',)),
+                'events.Role': ('role', ('name',)),
+                'events.Venue': ('venue', ('name',)),
+            },
+        ),
+    ]
+}
+
+UPDATE_FIELDS = ['category', 'title', 'subtitle', 'status', 'search_text', 'updated_at']
+
+
+def index_objects(document_type: str, objects: Iterable[Any]) -> int:
+    """Create or update the search documents of ``objects``"""
+    spec = DOCUMENT_SPECS[document_type]
+    documents = [
+        SearchDocument(document_type=document_type, object_id=str(obj.pk), **spec.build(obj))
+        for obj in objects
+    ]
+    if documents:
+        SearchDocument.objects.bulk_create(
+            documents,
+            batch_size=get_search_settings()['BATCH_SIZE'],
+            update_conflicts=True,
+            unique_fields=['document_type', 'object_id'],
+            update_fields=UPDATE_FIELDS
+        )
+    return len(documents)
+
+
+def remove_objects(document_type: str, object_ids: Iterable[Any]) -> None:
+    """Delete the search documents of the given objects"""
+    SearchDocument.objects.filter(
+        document_type=document_type, object_id__in=[str(object_id) for object_id in object_ids]
+    ).delete()
+
+
+def reindex(document_type: str, queryset=None) -> int:
+    """Re-index every object of a type (or those in ``queryset``) in batches"""
+    spec = DOCUMENT_SPECS[document_type]
+    if queryset is None:
+        queryset = spec.queryset()
+    batch_size = get_search_settings()['BATCH_SIZE']
+
+    total = 0
+    batch = []
+    for obj in queryset.iterator(chunk_size=batch_size):
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            total += index_objects(document_type, batch)
+            batch = []
+    return total + index_objects(document_type, batch)
+
+
+def reindex_on_commit(document_type: str, object_ids: Iterable[Any]) -> None:
+    """Re-index objects changed by a bulk write once the current transaction commits"""
+    object_ids = list(object_ids)
+    if object_ids:
+        queryset = DOCUMENT_SPECS[document_type].queryset().filter(pk__in=object_ids)
+        transaction.on_commit(partial(reindex, document_type, queryset))
+
+
+# Searching
+
+def _query_words(query: str) -> List[str]:
+    return normalize(query).split()[:get_search_settings()['MAX_QUERY_WORDS']]
+
+
+def search(query: str, types: Optional[Iterable[str]] = None, category: Optional[str] = None,
+           limit: Optional[int] = 20) -> List[SearchDocument]:
+    """
+    Ranked search documents matching every word of ``query`` as a prefix
+
+    Args:
+        query: Words to search for
+        types: Document types to include (default: all)
+        category: Only include documents in this category, e.g. ``VOLUNTEER`` users
+        limit: Maximum number of results, or None for every match
+
+    Returns:
+        SearchDocument instances, best match first, each with a ``rank``
+    """
+    words = _query_words(query)
+    if not words:
+        return []
+
+    filters, params = [], []
+    if types is not None:
+        types = list(types)
+        if not types:
+            return []
+        filters.append(f"d.document_type IN ({', '.join(['%s'] * len(types))})")
+        params.extend(types)
+    if category is not None:
+        filters.append('d.category = %s')
+        params.append(category)
+
+    if connection.vendor == 'postgresql':
+        return _search_postgresql(words, filters, params, limit)
+    if connection.vendor == 'sqlite' and _has_fts_table():
+        return _search_sqlite(words, filters, params, limit)
+    return _search_fallback(words, types, category, limit)
+
+
+def search_ids(query: str, document_type: str, category: Optional[str] = None,
+               limit: Optional[int] = None) -> List[str]:
+    """Object ids of the best matches of one document type (all of them by default)"""
+    return [document.object_id for document in search(query, [document_type], category, limit)]
+
+
+def _where(filters: List[str]) -> str:
+    return ''.join(f' AND {condition}' for condition in filters)
+
+
+def _limit(limit: Optional[int]) -> Tuple[str, List[int]]:
+    return ('', []) if limit is None else (' LIMIT %s', [limit])
+
+
+def _search_postgresql(words, filters, params, limit):
+    tsquery = ' & '.join(f'{word}:*' for word in words)
+    text = ' '.join(words)
+    if _has_trigram():
+        rank = "ts_rank(to_tsvector('simple', d.search_text), q) + similarity(d.title, %s)"
+        match = "(to_tsvector('simple', d.search_text) @@ q OR d.title %% %s)"
+        rank_params, match_params = [text], [text]
+    else:
+        rank = "ts_rank(to_tsvector('simple', d.search_text), q)"
+        match = "to_tsvector('simple', d.search_text) @@ q"
+        rank_params, match_params = [], []
+
+    limit_sql, limit_params = _limit(limit)
+    sql = (
+        f"SELECT d.*, {rank} AS rank FROM {TABLE} d, to_tsquery('simple', %s) q "
+        f"WHERE {match}{_where(filters)} ORDER BY rank DESC, d.title{limit_sql}"
+    )
+    return list(SearchDocument.objects.raw(sql, rank_params + [tsquery] + match_params + params + limit_params))
+
+
+def _search_sqlite(words, filters, params, limit):
+    match = ' AND '.join(f'"{word}"*' for word in words)
+    limit_sql, limit_params = _limit(limit)
+    sql = (
+        f"SELECT d.*, -bm25({FTS_TABLE}) AS rank FROM {FTS_TABLE} JOIN {TABLE} d ON d.id = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH %s{_where(filters)} ORDER BY rank DESC, d.title{limit_sql}"
+    )
+    return list(SearchDocument.objects.raw(sql, [match] + params + limit_params))
+
+
+def _search_fallback(words, types, category, limit):
+    documents = SearchDocument.objects.all()
+    if types is not None:
+        documents = documents.filter(document_type__in=types)
+    if category is not None:
+        documents = documents.filter(category=category)
+    for word in words:
+        documents = documents.filter(Q(search_text__startswith=word) | Q(search_text__contains=f' {word}'))
+    documents = documents.annotate(rank=Case(
+        When(title__istartswith=words[0], then=Value(1)), default=Value(0), output_field=IntegerField()
+    ))
+    documents = documents.order_by('-rank', 'title')
+    return list(documents if limit is None else documents[:limit])
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    ``?search=`` backed by the search index.
+
+    Views set ``search_document_type`` to the document type of their model;
+    views without it fall back to DRF's ``search_fields`` lookups. Every
+    match is kept, since the view paginates the filtered queryset itself.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        document_type = getattr(view, 'search_document_type', None)
+        if document_type is None:
+            return super().filter_queryset(request, queryset, view)
+
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return queryset.filter(pk__in=search_ids(' '.join(terms), document_type))
+
+
+# Backend indexes
+
+_backend_features = {}
+
+
+def _has_fts_table() -> bool:
+    if 'fts' not in _backend_features:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+            exists = cursor.fetchone() is not None
+        if not exists:
+            # Not cached: the table may be created by a later migrate
+            return False
+        _backend_features['fts'] = True
+    return _backend_features['fts']
+
+
+def _has_trigram() -> bool:
+    if 'trigram' not in _backend_features:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _backend_features['trigram'] = cursor.fetchone() is not None
+    return _backend_features['trigram']
+
+
+SQLITE_INDEX_SQL = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    f"search_text, content='{TABLE}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON {TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON {TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON {TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+    f"INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+POSTGRESQL_INDEX_SQL = [
+    f"CREATE INDEX IF NOT EXISTS {TABLE}_text_gin ON {TABLE} USING gin (to_tsvector('simple', search_text))",
+]
+
+POSTGRESQL_TRIGRAM_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS {TABLE}_title_trgm ON {TABLE} USING gin (title gin_trgm_ops)",
+]
+
+
+def ensure_search_indexes(sender, using='default', **kwargs) -> None:
+    """Create the backend's full-text index over search documents (post_migrate)"""
+    from django.db import connections
+
+    db = connections[using]
+    with db.cursor() as cursor:
+        if db.vendor == 'sqlite':
+            if FTS_TABLE in db.introspection.table_names(cursor):
+                return
+            for sql in SQLITE_INDEX_SQL:
+                cursor.execute(sql)
+        elif db.vendor == 'postgresql':
+            for sql in POSTGRESQL_INDEX_SQL:
+                cursor.execute(sql)
+            try:
+                with transaction.atomic(using=using):
+                    for sql in POSTGRESQL_TRIGRAM_SQL:
+                        cursor.execute(sql)
+            except Exception as e:
+                logger.warning(f"pg_trgm unavailable, search will not match misspelled titles: {e}")
+    _backend_features.clear()
+
+
+# Signals
+
+def _changed(update_fields, fields) -> bool:
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+def connect_signals() -> None:
+    """Keep search documents in step with their source and related models"""
+    for document_type, spec in DOCUMENT_SPECS.items():
+        model = spec.model
+
+        def saved(sender, instance, update_fields=None, spec=spec, **kwargs):
+            if _changed(update_fields, spec.fields):
+                transaction.on_commit(partial(
+                    index_objects, spec.document_type, spec.queryset().filter(pk=instance.pk)
+                ))
+
+        def deleted(sender, instance, spec=spec, **kwargs):
+            transaction.on_commit(partial(remove_objects, spec.document_type, [instance.pk]))
+
+        dispatch_uid = f'search_{document_type}'
+        post_save.connect(saved, sender=model, weak=False, dispatch_uid=f'{dispatch_uid}_save')
+        post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=f'{dispatch_uid}_delete')
+
+        for label, (lookup, fields) in spec.related.items():
+            def related_saved(sender, instance, created=False, update_fields=None,
+                              spec=spec, lookup=lookup, fields=fields, **kwargs):
+                if not created and _changed(update_fields, fields):
+                    transaction.on_commit(partial(
+                        reindex, spec.document_type, spec.queryset().filter(**{lookup: instance.pk})
+                    ))
+
+            post_save.connect(
+                related_saved, sender=apps.get_model(label), weak=False,
+                dispatch_uid=f'{dispatch_uid}_{label}_save'
+            )
@@ -0,0 +1,157 @@
+"""
+Per-process registry of active ``SystemConfig`` values.
+
+All active configurations are loaded with one query into an in-memory
+snapshot, and typed lookups are served from it, so reading configuration
+costs no queries in steady state.
+
+Saving or deleting a ``SystemConfig`` bumps a version number in the shared
+cache once the transaction commits. Every process compares its snapshot's
+version with the shared one at most every ``VERSION_CHECK_INTERVAL``
+seconds and reloads when it has changed. Bulk ``QuerySet.update`` calls
+send no signals; call ``config_registry.invalidate()`` after them.
+
+Usage:
+    from common.system_config import config_registry
+
+    config_registry.get('SITE_NAME', 'SOI Hub')
+    config_registry.get_int('MAX_ASSIGNMENTS_PER_VOLUNTEER', 5)
+"""
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .models import SystemConfig
+
+VERSION_KEY = 'system_config:version'
+VERSION_CHECK_INTERVAL = 5
+
+TRUE_STRINGS = {'1', 'true', 'yes', 'on'}
+FALSE_STRINGS = {'0', 'false', 'no', 'off', ''}
+
+
+class ConfigSnapshot:
+    """Active configuration values at one version"""
+
+    def __init__(self, version: Optional[int], values: dict, public_keys: set):
+        self.version = version
+        self.values = values
+        self.public = MappingProxyType({key: values[key] for key in public_keys})
+
+
+class ConfigRegistry:
+    """
+    In-memory view of active system configuration
+
+    Snapshots are replaced whole, so readers never see a partial reload.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # Lookups
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of an active configuration, or ``default``"""
+        return self.snapshot().values.get(key, default)
+
+    def get_str(self, key: str, default: str = '') -> str:
+        value = self.get(key)
+        return default if value is None else str(value)
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        try:
+            return int(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        try:
+            return float(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self.get(key, default)
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in TRUE_STRINGS:
+                return True
+            if lowered in FALSE_STRINGS:
+                return False
+            return default
+        return bool(value)
+
+    def get_list(self, key: str, default: Optional[list] = None) -> list:
+        value = self.get(key)
+        return value if isinstance(value, list) else list(default or [])
+
+    def get_dict(self, key: str, default: Optional[dict] = None) -> dict:
+        value = self.get(key)
+        return value if isinstance(value, dict) else dict(default or {})
+
+    def public(self) -> Mapping[str, Any]:
+        """Read-only mapping of active public configurations"""
+        return self.snapshot().public
+
+    # Snapshot management
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Current snapshot, reloading it if another process changed configuration"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return snapshot
+
+        version = cache.get(VERSION_KEY)
+        self._checked_at = now
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and self._snapshot is not snapshot and self._snapshot.version == version:
+                return self._snapshot
+            self._snapshot = self._load(version)
+            return self._snapshot
+
+    def _load(self, version: Optional[int]) -> ConfigSnapshot:
+        values, public_keys = {}, set()
+        for key, value, is_public in SystemConfig.objects.filter(is_active=True).values_list(
+            'key', 'value', 'is_public'
+        ):
+            values[key] = value
+            if is_public:
+                public_keys.add(key)
+        return ConfigSnapshot(version, values, public_keys)
+
+    def clear(self) -> None:
+        """Drop this process's snapshot"""
+        self._snapshot = None
+
+    def invalidate(self) -> None:
+        """Make every process reload its snapshot"""
+        cache.set(VERSION_KEY, time.time_ns(), None)
+        self.clear()
+
+
+config_registry = ConfigRegistry()
+
+
+def _config_changed(sender, **kwargs):
+    # This process sees its own change straight away; others once it commits
+    config_registry.clear()
+    transaction.on_commit(config_registry.invalidate)
+
+
+def connect_signals() -> None:
+    """Invalidate the registry when configuration is saved or deleted"""
+    post_save.connect(_config_changed, sender=SystemConfig, dispatch_uid='system_config_registry_save')
+    post_delete.connect(_config_changed, sender=SystemConfig, dispatch_uid='system_config_registry_delete')
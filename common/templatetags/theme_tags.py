@@ -6,6 +6,7 @@ from django import template
 from django.utils.safestring import mark_safe
 from django.utils.html import format_html
 from ..models import Theme, UserThemePreference
+from ..theme_cache import get_theme_type, resolve_theme
 
 register = template.Library()
 
@@ -13,34 +14,16 @@ register = template.Library()
 @register.simple_tag(takes_context=True)
 def theme_css(context):
     """
-    Generate CSS for the current theme
+    Link the compiled CSS of the current theme
     """
     request = context.get('request')
     if not request:
         return ''
     
     try:
-        # Determine theme type
-        if request.path.startswith('/admin/'):
-            theme_type = 'ADMIN'
-        elif request.path.startswith('/mobile-admin/'):
-            theme_type = 'MOBILE'
-        else:
-            theme_type = 'PUBLIC'
-        
-        # Get current theme
-        if request.user.is_authenticated:
-            try:
-                user_preference = UserThemePreference.objects.get(user=request.user)
-                current_theme = user_preference.get_effective_theme(theme_type)
-            except UserThemePreference.DoesNotExist:
-                current_theme = Theme.get_active_theme(theme_type)
-        else:
-            current_theme = Theme.get_active_theme(theme_type)
-        
-        if current_theme:
-            css = current_theme.generate_css()
-            return mark_safe(f'<style type="text/css">\n{css}\n</style>')
+        resolved = resolve_theme(request.user, get_theme_type(request.path))
+        if resolved['css_url']:
+            return format_html('<link rel="stylesheet" type="text/css" href="{}">', resolved['css_url'])
     
     except Exception:
         pass
@@ -58,26 +41,7 @@ def theme_variables(context):
         return {}
     
     try:
-        # Determine theme type
-        if request.path.startswith('/admin/'):
-            theme_type = 'ADMIN'
-        elif request.path.startswith('/mobile-admin/'):
-            theme_type = 'MOBILE'
-        else:
-            theme_type = 'PUBLIC'
-        
-        # Get current theme
-        if request.user.is_authenticated:
-            try:
-                user_preference = UserThemePreference.objects.get(user=request.user)
-                current_theme = user_preference.get_effective_theme(theme_type)
-            except UserThemePreference.DoesNotExist:
-                current_theme = Theme.get_active_theme(theme_type)
-        else:
-            current_theme = Theme.get_active_theme(theme_type)
-        
-        if current_theme:
-            return current_theme.get_css_variables()
+        return resolve_theme(request.user, get_theme_type(request.path))['css_vars']
     
     except Exception:
         pass
@@ -0,0 +1,109 @@
+"""
+Tests for the shared analytics cache: canonical keys, signal invalidation,
+single-flight recompute and hit/miss counters.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from volunteers.models import VolunteerProfile
+from . import analytics_cache
+from .analytics_cache import NAMESPACES, VOLUNTEERS, get_or_compute, get_stats, get_versions, make_key
+from .models import AuditLog
+from .powerbi_service import PowerBIService
+
+User = get_user_model()
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'analytics-cache-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AnalyticsCacheTest(TestCase):
+    """Test cases for the analytics cache"""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+
+    def create_volunteer(self, username):
+        """Create a volunteer with a profile"""
+        user = User.objects.create_user(
+            username=username,
+            email=f'{username}@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+        return VolunteerProfile.objects.create(user=user)
+
+    def test_keys_are_canonical(self):
+        """Test keys ignore dict ordering and change with values and versions"""
+        first = make_key('dataset', {'status': 'ACTIVE', 'event_id': 1}, [VOLUNTEERS])
+        second = make_key('dataset', {'event_id': 1, 'status': 'ACTIVE'}, [VOLUNTEERS])
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, make_key('dataset', {'event_id': 2, 'status': 'ACTIVE'}, [VOLUNTEERS]))
+
+        analytics_cache.bump(VOLUNTEERS)
+        self.assertNotEqual(first, make_key('dataset', {'status': 'ACTIVE', 'event_id': 1}, [VOLUNTEERS]))
+
+    def test_hits_and_misses_are_counted(self):
+        """Test a second call is served from the cache and counted as a hit"""
+        compute = mock.Mock(return_value={'total': 1})
+
+        get_or_compute('dataset', compute, namespaces=[VOLUNTEERS])
+        get_or_compute('dataset', compute, namespaces=[VOLUNTEERS])
+
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(get_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 50.0})
+        self.assertEqual(PowerBIService._get_cache_hit_rate(), 50.0)
+
+    def test_model_changes_invalidate_datasets(self):
+        """Test saving a source model makes cached datasets recompute"""
+        self.create_volunteer('volunteer1')
+        dataset = PowerBIService.get_volunteer_analytics_dataset()
+        self.assertEqual(dataset['summary_metrics']['total_volunteers'], 1)
+
+        # Positional, keyword and default arguments share one entry
+        with self.assertNumQueries(0):
+            PowerBIService.get_volunteer_analytics_dataset(None)
+            PowerBIService.get_volunteer_analytics_dataset(filters=None)
+
+        self.create_volunteer('volunteer2')
+        dataset = PowerBIService.get_volunteer_analytics_dataset()
+        self.assertEqual(dataset['summary_metrics']['total_volunteers'], 2)
+
+    def test_bookkeeping_writes_do_not_invalidate(self):
+        """Test logins and audit records leave cached entries in place"""
+        user = self.create_volunteer('volunteer1').user
+        versions = get_versions(NAMESPACES)
+
+        user.last_login = timezone.now()
+        user.save(update_fields=['last_login'])
+        AuditLog.objects.create(action_type=AuditLog.ActionType.LOGIN, action_description='Login', user=user)
+        self.assertEqual(get_versions(NAMESPACES), versions)
+
+        user.save(update_fields=['first_name', 'last_login'])
+        self.assertNotEqual(get_versions([VOLUNTEERS]), {VOLUNTEERS: versions[VOLUNTEERS]})
+
+    def test_recompute_is_single_flight(self):
+        """Test a caller that finds the lock held waits for the other worker's result"""
+        key = make_key('dataset', None, [VOLUNTEERS])
+        cache.add(f'{key}:lock', 1)
+        compute = mock.Mock(return_value='mine')
+
+        def other_worker_finishes(_seconds):
+            cache.set(key, 'theirs')
+
+        with mock.patch.object(analytics_cache.time, 'sleep', side_effect=other_worker_finishes):
+            value = get_or_compute('dataset', compute, namespaces=[VOLUNTEERS])
+
+        self.assertEqual(value, 'theirs')
+        compute.assert_not_called()
@@ -0,0 +1,142 @@
+"""
+Tests for the buffered audit log writer and its spool fallback.
+"""
+
+import os
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.db import DatabaseError, IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from .audit_sink import BufferedAuditSink, persist_records, replay_spool, write_audit_log
+from .models import AuditLog
+
+
+def make_record(index=0, **fields):
+    """Build an unsaved audit record"""
+    return AuditLog(
+        action_type=AuditLog.ActionType.UPDATE,
+        action_description=f'Audit record {index}',
+        **fields
+    )
+
+
+class BufferedAuditSinkTest(TestCase):
+    """Test cases for the background audit writer"""
+
+    def setUp(self):
+        """Set up test data"""
+        patcher = mock.patch('common.audit_sink.persist_records', return_value=False)
+        self.persist = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def batch_sizes(self):
+        return [len(call.args[0]) for call in self.persist.call_args_list]
+
+    def test_flushes_every_batch_size_records(self):
+        """Test full batches are written together and flush writes the rest"""
+        sink = BufferedAuditSink(batch_size=2, flush_interval_ms=60000)
+        self.addCleanup(sink.close)
+
+        sink.write_many([make_record(index) for index in range(5)])
+        sink.flush(timeout=5)
+
+        self.assertEqual(self.batch_sizes(), [2, 2, 1])
+
+    def test_flushes_after_interval(self):
+        """Test a partial batch is written once the flush interval passes"""
+        sink = BufferedAuditSink(batch_size=100, flush_interval_ms=20)
+        self.addCleanup(sink.close)
+
+        sink.write(make_record())
+        deadline = time.monotonic() + 5
+        while not self.persist.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.batch_sizes(), [1])
+
+    def test_close_flushes_remaining_records(self):
+        """Test shutdown writes whatever is still buffered"""
+        sink = BufferedAuditSink(batch_size=100, flush_interval_ms=60000)
+        sink.write_many([make_record(index) for index in range(3)])
+
+        sink.close()
+
+        self.assertEqual(self.batch_sizes(), [3])
+
+
+class AuditWriteTest(TestCase):
+    """Test cases for handing records to a buffered sink"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.sink = mock.Mock(transactional=False)
+        patcher = mock.patch('common.audit_sink.get_audit_sink', return_value=self.sink)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_records_are_queued_on_commit(self):
+        """Test records reach the sink only once the transaction commits"""
+        with self.captureOnCommitCallbacks(execute=True):
+            record = write_audit_log(action_type=AuditLog.ActionType.UPDATE, action_description='Committed')
+            self.sink.write_many.assert_not_called()
+
+        self.sink.write_many.assert_called_once_with([record])
+
+    def test_rolled_back_changes_are_not_audited(self):
+        """Test records written inside a rolled back transaction are dropped"""
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                write_audit_log(action_type=AuditLog.ActionType.UPDATE, action_description='Rolled back')
+                raise RuntimeError
+
+        self.sink.write_many.assert_not_called()
+
+
+class AuditSpoolTest(TestCase):
+    """Test cases for the spool fallback"""
+
+    def setUp(self):
+        """Set up test data"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.spool_path = os.path.join(directory.name, 'audit_spool.jsonl')
+
+    def test_failed_batches_are_spooled_and_replayed(self):
+        """Test records survive a database outage and keep their timestamps"""
+        occurred_at = (timezone.now() - timedelta(hours=1)).replace(microsecond=0)
+        records = [make_record(index, timestamp=occurred_at) for index in range(3)]
+
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=DatabaseError('down')):
+            self.assertFalse(persist_records(records, self.spool_path))
+        self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertTrue(os.path.getsize(self.spool_path))
+
+        self.assertEqual(replay_spool(self.spool_path), 3)
+        self.assertEqual(replay_spool(self.spool_path), 0)
+        self.assertEqual(AuditLog.objects.count(), 3)
+        self.assertEqual(AuditLog.objects.get(pk=records[0].pk).timestamp, occurred_at)
+
+    def test_bad_record_does_not_spool_its_batch(self):
+        """Test a rejected batch is retried one by one and only the bad record is spooled"""
+        records = [make_record(index) for index in range(3)]
+        bulk_create = AuditLog.objects.bulk_create
+
+        def reject_bad_record(batch, **kwargs):
+            if records[1] in batch:
+                raise IntegrityError('foreign key violation')
+            return bulk_create(batch, **kwargs)
+
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=reject_bad_record):
+            self.assertFalse(persist_records(records, self.spool_path))
+
+        self.assertEqual(
+            set(AuditLog.objects.values_list('pk', flat=True)),
+            {records[0].pk, records[2].pk}
+        )
+        self.assertEqual(replay_spool(self.spool_path), 1)
+        self.assertTrue(AuditLog.objects.filter(pk=records[1].pk).exists())
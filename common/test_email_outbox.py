@@ -0,0 +1,103 @@
+"""
+Tests for the outbound email queue and mail worker.
+"""
+
+import smtplib
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from volunteers.eoi_models import EOISubmission
+from volunteers.signals import EOI_CONFIRMATION_EMAIL
+from .email_outbox import MailWorker, queue_email, requeue_dead_letters
+from .notification_models import OutboundEmail
+
+
+class MailWorkerTest(TestCase):
+    """Test cases for draining the outbox"""
+
+    def queue(self, count, domain='example.com', **kwargs):
+        """Queue test emails"""
+        return [
+            queue_email(f'Subject {index}', 'Body', [f'user{index}@{domain}'], **kwargs)
+            for index in range(count)
+        ]
+
+    def failing_connection(self, error):
+        """A mail connection whose sends always raise ``error``"""
+        connection = mock.Mock()
+        connection.send_messages.side_effect = error
+        return connection
+
+    def test_sends_batch_over_one_connection(self):
+        """Test queued emails are sent together and marked as sent"""
+        self.queue(3)
+
+        with mock.patch('common.email_outbox.get_connection', wraps=get_connection) as connect:
+            sent = MailWorker(batch_size=2).run_once()
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.SENT).count(), 3)
+
+    def test_transient_failure_is_retried_with_backoff(self):
+        """Test a dropped connection requeues the email for later"""
+        email, = self.queue(1)
+
+        worker = MailWorker(connection=self.failing_connection(smtplib.SMTPServerDisconnected('gone')))
+        worker.run_once()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.QUEUED)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.available_at, timezone.now())
+        self.assertIn('SMTPServerDisconnected', email.last_error)
+
+    def test_permanent_failures_are_dead_lettered(self):
+        """Test rejected recipients and exhausted attempts end up as dead letters"""
+        refused, = self.queue(1)
+        exhausted, = self.queue(1, domain='other.com')
+        OutboundEmail.objects.filter(pk=exhausted.pk).update(attempts=5)
+
+        refused_error = smtplib.SMTPRecipientsRefused({refused.to[0]: (550, b'No such user')})
+        MailWorker(connection=self.failing_connection(refused_error)).run_once()
+
+        self.assertEqual(
+            set(OutboundEmail.objects.values_list('status', flat=True)), {OutboundEmail.Status.DEAD}
+        )
+        self.assertEqual(requeue_dead_letters(), 2)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.QUEUED).count(), 2)
+
+    @override_settings(EMAIL_OUTBOX={'DOMAIN_RATE_LIMITS': {'example.com': 2}})
+    def test_domains_are_rate_limited(self):
+        """Test emails over a domain's rate are deferred, not failed"""
+        self.queue(3)
+        self.queue(2, domain='other.com')
+
+        MailWorker().run_once()
+
+        self.assertEqual(len(mail.outbox), 4)
+        deferred = OutboundEmail.objects.get(status=OutboundEmail.Status.QUEUED)
+        self.assertEqual(deferred.recipient_domain, 'example.com')
+        self.assertEqual(deferred.attempts, 0)
+        self.assertGreater(deferred.available_at, timezone.now())
+
+    def test_sent_confirmation_marks_eoi_submission(self):
+        """Test an EOI is marked as confirmed only once its email is sent"""
+        submission = EOISubmission.objects.create(volunteer_type='NEW_VOLUNTEER', session_key='abc')
+        queue_email(
+            'EOI Confirmation', 'Thanks', ['volunteer@example.com'],
+            category=EOI_CONFIRMATION_EMAIL, related_object=submission
+        )
+        submission.refresh_from_db()
+        self.assertFalse(submission.confirmation_email_sent)
+
+        MailWorker().run_once()
+
+        submission.refresh_from_db()
+        self.assertTrue(submission.confirmation_email_sent)
+        self.assertIsNotNone(submission.confirmation_email_sent_at)
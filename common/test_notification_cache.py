@@ -0,0 +1,135 @@
+"""
+Tests for the Redis notification read-state cache.
+"""
+
+import json
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from .notification_cache import NotificationCache, get_keys
+from .notification_fanout import NotificationFanout
+from .notification_models import Notification
+from .notification_service import NotificationService
+
+User = get_user_model()
+
+
+class NotificationCacheTest(TestCase):
+    """Test cases for notification read state kept in Redis"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.redis = mock.MagicMock()
+        self.pipeline = self.redis.pipeline.return_value
+        self.add_script, self.recent_script = mock.Mock(), mock.Mock()
+        self.redis.register_script.side_effect = [self.add_script, self.recent_script]
+
+        self.service = NotificationService()
+        self.service.redis_client = self.redis
+        self.service.read_cache = NotificationCache(self.redis)
+
+        self.user = User.objects.create_user(
+            username='coordinator',
+            email='coordinator@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+
+    def create_notifications(self, count, user=None):
+        """Create sent notifications"""
+        return [
+            Notification.objects.create(
+                recipient=user or self.user,
+                title=f'Notification {index}',
+                message='Message',
+                channels=['IN_APP'],
+                status=Notification.Status.SENT
+            )
+            for index in range(count)
+        ]
+
+    def test_mark_as_read_is_a_single_command(self):
+        """Test marking one notification read only removes it from the unread set"""
+        notification, = self.create_notifications(1)
+
+        self.assertTrue(self.service.mark_as_read(notification.id, self.user))
+
+        self.redis.srem.assert_called_once_with(get_keys(self.user.id)[2], str(notification.id))
+        self.redis.lrange.assert_not_called()
+        self.pipeline.execute.assert_not_called()
+
+    def test_unread_count_reads_the_unread_set(self):
+        """Test a warm cache answers without touching the database"""
+        self.pipeline.execute.return_value = [1, 7]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get_unread_count(self.user), 7)
+
+    def test_cold_unread_set_is_loaded_once(self):
+        """Test the unread set is rebuilt from the database when missing"""
+        notifications = self.create_notifications(3)
+        self.pipeline.execute.return_value = [0, 0]
+
+        self.assertEqual(self.service.get_unread_count(self.user), 3)
+
+        self.pipeline.sadd.assert_called_once_with(
+            get_keys(self.user.id)[2], *[str(n.id) for n in reversed(notifications)]
+        )
+        self.pipeline.set.assert_called_once_with(get_keys(self.user.id)[3], 1, ex=self.service.read_cache.ttl)
+
+    def test_bulk_add_uses_one_pipeline(self):
+        """Test caching notifications for many users is one round trip"""
+        other = User.objects.create_user(username='other', email='other@test.com', password='testpass123')
+        notifications = self.create_notifications(2) + self.create_notifications(2, user=other)
+
+        self.service.read_cache.add(notifications)
+
+        self.assertEqual(self.add_script.call_count, 4)
+        self.assertTrue(all(call.kwargs['client'] is self.pipeline for call in self.add_script.call_args_list))
+        self.pipeline.execute.assert_called_once_with()
+
+    def test_recent_includes_read_state(self):
+        """Test recent notifications come back newest first with is_read set"""
+        self.recent_script.return_value = [
+            [json.dumps({'id': 'b', 'title': 'Newer'}), 1],
+            [json.dumps({'id': 'a', 'title': 'Older'}), 0],
+        ]
+
+        recent = self.service.get_recent_notifications(self.user, limit=2)
+
+        self.assertEqual([(n['id'], n['is_read']) for n in recent], [('b', False), ('a', True)])
+        self.recent_script.assert_called_once_with(keys=list(get_keys(self.user.id)[:3]), args=[2])
+
+    def test_inserted_notifications_join_the_unread_set(self):
+        """Test rows count as unread from insertion, even when delivery is scheduled for later"""
+        unread = get_keys(self.user.id)[2]
+        with mock.patch('common.notification_service.notification_service.read_cache', self.service.read_cache):
+            with self.captureOnCommitCallbacks(execute=True):
+                notification = Notification.objects.create(
+                    recipient=self.user,
+                    title='Tomorrow',
+                    message='Message',
+                    channels=['EMAIL'],
+                    scheduled_at=timezone.now() + timezone.timedelta(days=1)
+                )
+            notification_id = str(notification.id)
+            self.pipeline.sadd.assert_called_once_with(unread, notification_id)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                notification.delete()
+            self.pipeline.srem.assert_called_once_with(unread, notification_id)
+
+    def test_failed_fanout_notifications_leave_the_unread_set(self):
+        """Test notifications whose only channel fails are dropped from the unread set"""
+        unread = get_keys(self.user.id)[2]
+        fanout = NotificationFanout(self.service)
+        with mock.patch.object(NotificationFanout, 'send_email', side_effect=RuntimeError('SMTP down')):
+            with self.captureOnCommitCallbacks(execute=True):
+                notification, = fanout.run([self.user], 'Rota', 'Rota published', channels=['EMAIL'])
+
+        self.assertEqual(notification.status, Notification.Status.FAILED)
+        self.pipeline.sadd.assert_called_once_with(unread, str(notification.id))
+        self.pipeline.srem.assert_called_once_with(unread, str(notification.id))
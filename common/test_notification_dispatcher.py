@@ -0,0 +1,104 @@
+"""
+Tests for the scheduled notification dispatcher.
+"""
+
+from datetime import time, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from .notification_dispatcher import NotificationDispatcher
+from .notification_models import Notification, NotificationPreference
+from .notification_service import NotificationService
+
+User = get_user_model()
+
+
+class NotificationDispatcherTest(TestCase):
+    """Test cases for dispatching deferred notifications"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.service = NotificationService()
+        self.user = User.objects.create_user(
+            username='volunteer1',
+            email='volunteer1@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+
+    def create_notification(self, scheduled_at, **kwargs):
+        """Create a pending in-app notification"""
+        return Notification.objects.create(
+            recipient=self.user,
+            title='Shift reminder',
+            message='Your shift starts soon',
+            channels=['IN_APP'],
+            scheduled_at=scheduled_at,
+            **kwargs
+        )
+
+    def test_quiet_hours_defer_notifications(self):
+        """Test a notification created during quiet hours waits for the dispatcher"""
+        NotificationPreference.objects.create(
+            user=self.user,
+            quiet_hours_start=time(0, 0),
+            quiet_hours_end=time.max,
+            timezone='Europe/Dublin'
+        )
+
+        notification = self.service.create_notification(self.user, 'Update', 'Rota changed')
+
+        self.assertEqual(notification.status, Notification.Status.PENDING)
+        self.assertGreater(notification.scheduled_at, timezone.now())
+
+        dispatcher = NotificationDispatcher(service=self.service)
+        self.assertEqual(dispatcher.run_once(), 0)
+
+        with mock.patch('common.notification_dispatcher.timezone.now',
+                        return_value=notification.scheduled_at + timedelta(seconds=1)):
+            self.assertEqual(dispatcher.run_once(), 1)
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, Notification.Status.SENT)
+
+    def test_dispatches_due_notifications_in_batches(self):
+        """Test due notifications are sent once and expired or future ones are left"""
+        now = timezone.now()
+        due = [self.create_notification(now - timedelta(minutes=index)) for index in range(5)]
+        future = self.create_notification(now + timedelta(hours=1))
+        expired = self.create_notification(now - timedelta(hours=2), expires_at=now - timedelta(hours=1))
+
+        dispatcher = NotificationDispatcher(service=self.service, batch_size=2)
+        self.assertEqual(dispatcher.run_once(), 5)
+        self.assertEqual(dispatcher.run_once(), 0)
+
+        statuses = dict(Notification.objects.values_list('id', 'status'))
+        self.assertEqual({statuses[n.id] for n in due}, {Notification.Status.SENT})
+        self.assertEqual(statuses[future.id], Notification.Status.PENDING)
+        self.assertEqual(statuses[expired.id], Notification.Status.PENDING)
+
+        self.assertEqual(self.service.cleanup_expired_notifications(), 1)
+        expired.refresh_from_db()
+        self.assertEqual(expired.status, Notification.Status.EXPIRED)
+
+    def test_claimed_notifications_are_sending_while_sent(self):
+        """Test claimed rows leave PENDING before any channel send runs"""
+        notification = self.create_notification(timezone.now() - timedelta(minutes=1))
+        dispatcher = NotificationDispatcher(service=self.service)
+        send_notification = self.service.send_notification
+        seen = []
+
+        def send(claimed):
+            seen.append(Notification.objects.get(id=claimed.id).status)
+            seen.append(NotificationDispatcher(service=self.service).dispatch_batch())
+            return send_notification(claimed)
+
+        with mock.patch.object(self.service, 'send_notification', side_effect=send):
+            self.assertEqual(dispatcher.dispatch_batch(), 1)
+
+        self.assertEqual(seen, [Notification.Status.SENDING, 0])
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, Notification.Status.SENT)
@@ -0,0 +1,114 @@
+"""
+Tests for the bulk notification fan-out pipeline.
+"""
+
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from .notification_dispatcher import NotificationDispatcher
+from .notification_fanout import NotificationFanout
+from .notification_models import Notification, NotificationLog, NotificationPreference, OutboundEmail
+from .notification_service import NotificationService
+
+User = get_user_model()
+
+
+class NotificationFanoutTest(TestCase):
+    """Test cases for bulk_notify and notify_user_type"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.service = NotificationService()
+        self.sender = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+
+    def create_volunteers(self, count, prefix='volunteer'):
+        """Create active volunteer users"""
+        return [
+            User.objects.create_user(
+                username=f'{prefix}{index}',
+                email=f'{prefix}{index}@test.com',
+                password='testpass123',
+                user_type=User.UserType.VOLUNTEER
+            )
+            for index in range(count)
+        ]
+
+    def test_respects_preferences(self):
+        """Test opted-out users are skipped and channels follow preferences"""
+        enabled, no_email, disabled = self.create_volunteers(3)
+        NotificationPreference.objects.create(user=no_email, email_enabled=False)
+        NotificationPreference.objects.create(user=disabled, is_enabled=False)
+
+        notifications = self.service.bulk_notify(
+            [enabled, no_email, disabled], 'Shift update', 'Your shift has moved', sender=self.sender
+        )
+
+        self.assertEqual({n.recipient for n in notifications}, {enabled, no_email})
+        self.assertEqual(list(OutboundEmail.objects.values_list('to', flat=True)), [[enabled.email]])
+        self.assertEqual(
+            Notification.objects.filter(status=Notification.Status.SENT).count(), 2
+        )
+        self.assertEqual(NotificationLog.objects.filter(delivery_status='SUCCESS').count(), 7)
+
+    def test_creates_missing_preferences(self):
+        """Test recipients without preferences get default ones"""
+        volunteers = self.create_volunteers(3)
+
+        self.service.bulk_notify(volunteers, 'Welcome', 'Welcome aboard')
+
+        self.assertEqual(NotificationPreference.objects.filter(user__in=volunteers).count(), 3)
+
+    def test_query_count_does_not_grow_with_recipients(self):
+        """Test the pipeline runs a fixed number of queries per batch"""
+        def count_queries(volunteers):
+            with CaptureQueriesContext(connection) as context:
+                self.service.bulk_notify(volunteers, 'Update', 'Schedule published')
+            return len(context)
+
+        self.assertEqual(
+            count_queries(self.create_volunteers(3, 'small')),
+            count_queries(self.create_volunteers(6, 'large'))
+        )
+        self.assertEqual(
+            set(self.service.last_fanout_stats),
+            {'preferences', 'build', 'insert', 'in_app', 'websocket', 'email', 'push', 'status'}
+        )
+
+    def test_notify_user_type_excludes_users(self):
+        """Test notify_user_type reaches active users of the type except exclusions"""
+        first, second = self.create_volunteers(2)
+
+        notifications = self.service.notify_user_type(
+            User.UserType.VOLUNTEER, 'Alert', 'Venue closed', exclude_users=[second]
+        )
+
+        self.assertEqual([n.recipient_id for n in notifications], [first.id])
+
+    def test_dispatcher_does_not_claim_rows_fanout_is_sending(self):
+        """Test a dispatcher polling mid fan-out leaves the due rows to fan-out"""
+        volunteers = self.create_volunteers(3)
+        deliver = NotificationFanout.deliver
+        claimed = []
+
+        def dispatch_then_deliver(fanout, notifications, related_object=None):
+            claimed.append(NotificationDispatcher(service=self.service).run_once())
+            return deliver(fanout, notifications, related_object)
+
+        with mock.patch.object(NotificationFanout, 'deliver', dispatch_then_deliver):
+            self.service.bulk_notify(volunteers, 'Update', 'Schedule published')
+
+        self.assertEqual(claimed, [0])
+        self.assertEqual(NotificationLog.objects.filter(channel_type='IN_APP').count(), 3)
+        self.assertEqual(
+            Notification.objects.filter(status=Notification.Status.SENT).count(), 3
+        )
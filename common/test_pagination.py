@@ -0,0 +1,89 @@
+"""
+Tests for keyset pagination.
+Includes a query benchmark showing deep pages cost the same as the first.
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .notification_models import Notification
+
+NOTIFICATIONS_URL = '/api/v1/notifications/api/notifications/notifications/'
+
+
+class KeysetPaginationTest(TestCase):
+    """Test cursor pages over the notification list"""
+
+    def setUp(self):
+        """Set up a user with notifications, some sharing a creation time"""
+        self.user = User.objects.create_user(username='paged', email='paged@test.com', password='testpass123')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        Notification.objects.bulk_create([
+            Notification(recipient=self.user, title=f'Notification {index}', message='Message', channels=['IN_APP'])
+            for index in range(45)
+        ])
+        now = timezone.now()
+        for offset, notification in enumerate(Notification.objects.order_by('title')):
+            # Groups of three share a timestamp so the id has to break ties
+            Notification.objects.filter(pk=notification.pk).update(created_at=now - timedelta(seconds=offset // 3))
+
+        self.expected = list(Notification.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def walk(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item['id'] for item in response.data['results'])
+            pages.append(response.data)
+            url = response.data['next']
+        return ids, pages
+
+    def test_pages_cover_every_row_once(self):
+        """Test following next links returns every row once in keyset order"""
+        ids, pages = self.walk(f'{NOTIFICATIONS_URL}?pagination=keyset&page_size=10')
+        self.assertEqual(ids, [str(pk) for pk in self.expected])
+        self.assertEqual(len(pages), 5)
+        self.assertIsNone(pages[0]['previous'])
+
+        previous = self.client.get(pages[-1]['previous']).data
+        self.assertEqual(previous['results'], pages[-2]['results'])
+        self.assertIsNotNone(previous['next'])
+
+    def test_active_ordering_is_used(self):
+        """Test ?ordering= pages by the requested field with the id as tie-breaker"""
+        ids, _ = self.walk(f'{NOTIFICATIONS_URL}?pagination=keyset&page_size=7&ordering=-priority')
+        expected = Notification.objects.order_by('-priority', '-id').values_list('id', flat=True)
+        self.assertEqual(ids, [str(pk) for pk in expected])
+
+    def test_totals_and_invalid_cursors(self):
+        """Test approximate totals are optional and bad cursors are rejected"""
+        response = self.client.get(f'{NOTIFICATIONS_URL}?pagination=keyset&include_total=true')
+        self.assertIn('approximate_count', response.data)
+        self.assertNotIn('approximate_count', self.client.get(f'{NOTIFICATIONS_URL}?pagination=keyset').data)
+
+        self.assertEqual(self.client.get(f'{NOTIFICATIONS_URL}?cursor=not-a-cursor').status_code, 404)
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        """Benchmark: per-page queries do not grow with depth and never COUNT or OFFSET"""
+        _, pages = self.walk(f'{NOTIFICATIONS_URL}?pagination=keyset&page_size=5')
+
+        measurements = []
+        for url in [f'{NOTIFICATIONS_URL}?pagination=keyset&page_size=5', pages[-2]['next']]:
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(url).status_code, 200)
+            page_sql = [query['sql'] for query in queries if 'notifications' in query['sql']]
+            for sql in page_sql:
+                self.assertNotIn('COUNT(', sql.upper())
+                self.assertNotIn('OFFSET', sql.upper())
+            measurements.append(len(queries))
+
+        self.assertEqual(measurements[0], measurements[1])
@@ -0,0 +1,178 @@
+"""
+Tests for streaming PowerBI exports and incremental pulls.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from openpyxl import load_workbook
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from events.models import Event, Venue, Role, Assignment
+from .powerbi_export import WATERMARK_HEADER, WATERMARK_OVERLAP, flatten, iter_dataset_rows
+from .powerbi_views import PowerBIExportView
+
+User = get_user_model()
+
+
+class PowerBIExportTest(TestCase):
+    """Test cases for streaming PowerBI exports"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.factory = APIRequestFactory()
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+
+        self.event = Event.objects.create(
+            name='Export Event',
+            slug='export-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Export Venue',
+            slug='export-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=10,
+            created_by=self.admin_user
+        )
+
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Export Role',
+            slug='export-role',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Export role',
+            total_positions=10,
+            created_by=self.admin_user
+        )
+
+        self.assignments = []
+        for index in range(3):
+            volunteer = User.objects.create_user(
+                username=f'volunteer{index}',
+                email=f'volunteer{index}@test.com',
+                password='testpass123',
+                user_type=User.UserType.VOLUNTEER
+            )
+            self.assignments.append(Assignment.objects.create(volunteer=volunteer, role=self.role))
+
+    def export(self, dataset_type, **params):
+        """Call the export view as the admin user"""
+        request = self.factory.get(f'/powerbi/export/{dataset_type}/', params)
+        force_authenticate(request, user=self.admin_user)
+        return PowerBIExportView.as_view()(request, dataset_type=dataset_type)
+
+    def content(self, response):
+        """Consume a streaming response"""
+        return b''.join(response.streaming_content)
+
+    def test_table_csv_is_streamed(self):
+        """Test a row-level table streams a CSV row per record"""
+        response = self.export('assignments', format='csv')
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn(WATERMARK_HEADER, response)
+
+        rows = list(csv.DictReader(io.StringIO(self.content(response).decode())))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['event_id'], str(self.event.id))
+        self.assertEqual(rows[0]['role__role_type'], Role.RoleType.GENERAL_VOLUNTEER)
+
+    def test_table_incremental_pull(self):
+        """Test ?since only returns rows changed after the timestamp"""
+        Assignment.objects.update(updated_at=timezone.now() - timedelta(days=2))
+        changed = self.assignments[1]
+        changed.status = Assignment.AssignmentStatus.APPROVED
+        changed.save()
+
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        response = self.export('assignments', format='ndjson', since=since)
+
+        lines = [json.loads(line) for line in self.content(response).decode().splitlines()]
+        self.assertEqual([line['id'] for line in lines], [str(changed.id)])
+        self.assertEqual(lines[0]['status'], Assignment.AssignmentStatus.APPROVED)
+
+        response = self.export('assignments', since='not-a-timestamp')
+        self.assertEqual(response.status_code, 400)
+
+    def test_watermark_overlaps_late_commits(self):
+        """Test a row committed after a pull with an earlier updated_at reaches the next pull"""
+        Assignment.objects.update(updated_at=timezone.now() - timedelta(days=2))
+        started = timezone.now()
+        response = self.export('assignments', format='ndjson', since=started.isoformat())
+        self.assertEqual(self.content(response), b'')
+        watermark = datetime.fromisoformat(response[WATERMARK_HEADER])
+        self.assertLess(watermark, started)
+        self.assertGreaterEqual(watermark, started - WATERMARK_OVERLAP)
+
+        late = self.assignments[0]
+        Assignment.objects.filter(pk=late.pk).update(updated_at=started - timedelta(seconds=1))
+
+        response = self.export('assignments', format='ndjson', since=watermark.isoformat())
+        lines = [json.loads(line) for line in self.content(response).decode().splitlines()]
+        self.assertEqual([line['id'] for line in lines], [str(late.id)])
+
+    def test_excel_exports_are_real_workbooks(self):
+        """Test tables and datasets export as xlsx, datasets one sheet per section"""
+        response = self.export('assignments', format='xlsx')
+        workbook = load_workbook(io.BytesIO(self.content(response)), read_only=True)
+        rows = list(workbook.active.values)
+        self.assertEqual(rows[0][0], 'id')
+        self.assertEqual(len(rows), 4)
+
+        response = self.export('event-analytics', format='excel')
+        workbook = load_workbook(io.BytesIO(self.content(response)), read_only=True)
+        self.assertIn('summary_metrics', workbook.sheetnames)
+        self.assertIn('performance.completion_rates', workbook.sheetnames)
+
+    def test_dataset_csv_is_flattened(self):
+        """Test nested datasets flatten to section/row/field/value CSV"""
+        response = self.export('event-analytics', format='csv')
+        rows = list(csv.DictReader(io.StringIO(self.content(response).decode())))
+
+        total_events = [
+            row for row in rows
+            if row['section'] == 'summary_metrics' and row['field'] == 'total_events'
+        ]
+        self.assertEqual(total_events[0]['value'], '1')
+
+    def test_recursive_flattening(self):
+        """Test nested dicts become sections and list items become rows"""
+        dataset = {
+            'summary': {'total': 2, 'tags': ['a', 'b']},
+            'breakdown': {
+                'by_county': [
+                    {'county': 'Dublin', 'stats': {'count': 1}},
+                    {'county': 'Cork', 'stats': {'count': 1}},
+                ]
+            },
+        }
+
+        rows = list(iter_dataset_rows(dataset))
+
+        self.assertIn(('summary', {'total': 2, 'tags': 'a; b'}), rows)
+        self.assertIn(('breakdown.by_county', {'county': 'Cork', 'stats.count': 1}), rows)
+        self.assertEqual(flatten({'a': {'b': [{'c': 1}]}}), {'a.b': '[{"c": 1}]'})
@@ -0,0 +1,202 @@
+"""
+Tests for the indexed search subsystem.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from events.bulk_assignments import bulk_create_assignments
+from events.bulk_transitions import bulk_transition
+from events.models import Assignment, Event, Role, Venue
+from .models import SearchDocument
+from .search import search
+
+DocumentType = SearchDocument.DocumentType
+
+
+class SearchIndexTest(TestCase):
+    """Test search documents are maintained and matched by prefix"""
+
+    def setUp(self):
+        """Set up a volunteer assigned to an event role"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_objects()
+
+    def create_objects(self):
+        self.staff_user = User.objects.create_user(
+            username='staff_user',
+            email='staff@test.com',
+            password='testpass123',
+            first_name='Sinead',
+            last_name='Staff',
+            user_type=User.UserType.STAFF,
+            is_staff=True,
+            is_superuser=True
+        )
+        self.volunteer = User.objects.create_user(
+            username='jdoe',
+            email='john.doe@example.com',
+            password='testpass123',
+            first_name='John',
+            last_name='Doe',
+            user_type=User.UserType.VOLUNTEER
+        )
+        self.event = Event.objects.create(
+            name='National Games 2026',
+            slug='national-games-2026',
+            host_city='Limerick',
+            start_date=timezone.now().date() + timedelta(days=30),
+            end_date=timezone.now().date() + timedelta(days=35),
+            created_by=self.staff_user
+        )
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Aquatic Centre',
+            slug='aquatic-centre',
+            address_line_1='1 Pool Road',
+            city='Limerick',
+            created_by=self.staff_user
+        )
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Poolside Marshal',
+            description='Marshal description',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            total_positions=10,
+            created_by=self.staff_user
+        )
+        self.assignment = Assignment.objects.create(
+            volunteer=self.volunteer,
+            role=self.role,
+            event=self.event,
+            venue=self.venue,
+            start_date=timezone.now() + timedelta(days=30),
+            end_date=timezone.now() + timedelta(days=32),
+            assigned_by=self.staff_user
+        )
+
+    def titles(self, query, types=None, **kwargs):
+        return [document.title for document in search(query, types, **kwargs)]
+
+    def test_prefix_matching_across_fields(self):
+        """Test every query word must match the start of a word in the document"""
+        self.assertEqual(self.titles('jo do', [DocumentType.USER]), ['John Doe'])
+        self.assertEqual(self.titles('JOHN.DOE@EXAMPLE', [DocumentType.USER]), ['John Doe'])
+        self.assertEqual(self.titles('ohn', [DocumentType.USER]), [])
+        self.assertEqual(self.titles('john', [DocumentType.USER], category='STAFF'), [])
+
+        self.assertEqual(self.titles('limer'), ['National Games 2026'])
+        self.assertEqual(
+            self.titles('doe aquatic', [DocumentType.ASSIGNMENT]),
+            ['John Doe - National Games 2026']
+        )
+
+    def test_related_changes_and_deletes_update_documents(self):
+        """Test renaming a related object re-indexes its dependents and deletes remove documents"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.name = 'Summer Games'
+            self.event.save()
+        self.assertEqual(self.titles('summer', [DocumentType.ASSIGNMENT]), ['John Doe - Summer Games'])
+        self.assertEqual(self.titles('national'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.role.name = 'Lifeguard'
+            self.role.save(update_fields=['name'])
+        document = search('lifeguard', [DocumentType.ASSIGNMENT])[0]
+        self.assertEqual(document.subtitle, 'Role: Lifeguard')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.volunteer.last_login = timezone.now()
+            self.volunteer.save(update_fields=['last_login'])
+        self.assertEqual(callbacks, [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assignment.delete()
+        self.assertFalse(SearchDocument.objects.filter(document_type=DocumentType.ASSIGNMENT).exists())
+
+    def test_bulk_writes_update_documents(self):
+        """Test assignments created and transitioned in bulk are indexed on commit"""
+        rostered = [
+            User.objects.create_user(
+                username=f'roster{index}',
+                email=f'roster{index}@test.com',
+                password='testpass123',
+                first_name='Roster',
+                last_name=str(index),
+                user_type=User.UserType.VOLUNTEER
+            )
+            for index in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            results = bulk_create_assignments([
+                {'volunteer': str(user.id), 'role': str(self.role.id), 'start_date': '2026-07-02'}
+                for user in rostered
+            ])
+        self.assertEqual(results['successful'], 3)
+        self.assertEqual(len(search('roster', [DocumentType.ASSIGNMENT])), 3)
+
+        created_ids = [item['id'] for item in results['created_assignments']]
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_transition(created_ids, Assignment.AssignmentStatus.APPROVED, changed_by=self.staff_user)
+        self.assertEqual(
+            {document.status for document in search('roster', [DocumentType.ASSIGNMENT])},
+            {Assignment.AssignmentStatus.APPROVED}
+        )
+
+    def test_fallback_matches_like_full_text_index(self):
+        """Test the LIKE fallback finds the same documents as the FTS index"""
+        queries = ['jo do', 'limer', 'poolside', 'doe aquatic', 'zzz']
+        indexed = [self.titles(query) for query in queries]
+        with mock.patch('common.search._has_fts_table', return_value=False):
+            fallback = [self.titles(query) for query in queries]
+        self.assertEqual([sorted(titles) for titles in indexed], [sorted(titles) for titles in fallback])
+
+    def test_search_endpoints_use_index(self):
+        """Test the mobile and REST search endpoints return indexed matches"""
+        self.client.force_login(self.staff_user)
+        response = self.client.get('/mobile-admin/api/search/', {'q': 'jo do'})
+        results = response.json()['results']
+        self.assertEqual(
+            [(result['type'], result['title']) for result in results],
+            [('volunteer', 'John Doe'), ('assignment', 'John Doe - National Games 2026')]
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=self.staff_user)
+        response = client.get('/api/v1/events/events/', {'search': 'limer'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.json()], [str(self.event.id)])
+
+        response = client.get('/api/v1/events/events/', {'search': 'nobody'})
+        self.assertEqual(response.json(), [])
+
+    def test_search_filter_is_not_capped(self):
+        """Test ?search= keeps every match while the mobile search stays capped"""
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(11):
+                Event.objects.create(
+                    name=f'Regional Games {index}',
+                    slug=f'regional-games-{index}',
+                    host_city='Limerick',
+                    start_date=self.event.start_date,
+                    end_date=self.event.end_date,
+                    created_by=self.staff_user
+                )
+
+        client = APIClient()
+        client.force_authenticate(user=self.staff_user)
+        response = client.get('/api/v1/events/events/', {'search': 'limer'})
+        self.assertEqual(len(response.json()), 12)
+        with mock.patch('common.search._has_fts_table', return_value=False):
+            response = client.get('/api/v1/events/events/', {'search': 'limer'})
+        self.assertEqual(len(response.json()), 12)
+
+        self.client.force_login(self.staff_user)
+        response = self.client.get('/mobile-admin/api/search/', {'q': 'limer', 'type': 'events'})
+        self.assertEqual(len(response.json()['results']), 10)
@@ -0,0 +1,77 @@
+"""
+Tests for the cached SystemConfig registry.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from .context_processors import system_config_context
+from .models import SystemConfig
+from .system_config import VERSION_KEY, config_registry
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class ConfigRegistryTest(TestCase):
+    """Test typed lookups, query counts and invalidation"""
+
+    def setUp(self):
+        """Set up public and private configurations"""
+        config_registry.clear()
+        self.addCleanup(config_registry.clear)
+        self.site_name = self.create_config('SITE_NAME', 'SOI Volunteers', is_public=True)
+        self.create_config('MAX_SHIFTS', '4')
+        self.create_config('EOI_OPEN', 'yes')
+        self.create_config('DISABLED', 'hidden', is_active=False)
+
+    def create_config(self, key, value, **kwargs):
+        return SystemConfig.objects.create(key=key, name=key.title(), value=value, **kwargs)
+
+    def render_context(self):
+        return system_config_context(RequestFactory().get('/'))
+
+    def test_typed_lookups(self):
+        """Test values are coerced and inactive configurations are ignored"""
+        self.assertEqual(config_registry.get_int('MAX_SHIFTS'), 4)
+        self.assertTrue(config_registry.get_bool('EOI_OPEN'))
+        self.assertEqual(config_registry.get_int('SITE_NAME', 7), 7)
+        self.assertIsNone(config_registry.get('DISABLED'))
+        self.assertEqual(config_registry.get_list('MISSING', ['a']), ['a'])
+        self.assertEqual(dict(config_registry.public()), {'SITE_NAME': 'SOI Volunteers'})
+
+    def test_context_processor_is_served_from_memory(self):
+        """Test renders after the first load issue no queries"""
+        with self.assertNumQueries(1):
+            context = self.render_context()
+        self.assertEqual(context['site_name'], 'SOI Volunteers')
+        self.assertEqual(context['site_tagline'], 'Volunteer Management System')
+        self.assertEqual(dict(context['system_config']), {'SITE_NAME': 'SOI Volunteers'})
+
+        with self.assertNumQueries(0):
+            self.render_context()
+            config_registry.get_bool('EOI_OPEN')
+
+        self.site_name.value = 'Special Olympics Ireland'
+        self.site_name.save()
+        self.assertEqual(self.render_context()['site_name'], 'Special Olympics Ireland')
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_other_processes_reload_when_version_changes(self):
+        """Test a version bump in the shared cache makes the snapshot reload"""
+        cache.clear()
+        config_registry.clear()
+        self.assertEqual(config_registry.get('SITE_NAME'), 'SOI Volunteers')
+
+        # Another worker changes the value and bumps the shared version
+        SystemConfig.objects.filter(key='SITE_NAME').update(value='Changed Elsewhere')
+        cache.set(VERSION_KEY, 1, None)
+
+        self.assertEqual(config_registry.get('SITE_NAME'), 'SOI Volunteers')
+        with mock.patch('common.system_config.VERSION_CHECK_INTERVAL', 0):
+            self.assertEqual(config_registry.get('SITE_NAME'), 'Changed Elsewhere')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_config('SITE_TAGLINE', 'Together')
+        self.assertNotEqual(cache.get(VERSION_KEY), 1)
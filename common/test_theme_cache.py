@@ -0,0 +1,98 @@
+"""
+Tests for compiled theme CSS and the theme resolution cache.
+"""
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+
+from accounts.models import User
+from . import theme_cache
+from .context_processors import theme_context
+from .models import Theme, UserThemePreference
+
+
+class CompiledThemeCSSTest(TestCase):
+    """Test themes are compiled on save and served from fingerprinted URLs"""
+
+    def setUp(self):
+        """Set up an active admin theme"""
+        theme_cache.clear()
+        self.addCleanup(theme_cache.clear)
+        self.theme = Theme.objects.create(name='Test Admin', theme_type='ADMIN', is_active=True)
+
+    def test_save_compiles_css_with_content_hash(self):
+        """Test the compiled CSS and its fingerprint change only when the CSS does"""
+        self.assertEqual(self.theme.compiled_css, self.theme.generate_css())
+        url = self.theme.get_css_url()
+        self.assertIn(self.theme.css_hash, url)
+
+        self.theme.description = 'Not part of the CSS'
+        self.theme.save(update_fields=['description'])
+        self.assertEqual(self.theme.get_css_url(), url)
+
+        self.theme.primary_color = '#123456'
+        self.theme.save(update_fields=['primary_color'])
+        self.theme.refresh_from_db()
+        self.assertIn('--soi-primary: #123456;', self.theme.compiled_css)
+        self.assertNotEqual(self.theme.get_css_url(), url)
+
+    def test_fingerprinted_url_is_cached_long_term(self):
+        """Test the compiled CSS is served with immutable cache headers and ETags"""
+        url = self.theme.get_css_url()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response.content.decode(), self.theme.compiled_css)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        outdated = url.replace(self.theme.css_hash, '0' * 16)
+        self.assertRedirects(self.client.get(outdated), url, fetch_redirect_response=False)
+
+
+class ThemeResolutionCacheTest(TestCase):
+    """Test the context processor resolves themes from the in-process cache"""
+
+    def setUp(self):
+        """Set up themes and a user"""
+        theme_cache.clear()
+        self.addCleanup(theme_cache.clear)
+        self.default_theme = Theme.objects.create(name='Default Admin', theme_type='ADMIN', is_active=True)
+        self.dark_theme = Theme.objects.create(name='Dark Admin', theme_type='ADMIN', is_dark_mode=True)
+        self.user = User.objects.create_user(username='themed', email='themed@test.com', password='testpass123')
+
+    def render_context(self, user):
+        request = RequestFactory().get('/admin/')
+        request.user = user
+        return theme_context(request)
+
+    def test_repeat_renders_do_not_query(self):
+        """Test the second render for a user is a dictionary lookup"""
+        context = self.render_context(self.user)
+        self.assertEqual(context['current_theme'], self.default_theme)
+        self.assertEqual(context['theme_css_url'], self.default_theme.get_css_url())
+
+        with self.assertNumQueries(0):
+            self.render_context(self.user)
+            self.render_context(self.user)
+
+        self.assertEqual(self.render_context(AnonymousUser())['current_theme'], self.default_theme)
+        with self.assertNumQueries(0):
+            self.render_context(AnonymousUser())
+
+    def test_saving_preference_or_theme_invalidates(self):
+        """Test preference and theme changes are picked up on the next render"""
+        self.render_context(self.user)
+
+        UserThemePreference.objects.create(user=self.user, admin_theme=self.dark_theme)
+        context = self.render_context(self.user)
+        self.assertEqual(context['current_theme'], self.dark_theme)
+        self.assertEqual(context['user_theme_preference'].admin_theme, self.dark_theme)
+
+        self.dark_theme.primary_color = '#000000'
+        self.dark_theme.save()
+        context = self.render_context(self.user)
+        self.assertEqual(context['theme_css_vars']['--soi-primary'], '#000000')
+        self.assertIn(self.dark_theme.css_hash, context['theme_css_url'])
@@ -0,0 +1,121 @@
+"""
+In-process cache of resolved themes.
+
+Working out a request's theme takes a ``UserThemePreference`` lookup and
+possibly ``Theme.get_active_theme`` (which may create the default theme).
+The result - the theme, its CSS variables and the fingerprinted URL of its
+compiled CSS - is kept per ``(user, theme type)`` in a bounded dictionary,
+so template rendering normally does no theme queries at all.
+
+Saving or deleting a ``Theme`` or ``UserThemePreference`` clears this
+process's entries and bumps a shared generation number in the cache;
+other processes notice the new generation within ``GENERATION_CHECK_INTERVAL``
+seconds and clear theirs.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+from .models import Theme, UserThemePreference
+
+GENERATION_KEY = 'themes:resolution:generation'
+GENERATION_CHECK_INTERVAL = 5
+MAX_ENTRIES = 4096
+
+_entries: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_lock = threading.Lock()
+_state = {'generation': None, 'checked_at': 0.0}
+
+
+def get_theme_type(path: str) -> str:
+    """Theme type for a request path"""
+    if path.startswith('/admin/'):
+        return 'ADMIN'
+    if path.startswith('/mobile-admin/'):
+        return 'MOBILE'
+    return 'PUBLIC'
+
+
+def resolve_theme(user, theme_type: str) -> Dict[str, Any]:
+    """
+    Theme details for a user (or anonymous visitor) and theme type
+
+    Returns:
+        ``theme``, ``preference``, ``css_vars``, ``css`` and ``css_url``;
+        ``theme`` is None if no theme could be found
+    """
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    key = (user_id, theme_type)
+
+    _check_generation()
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            return entry
+
+    entry = _load(user_id, theme_type)
+    with _lock:
+        _entries[key] = entry
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return entry
+
+
+def _load(user_id: Optional[Any], theme_type: str) -> Dict[str, Any]:
+    preference = None
+    if user_id is not None:
+        preference = UserThemePreference.objects.select_related(
+            'admin_theme', 'mobile_theme'
+        ).filter(user_id=user_id).first()
+
+    theme = preference.get_effective_theme(theme_type) if preference else Theme.get_active_theme(theme_type)
+    if theme is None:
+        return {'theme': None, 'preference': preference, 'css_vars': {}, 'css': '', 'css_url': ''}
+
+    return {
+        'theme': theme,
+        'preference': preference,
+        'css_vars': theme.get_css_variables(),
+        'css': theme.get_compiled_css(),
+        'css_url': theme.get_css_url(),
+    }
+
+
+def clear() -> None:
+    """Drop this process's resolved themes"""
+    with _lock:
+        _entries.clear()
+
+
+def invalidate(**kwargs) -> None:
+    """Drop resolved themes in every process"""
+    clear()
+    generation = time.time_ns()
+    cache.set(GENERATION_KEY, generation, None)
+    _state['generation'] = generation
+
+
+def _check_generation() -> None:
+    now = time.monotonic()
+    if now - _state['checked_at'] < GENERATION_CHECK_INTERVAL:
+        return
+    _state['checked_at'] = now
+
+    generation = cache.get(GENERATION_KEY)
+    if generation != _state['generation']:
+        _state['generation'] = generation
+        clear()
+
+
+def connect_signals() -> None:
+    """Invalidate resolved themes when themes or preferences change"""
+    for model in (Theme, UserThemePreference):
+        label = model._meta.label_lower
+        post_save.connect(invalidate, sender=model, weak=False, dispatch_uid=f'theme_cache_{label}_save')
+        post_delete.connect(invalidate, sender=model, weak=False, dispatch_uid=f'theme_cache_{label}_delete')
@@ -10,6 +10,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from .models import Theme, UserThemePreference
+from .theme_cache import resolve_theme
 
 User = get_user_model()
 
@@ -308,11 +309,7 @@ class ThemeService:
     @staticmethod
     def get_user_effective_theme(user: User, theme_type: str = 'ADMIN') -> Theme:
         """Get the effective theme for a user"""
-        try:
-            preference = UserThemePreference.objects.get(user=user)
-            return preference.get_effective_theme(theme_type)
-        except UserThemePreference.DoesNotExist:
-            return Theme.get_active_theme(theme_type)
+        return resolve_theme(user, theme_type)['theme']
     
     @staticmethod
     def apply_theme_to_user(user: User, theme: Theme) -> UserThemePreference:
@@ -377,7 +374,7 @@ class ThemeService:
             css += "}\n"
             return css
         else:
-            return theme.generate_css()
+            return theme.get_compiled_css()
     
     @staticmethod
     def import_theme_from_css(css_content: str, theme_name: str, theme_type: str = 'ADMIN') -> Dict[str, str]:
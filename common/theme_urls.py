@@ -14,6 +14,7 @@ urlpatterns = [
     path('current-css/', theme_views.get_current_theme_css, name='current_css'),
     path('preview/<int:theme_id>/', theme_views.theme_preview, name='preview'),
     path('css/<int:theme_id>/', theme_views.get_theme_css, name='css'),
+    path('compiled/<int:theme_id>-<str:css_hash>.css', theme_views.compiled_theme_css, name='compiled_css'),
     
     # Staff theme management
     path('management/', theme_views.theme_management, name='management'),
@@ -5,7 +5,7 @@ Theme management views for SOI Hub
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, HttpResponseNotModified
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.admin.views.decorators import staff_member_required
@@ -16,6 +16,10 @@ import json
 from .models import Theme, UserThemePreference
 from .forms import ThemeForm, UserThemePreferenceForm
 from .theme_service import ThemeService
+from .theme_cache import get_theme_type, resolve_theme
+
+# Compiled CSS URLs are fingerprinted, so browsers may keep them for a year
+COMPILED_CSS_MAX_AGE = 365 * 24 * 3600
 
 
 @login_required
@@ -104,9 +108,30 @@ def get_theme_css(request, theme_id):
     Get CSS for a specific theme
     """
     theme = get_object_or_404(Theme, id=theme_id)
-    css = theme.generate_css()
     
-    return HttpResponse(css, content_type='text/css')
+    return HttpResponse(theme.get_compiled_css(), content_type='text/css')
+
+
+def compiled_theme_css(request, theme_id, css_hash):
+    """
+    Serve a theme's compiled CSS from its fingerprinted URL
+    
+    The URL changes whenever the CSS does, so matching requests are cached
+    for a year; an outdated fingerprint redirects to the current one.
+    """
+    theme = get_object_or_404(Theme, id=theme_id)
+    theme.get_compiled_css()
+    if css_hash != theme.css_hash:
+        return redirect(theme.get_css_url())
+    
+    etag = f'"{theme.css_hash}"'
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(theme.compiled_css, content_type='text/css')
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={COMPILED_CSS_MAX_AGE}, immutable'
+    return response
 
 
 @login_required
@@ -114,24 +139,10 @@ def get_current_theme_css(request):
     """
     Get CSS for the user's current theme based on request path
     """
-    # Determine theme type based on request path
-    if request.path.startswith('/admin/'):
-        theme_type = 'ADMIN'
-    elif request.path.startswith('/mobile-admin/'):
-        theme_type = 'MOBILE'
-    else:
-        theme_type = 'PUBLIC'
+    resolved = resolve_theme(request.user, get_theme_type(request.path))
     
-    # Get user's effective theme
-    try:
-        user_preference = UserThemePreference.objects.get(user=request.user)
-        current_theme = user_preference.get_effective_theme(theme_type)
-    except UserThemePreference.DoesNotExist:
-        current_theme = Theme.get_active_theme(theme_type)
-    
-    if current_theme:
-        css = current_theme.generate_css()
-        return HttpResponse(css, content_type='text/css')
+    if resolved['theme']:
+        return redirect(resolved['css_url'])
     else:
         return HttpResponse('/* No theme found */', content_type='text/css')
 
@@ -272,7 +283,7 @@ def theme_preview(request, theme_id):
     
     context = {
         'theme': theme,
-        'css': theme.generate_css(),
+        'css': theme.get_compiled_css(),
     }
     
     return render(request, 'admin/theme_preview.html', context)
@@ -34,6 +34,7 @@ from .permissions import (
     AdminOverrideStatsPermission, AuditLogPermission, SystemConfigPermission
 )
 from .override_service import AdminOverrideService
+from .pagination import KeysetModeMixin
 from .audit_service import AdminAuditService
 
 logger = logging.getLogger(__name__)
@@ -127,6 +128,10 @@ class AdminOverridePagination(PageNumberPagination):
     max_page_size = 100
 
 
+class AuditLogPagination(KeysetModeMixin, AdminOverridePagination):
+    """Admin override page sizes with the keyset mode for deep audit history"""
+
+
 class AdminOverrideViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing admin overrides with comprehensive functionality
@@ -664,7 +669,8 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['action_description', 'user__username', 'object_representation']
     ordering_fields = ['timestamp', 'action_type', 'user__username']
     ordering = ['-timestamp']
-    pagination_class = AdminOverridePagination
+    pagination_class = AuditLogPagination
+    keyset_ordering = ['-timestamp', '-id']
 
 
 class SystemConfigViewSet(viewsets.ModelViewSet):
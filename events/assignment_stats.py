@@ -0,0 +1,119 @@
+"""
+Conditional aggregation helpers for assignment statistics.
+
+All breakdowns are computed with a single ``aggregate()`` call using
+``Count(filter=Q(...))`` per bucket, so the number of database round-trips
+does not grow with the number of status, type or priority choices.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.db.models import Avg, Count, Q, QuerySet
+from django.utils import timezone
+
+from .capacity import CAPACITY_STATUSES
+from .models import Assignment
+
+
+# Statuses used for time-based metrics
+OVERDUE_STATUSES = ['PENDING', 'APPROVED']
+UPCOMING_STATUSES = ['APPROVED', 'CONFIRMED', 'ACTIVE']
+
+
+def choice_buckets(field: str, choices: Iterable[Tuple[str, Any]], prefix: Optional[str] = None) -> Dict[str, Count]:
+    """
+    Build one filtered ``Count`` expression per choice value.
+
+    Returns a mapping of aggregate alias to expression, suitable for
+    unpacking into ``QuerySet.aggregate()``.
+    """
+    prefix = prefix or field
+    return {
+        f"{prefix}_{value}": Count('pk', filter=Q(**{field: value}))
+        for value, _label in choices
+    }
+
+
+def unpack_buckets(results: Dict[str, Any], choices: Iterable[Tuple[str, Any]], prefix: str) -> Dict[str, int]:
+    """Convert aggregate results produced by ``choice_buckets`` back into a choice dict"""
+    return {
+        value: results[f"{prefix}_{value}"] or 0
+        for value, _label in choices
+    }
+
+
+def count_by_choices(queryset: QuerySet, field: str, choices: Iterable[Tuple[str, Any]]) -> Dict[str, int]:
+    """Count rows per choice value in a single query"""
+    choices = list(choices)
+    results = queryset.aggregate(**choice_buckets(field, choices))
+    return unpack_buckets(results, choices, field)
+
+
+def get_assignment_stats(queryset: Optional[QuerySet] = None, today=None) -> Dict[str, Any]:
+    """
+    Compute assignment statistics for a queryset in one query.
+
+    Returns totals, status/type/priority breakdowns, admin override count,
+    overdue and upcoming counts and the average rating of completed assignments.
+    """
+    if queryset is None:
+        queryset = Assignment.objects.all()
+    if today is None:
+        today = timezone.now().date()
+
+    status_choices = Assignment.AssignmentStatus.choices
+    type_choices = Assignment.AssignmentType.choices
+    priority_choices = Assignment.PriorityLevel.choices
+
+    results = queryset.aggregate(
+        total=Count('pk'),
+        admin_overrides=Count('pk', filter=Q(is_admin_override=True)),
+        overdue=Count('pk', filter=Q(start_date__lt=today, status__in=OVERDUE_STATUSES)),
+        upcoming=Count('pk', filter=Q(start_date__gte=today, status__in=UPCOMING_STATUSES)),
+        average_performance_rating=Avg('performance_rating', filter=Q(status='COMPLETED')),
+        **choice_buckets('status', status_choices),
+        **choice_buckets('assignment_type', type_choices),
+        **choice_buckets('priority_level', priority_choices),
+    )
+
+    return {
+        'total': results['total'],
+        'admin_overrides': results['admin_overrides'],
+        'overdue': results['overdue'],
+        'upcoming': results['upcoming'],
+        'average_performance_rating': results['average_performance_rating'],
+        'status': unpack_buckets(results, status_choices, 'status'),
+        'type': unpack_buckets(results, type_choices, 'assignment_type'),
+        'priority': unpack_buckets(results, priority_choices, 'priority_level'),
+    }
+
+
+def get_volunteer_assignment_totals(queryset: Optional[QuerySet] = None) -> Dict[Any, Tuple[int, int, int]]:
+    """
+    Count assignments per volunteer in one grouped query.
+
+    Returns a mapping of volunteer id to (total, completed, capacity-occupying) counts.
+    """
+    if queryset is None:
+        queryset = Assignment.objects.all()
+
+    return {
+        volunteer_id: (total, completed, active)
+        for volunteer_id, total, completed, active in (
+            queryset.order_by()
+            .values('volunteer_id')
+            .annotate(
+                total=Count('pk'),
+                completed=Count('pk', filter=Q(status=Assignment.AssignmentStatus.COMPLETED)),
+                active=Count('pk', filter=Q(status__in=CAPACITY_STATUSES))
+            )
+            .values_list('volunteer_id', 'total', 'completed', 'active')
+        )
+    }
+
+
+def calculate_rate(count: int, total: int) -> float:
+    """Calculate a percentage rounded to two decimals"""
+    if not total:
+        return 0.0
+    return round(count / total * 100, 2)
@@ -0,0 +1,180 @@
+"""
+Batched bulk creation of assignments.
+
+Rows are validated field by field without touching the database, then every
+referenced volunteer and role is fetched in two queries. Duplicate, capacity
+and age rules are checked in memory against the fetched rows and the valid
+rows are inserted with ``bulk_create`` in chunks.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+
+from common import analytics_cache
+from common.search import DocumentType, reindex_on_commit
+from .models import Assignment, Role, Venue
+from .serializers import AssignmentBulkCreateRowSerializer
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+CHUNK_SIZE = 500
+
+
+def _row_error(results: Dict[str, Any], row: Dict[str, Any], errors) -> None:
+    results['failed'] += 1
+    if isinstance(errors, str):
+        results['errors'].append({'data': row, 'error': errors})
+    else:
+        results['errors'].append({'data': row, 'errors': errors})
+
+
+def bulk_create_assignments(rows: List[Dict[str, Any]], assigned_by=None,
+                            chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Create many assignments at once.
+
+    Returns the response shape used by the bulk assignment endpoint, with
+    per-row errors for rows that were rejected.
+    """
+    results = {
+        'total_requested': len(rows),
+        'successful': 0,
+        'failed': 0,
+        'created_assignments': [],
+        'errors': []
+    }
+
+    # Field validation only, no lookups
+    parsed = []
+    for row in rows:
+        serializer = AssignmentBulkCreateRowSerializer(data=row)
+        if serializer.is_valid():
+            parsed.append((row, serializer.validated_data))
+        else:
+            _row_error(results, row, serializer.errors)
+
+    if not parsed:
+        return results
+
+    volunteer_ids = {data['volunteer'] for _row, data in parsed}
+    role_ids = {data['role'] for _row, data in parsed}
+
+    volunteers = User.objects.in_bulk(volunteer_ids)
+    roles = Role.objects.select_related('event', 'venue').order_by().in_bulk(role_ids)
+
+    # Venues are only looked up when a row names one other than the role's venue
+    extra_venue_ids = {
+        data['venue'] for _row, data in parsed
+        if data.get('venue') and data['role'] in roles and roles[data['role']].venue_id != data['venue']
+    }
+    venues = Venue.objects.in_bulk(extra_venue_ids) if extra_venue_ids else {}
+
+    existing_pairs = set(
+        Assignment.objects.filter(volunteer_id__in=volunteer_ids, role_id__in=role_ids)
+        .order_by()
+        .values_list('volunteer_id', 'role_id')
+    )
+
+    pending = []
+    for row, data in parsed:
+        volunteer = volunteers.get(data['volunteer'])
+        role = roles.get(data['role'])
+
+        if volunteer is None:
+            _row_error(results, row, {'volunteer': ['Volunteer not found.']})
+            continue
+        if role is None:
+            _row_error(results, row, {'role': ['Role not found.']})
+            continue
+
+        event_id = data.get('event') or role.event_id
+        if role.event_id != event_id:
+            _row_error(results, row, {'non_field_errors': ["Role must belong to the specified event."]})
+            continue
+
+        venue = role.venue
+        if data.get('venue') and data['venue'] != role.venue_id:
+            venue = venues.get(data['venue'])
+            if venue is None or venue.event_id != event_id:
+                _row_error(results, row, {'non_field_errors': ["Venue must belong to the specified event."]})
+                continue
+
+        pair = (volunteer.id, role.id)
+        if pair in existing_pairs:
+            _row_error(results, row, {'non_field_errors': ["Volunteer is already assigned to this role."]})
+            continue
+
+        # Same rule as AssignmentCreateSerializer: new rows are PENDING and only
+        # take a position once approved, when the capacity counter enforces it
+        if role.is_full():
+            _row_error(results, row, {
+                'non_field_errors': ["Role is at full capacity. Use admin override if necessary."]
+            })
+            continue
+
+        age = volunteer.get_age()
+        if age is not None and not role.check_age_requirement(age):
+            _row_error(results, row, {'non_field_errors': [
+                f"Volunteer does not meet age requirement (min: {role.minimum_age}, "
+                f"max: {role.maximum_age or 'none'})."
+            ]})
+            continue
+
+        fields = {
+            key: value for key, value in data.items()
+            if key not in ('volunteer', 'role', 'event', 'venue')
+        }
+        assignment = Assignment(
+            volunteer=volunteer,
+            role=role,
+            event=role.event,
+            venue=venue,
+            assigned_by=assigned_by,
+            **fields
+        )
+        # save() is bypassed, so apply its defaults here
+        if not assignment.assignment_configuration:
+            assignment.assignment_configuration = assignment._get_default_assignment_configuration()
+        if not assignment.notification_preferences:
+            assignment.notification_preferences = assignment._get_default_notification_preferences()
+
+        existing_pairs.add(pair)
+        pending.append((row, assignment))
+
+    if not pending:
+        return results
+
+    try:
+        with transaction.atomic():
+            Assignment.objects.bulk_create(
+                [assignment for _row, assignment in pending],
+                batch_size=chunk_size
+            )
+    except IntegrityError as e:
+        logger.error(f"Bulk assignment creation failed: {str(e)}")
+        for row, _assignment in pending:
+            _row_error(results, row, str(e))
+        return results
+
+    # bulk_create sends no post_save signals
+    analytics_cache.bump(analytics_cache.ASSIGNMENTS, analytics_cache.EVENTS)
+    reindex_on_commit(DocumentType.ASSIGNMENT, [assignment.pk for _row, assignment in pending])
+
+    results['successful'] = len(pending)
+    results['created_assignments'] = [
+        {
+            'id': str(assignment.id),
+            'volunteer_name': assignment.volunteer.get_full_name(),
+            'role_name': assignment.role.name,
+            'event_name': assignment.event.name
+        }
+        for _row, assignment in pending
+    ]
+
+    logger.info(f"Bulk created {results['successful']} assignments, {results['failed']} rejected")
+    return results
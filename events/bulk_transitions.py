@@ -0,0 +1,217 @@
+"""
+Set-based bulk state transitions for assignments.
+
+Transitions are validated in memory against ``Assignment.ALLOWED_TRANSITIONS``,
+the same rules single status changes follow, written with ``bulk_update``,
+and ``Role.filled_positions`` is recomputed once per affected role from a
+single grouped count, instead of calling ``save()`` (and therefore
+``_update_role_capacity()``) for every assignment. All writes, including the
+batched audit trail, happen inside one transaction.
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from common import analytics_cache
+from common.audit_service import AdminAuditService
+from common.search import DocumentType, reindex_on_commit
+from .capacity import CAPACITY_STATUSES, apply_deltas
+from .models import Assignment, Role
+
+logger = logging.getLogger(__name__)
+
+Status = Assignment.AssignmentStatus
+
+# Bulk API actions mapped to target status and default reason
+ACTION_STATUSES = {
+    'approve': (Status.APPROVED, "Assignment approved"),
+    'cancel': (Status.CANCELLED, "Assignment cancelled"),
+    'activate': (Status.ACTIVE, "Assignment activated"),
+    'complete': (Status.COMPLETED, "Assignment completed"),
+    'reject': (Status.REJECTED, "Assignment rejected"),
+    'suspend': (Status.SUSPENDED, "Assignment suspended"),
+}
+
+UPDATE_FIELDS = [
+    'status', 'status_changed_at', 'status_changed_by', 'status_change_reason',
+    'approved_by', 'approval_date', 'confirmation_date', 'completion_date', 'updated_at',
+]
+
+BATCH_SIZE = 500
+
+
+def get_active_counts(role_ids: Iterable) -> Dict[Any, int]:
+    """Count capacity-occupying assignments per role in one grouped query"""
+    return dict(
+        Assignment.objects.filter(role_id__in=role_ids, status__in=CAPACITY_STATUSES)
+        .order_by()
+        .values('role_id')
+        .annotate(count=Count('pk'))
+        .values_list('role_id', 'count')
+    )
+
+
+def _error(assignment: Assignment, message: str) -> Dict[str, str]:
+    return {
+        'assignment_id': str(assignment.id),
+        'volunteer_name': assignment.volunteer.get_full_name(),
+        'error': message,
+    }
+
+
+def bulk_transition(assignment_ids: List, new_status: str, changed_by=None, reason: str = '',
+                    request=None, enforce_capacity: bool = True) -> Dict[str, Any]:
+    """
+    Move many assignments to ``new_status`` in a single transaction.
+
+    Invalid transitions are reported per assignment and skipped; valid ones are
+    applied together. Returns the same result shape the bulk endpoints have
+    always used.
+    """
+    if new_status not in Assignment.ALLOWED_TRANSITIONS:
+        raise ValueError(f"Invalid assignment status: {new_status}")
+
+    requested_ids = [str(assignment_id) for assignment_id in assignment_ids]
+    results = {
+        'total_requested': len(requested_ids),
+        'successful': 0,
+        'failed': 0,
+        'errors': []
+    }
+
+    with transaction.atomic():
+        assignments = list(
+            Assignment.objects.select_for_update(of=('self',))
+            .select_related('volunteer')
+            .filter(id__in=requested_ids)
+            .order_by()
+        )
+
+        found_ids = {str(assignment.id) for assignment in assignments}
+        for assignment_id in requested_ids:
+            if assignment_id not in found_ids:
+                results['failed'] += 1
+                results['errors'].append({
+                    'assignment_id': assignment_id,
+                    'volunteer_name': None,
+                    'error': 'Assignment not found'
+                })
+
+        role_ids = {assignment.role_id for assignment in assignments}
+        roles = {
+            role.id: role
+            for role in Role.objects.select_for_update().filter(id__in=role_ids)
+            .only('id', 'total_positions', 'filled_positions', 'override_positions').order_by()
+        }
+        active_counts = Counter(get_active_counts(role_ids))
+
+        now = timezone.now()
+        entering_capacity = new_status in CAPACITY_STATUSES
+        changed = []
+        audit_changes = []
+        venue_deltas = Counter()
+        event_deltas = Counter()
+
+        for assignment in assignments:
+            error = assignment.get_transition_error(new_status)
+
+            was_active = assignment.status in CAPACITY_STATUSES
+            if not error and entering_capacity and not was_active:
+                role = roles[assignment.role_id]
+                if (enforce_capacity and not assignment.capacity_override and
+                        active_counts[role.id] >= role.total_positions):
+                    error = "Role is at capacity"
+
+            if error:
+                results['failed'] += 1
+                results['errors'].append(_error(assignment, error))
+                continue
+
+            if entering_capacity and not was_active:
+                active_counts[assignment.role_id] += 1
+                venue_deltas[assignment.venue_id] += 1
+                event_deltas[assignment.event_id] += 1
+            elif was_active and not entering_capacity:
+                active_counts[assignment.role_id] -= 1
+                venue_deltas[assignment.venue_id] -= 1
+                event_deltas[assignment.event_id] -= 1
+
+            old_status = assignment.status
+            assignment.status = new_status
+            assignment.status_changed_at = now
+            assignment.status_changed_by = changed_by
+            assignment.status_change_reason = reason or f"Status changed from {old_status} to {new_status}"
+            assignment.updated_at = now
+
+            if new_status == Status.APPROVED:
+                assignment.approved_by = changed_by
+                assignment.approval_date = now
+            elif new_status == Status.CONFIRMED and not assignment.confirmation_date:
+                assignment.confirmation_date = now
+            elif new_status == Status.COMPLETED and not assignment.completion_date:
+                assignment.completion_date = now
+
+            changed.append(assignment)
+            audit_changes.append({
+                'object': assignment,
+                'representation': f"{assignment.volunteer.get_full_name()} ({assignment.role_id})",
+                'old_values': {'status': old_status},
+                'new_values': {'status': new_status},
+                'description': assignment.status_change_reason,
+            })
+
+        if changed:
+            Assignment.objects.bulk_update(changed, UPDATE_FIELDS, batch_size=BATCH_SIZE)
+
+            # filled_positions is capped by a check constraint on Role; the
+            # excess from capacity overrides is kept in override_positions
+            updated_roles = []
+            for role in roles.values():
+                filled = min(active_counts[role.id], role.total_positions)
+                overridden = active_counts[role.id] - filled
+                if (role.filled_positions, role.override_positions) != (filled, overridden):
+                    role.filled_positions, role.override_positions = filled, overridden
+                    updated_roles.append(role)
+            if updated_roles:
+                Role.objects.bulk_update(
+                    updated_roles, ['filled_positions', 'override_positions'], batch_size=BATCH_SIZE
+                )
+            apply_deltas(venue_deltas=venue_deltas, event_deltas=event_deltas)
+
+            AdminAuditService.log_bulk_object_changes(
+                user=changed_by,
+                action_type='UPDATE',
+                changes=audit_changes,
+                request=request,
+                details={'operation': 'assignment_bulk_transition', 'new_status': new_status},
+                batch_size=BATCH_SIZE
+            )
+            # bulk_update sends no post_save signals
+            transaction.on_commit(lambda: analytics_cache.bump(analytics_cache.ASSIGNMENTS, analytics_cache.EVENTS))
+            reindex_on_commit(DocumentType.ASSIGNMENT, [assignment.pk for assignment in changed])
+
+        results['successful'] = len(changed)
+
+    logger.info(
+        f"Bulk transition to {new_status}: {results['successful']} updated, {results['failed']} failed"
+    )
+    return results
+
+
+def bulk_action(assignment_ids: List, action: str, user=None, notes: str = '', request=None) -> Dict[str, Any]:
+    """Apply a named bulk action (approve, cancel, ...) to many assignments"""
+    if action not in ACTION_STATUSES:
+        raise ValueError(f"Unsupported bulk action: {action}")
+
+    new_status, default_reason = ACTION_STATUSES[action]
+    if action == 'cancel':
+        reason = f"{default_reason} - {notes}" if notes else default_reason
+    else:
+        reason = notes or default_reason
+
+    return bulk_transition(assignment_ids, new_status, changed_by=user, reason=reason, request=request)
@@ -0,0 +1,215 @@
+"""
+Incrementally maintained capacity counters for roles, venues and events.
+
+``Role.filled_positions``, ``Venue.assigned_volunteer_count`` and
+``Event.assigned_volunteer_count`` are adjusted with atomic ``F()`` updates
+when an assignment moves into or out of a capacity-occupying status, rather
+than being recounted on every save. Role increments are conditional on a
+free position, which makes the capacity check race-free under concurrent
+approvals. Capacity overrides beyond ``total_positions`` are counted in
+``Role.override_positions`` and released before filled positions, so
+cancelling an override does not undercount the role. ``reconcile_capacity``
+repairs any drift from one grouped query.
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest, Least
+from django.utils.translation import gettext_lazy as _
+
+from .models import Assignment, Event, Role, Venue
+
+logger = logging.getLogger(__name__)
+
+# Statuses that occupy a position on the role
+CAPACITY_STATUSES = {
+    Assignment.AssignmentStatus.APPROVED,
+    Assignment.AssignmentStatus.CONFIRMED,
+    Assignment.AssignmentStatus.ACTIVE,
+}
+
+STATE_FIELDS = ['status', 'role_id', 'venue_id', 'event_id', 'capacity_override']
+
+
+def occupies_capacity(status: Optional[str]) -> bool:
+    """Check if an assignment status counts against role capacity"""
+    return status in CAPACITY_STATUSES
+
+
+def get_assignment_state(assignment: Assignment) -> Dict[str, Any]:
+    """Get the capacity-relevant state of an in-memory assignment"""
+    return {field: getattr(assignment, field) for field in STATE_FIELDS}
+
+
+def get_stored_state(assignment_id, lock: bool = True) -> Optional[Dict[str, Any]]:
+    """Get the stored capacity-relevant state, locking the row inside a transaction"""
+    queryset = Assignment.objects.filter(pk=assignment_id).order_by()
+    if lock:
+        queryset = queryset.select_for_update()
+    return queryset.values(*STATE_FIELDS).first()
+
+
+def increment_role(role_id, delta: int = 1, enforce_capacity: bool = True) -> bool:
+    """
+    Add ``delta`` filled positions to a role.
+
+    When enforcing capacity the update only applies if enough positions are
+    free, so two concurrent approvals cannot both take the last position.
+    Returns False if the role did not have room.
+    """
+    if enforce_capacity:
+        return bool(
+            Role.objects.filter(pk=role_id, filled_positions__lte=F('total_positions') - delta)
+            .update(filled_positions=F('filled_positions') + delta)
+        )
+
+    # Overrides may exceed capacity, but filled_positions is capped by a check
+    # constraint, so the excess is counted in override_positions. Both
+    # expressions read the row as it was before the update.
+    Role.objects.filter(pk=role_id).update(
+        filled_positions=Least(F('filled_positions') + delta, F('total_positions')),
+        override_positions=F('override_positions') + Greatest(
+            F('filled_positions') + delta - F('total_positions'), Value(0)
+        ),
+    )
+    return True
+
+
+def decrement_role(role_id, delta: int = 1) -> None:
+    """Release ``delta`` positions on a role, override positions first"""
+    Role.objects.filter(pk=role_id).update(
+        filled_positions=Greatest(
+            F('filled_positions') - Greatest(Value(delta) - F('override_positions'), Value(0)), Value(0)
+        ),
+        override_positions=Greatest(F('override_positions') - delta, Value(0)),
+    )
+
+
+def adjust_assigned_count(model, pk, delta: int) -> None:
+    """Apply a delta to a venue or event assigned volunteer count"""
+    if not pk or not delta:
+        return
+    if delta > 0:
+        model.objects.filter(pk=pk).update(assigned_volunteer_count=F('assigned_volunteer_count') + delta)
+    else:
+        model.objects.filter(pk=pk).update(
+            assigned_volunteer_count=Greatest(F('assigned_volunteer_count') + delta, Value(0))
+        )
+
+
+def apply_transition(previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]) -> None:
+    """
+    Update counters for an assignment moving from ``previous`` to ``current`` state.
+
+    Either state may be None (created or deleted). Raises ValidationError if a
+    role without a free position would be filled and capacity is not overridden.
+    """
+    old = previous if previous and occupies_capacity(previous['status']) else None
+    new = current if current and occupies_capacity(current['status']) else None
+
+    if old is None and new is None:
+        return
+
+    old_role = old['role_id'] if old else None
+    new_role = new['role_id'] if new else None
+
+    if new_role and new_role != old_role:
+        if not increment_role(new_role, enforce_capacity=not new['capacity_override']):
+            raise ValidationError(_('Role is at capacity'))
+    if old_role and old_role != new_role:
+        decrement_role(old_role)
+
+    for field, model in (('venue_id', Venue), ('event_id', Event)):
+        old_pk = old[field] if old else None
+        new_pk = new[field] if new else None
+        if old_pk != new_pk:
+            adjust_assigned_count(model, old_pk, -1)
+            adjust_assigned_count(model, new_pk, 1)
+
+
+def apply_deltas(role_deltas: Counter = None, venue_deltas: Counter = None, event_deltas: Counter = None) -> None:
+    """Apply aggregated counter deltas, e.g. after a bulk update"""
+    for role_id, delta in (role_deltas or {}).items():
+        if delta > 0:
+            increment_role(role_id, delta, enforce_capacity=False)
+        elif delta < 0:
+            decrement_role(role_id, -delta)
+    for venue_id, delta in (venue_deltas or {}).items():
+        adjust_assigned_count(Venue, venue_id, delta)
+    for event_id, delta in (event_deltas or {}).items():
+        adjust_assigned_count(Event, event_id, delta)
+
+
+def reconcile_capacity(event=None, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Recompute all counters from one grouped query and repair any drift.
+
+    Returns the number of roles, venues and events whose counters were wrong.
+    """
+    assignments = Assignment.objects.filter(status__in=CAPACITY_STATUSES)
+    roles = Role.objects.all()
+    venues = Venue.objects.all()
+    events = Event.objects.all()
+    if event is not None:
+        assignments = assignments.filter(event=event)
+        roles = roles.filter(event=event)
+        venues = venues.filter(event=event)
+        events = events.filter(pk=event.pk)
+
+    role_counts = Counter()
+    venue_counts = Counter()
+    event_counts = Counter()
+    grouped = (
+        assignments.order_by()
+        .values('role_id', 'venue_id', 'event_id')
+        .annotate(count=Count('pk'))
+        .values_list('role_id', 'venue_id', 'event_id', 'count')
+    )
+    for role_id, venue_id, event_id, count in grouped:
+        role_counts[role_id] += count
+        if venue_id:
+            venue_counts[venue_id] += count
+        event_counts[event_id] += count
+
+    drifted_roles = []
+    for role in roles.order_by().only('id', 'total_positions', 'filled_positions', 'override_positions'):
+        filled = min(role_counts[role.id], role.total_positions)
+        overridden = role_counts[role.id] - filled
+        if (role.filled_positions, role.override_positions) != (filled, overridden):
+            role.filled_positions, role.override_positions = filled, overridden
+            drifted_roles.append(role)
+
+    drifted_venues = []
+    for venue in venues.order_by().only('id', 'assigned_volunteer_count'):
+        if venue.assigned_volunteer_count != venue_counts[venue.id]:
+            venue.assigned_volunteer_count = venue_counts[venue.id]
+            drifted_venues.append(venue)
+
+    drifted_events = []
+    for event_obj in events.order_by().only('id', 'assigned_volunteer_count'):
+        if event_obj.assigned_volunteer_count != event_counts[event_obj.id]:
+            event_obj.assigned_volunteer_count = event_counts[event_obj.id]
+            drifted_events.append(event_obj)
+
+    if not dry_run:
+        with transaction.atomic():
+            Role.objects.bulk_update(drifted_roles, ['filled_positions', 'override_positions'], batch_size=500)
+            Venue.objects.bulk_update(drifted_venues, ['assigned_volunteer_count'], batch_size=500)
+            Event.objects.bulk_update(drifted_events, ['assigned_volunteer_count'], batch_size=500)
+
+    if drifted_roles or drifted_venues or drifted_events:
+        logger.warning(
+            f"Capacity drift: {len(drifted_roles)} roles, {len(drifted_venues)} venues, "
+            f"{len(drifted_events)} events{' (dry run)' if dry_run else ' repaired'}"
+        )
+
+    return {
+        'roles': len(drifted_roles),
+        'venues': len(drifted_venues),
+        'events': len(drifted_events),
+    }
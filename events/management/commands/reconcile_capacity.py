@@ -0,0 +1,53 @@
+"""
+Django management command for repairing role, venue and event capacity counters.
+
+Usage:
+    python manage.py reconcile_capacity
+    python manage.py reconcile_capacity --event isg-2026
+    python manage.py reconcile_capacity --dry-run
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from events.capacity import reconcile_capacity
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = 'Recompute filled capacity counters from assignments and repair any drift'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        parser.add_argument(
+            '--event',
+            type=str,
+            help='Only reconcile the event with this slug'
+        )
+
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drift without changing any counters'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        event = None
+        if options['event']:
+            try:
+                event = Event.objects.get(slug=options['event'])
+            except Event.DoesNotExist:
+                raise CommandError(f"Event '{options['event']}' not found")
+
+        drift = reconcile_capacity(event=event, dry_run=options['dry_run'])
+        total = sum(drift.values())
+
+        if not total:
+            self.stdout.write(self.style.SUCCESS('All capacity counters are correct'))
+            return
+
+        action = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(self.style.WARNING(
+            f"{action} drift in {drift['roles']} role(s), {drift['venues']} venue(s) "
+            f"and {drift['events']} event(s)"
+        ))
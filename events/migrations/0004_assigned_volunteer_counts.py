@@ -0,0 +1,40 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:19
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_assigned_counts(apps, schema_editor):
+    """Initialise venue and event counters from existing assignments"""
+    Assignment = apps.get_model('events', 'Assignment')
+    Venue = apps.get_model('events', 'Venue')
+    Event = apps.get_model('events', 'Event')
+
+    active = Assignment.objects.filter(status__in=['APPROVED', 'CONFIRMED', 'ACTIVE']).order_by()
+
+    for row in active.exclude(venue__isnull=True).values('venue_id').annotate(count=Count('pk')):
+        Venue.objects.filter(pk=row['venue_id']).update(assigned_volunteer_count=row['count'])
+
+    for row in active.values('event_id').annotate(count=Count('pk')):
+        Event.objects.filter(pk=row['event_id']).update(assigned_volunteer_count=row['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_assignment_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='assigned_volunteer_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of approved, confirmed or active assignments (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='venue',
+            name='assigned_volunteer_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of approved, confirmed or active assignments (maintained automatically)'),
+        ),
+        migrations.RunPython(populate_assigned_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_assigned_volunteer_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['created_at', 'id'], name='events_assi_created_e97539_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.14 on 2026-10-16 22:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_override_positions(apps, schema_editor):
+    """Count existing assignments beyond each role's total positions as overrides"""
+    Assignment = apps.get_model('events', 'Assignment')
+    Role = apps.get_model('events', 'Role')
+
+    active = Assignment.objects.filter(status__in=['APPROVED', 'CONFIRMED', 'ACTIVE']).order_by()
+    counts = dict(active.values('role_id').annotate(count=Count('pk')).values_list('role_id', 'count'))
+
+    for role in Role.objects.filter(pk__in=counts).only('id', 'total_positions'):
+        count = counts[role.pk]
+        if count > role.total_positions:
+            Role.objects.filter(pk=role.pk).update(
+                filled_positions=role.total_positions, override_positions=count - role.total_positions
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='role',
+            name='override_positions',
+            field=models.PositiveIntegerField(default=0, help_text='Assignments approved with a capacity override beyond total positions (maintained automatically)'),
+        ),
+        migrations.RunPython(populate_override_positions, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
@@ -7,6 +7,8 @@ from django.contrib.auth import get_user_model
 import uuid
 import json
 
+from .querysets import AssignmentQuerySet, EventQuerySet, RoleQuerySet, VenueQuerySet
+
 User = get_user_model()
 
 class Event(models.Model):
@@ -118,6 +120,10 @@ class Event(models.Model):
         validators=[MinValueValidator(0)],
         help_text=_('Target number of volunteers')
     )
+    assigned_volunteer_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of approved, confirmed or active assignments (maintained automatically)')
+    )
     volunteer_minimum_age = models.PositiveIntegerField(
         default=15,
         validators=[MinValueValidator(13), MaxValueValidator(25)],
@@ -250,6 +256,8 @@ class Event(models.Model):
         help_text=_('External system references and IDs')
     )
     
+    objects = EventQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('event')
         verbose_name_plural = _('events')
@@ -521,17 +529,19 @@ class Event(models.Model):
     # Relationship methods
     def get_venue_count(self):
         """Get number of venues for this event"""
+        if hasattr(self, 'venue_count'):
+            return self.venue_count
         return self.venues.count()
     
     def get_role_count(self):
         """Get total number of roles across all venues"""
-        # Return 0 until Role model is implemented in Task 2.4
-        return 0
+        if hasattr(self, 'role_count'):
+            return self.role_count
+        return self.roles.count()
     
     def get_volunteer_count(self):
         """Get total number of assigned volunteers"""
-        # Return 0 until Assignment model is implemented in Task 2.5
-        return 0
+        return self.assigned_volunteer_count
     
     def get_volunteer_target_progress(self):
         """Get volunteer recruitment progress percentage"""
@@ -782,6 +792,10 @@ class Venue(models.Model):
         validators=[MinValueValidator(0)],
         help_text=_('Maximum number of volunteers for this venue')
     )
+    assigned_volunteer_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of approved, confirmed or active assignments (maintained automatically)')
+    )
     spectator_capacity = models.PositiveIntegerField(
         default=0,
         validators=[MinValueValidator(0)],
@@ -963,6 +977,8 @@ class Venue(models.Model):
         help_text=_('External system references and IDs')
     )
     
+    objects = VenueQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('venue')
         verbose_name_plural = _('venues')
@@ -1143,14 +1159,12 @@ class Venue(models.Model):
         if self.volunteer_capacity == 0:
             return 0
         
-        # This will be updated when Role and Assignment models are implemented
         assigned_volunteers = self.get_assigned_volunteer_count()
         return min(100, (assigned_volunteers / self.volunteer_capacity) * 100)
     
     def get_assigned_volunteer_count(self):
         """Get number of currently assigned volunteers"""
-        # Return 0 until Role and Assignment models are implemented in Tasks 2.4 and 2.5
-        return 0
+        return self.assigned_volunteer_count
     
     def get_available_capacity(self):
         """Get remaining volunteer capacity"""
@@ -1167,13 +1181,15 @@ class Venue(models.Model):
     # Role and assignment methods
     def get_role_count(self):
         """Get number of roles for this venue"""
-        # Return 0 until Role model is implemented in Task 2.4
-        return 0
+        if hasattr(self, 'role_count'):
+            return self.role_count
+        return self.roles.count()
     
     def get_active_role_count(self):
         """Get number of active roles for this venue"""
-        # Return 0 until Role model is implemented in Task 2.4
-        return 0
+        if hasattr(self, 'active_role_count'):
+            return self.active_role_count
+        return self.roles.filter(status=Role.RoleStatus.ACTIVE).count()
     
     # Accessibility methods
     def is_fully_accessible(self):
@@ -1592,6 +1608,10 @@ class Role(models.Model):
         validators=[MinValueValidator(0)],
         help_text=_('Number of positions currently filled')
     )
+    override_positions = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Assignments approved with a capacity override beyond total positions (maintained automatically)')
+    )
     minimum_volunteers = models.PositiveIntegerField(
         default=1,
         validators=[MinValueValidator(1)],
@@ -1808,6 +1828,8 @@ class Role(models.Model):
         help_text=_('External system references')
     )
     
+    objects = RoleQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('role')
         verbose_name_plural = _('roles')
@@ -2043,7 +2065,7 @@ class Role(models.Model):
     
     def get_volunteer_count(self):
         """Get current volunteer count"""
-        return self.filled_positions
+        return self.filled_positions + self.override_positions
     
     def update_volunteer_count(self):
         """Update filled positions based on actual assignments"""
@@ -2225,6 +2247,24 @@ class Assignment(models.Model):
         NO_SHOW = 'NO_SHOW', _('No Show')
         SUSPENDED = 'SUSPENDED', _('Suspended')
     
+    # Allowed source statuses for each target status, enforced by
+    # change_status and by bulk transitions
+    ALLOWED_TRANSITIONS = {
+        AssignmentStatus.PENDING: {AssignmentStatus.SUSPENDED},
+        AssignmentStatus.APPROVED: {AssignmentStatus.PENDING, AssignmentStatus.SUSPENDED},
+        AssignmentStatus.CONFIRMED: {AssignmentStatus.APPROVED},
+        AssignmentStatus.ACTIVE: {AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED, AssignmentStatus.SUSPENDED},
+        AssignmentStatus.COMPLETED: {AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED, AssignmentStatus.ACTIVE},
+        AssignmentStatus.CANCELLED: {
+            AssignmentStatus.PENDING, AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED,
+            AssignmentStatus.ACTIVE, AssignmentStatus.NO_SHOW, AssignmentStatus.SUSPENDED,
+        },
+        AssignmentStatus.REJECTED: {AssignmentStatus.PENDING},
+        AssignmentStatus.WITHDRAWN: {AssignmentStatus.PENDING, AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED},
+        AssignmentStatus.NO_SHOW: {AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED, AssignmentStatus.ACTIVE},
+        AssignmentStatus.SUSPENDED: {AssignmentStatus.APPROVED, AssignmentStatus.CONFIRMED, AssignmentStatus.ACTIVE},
+    }
+    
     class AssignmentType(models.TextChoices):
         STANDARD = 'STANDARD', _('Standard Assignment')
         EMERGENCY = 'EMERGENCY', _('Emergency Assignment')
@@ -2521,6 +2561,8 @@ class Assignment(models.Model):
         help_text=_('External system references and IDs')
     )
     
+    objects = AssignmentQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('assignment')
         verbose_name_plural = _('assignments')
@@ -2538,6 +2580,7 @@ class Assignment(models.Model):
             models.Index(fields=['is_admin_override']),
             models.Index(fields=['assigned_date']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['created_at', 'id']),
         ]
         constraints = [
             models.CheckConstraint(
@@ -2589,10 +2632,26 @@ class Assignment(models.Model):
         # Update status dates based on status
         self._update_status_dates()
         
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            previous_state = None
+            if not self._state.adding:
+                from .capacity import get_stored_state
+                previous_state = get_stored_state(self.pk)
+            
+            super().save(*args, **kwargs)
+            
+            # Update role, venue and event filled counts
+            self._update_role_capacity(previous_state)
+    
+    def delete(self, *args, **kwargs):
+        """Release capacity held by this assignment when deleting"""
+        from .capacity import apply_transition, get_stored_state
         
-        # Update role filled positions
-        self._update_role_capacity()
+        with transaction.atomic():
+            previous_state = get_stored_state(self.pk)
+            result = super().delete(*args, **kwargs)
+            apply_transition(previous_state, None)
+        return result
     
     def _get_default_assignment_configuration(self):
         """Get default assignment configuration"""
@@ -2631,20 +2690,11 @@ class Assignment(models.Model):
         elif self.status == self.AssignmentStatus.COMPLETED and not self.completion_date:
             self.completion_date = now
     
-    def _update_role_capacity(self):
-        """Update role filled positions based on active assignments"""
-        if self.role_id:
-            active_count = Assignment.objects.filter(
-                role=self.role,
-                status__in=[
-                    self.AssignmentStatus.APPROVED,
-                    self.AssignmentStatus.CONFIRMED,
-                    self.AssignmentStatus.ACTIVE,
-                ]
-            ).count()
-            
-            if self.role.filled_positions != active_count:
-                Role.objects.filter(id=self.role.id).update(filled_positions=active_count)
+    def _update_role_capacity(self, previous_state=None):
+        """Adjust role, venue and event counters for the change from the stored state"""
+        from .capacity import apply_transition, get_assignment_state
+        
+        apply_transition(previous_state, get_assignment_state(self))
     
     # Status checking methods
     def is_active(self):
@@ -2780,8 +2830,24 @@ class Assignment(models.Model):
         )
         self.save()
     
+    def get_transition_error(self, new_status):
+        """Return why the assignment cannot move to ``new_status``, or None if it can"""
+        if self.status == new_status:
+            return f"Assignment is already {self.get_status_display()}"
+        if self.status not in self.ALLOWED_TRANSITIONS.get(new_status, set()):
+            return f"Cannot change status from {self.status} to {new_status}"
+        return None
+    
+    def can_transition_to(self, new_status):
+        """Check if the assignment can move to ``new_status``"""
+        return self.get_transition_error(new_status) is None
+    
     def change_status(self, new_status, changed_by=None, reason=None):
         """Change assignment status with audit trail"""
+        error = self.get_transition_error(new_status)
+        if error:
+            raise ValidationError(error)
+        
         old_status = self.status
         self.status = new_status
         self.status_changed_at = timezone.now()
@@ -2876,8 +2942,9 @@ class Assignment(models.Model):
             # Implementation depends on volunteer profile structure
             pass
         
-        # Check capacity (unless overridden)
+        # Check capacity against the live counter (unless overridden)
         if not self.capacity_override:
+            self.role.refresh_from_db(fields=['filled_positions'])
             if not self.role.can_accept_volunteers():
                 errors.append("Role is at capacity")
         
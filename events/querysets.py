@@ -0,0 +1,70 @@
+"""
+Querysets that precompute what the event, venue, role and assignment
+serializers display.
+
+``with_list_stats()`` joins the related users and objects the serializers
+read, prefetches coordinator and manager lists, and annotates counts with
+correlated subqueries, so serializing a page costs a fixed number of
+queries however many rows it holds. Model methods such as
+``Event.get_venue_count()`` return the annotated value when it is present
+and fall back to a query otherwise.
+"""
+
+from django.db.models import Count, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_related(model, field: str, **filters) -> Coalesce:
+    """Number of ``model`` rows whose ``field`` points at the outer row"""
+    counts = (
+        model.objects.filter(**{field: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class EventQuerySet(QuerySet):
+    """Event queryset with list annotations"""
+
+    def with_list_stats(self) -> 'EventQuerySet':
+        from .models import Role, Venue
+        return self.select_related('created_by').prefetch_related('event_managers').annotate(
+            venue_count=count_related(Venue, 'event'),
+            role_count=count_related(Role, 'event'),
+        )
+
+
+class VenueQuerySet(QuerySet):
+    """Venue queryset with list annotations"""
+
+    def with_list_stats(self) -> 'VenueQuerySet':
+        from .models import Role
+        return self.select_related('event', 'created_by', 'status_changed_by').prefetch_related(
+            'venue_coordinators'
+        ).annotate(
+            role_count=count_related(Role, 'venue'),
+            active_role_count=count_related(Role, 'venue', status=Role.RoleStatus.ACTIVE),
+        )
+
+
+class RoleQuerySet(QuerySet):
+    """Role queryset with list annotations"""
+
+    def with_list_stats(self) -> 'RoleQuerySet':
+        return self.select_related(
+            'event', 'venue', 'created_by', 'role_supervisor', 'status_changed_by'
+        ).prefetch_related('role_coordinators')
+
+
+class AssignmentQuerySet(QuerySet):
+    """Assignment queryset with list annotations"""
+
+    def with_list_stats(self) -> 'AssignmentQuerySet':
+        return self.select_related(
+            'volunteer', 'role', 'event', 'venue',
+            'assigned_by', 'reviewed_by', 'approved_by',
+            'status_changed_by', 'admin_override_by'
+        )
@@ -1479,6 +1479,39 @@ class AssignmentCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class AssignmentBulkCreateRowSerializer(serializers.ModelSerializer):
+    """
+    Field-level validation for one row of a bulk assignment import.
+    Related objects are passed as IDs and resolved in bulk by the caller.
+    """
+    volunteer = serializers.UUIDField()
+    role = serializers.UUIDField()
+    event = serializers.UUIDField(required=False, allow_null=True)
+    venue = serializers.UUIDField(required=False, allow_null=True)
+
+    class Meta:
+        model = Assignment
+        fields = AssignmentCreateSerializer.Meta.fields
+        # Uniqueness is checked for the whole batch in one query
+        validators = []
+
+    def validate(self, data):
+        """Validate row data that does not need the database"""
+        if data.get('start_date') and data.get('end_date'):
+            if data['end_date'] < data['start_date']:
+                raise serializers.ValidationError(
+                    "End date must be after start date."
+                )
+
+        if data.get('start_time') and data.get('end_time'):
+            if data['end_time'] <= data['start_time']:
+                raise serializers.ValidationError(
+                    "End time must be after start time."
+                )
+
+        return data
+
+
 class AssignmentUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating assignments
@@ -1565,6 +1598,14 @@ class AssignmentStatusSerializer(serializers.ModelSerializer):
         fields = ['id', 'status', 'status_change_reason', 'status_changed_at', 'status_changed_by']
         read_only_fields = ['id', 'status_changed_at', 'status_changed_by']
     
+    def validate_status(self, value):
+        """Validate the status change against the assignment's allowed transitions"""
+        if self.instance and value != self.instance.status:
+            error = self.instance.get_transition_error(value)
+            if error:
+                raise serializers.ValidationError(error)
+        return value
+    
     def update(self, instance, validated_data):
         """Update assignment status with workflow validation"""
         new_status = validated_data.get('status')
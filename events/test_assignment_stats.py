@@ -0,0 +1,153 @@
+"""
+Tests for the assignment statistics aggregation engine.
+Includes a query-count benchmark showing the cost is constant in the number of choices.
+"""
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from .models import Event, Venue, Role, Assignment
+from .assignment_stats import count_by_choices, get_assignment_stats
+from common.dashboard_service import DashboardService
+
+User = get_user_model()
+
+
+class AssignmentStatsEngineTest(TestCase):
+    """Test cases for single-query assignment statistics"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True,
+            is_superuser=True
+        )
+
+        self.event = Event.objects.create(
+            name='Stats Event',
+            slug='stats-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Stats Venue',
+            slug='stats-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=100,
+            created_by=self.admin_user
+        )
+
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Stats Role',
+            slug='stats-role',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Stats role',
+            total_positions=50,
+            created_by=self.admin_user
+        )
+
+        today = timezone.now().date()
+        statuses = [
+            ('PENDING', today - timedelta(days=2)),
+            ('PENDING', today + timedelta(days=2)),
+            ('APPROVED', today - timedelta(days=1)),
+            ('CONFIRMED', today + timedelta(days=3)),
+            ('CONFIRMED', today + timedelta(days=4)),
+            ('COMPLETED', today - timedelta(days=10)),
+            ('CANCELLED', today),
+        ]
+        for index, (status, start_date) in enumerate(statuses):
+            volunteer = User.objects.create_user(
+                username=f'volunteer{index}',
+                email=f'volunteer{index}@test.com',
+                password='testpass123',
+                user_type=User.UserType.VOLUNTEER
+            )
+            Assignment.objects.create(
+                volunteer=volunteer,
+                role=self.role,
+                status=status,
+                start_date=start_date,
+                assignment_type='EMERGENCY' if index == 0 else 'STANDARD',
+                priority_level='HIGH' if index % 2 else 'NORMAL',
+                is_admin_override=index == 1,
+                admin_override_reason='Test override' if index == 1 else '',
+                performance_rating=4 if status == 'COMPLETED' else None,
+                assigned_by=self.admin_user
+            )
+
+    def test_stats_match_per_choice_counts(self):
+        """Test aggregate results match naive per-choice counts"""
+        stats = get_assignment_stats()
+        queryset = Assignment.objects.all()
+
+        self.assertEqual(stats['total'], queryset.count())
+        for status, _label in Assignment.AssignmentStatus.choices:
+            self.assertEqual(stats['status'][status], queryset.filter(status=status).count())
+        for assignment_type, _label in Assignment.AssignmentType.choices:
+            self.assertEqual(stats['type'][assignment_type], queryset.filter(assignment_type=assignment_type).count())
+        for priority, _label in Assignment.PriorityLevel.choices:
+            self.assertEqual(stats['priority'][priority], queryset.filter(priority_level=priority).count())
+
+        self.assertEqual(stats['admin_overrides'], 1)
+        self.assertEqual(stats['overdue'], 2)
+        self.assertEqual(stats['upcoming'], 2)
+        self.assertEqual(stats['average_performance_rating'], 4)
+
+    def test_stats_use_single_query(self):
+        """Test all breakdowns are computed in one query"""
+        with self.assertNumQueries(1):
+            get_assignment_stats(Assignment.objects.filter(event=self.event))
+
+    def test_query_count_constant_in_number_of_choices(self):
+        """Benchmark: query count does not grow with the number of choices"""
+        few_choices = [('PENDING', 'Pending'), ('CONFIRMED', 'Confirmed')]
+        many_choices = few_choices + [(f'STATUS_{index}', f'Status {index}') for index in range(60)]
+
+        with self.assertNumQueries(1):
+            few = count_by_choices(Assignment.objects.all(), 'status', few_choices)
+        with self.assertNumQueries(1):
+            many = count_by_choices(Assignment.objects.all(), 'status', many_choices)
+
+        self.assertEqual(few['PENDING'], many['PENDING'])
+        self.assertEqual(many['STATUS_59'], 0)
+
+    def test_stats_view_query_count(self):
+        """Test the stats endpoint issues a single query regardless of data size"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+        url = reverse('events:assignment-stats')
+
+        with self.assertNumQueries(1):
+            response = client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['summary']['total_assignments'], 7)
+        self.assertEqual(response.data['status_breakdown']['CONFIRMED'], 2)
+        self.assertEqual(response.data['summary']['overdue_assignments'], 2)
+
+    def test_dashboard_confirmation_rate(self):
+        """Test dashboard confirmation rate reuses the aggregation engine"""
+        with self.assertNumQueries(1):
+            rate = DashboardService._calculate_confirmation_rate()
+
+        self.assertEqual(rate, round(2 / 7 * 100, 2))
@@ -0,0 +1,188 @@
+"""
+Tests for batched bulk assignment creation.
+Includes a query-count benchmark showing lookups do not grow with the number of rows.
+"""
+
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from .models import Event, Venue, Role, Assignment
+from .bulk_assignments import bulk_create_assignments
+
+User = get_user_model()
+
+
+class BulkAssignmentCreateTest(TestCase):
+    """Test cases for bulk assignment creation"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True,
+            is_superuser=True
+        )
+
+        self.event = Event.objects.create(
+            name='Roster Event',
+            slug='roster-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Roster Venue',
+            slug='roster-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=100,
+            created_by=self.admin_user
+        )
+
+        self.role = self.create_role('roster-role', total_positions=20)
+        self.volunteers = [self.create_volunteer(index) for index in range(10)]
+
+    def create_role(self, slug, total_positions, **kwargs):
+        """Create a role at the test venue"""
+        return Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name=slug.replace('-', ' ').title(),
+            slug=slug,
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Roster role',
+            total_positions=total_positions,
+            created_by=self.admin_user,
+            **kwargs
+        )
+
+    def create_volunteer(self, index, date_of_birth=None):
+        """Create a volunteer user"""
+        return User.objects.create_user(
+            username=f'volunteer{index}',
+            email=f'volunteer{index}@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER,
+            date_of_birth=date_of_birth
+        )
+
+    def row(self, volunteer, role=None, **kwargs):
+        return {
+            'volunteer': str(volunteer.id),
+            'role': str((role or self.role).id),
+            'event': str(self.event.id),
+            'start_date': '2026-07-02',
+            **kwargs
+        }
+
+    def test_bulk_create_inserts_rows_with_defaults(self):
+        """Test valid rows are created with the same defaults as save()"""
+        results = bulk_create_assignments(
+            [self.row(volunteer) for volunteer in self.volunteers],
+            assigned_by=self.admin_user
+        )
+
+        self.assertEqual(results['successful'], 10)
+        self.assertEqual(results['failed'], 0)
+        self.assertEqual(len(results['created_assignments']), 10)
+
+        assignment = Assignment.objects.get(volunteer=self.volunteers[0])
+        self.assertEqual(assignment.event, self.event)
+        self.assertEqual(assignment.venue, self.venue)
+        self.assertEqual(assignment.assigned_by, self.admin_user)
+        self.assertEqual(assignment.status, Assignment.AssignmentStatus.PENDING)
+        self.assertTrue(assignment.assignment_configuration['auto_reminders'])
+        self.assertTrue(assignment.notification_preferences['email_notifications'])
+
+    def test_per_row_errors(self):
+        """Test invalid rows are reported without blocking valid ones"""
+        Assignment.objects.create(volunteer=self.volunteers[0], role=self.role)
+        rows = [
+            self.row(self.volunteers[0]),
+            self.row(self.volunteers[1], start_date='2026-07-05', end_date='2026-07-01'),
+            {'volunteer': 'not-a-uuid', 'role': str(self.role.id)},
+            self.row(self.volunteers[2]),
+            self.row(self.volunteers[2]),
+        ]
+
+        results = bulk_create_assignments(rows, assigned_by=self.admin_user)
+
+        self.assertEqual(results['successful'], 1)
+        self.assertEqual(results['failed'], 4)
+        self.assertIn('volunteer', results['errors'][1]['errors'])
+        self.assertEqual(
+            results['errors'][2]['errors']['non_field_errors'],
+            ["Volunteer is already assigned to this role."]
+        )
+
+    def test_capacity_matches_single_create(self):
+        """Test pending rows do not fill a role, but a full role rejects every row"""
+        small_role = self.create_role('small-role', total_positions=3)
+        full_role = self.create_role('full-role', total_positions=2, filled_positions=2)
+
+        results = bulk_create_assignments(
+            [self.row(volunteer, role=small_role) for volunteer in self.volunteers[:5]]
+            + [self.row(volunteer, role=full_role) for volunteer in self.volunteers[:2]]
+        )
+
+        self.assertEqual(results['successful'], 5)
+        self.assertEqual(results['failed'], 2)
+        self.assertEqual(Assignment.objects.filter(role=small_role).count(), 5)
+        self.assertEqual(
+            results['errors'][0]['errors']['non_field_errors'],
+            ["Role is at full capacity. Use admin override if necessary."]
+        )
+
+    def test_age_requirement(self):
+        """Test volunteers outside the role age range are rejected"""
+        adult_role = self.create_role('adult-role', total_positions=5, minimum_age=18)
+        young = self.create_volunteer(50, date_of_birth=date.today().replace(year=date.today().year - 16))
+
+        results = bulk_create_assignments([
+            self.row(young, role=adult_role),
+            self.row(self.volunteers[0], role=adult_role),
+        ])
+
+        self.assertEqual(results['successful'], 1)
+        self.assertIn('age requirement', results['errors'][0]['errors']['non_field_errors'][0])
+
+    def test_query_count_constant_in_number_of_rows(self):
+        """Benchmark: query count does not grow with the number of rows"""
+        other_role = self.create_role('other-role', total_positions=20)
+
+        with self.assertNumQueries(6) as few_context:
+            bulk_create_assignments([self.row(volunteer) for volunteer in self.volunteers[:2]])
+        with self.assertNumQueries(len(few_context.captured_queries)):
+            bulk_create_assignments([self.row(volunteer, role=other_role) for volunteer in self.volunteers])
+
+    def test_bulk_create_endpoint(self):
+        """Test the bulk endpoint keeps its response shape"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+
+        response = client.post(reverse('events:bulk-assignment'), {
+            'operation': 'create_multiple',
+            'assignments': [self.row(volunteer) for volunteer in self.volunteers[:3]] + [
+                {'volunteer': str(self.volunteers[3].id)}
+            ]
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_requested'], 4)
+        self.assertEqual(response.data['successful'], 3)
+        self.assertEqual(response.data['failed'], 1)
+        self.assertIn('role', response.data['errors'][0]['errors'])
+        self.assertEqual(response.data['created_assignments'][0]['event_name'], 'Roster Event')
@@ -0,0 +1,264 @@
+"""
+Tests for set-based bulk assignment state transitions.
+Includes a query-count benchmark showing the cost does not grow with the number of assignments.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from .models import Event, Venue, Role, Assignment
+from .bulk_transitions import bulk_action, bulk_transition
+from common.models import AuditLog
+
+User = get_user_model()
+
+
+class BulkTransitionTest(TestCase):
+    """Test cases for bulk assignment transitions"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True,
+            is_superuser=True
+        )
+
+        self.event = Event.objects.create(
+            name='Bulk Event',
+            slug='bulk-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Bulk Venue',
+            slug='bulk-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=100,
+            created_by=self.admin_user
+        )
+
+        self.role = self.create_role('bulk-role', total_positions=50)
+        self.other_role = self.create_role('other-role', total_positions=50)
+
+        self.assignments = [
+            self.create_assignment(index, self.role if index % 2 else self.other_role)
+            for index in range(10)
+        ]
+
+    def create_role(self, slug, total_positions):
+        """Create a role at the test venue"""
+        return Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name=slug.replace('-', ' ').title(),
+            slug=slug,
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Bulk role',
+            total_positions=total_positions,
+            created_by=self.admin_user
+        )
+
+    def create_assignment(self, index, role, status='PENDING'):
+        """Create a volunteer and an assignment for them"""
+        volunteer = User.objects.create_user(
+            username=f'volunteer{index}',
+            email=f'volunteer{index}@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+        return Assignment.objects.create(
+            volunteer=volunteer,
+            role=role,
+            status=status,
+            start_date=date(2026, 7, 2),
+            assigned_by=self.admin_user
+        )
+
+    def ids(self, assignments=None):
+        return [str(assignment.id) for assignment in (assignments or self.assignments)]
+
+    def test_bulk_approve_updates_assignments_and_capacity(self):
+        """Test approving many assignments updates statuses and role counts"""
+        results = bulk_action(self.ids(), 'approve', user=self.admin_user, notes='Games day')
+
+        self.assertEqual(results['successful'], 10)
+        self.assertEqual(results['failed'], 0)
+
+        for assignment in Assignment.objects.all():
+            self.assertEqual(assignment.status, 'APPROVED')
+            self.assertEqual(assignment.approved_by, self.admin_user)
+            self.assertIsNotNone(assignment.approval_date)
+            self.assertEqual(assignment.status_change_reason, 'Games day')
+
+        self.role.refresh_from_db()
+        self.other_role.refresh_from_db()
+        self.assertEqual(self.role.filled_positions, 5)
+        self.assertEqual(self.other_role.filled_positions, 5)
+
+        self.assertEqual(
+            AuditLog.objects.filter(metadata__operation='assignment_bulk_transition').count(),
+            10
+        )
+
+    def test_invalid_transitions_reported_per_assignment(self):
+        """Test invalid transitions are skipped without blocking valid ones"""
+        bulk_action(self.ids(self.assignments[:2]), 'complete', user=self.admin_user)
+        results = bulk_transition(self.ids(self.assignments[:4]), 'APPROVED', changed_by=self.admin_user)
+
+        self.assertEqual(results['successful'], 4)
+        results = bulk_transition(self.ids(self.assignments[:4]), 'REJECTED', changed_by=self.admin_user)
+
+        self.assertEqual(results['successful'], 0)
+        self.assertEqual(results['failed'], 4)
+        self.assertEqual(results['errors'][0]['volunteer_name'], self.assignments[0].volunteer.get_full_name())
+
+    def test_cancel_releases_capacity(self):
+        """Test cancelling approved assignments frees role positions"""
+        bulk_action(self.ids(), 'approve', user=self.admin_user)
+        bulk_action(self.ids(self.assignments[:4]), 'cancel', user=self.admin_user, notes='Weather')
+
+        self.role.refresh_from_db()
+        self.other_role.refresh_from_db()
+        self.assertEqual(self.role.filled_positions, 3)
+        self.assertEqual(self.other_role.filled_positions, 3)
+
+        cancelled = Assignment.objects.get(id=self.assignments[0].id)
+        self.assertEqual(cancelled.status_change_reason, 'Assignment cancelled - Weather')
+
+    def test_capacity_enforced_in_memory(self):
+        """Test approvals beyond role capacity fail individually"""
+        small_role = self.create_role('small-role', total_positions=2)
+        assignments = [self.create_assignment(100 + index, small_role) for index in range(3)]
+
+        results = bulk_action(self.ids(assignments), 'approve', user=self.admin_user)
+
+        self.assertEqual(results['successful'], 2)
+        self.assertEqual(results['errors'][0]['error'], 'Role is at capacity')
+        small_role.refresh_from_db()
+        self.assertEqual(small_role.filled_positions, 2)
+
+    def test_capacity_overrides_counted_beyond_total(self):
+        """Test overrides approved in bulk past capacity are kept in override_positions"""
+        small_role = self.create_role('override-role', total_positions=2)
+        assignments = [self.create_assignment(100 + index, small_role) for index in range(3)]
+        Assignment.objects.filter(pk=assignments[2].pk).update(capacity_override=True)
+
+        bulk_action(self.ids(assignments[:2]), 'approve', user=self.admin_user)
+        results = bulk_action(self.ids(assignments[2:]), 'approve', user=self.admin_user)
+
+        self.assertEqual(results['successful'], 1)
+        small_role.refresh_from_db()
+        self.assertEqual((small_role.filled_positions, small_role.override_positions), (2, 1))
+
+        bulk_action(self.ids(assignments[2:]), 'cancel', user=self.admin_user)
+        small_role.refresh_from_db()
+        self.assertEqual((small_role.filled_positions, small_role.override_positions), (2, 0))
+
+    def test_query_count_constant_in_number_of_assignments(self):
+        """Benchmark: query count does not grow with the number of assignments"""
+        few = self.ids(self.assignments[:2])
+        many = self.ids(self.assignments[2:])
+
+        with self.assertNumQueries(12) as few_context:
+            bulk_transition(few, 'APPROVED', changed_by=self.admin_user)
+        with self.assertNumQueries(len(few_context.captured_queries)):
+            bulk_transition(many, 'APPROVED', changed_by=self.admin_user)
+
+    def test_bulk_status_update_endpoint(self):
+        """Test the bulk status update endpoint uses set-based transitions"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+
+        response = client.post(reverse('events:bulk-assignment'), {
+            'operation': 'status_update',
+            'assignment_ids': self.ids(),
+            'status': 'APPROVED',
+            'reason': 'Bulk approval'
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['successful'], 10)
+        self.assertEqual(Assignment.objects.filter(status='APPROVED').count(), 10)
+
+        response = client.post(reverse('events:bulk-assignment'), {
+            'operation': 'status_update',
+            'assignment_ids': self.ids(),
+            'status': 'NOT_A_STATUS'
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_operations_action(self):
+        """Test the viewset bulk_operations action"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+
+        response = client.post(reverse('events:assignment-bulk-operations'), {
+            'assignment_ids': self.ids(),
+            'action': 'approve',
+            'notes': 'Approved in bulk'
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['successful'], 10)
+        self.role.refresh_from_db()
+        self.assertEqual(self.role.filled_positions, 5)
+
+    def test_single_changes_follow_bulk_rules(self):
+        """Test single-item status changes reject the transitions bulk rejects"""
+        assignment = self.assignments[0]
+        for action in ('approve', 'complete'):
+            bulk_action(self.ids([assignment]), action, user=self.admin_user)
+        assignment.refresh_from_db()
+
+        results = bulk_transition(self.ids([assignment]), 'APPROVED', changed_by=self.admin_user)
+        with self.assertRaises(ValidationError) as context:
+            assignment.approve(approved_by=self.admin_user)
+
+        self.assertEqual(context.exception.messages, [results['errors'][0]['error']])
+        self.assertEqual(Assignment.objects.get(pk=assignment.pk).status, 'COMPLETED')
+        self.assertFalse(assignment.can_transition_to('CANCELLED'))
+
+    def test_unknown_ids(self):
+        """Test unknown ids fail bulk_operations but are reported per id by status updates"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin_user)
+        missing = str(uuid4())
+
+        response = client.post(reverse('events:assignment-bulk-operations'), {
+            'assignment_ids': self.ids(self.assignments[:2]) + [missing],
+            'action': 'approve'
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Assignment.objects.filter(status='APPROVED').count(), 0)
+
+        response = client.post(reverse('events:bulk-assignment'), {
+            'operation': 'status_update',
+            'assignment_ids': self.ids(self.assignments[:2]) + [missing],
+            'status': 'APPROVED'
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.data['total_requested'], response.data['successful'], response.data['failed']), (3, 2, 1)
+        )
+        self.assertEqual(
+            response.data['errors'],
+            [{'assignment_id': missing, 'volunteer_name': None, 'error': 'Assignment not found'}]
+        )
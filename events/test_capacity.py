@@ -0,0 +1,193 @@
+"""
+Tests for incrementally maintained role, venue and event capacity counters.
+"""
+
+from datetime import date
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from .models import Event, Venue, Role, Assignment
+from .capacity import reconcile_capacity, increment_role
+
+User = get_user_model()
+
+
+class CapacityCounterTest(TestCase):
+    """Test cases for capacity counters"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+
+        self.event = Event.objects.create(
+            name='Capacity Event',
+            slug='capacity-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Capacity Venue',
+            slug='capacity-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=10,
+            created_by=self.admin_user
+        )
+
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Capacity Role',
+            slug='capacity-role',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Capacity role',
+            total_positions=2,
+            created_by=self.admin_user
+        )
+
+        self.volunteers = [
+            User.objects.create_user(
+                username=f'volunteer{index}',
+                email=f'volunteer{index}@test.com',
+                password='testpass123',
+                user_type=User.UserType.VOLUNTEER
+            )
+            for index in range(3)
+        ]
+
+    def refresh(self):
+        self.role.refresh_from_db()
+        self.venue.refresh_from_db()
+        self.event.refresh_from_db()
+
+    def test_counters_follow_status_transitions(self):
+        """Test counters move with transitions into and out of active statuses"""
+        assignment = Assignment.objects.create(volunteer=self.volunteers[0], role=self.role)
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 0)
+
+        assignment.approve(approved_by=self.admin_user)
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 1)
+        self.assertEqual(self.venue.get_assigned_volunteer_count(), 1)
+        self.assertEqual(self.event.get_volunteer_count(), 1)
+
+        # Moving between active statuses does not change counts
+        assignment.confirm()
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 1)
+
+        assignment.cancel(cancelled_by=self.admin_user)
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 0)
+        self.assertEqual(self.venue.assigned_volunteer_count, 0)
+        self.assertEqual(self.event.assigned_volunteer_count, 0)
+
+    def test_save_without_status_change_does_not_recount(self):
+        """Test saving an active assignment again does not double count"""
+        assignment = Assignment.objects.create(
+            volunteer=self.volunteers[0], role=self.role, status='APPROVED'
+        )
+        assignment.notes = 'Updated'
+        assignment.save()
+
+        with self.assertNumQueries(4):
+            # Savepoint, locked state read, update, release
+            assignment.save()
+
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 1)
+
+    def test_stale_instances_do_not_double_count(self):
+        """Test two copies approving the same assignment only count once"""
+        assignment = Assignment.objects.create(volunteer=self.volunteers[0], role=self.role)
+        first = Assignment.objects.get(pk=assignment.pk)
+        second = Assignment.objects.get(pk=assignment.pk)
+
+        first.approve(approved_by=self.admin_user)
+        second.approve(approved_by=self.admin_user)
+
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 1)
+
+    def test_full_role_rejects_approval(self):
+        """Test the conditional increment refuses the last position twice"""
+        for volunteer in self.volunteers[:2]:
+            Assignment.objects.create(volunteer=volunteer, role=self.role, status='APPROVED')
+
+        assignment = Assignment.objects.create(volunteer=self.volunteers[2], role=self.role)
+        with self.assertRaises(ValidationError):
+            assignment.approve(approved_by=self.admin_user)
+
+        self.assertEqual(Assignment.objects.get(pk=assignment.pk).status, 'PENDING')
+        self.assertFalse(increment_role(self.role.id))
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 2)
+
+    def test_cancelling_override_over_capacity_keeps_role_full(self):
+        """Test an override beyond capacity is released without freeing a position"""
+        for volunteer in self.volunteers[:2]:
+            Assignment.objects.create(volunteer=volunteer, role=self.role, status='APPROVED')
+
+        override = Assignment.objects.create(
+            volunteer=self.volunteers[2], role=self.role, capacity_override=True
+        )
+        override.approve(approved_by=self.admin_user)
+        self.refresh()
+        self.assertEqual((self.role.filled_positions, self.role.override_positions), (2, 1))
+        self.assertEqual(self.role.get_volunteer_count(), 3)
+        self.assertEqual(reconcile_capacity(dry_run=True)['roles'], 0)
+
+        override.cancel(cancelled_by=self.admin_user)
+        self.refresh()
+        self.assertEqual((self.role.filled_positions, self.role.override_positions), (2, 0))
+        self.assertFalse(increment_role(self.role.id))
+
+        Assignment.objects.filter(volunteer=self.volunteers[0]).get().cancel(cancelled_by=self.admin_user)
+        self.refresh()
+        self.assertEqual((self.role.filled_positions, self.role.override_positions), (1, 0))
+
+    def test_delete_releases_capacity(self):
+        """Test deleting an active assignment releases its position"""
+        assignment = Assignment.objects.create(
+            volunteer=self.volunteers[0], role=self.role, status='APPROVED'
+        )
+        assignment.delete()
+
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 0)
+        self.assertEqual(self.venue.assigned_volunteer_count, 0)
+
+    def test_reconcile_repairs_drift(self):
+        """Test reconcile recomputes counters in one grouped query"""
+        Assignment.objects.create(volunteer=self.volunteers[0], role=self.role, status='APPROVED')
+        Role.objects.filter(pk=self.role.pk).update(filled_positions=0)
+        Venue.objects.filter(pk=self.venue.pk).update(assigned_volunteer_count=7)
+
+        self.assertEqual(reconcile_capacity(dry_run=True), {'roles': 1, 'venues': 1, 'events': 0})
+
+        out = StringIO()
+        call_command('reconcile_capacity', stdout=out)
+        self.assertIn('Repaired drift', out.getvalue())
+
+        self.refresh()
+        self.assertEqual(self.role.filled_positions, 1)
+        self.assertEqual(self.venue.assigned_volunteer_count, 1)
+        self.assertEqual(reconcile_capacity(), {'roles': 0, 'venues': 0, 'events': 0})
@@ -0,0 +1,175 @@
+"""
+Query-count regression tests for event, venue, role and assignment lists.
+Each list endpoint must issue the same number of queries however many rows it returns.
+"""
+
+from datetime import date
+from itertools import count
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Event, Venue, Role, Assignment
+
+User = get_user_model()
+
+API = '/api/v1/events'
+
+
+class ListQueryCountTest(TestCase):
+    """Test list endpoints do not issue per-row queries"""
+
+    def setUp(self):
+        """Set up an admin, an event and one row of each kind"""
+        self.sequence = count()
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+
+        self.event = self.create_event()
+        self.add_rows(self.event)
+
+    def create_user(self):
+        index = next(self.sequence)
+        return User.objects.create_user(
+            username=f'user{index}',
+            email=f'user{index}@test.com',
+            password='testpass123',
+            first_name='Test',
+            last_name=f'User {index}'
+        )
+
+    def create_event(self):
+        index = next(self.sequence)
+        event = Event.objects.create(
+            name=f'Event {index}',
+            slug=f'event-{index}',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+        event.event_managers.add(self.create_user())
+        return event
+
+    def add_rows(self, event, rows=1):
+        """Add venues, roles and assignments, each with related users"""
+        for _ in range(rows):
+            index = next(self.sequence)
+            venue = Venue.objects.create(
+                event=event,
+                name=f'Venue {index}',
+                slug=f'venue-{index}',
+                venue_type=Venue.VenueType.SPORTS_FACILITY,
+                address_line_1='1 Test Street',
+                city='Dublin',
+                country='Ireland',
+                volunteer_capacity=100,
+                created_by=self.admin_user
+            )
+            venue.venue_coordinators.add(self.create_user())
+            role = Role.objects.create(
+                event=event,
+                venue=venue,
+                name=f'Role {index}',
+                slug=f'role-{index}',
+                role_type=Role.RoleType.GENERAL_VOLUNTEER,
+                status=Role.RoleStatus.ACTIVE,
+                description='Test role',
+                total_positions=10,
+                role_supervisor=self.create_user(),
+                created_by=self.admin_user
+            )
+            role.role_coordinators.add(self.create_user())
+            Assignment.objects.create(
+                volunteer=self.create_user(),
+                role=role,
+                start_date=date(2026, 7, 2),
+                assigned_by=self.admin_user
+            )
+
+    def count_queries(self, url):
+        """Number of queries ``url`` issues and of rows it lists"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        rows = len(response.data) if isinstance(response.data, list) else None
+        return len(queries), rows
+
+    def assertConstantQueries(self, url, grow):
+        """Assert ``url`` issues as many queries after ``grow()`` adds rows as before"""
+        # Warm up per-user lookups the views cache on the request user
+        self.count_queries(url)
+        before, rows = self.count_queries(url)
+        grow()
+        after, more_rows = self.count_queries(url)
+        self.assertEqual(after, before, url)
+        if rows is not None:
+            self.assertGreater(more_rows, rows, url)
+
+    def test_event_list(self):
+        """Test the event lists annotate venue and role counts"""
+        self.assertConstantQueries(f'{API}/events/{self.event.id}/', lambda: self.add_rows(self.event, 3))
+
+        def add_events():
+            for _ in range(3):
+                self.add_rows(self.create_event())
+        self.assertConstantQueries(f'{API}/events/', add_events)
+
+        data = self.client.get(f'{API}/events/{self.event.id}/').data
+        self.assertEqual(data['venue_count'], self.event.venues.count())
+        self.assertEqual(data['role_count'], self.event.roles.count())
+
+    def test_venue_lists(self):
+        """Test venue lists join events and prefetch coordinators"""
+        for url in [
+            f'{API}/venues/',
+            f'{API}/api/events/{self.event.id}/venues/',
+            f'{API}/events/{self.event.id}/venues/',
+        ]:
+            self.assertConstantQueries(url, lambda: self.add_rows(self.event, 3))
+
+    def test_role_lists(self):
+        """Test role lists join their event, venue and users"""
+        venue = self.event.venues.get()
+        for url in [
+            f'{API}/roles/',
+            f'{API}/api/events/{self.event.id}/roles/',
+        ]:
+            self.assertConstantQueries(url, lambda: self.add_rows(self.event, 3))
+
+        def add_venue_roles():
+            for index in range(3):
+                Role.objects.create(
+                    event=self.event, venue=venue, name=f'Extra Role {index}', slug=f'extra-role-{index}',
+                    role_type=Role.RoleType.GENERAL_VOLUNTEER, status=Role.RoleStatus.ACTIVE,
+                    description='Extra role', created_by=self.admin_user
+                )
+        self.assertConstantQueries(f'{API}/api/venues/{venue.id}/roles/', add_venue_roles)
+
+    def test_assignment_lists(self):
+        """Test assignment lists join volunteers, roles, events and venues"""
+        role = self.event.roles.get()
+        for url in [
+            f'{API}/assignments/',
+            f'{API}/api/events/{self.event.id}/assignments/',
+        ]:
+            self.assertConstantQueries(url, lambda: self.add_rows(self.event, 3))
+
+        def add_role_assignments():
+            for _ in range(3):
+                Assignment.objects.create(
+                    volunteer=self.create_user(), role=role, start_date=date(2026, 7, 3), assigned_by=self.admin_user
+                )
+        self.assertConstantQueries(f'{API}/api/roles/{role.id}/volunteers/', add_role_assignments)
@@ -4,10 +4,13 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from django.db.models import Q, Count, Avg
+from django.db.models import Q, Count
 from django.core.exceptions import ValidationError
 
 from .models import Event, Venue, Role, Assignment
+from .assignment_stats import get_assignment_stats
+from .bulk_assignments import bulk_create_assignments
+from .bulk_transitions import bulk_action, bulk_transition
 from .serializers import (
     EventListSerializer, EventDetailSerializer, EventCreateSerializer,
     EventUpdateSerializer, EventConfigurationSerializer, EventStatusSerializer,
@@ -23,6 +26,9 @@ from .permissions import IsEventManager
 from accounts.permissions import CanManageEvents
 from common.permissions import EventManagementPermission
 from common.audit_service import AdminAuditService
+from common.models import SearchDocument
+from common.pagination import KeysetPageNumberPagination
+from common.search import IndexedSearchFilter
 
 # Initialize audit service
 audit_service = AdminAuditService()
@@ -41,9 +47,9 @@ class EventViewSet(viewsets.ModelViewSet):
     - Custom actions for configuration, status, and statistics
     """
     queryset = Event.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'event_type', 'is_active', 'is_public', 'is_featured']
-    search_fields = ['name', 'short_name', 'description', 'host_city', 'host_country']
+    search_document_type = SearchDocument.DocumentType.EVENT
     ordering_fields = ['name', 'start_date', 'end_date', 'created_at', 'volunteer_target']
     ordering = ['-start_date', 'name']
     
@@ -87,12 +93,8 @@ class EventViewSet(viewsets.ModelViewSet):
                    (self.request.user.is_staff or self.request.user.is_superuser)):
                 queryset = queryset.filter(is_public=True, is_active=True)
         
-        # Add select_related and prefetch_related for performance
-        queryset = queryset.select_related('created_by').prefetch_related(
-            'event_managers', 'venues', 'roles'
-        )
-        
-        return queryset
+        # Join, prefetch and annotate what the serializers display
+        return queryset.with_list_stats()
     
     def perform_create(self, serializer):
         """Create event with audit logging"""
@@ -259,7 +261,7 @@ class EventViewSet(viewsets.ModelViewSet):
     def venues(self, request, pk=None):
         """Get all venues for this event"""
         event = self.get_object()
-        venues = event.venues.all()
+        venues = Venue.objects.filter(event=event).with_list_stats()
         serializer = VenueListSerializer(venues, many=True, context={'request': request})
         return Response(serializer.data)
     
@@ -366,12 +368,8 @@ class VenueViewSet(viewsets.ModelViewSet):
                     event__is_active=True
                 )
         
-        # Add select_related for performance
-        queryset = queryset.select_related('event', 'created_by').prefetch_related(
-            'venue_coordinators', 'roles'
-        )
-        
-        return queryset
+        # Join, prefetch and annotate what the serializers display
+        return queryset.with_list_stats()
     
     def perform_create(self, serializer):
         """Create venue with audit logging"""
@@ -507,7 +505,7 @@ class EventVenuesView(generics.ListAPIView):
     
     def get_queryset(self):
         event_id = self.kwargs['event_id']
-        return Venue.objects.filter(event_id=event_id, is_active=True)
+        return Venue.objects.filter(event_id=event_id, is_active=True).with_list_stats()
 
 
 class EventRolesView(generics.ListAPIView):
@@ -517,7 +515,7 @@ class EventRolesView(generics.ListAPIView):
     
     def get_queryset(self):
         event_id = self.kwargs['event_id']
-        return Role.objects.filter(event_id=event_id, is_public=True, status='ACTIVE')
+        return Role.objects.filter(event_id=event_id, is_public=True, status='ACTIVE').with_list_stats()
 
 
 class EventAssignmentsView(generics.ListAPIView):
@@ -527,9 +525,7 @@ class EventAssignmentsView(generics.ListAPIView):
     
     def get_queryset(self):
         event_id = self.kwargs['event_id']
-        return Assignment.objects.filter(event_id=event_id).select_related(
-            'volunteer', 'role', 'venue', 'assigned_by'
-        )
+        return Assignment.objects.filter(event_id=event_id).with_list_stats()
 
 
 class VenueRolesView(generics.ListAPIView):
@@ -539,7 +535,7 @@ class VenueRolesView(generics.ListAPIView):
     
     def get_queryset(self):
         venue_id = self.kwargs['venue_id']
-        return Role.objects.filter(venue_id=venue_id, is_public=True, status='ACTIVE')
+        return Role.objects.filter(venue_id=venue_id, is_public=True, status='ACTIVE').with_list_stats()
 
 
 class VenueCapacityView(generics.RetrieveAPIView):
@@ -721,12 +717,8 @@ class RoleViewSet(viewsets.ModelViewSet):
                    (self.request.user.is_staff or self.request.user.is_superuser)):
                 queryset = queryset.filter(is_public=True, status='ACTIVE')
         
-        # Add select_related and prefetch_related for performance
-        queryset = queryset.select_related(
-            'event', 'venue', 'created_by', 'role_supervisor', 'status_changed_by'
-        ).prefetch_related('role_coordinators')
-        
-        return queryset
+        # Join and prefetch what the serializers display
+        return queryset.with_list_stats()
     
     def perform_create(self, serializer):
         """Create role with audit logging"""
@@ -1067,9 +1059,7 @@ class RoleVolunteersView(generics.ListAPIView):
     
     def get_queryset(self):
         role_id = self.kwargs['role_id']
-        return Assignment.objects.filter(role_id=role_id).select_related(
-            'volunteer', 'role', 'event', 'venue', 'assigned_by'
-        )
+        return Assignment.objects.filter(role_id=role_id).with_list_stats()
     
     def list(self, request, *args, **kwargs):
         try:
@@ -1111,22 +1101,19 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     - Custom actions for status workflows, attendance, and bulk operations
     """
     queryset = Assignment.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_fields = [
         'volunteer', 'role', 'event', 'venue', 'assignment_type', 'status',
         'priority_level', 'is_admin_override', 'assigned_by', 'reviewed_by',
         'approved_by', 'start_date', 'end_date'
     ]
-    search_fields = [
-        'volunteer__first_name', 'volunteer__last_name', 'volunteer__email',
-        'role__name', 'event__name', 'venue__name', 'special_instructions',
-        'notes'
-    ]
+    search_document_type = SearchDocument.DocumentType.ASSIGNMENT
     ordering_fields = [
         'assigned_date', 'start_date', 'end_date', 'status', 'priority_level',
         'volunteer__last_name', 'role__name', 'event__name'
     ]
     ordering = ['-assigned_date', 'start_date', 'volunteer__last_name']
+    pagination_class = KeysetPageNumberPagination
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -1162,14 +1149,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return filtered queryset based on user permissions"""
-        queryset = Assignment.objects.select_related(
-            'volunteer', 'role', 'event', 'venue',
-            'assigned_by', 'reviewed_by', 'approved_by',
-            'status_changed_by', 'admin_override_by'
-        ).prefetch_related(
-            'role__required_credentials',
-            'role__preferred_credentials'
-        )
+        queryset = Assignment.objects.with_list_stats()
         
         # Filter based on user permissions
         user = self.request.user
@@ -1586,48 +1566,29 @@ class AssignmentViewSet(viewsets.ModelViewSet):
             action = serializer.validated_data['action']
             notes = serializer.validated_data.get('notes', '')
             
-            assignments = Assignment.objects.filter(id__in=assignment_ids)
-            
-            if assignments.count() != len(assignment_ids):
-                return Response({
-                    'error': 'Some assignment IDs were not found'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            results = {
-                'total_requested': len(assignment_ids),
-                'successful': 0,
-                'failed': 0,
-                'errors': []
-            }
-            
-            for assignment in assignments:
-                try:
-                    if action == 'approve':
-                        assignment.approve(approved_by=request.user, notes=notes)
-                    elif action == 'cancel':
-                        assignment.cancel(cancelled_by=request.user, reason=notes)
-                    elif action == 'activate':
-                        assignment.activate(activated_by=request.user, notes=notes)
-                    elif action == 'complete':
-                        assignment.complete(completed_by=request.user, notes=notes)
-                    elif action == 'send_notification':
-                        # Would integrate with notification system
-                        pass
-                    
-                    results['successful'] += 1
-                    
-                except ValidationError as e:
-                    results['failed'] += 1
-                    results['errors'].append({
-                        'assignment_id': str(assignment.id),
-                        'volunteer_name': assignment.volunteer.get_full_name(),
-                        'error': str(e)
-                    })
+            if action == 'send_notification':
+                # Would integrate with notification system
+                results = {
+                    'total_requested': len(assignment_ids),
+                    'successful': len(assignment_ids),
+                    'failed': 0,
+                    'errors': []
+                }
+            else:
+                results = bulk_action(
+                    assignment_ids,
+                    action,
+                    user=request.user,
+                    notes=notes,
+                    request=request
+                )
             
             # Log bulk operation
-            audit_service.log_event_management_operation(
-                operation=f'ASSIGNMENT_BULK_{action.upper()}',
+            audit_service.log_bulk_operation(
                 user=request.user,
+                operation_type=f'ASSIGNMENT_BULK_{action.upper()}',
+                affected_count=results['successful'],
+                request=request,
                 details={
                     'action': action,
                     'total_requested': results['total_requested'],
@@ -1748,48 +1709,14 @@ class BulkAssignmentView(generics.GenericAPIView):
                 'error': 'assignments data is required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        results = {
-            'total_requested': len(assignments_data),
-            'successful': 0,
-            'failed': 0,
-            'created_assignments': [],
-            'errors': []
-        }
-        
-        for assignment_data in assignments_data:
-            try:
-                serializer = AssignmentCreateSerializer(
-                    data=assignment_data,
-                    context={'request': request}
-                )
-                
-                if serializer.is_valid():
-                    assignment = serializer.save(assigned_by=request.user)
-                    results['successful'] += 1
-                    results['created_assignments'].append({
-                        'id': str(assignment.id),
-                        'volunteer_name': assignment.volunteer.get_full_name(),
-                        'role_name': assignment.role.name,
-                        'event_name': assignment.event.name
-                    })
-                else:
-                    results['failed'] += 1
-                    results['errors'].append({
-                        'data': assignment_data,
-                        'errors': serializer.errors
-                    })
-                    
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append({
-                    'data': assignment_data,
-                    'error': str(e)
-                })
+        results = bulk_create_assignments(assignments_data, assigned_by=request.user)
         
         # Log bulk creation
-        audit_service.log_event_management_operation(
-            operation='ASSIGNMENT_BULK_CREATE',
+        audit_service.log_bulk_operation(
             user=request.user,
+            operation_type='ASSIGNMENT_BULK_CREATE',
+            affected_count=results['successful'],
+            request=request,
             details={
                 'total_requested': results['total_requested'],
                 'successful': results['successful'],
@@ -1811,31 +1738,34 @@ class BulkAssignmentView(generics.GenericAPIView):
                 'error': 'assignment_ids and status are required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        assignments = Assignment.objects.filter(id__in=assignment_ids)
+        if new_status not in Assignment.AssignmentStatus.values:
+            return Response({
+                'error': f'Invalid status: {new_status}'
+            }, status=status.HTTP_400_BAD_REQUEST)
         
-        results = {
-            'total_requested': len(assignment_ids),
-            'successful': 0,
-            'failed': 0,
-            'errors': []
-        }
+        results = bulk_transition(
+            assignment_ids,
+            new_status,
+            changed_by=request.user,
+            reason=reason,
+            request=request
+        )
         
-        for assignment in assignments:
-            try:
-                assignment.change_status(
-                    new_status,
-                    changed_by=request.user,
-                    reason=reason
-                )
-                results['successful'] += 1
-                
-            except ValidationError as e:
-                results['failed'] += 1
-                results['errors'].append({
-                    'assignment_id': str(assignment.id),
-                    'volunteer_name': assignment.volunteer.get_full_name(),
-                    'error': str(e)
-                })
+        # Log bulk status update
+        audit_service.log_bulk_operation(
+            user=request.user,
+            operation_type='ASSIGNMENT_BULK_STATUS_UPDATE',
+            affected_count=results['successful'],
+            request=request,
+            details={
+                'status': new_status,
+                'total_requested': results['total_requested'],
+                'successful': results['successful'],
+                'failed': results['failed'],
+                'reason': reason,
+                'via_api': True
+            }
+        )
         
         return Response(results)
     
@@ -1993,61 +1923,21 @@ class AssignmentStatsView(generics.GenericAPIView):
         if date_to:
             queryset = queryset.filter(assigned_date__lte=date_to)
         
-        # Calculate statistics
-        total_assignments = queryset.count()
-        
-        # Status breakdown
-        status_counts = {}
-        for status_choice in Assignment.AssignmentStatus.choices:
-            status_code = status_choice[0]
-            status_counts[status_code] = queryset.filter(status=status_code).count()
-        
-        # Assignment type breakdown
-        type_counts = {}
-        for type_choice in Assignment.AssignmentType.choices:
-            type_code = type_choice[0]
-            type_counts[type_code] = queryset.filter(assignment_type=type_code).count()
-        
-        # Priority breakdown
-        priority_counts = {}
-        for priority_choice in Assignment.PriorityLevel.choices:
-            priority_code = priority_choice[0]
-            priority_counts[priority_code] = queryset.filter(priority_level=priority_code).count()
-        
-        # Admin overrides
-        admin_overrides = queryset.filter(is_admin_override=True).count()
-        
-        # Performance metrics
-        completed_assignments = queryset.filter(status='COMPLETED')
-        avg_performance_rating = completed_assignments.aggregate(
-            avg_rating=Avg('performance_rating')
-        )['avg_rating']
-        
-        # Time-based metrics
-        from django.utils import timezone
-        today = timezone.now().date()
-        
-        overdue_assignments = queryset.filter(
-            start_date__lt=today,
-            status__in=['PENDING', 'APPROVED']
-        ).count()
-        
-        upcoming_assignments = queryset.filter(
-            start_date__gte=today,
-            status__in=['APPROVED', 'CONFIRMED', 'ACTIVE']
-        ).count()
+        # Calculate all statistics in a single aggregate query
+        stats = get_assignment_stats(queryset)
+        avg_performance_rating = stats['average_performance_rating']
         
         return Response({
             'summary': {
-                'total_assignments': total_assignments,
-                'admin_overrides': admin_overrides,
-                'overdue_assignments': overdue_assignments,
-                'upcoming_assignments': upcoming_assignments,
+                'total_assignments': stats['total'],
+                'admin_overrides': stats['admin_overrides'],
+                'overdue_assignments': stats['overdue'],
+                'upcoming_assignments': stats['upcoming'],
                 'average_performance_rating': round(avg_performance_rating, 2) if avg_performance_rating else None
             },
-            'status_breakdown': status_counts,
-            'type_breakdown': type_counts,
-            'priority_breakdown': priority_counts,
+            'status_breakdown': stats['status'],
+            'type_breakdown': stats['type'],
+            'priority_breakdown': stats['priority'],
             'filters_applied': {
                 'event_id': event_id,
                 'role_id': role_id,
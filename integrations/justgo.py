@@ -4,6 +4,11 @@ JustGo API Integration Client
 This module provides a comprehensive client for integrating with the JustGo API v2.1.
 Supports authentication, rate limiting, member management, credentials, and events.
 
+Requests from every thread and client instance talking to the same JustGo host
+share one token bucket, so bulk lookups can run on a bounded thread pool over
+a pooled session without exceeding JustGo's rate limits. A 429 response pauses
+the shared bucket for the ``Retry-After`` period.
+
 Based on JustGo API Documentation - June 13, 2025
 Base URL: https://api.justgo.com
 API Version: v2.1
@@ -11,10 +16,13 @@ API Version: v2.1
 
 import time
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
@@ -45,6 +53,8 @@ class JustGoCredentials:
     timeout: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 0.5  # Seconds between requests
+    rate_limit_burst: int = 1  # Requests allowed back to back before spacing applies
+    max_workers: int = 8  # Concurrent requests for bulk lookups
 
 
 @dataclass
@@ -113,13 +123,69 @@ class JustGoNotFoundError(JustGoAPIError):
     pass
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket for JustGo requests.
+    
+    Each caller reserves the next free slot and sleeps until it, so any
+    number of threads together stay under ``rate`` requests per second, with
+    bursts of up to ``burst`` requests. ``pause`` holds every caller back,
+    e.g. for a ``Retry-After`` period.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.burst = max(1, burst)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    def acquire(self) -> float:
+        """Wait for a token; returns the seconds waited"""
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._paused_until, self._next_slot - (self.burst - 1) * self.interval)
+            self._next_slot = max(self._next_slot, start) + self.interval
+        
+        wait = start - now
+        if wait <= 0:
+            return 0.0
+
+        time.sleep(wait)
+        with self._lock:
+            # Push later slots back by however long the sleep overran
+            self._next_slot += max(self.clock() - start, 0.0)
+        return wait
+
+    def pause(self, seconds: float):
+        """Hold back all callers for ``seconds``"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+
+
+_rate_limiters: Dict[tuple, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(credentials: JustGoCredentials) -> TokenBucket:
+    """Get the token bucket shared by all clients for this host and limit"""
+    rate = 1.0 / credentials.rate_limit_delay if credentials.rate_limit_delay > 0 else 0.0
+    key = (credentials.base_url, rate, credentials.rate_limit_burst)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = TokenBucket(rate, credentials.rate_limit_burst)
+        return _rate_limiters[key]
+
+
 class JustGoAPIClient:
     """
     JustGo API Client with comprehensive functionality
     
     Features:
     - Automatic authentication and token management
-    - Rate limiting and retry logic
+    - Shared token-bucket rate limiting and retry logic
+    - Bounded concurrent bulk lookups over a pooled session
     - Member lookup and management
     - Credential retrieval and validation
     - Event management and booking operations
@@ -137,14 +203,23 @@ class JustGoAPIClient:
         self.session = requests.Session()
         self.session.timeout = self.credentials.timeout
         
+        # Keep a pooled connection per concurrent worker
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(self.credentials.max_workers, 1))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Authentication state
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._auth_lock = threading.Lock()
         
         # Rate limiting
+        self.rate_limiter = get_rate_limiter(self.credentials)
         self._last_request_time: float = 0
         self._request_count: int = 0
         
+        self._member_cache = None
+        
         # Setup session headers
         self.session.headers.update({
             'accept': 'application/json',
@@ -164,7 +239,9 @@ class JustGoAPIClient:
                 api_version=justgo_config.get('API_VERSION', 'v2.1'),
                 timeout=justgo_config.get('TIMEOUT', 30),
                 max_retries=justgo_config.get('MAX_RETRIES', 3),
-                rate_limit_delay=justgo_config.get('RATE_LIMIT_DELAY', 0.5)
+                rate_limit_delay=justgo_config.get('RATE_LIMIT_DELAY', 0.5),
+                rate_limit_burst=justgo_config.get('RATE_LIMIT_BURST', 1),
+                max_workers=justgo_config.get('MAX_WORKERS', 8)
             )
         except Exception as e:
             logger.error(f"Failed to load JustGo credentials from settings: {e}")
@@ -176,14 +253,10 @@ class JustGoAPIClient:
         return f"{self.credentials.base_url}/api/{self.credentials.api_version}/{endpoint}"
 
     def _apply_rate_limiting(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        
-        if time_since_last_request < self.credentials.rate_limit_delay:
-            sleep_time = self.credentials.rate_limit_delay - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        """Wait for a token from the shared rate limiter"""
+        sleep_time = self.rate_limiter.acquire()
+        if sleep_time:
+            logger.debug(f"Rate limiting: slept for {sleep_time:.2f} seconds")
         
         self._last_request_time = time.time()
         self._request_count += 1
@@ -277,17 +350,11 @@ class JustGoAPIClient:
             JustGoAPIError: For other API errors
         """
         url = self._get_api_url(endpoint)
+        extra_headers = kwargs.pop('headers', None) or {}
         
         # Ensure authentication
         self._ensure_authenticated()
         
-        # Apply rate limiting
-        self._apply_rate_limiting()
-        
-        # Add authorization header
-        if self._access_token:
-            self.session.headers['Authorization'] = f'Bearer {self._access_token}'
-        
         # Set timeout if not provided
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.credentials.timeout
@@ -300,7 +367,15 @@ class JustGoAPIClient:
             try:
                 logger.debug(f"JustGo API request attempt {attempt + 1}/{self.credentials.max_retries}: {method} {url}")
                 
-                response = self.session.request(method, url, **kwargs)
+                # Every attempt, including retries, takes a token
+                self._apply_rate_limiting()
+                
+                # Per-request header; the session is shared between threads
+                headers = dict(extra_headers)
+                if self._access_token:
+                    headers['Authorization'] = f'Bearer {self._access_token}'
+                
+                response = self.session.request(method, url, headers=headers, **kwargs)
                 return self._handle_response(response)
                 
             except JustGoAuthenticationError:
@@ -323,8 +398,9 @@ class JustGoAPIClient:
                 else:
                     wait_time = base_delay * (2 ** attempt)  # Exponential backoff
                 
+                # Pause the shared limiter so every worker backs off together
                 logger.warning(f"Rate limited (attempt {attempt + 1}), waiting {wait_time} seconds")
-                time.sleep(wait_time)
+                self.rate_limiter.pause(wait_time)
                 last_exception = e
                 
             except requests.exceptions.Timeout as e:
@@ -454,10 +530,17 @@ class JustGoAPIClient:
     def _ensure_authenticated(self):
         """Ensure we have a valid access token"""
         # Check if token is still valid
-        if (self._access_token and self._token_expires_at and 
-            timezone.now() < self._token_expires_at):
+        if self.is_authenticated():
             return
         
+        # Only one thread authenticates; the others reuse its token
+        with self._auth_lock:
+            if self.is_authenticated():
+                return
+            self._refresh_access_token()
+
+    def _refresh_access_token(self):
+        """Load the shared cached token or authenticate"""
         # Try to get cached token
         cached_token = cache.get('justgo_access_token')
         cached_expires = cache.get('justgo_token_expires_at')
@@ -533,6 +616,91 @@ class JustGoAPIClient:
         logger.info(f"Getting credentials for member: {member_id}")
         return self._make_request('GET', f'Credentials/FindByAttributes?memberId={member_id}')
 
+    def get_many_member_credentials(self, member_ids: List[str],
+                                    max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get credentials for many members concurrently
+        
+        Lookups run on a bounded thread pool and share the client's rate limiter.
+        
+        Args:
+            member_ids: List of member IDs (MIDs or GUIDs)
+            max_workers: Concurrent lookups (default: credentials.max_workers)
+            
+        Returns:
+            Dictionary of member ID to either a dict with ``member_name`` and
+            ``credentials``, or the exception raised for that member
+        """
+        def fetch(member_id: str) -> Dict[str, Any]:
+            member, credentials_data = self._fetch_member_record(member_id)
+            return {
+                'member_id': member_id,
+                'member_name': f"{member.get('firstName', '')} {member.get('lastName', '')}".strip(),
+                'credentials': credentials_data
+            }
+        
+        return self._map_concurrently(fetch, member_ids, max_workers)
+
+    def _fetch_member_record(self, member_id: str):
+        """
+        Fetch a member's details and credentials from JustGo
+        
+        Args:
+            member_id: Member GUID or MID
+            
+        Returns:
+            Tuple of (member data, credentials data)
+        """
+        if len(member_id) < 10:  # Assume it's a MID
+            member_journey = self.get_member_journey(member_id)
+            member_data = (member_journey.get('search_result', {}).get('data') or [{}])[0]
+            credentials_data = member_journey.get('credentials', {})
+        else:  # Assume it's a member GUID
+            credentials_data = self.get_member_credentials(member_id)
+            member_data = self.get_member_by_id(member_id).get('data', {})
+        return member_data, credentials_data
+
+    @property
+    def member_cache(self):
+        """Read-through cache of member details and credentials"""
+        if self._member_cache is None:
+            from .justgo_cache import JustGoMemberCache
+            self._member_cache = JustGoMemberCache(self)
+        return self._member_cache
+
+    def lookup_member_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a member by email for pre-filling forms
+        
+        Args:
+            email: Email address
+            
+        Returns:
+            Member summary with personal details, or None if not a JustGo member
+        """
+        return self.member_cache.lookup_member_by_email(email)
+
+    def _map_concurrently(self, func, items: List[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Call ``func`` for each item on a bounded thread pool
+        
+        Returns:
+            Dictionary of item to result, or to the exception it raised, in input order
+        """
+        items = list(dict.fromkeys(items))
+        if not items:
+            return {}
+        
+        workers = min(max_workers or self.credentials.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='justgo') as executor:
+            futures = {item: executor.submit(func, item) for item in items}
+        
+        results = {}
+        for item, future in futures.items():
+            error = future.exception()
+            results[item] = error if error is not None else future.result()
+        return results
+
     # Event Management Methods
     
     def find_event_candidates(self, event_id: str) -> Dict[str, Any]:
@@ -705,13 +873,15 @@ class JustGoAPIClient:
 
     # Synchronization Methods
     
-    def sync_member_to_local(self, mid: str, local_user_model) -> Dict[str, Any]:
+    def sync_member_to_local(self, mid: str, local_user_model,
+                             member_journey: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Synchronize JustGo member data to local database
         
         Args:
             mid: Member ID to sync
             local_user_model: Django User model class
+            member_journey: Member journey already fetched for this MID, if any
             
         Returns:
             Synchronization results
@@ -720,7 +890,7 @@ class JustGoAPIClient:
         
         try:
             # Get complete member journey from JustGo
-            member_journey = self.get_member_journey(mid)
+            member_journey = member_journey or self.get_member_journey(mid)
             
             # Extract member data
             search_result = member_journey.get('search_result', {})
@@ -1013,14 +1183,8 @@ class JustGoAPIClient:
         logger.info(f"Validating credentials for member {member_id}")
         
         try:
-            # Get member credentials
-            if len(member_id) < 10:  # Assume it's a MID
-                member_journey = self.get_member_journey(member_id)
-                credentials_data = member_journey.get('credentials', {})
-                member_data = member_journey.get('search_result', {}).get('data', [{}])[0]
-            else:  # Assume it's a member GUID
-                credentials_data = self.get_member_credentials(member_id)
-                member_data = self.get_member_by_id(member_id).get('data', {})
+            # Get member credentials, served from the cache for mapped members
+            member_data, credentials_data = self.member_cache.get_member(member_id)
             
             # Process credentials
             extractor = JustGoDataExtractor()
@@ -1161,58 +1325,45 @@ class JustGoAPIClient:
         
         extractor = JustGoDataExtractor()
         
-        for member_id in member_ids:
-            try:
-                # Get member credentials
-                if len(member_id) < 10:  # MID
-                    member_journey = self.get_member_journey(member_id)
-                    credentials_data = member_journey.get('credentials', {})
-                    member_name = f"{member_journey.get('search_result', {}).get('data', [{}])[0].get('firstName', '')} {member_journey.get('search_result', {}).get('data', [{}])[0].get('lastName', '')}"
-                else:  # GUID
-                    credentials_data = self.get_member_credentials(member_id)
-                    member_detail = self.get_member_by_id(member_id).get('data', {})
-                    member_name = f"{member_detail.get('firstName', '')} {member_detail.get('lastName', '')}"
-                
-                # Check for expiring credentials
-                expiring_credentials = extractor.check_credential_expiry(credentials_data, days_ahead)
-                
-                if expiring_credentials:
-                    report['members_with_expiring_credentials'] += 1
-                    report['total_expiring_credentials'] += len(expiring_credentials)
-                    
-                    member_report = {
-                        'member_id': member_id,
-                        'member_name': member_name.strip(),
-                        'expiring_credentials': expiring_credentials,
-                        'expiring_count': len(expiring_credentials)
-                    }
-                    
-                    report['member_reports'].append(member_report)
-                    
-                    # Update summary by credential type
-                    for cred in expiring_credentials:
-                        cred_type = cred.get('type', 'Unknown')
-                        if cred_type not in report['summary_by_credential_type']:
-                            report['summary_by_credential_type'][cred_type] = {
-                                'count': 0,
-                                'members': []
-                            }
-                        
-                        report['summary_by_credential_type'][cred_type]['count'] += 1
-                        if member_id not in report['summary_by_credential_type'][cred_type]['members']:
-                            report['summary_by_credential_type'][cred_type]['members'].append(member_id)
-                
-                report['members_processed'] += 1
-                
-                # Rate limiting
-                self._apply_rate_limiting()
-                
-            except Exception as e:
-                logger.error(f"Error processing member {member_id}: {e}")
+        for member_id, result in self.get_many_member_credentials(member_ids).items():
+            if isinstance(result, Exception):
+                logger.error(f"Error processing member {member_id}: {result}")
                 report['errors'].append({
                     'member_id': member_id,
-                    'error': str(e)
+                    'error': str(result)
                 })
+                continue
+            
+            # Check for expiring credentials
+            expiring_credentials = extractor.check_credential_expiry(result['credentials'], days_ahead)
+            
+            if expiring_credentials:
+                report['members_with_expiring_credentials'] += 1
+                report['total_expiring_credentials'] += len(expiring_credentials)
+                
+                member_report = {
+                    'member_id': member_id,
+                    'member_name': result['member_name'],
+                    'expiring_credentials': expiring_credentials,
+                    'expiring_count': len(expiring_credentials)
+                }
+                
+                report['member_reports'].append(member_report)
+                
+                # Update summary by credential type
+                for cred in expiring_credentials:
+                    cred_type = cred.get('type', 'Unknown')
+                    if cred_type not in report['summary_by_credential_type']:
+                        report['summary_by_credential_type'][cred_type] = {
+                            'count': 0,
+                            'members': []
+                        }
+                    
+                    report['summary_by_credential_type'][cred_type]['count'] += 1
+                    if member_id not in report['summary_by_credential_type'][cred_type]['members']:
+                        report['summary_by_credential_type'][cred_type]['members'].append(member_id)
+            
+            report['members_processed'] += 1
         
         logger.info(f"Credential expiry report completed: {report['members_with_expiring_credentials']} members with expiring credentials")
         return report
@@ -1249,11 +1400,12 @@ class JustGoAPIClient:
             if not member_id:
                 raise JustGoAPIError("No member ID found in search result")
             
-            # Step 2: Get detailed member information
-            detailed_info = self.get_member_by_id(member_id)
-            
-            # Step 3: Get member credentials
-            credentials = self.get_member_credentials(member_id)
+            # Steps 2 and 3: Get detailed member information and credentials together
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix='justgo') as executor:
+                detailed_future = executor.submit(self.get_member_by_id, member_id)
+                credentials_future = executor.submit(self.get_member_credentials, member_id)
+            detailed_info = detailed_future.result()
+            credentials = credentials_future.result()
             
             # Step 4: Extract all identifiers
             extractor = JustGoDataExtractor()
@@ -1589,6 +1741,20 @@ class JustGoAPIClient:
             logger.error(f"Failed to get memberships for member {member_id}: {e}")
             raise JustGoAPIError(f"Failed to retrieve memberships: {e}")
 
+    def get_many_member_memberships(self, member_ids: List[str],
+                                    max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get memberships for many members concurrently
+        
+        Args:
+            member_ids: List of JustGo member IDs
+            max_workers: Concurrent lookups (default: credentials.max_workers)
+            
+        Returns:
+            Dictionary of member ID to memberships data, or the exception raised for that member
+        """
+        return self._map_concurrently(self.get_member_memberships, member_ids, max_workers)
+
     def _process_membership_data(self, membership: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process and standardize membership data
@@ -1654,8 +1820,8 @@ class JustGoAPIClient:
         logger.info(f"Validating membership for member {member_id} against role requirements")
         
         try:
-            # Get member memberships
-            memberships_data = self.get_member_memberships(member_id)
+            # Get member memberships, served from the cache for mapped members
+            memberships_data = self.member_cache.get_memberships(member_id)
             memberships = memberships_data.get('memberships', [])
             
             # Extract required membership types
@@ -1811,9 +1977,10 @@ class JustGoAPIClient:
         membership_type_counts = {}
         category_counts = {}
         
-        for member_id in member_ids:
+        for member_id, memberships_data in self.get_many_member_memberships(member_ids).items():
             try:
-                memberships_data = self.get_member_memberships(member_id)
+                if isinstance(memberships_data, Exception):
+                    raise memberships_data
                 memberships = memberships_data.get('memberships', [])
                 
                 member_summary = {
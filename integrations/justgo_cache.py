@@ -0,0 +1,360 @@
+"""
+Read-through cache for JustGo member records
+
+A member record is the member's JustGo details (including memberships) plus
+their credentials. Records for members mapped to a local user are persisted
+in ``JustGoCredentialCache`` rows and the mapping's ``mapping_metadata``, and
+the hottest ones are also kept in an in-process LRU.
+
+A record is fresh for ``FRESH_TTL`` seconds after ``last_verified_at``. After
+that it is stale: it is still served, and a background thread refreshes it
+from JustGo. It expires outright ``MAX_STALE`` seconds after verification, or
+at the end of the earliest expiry date of its active credentials, whichever
+comes first, and the next lookup then waits for JustGo.
+
+Emails that JustGo does not know are remembered for ``NEGATIVE_TTL`` seconds,
+both in the LRU (as the time the entry lapses) and the shared Django cache, so EOI pre-fill does not ask
+again for every page load. Unmapped members are not cached and always go to
+JustGo.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, time as dt_time, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import JustGoCredentialCache, JustGoMemberMapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SETTINGS = {
+    'FRESH_TTL': 6 * 3600,
+    'MAX_STALE': 7 * 86400,
+    'NEGATIVE_TTL': 15 * 60,
+    'LRU_SIZE': 1024,
+    'REFRESH_WORKERS': 2,
+}
+
+def get_cache_settings() -> Dict[str, Any]:
+    """JustGo cache settings merged with defaults"""
+    return {**DEFAULT_CACHE_SETTINGS, **getattr(settings, 'JUSTGO_CACHE', {})}
+
+
+@dataclass
+class MemberRecord:
+    """A member's JustGo details and credentials as of ``verified_at``"""
+    member_id: str
+    member: Dict[str, Any]
+    credentials: Dict[str, Any]
+    verified_at: datetime
+    fresh_until: datetime
+    expires_at: datetime
+
+    @classmethod
+    def build(cls, member_id: str, member: Dict[str, Any], credentials: Dict[str, Any],
+              verified_at: datetime, options: Dict[str, Any]) -> 'MemberRecord':
+        """Build a record with TTLs from verification time and credential expiry"""
+        expires_at = verified_at + timedelta(seconds=options['MAX_STALE'])
+        for credential in credentials.get('data', []):
+            if credential.get('status') != 'Active' or not credential.get('expiryDate'):
+                continue
+            try:
+                expiry_date = datetime.strptime(credential['expiryDate'][:10], '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            end_of_day = timezone.make_aware(datetime.combine(expiry_date + timedelta(days=1), dt_time.min))
+            expires_at = min(expires_at, end_of_day)
+
+        fresh_until = min(verified_at + timedelta(seconds=options['FRESH_TTL']), expires_at)
+        return cls(member_id, member, credentials, verified_at, fresh_until, expires_at)
+
+    def is_fresh(self, now: datetime) -> bool:
+        return now < self.fresh_until
+
+    def is_usable(self, now: datetime) -> bool:
+        return now < self.expires_at
+
+
+class LRUCache:
+    """Thread-safe, size-bounded in-process cache"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_lru = LRUCache(DEFAULT_CACHE_SETTINGS['LRU_SIZE'])
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refreshing = set()
+_refresh_lock = threading.Lock()
+
+
+def get_lru() -> LRUCache:
+    """Process-wide LRU of member records and unknown emails"""
+    _lru.maxsize = get_cache_settings()['LRU_SIZE']
+    return _lru
+
+
+def _email_key(email: str) -> str:
+    digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+    return f"justgo:unknown_email:{digest}"
+
+
+class JustGoMemberCache:
+    """
+    Read-through cache in front of a JustGoAPIClient
+
+    Usage:
+        member_cache = JustGoMemberCache(client)
+        member, credentials = member_cache.get_member(member_id)
+    """
+
+    def __init__(self, client, options: Optional[Dict[str, Any]] = None):
+        self.client = client
+        self.options = options or get_cache_settings()
+        self.lru = get_lru()
+
+    # Lookups
+
+    def get_member(self, member_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get a member's details and credentials
+
+        Returns:
+            ``(member_data, credentials_data)`` in JustGo's response shapes
+        """
+        record = self._get_record(member_id)
+        if record is not None:
+            return record.member, record.credentials
+        return self.client._fetch_member_record(member_id)
+
+    def get_memberships(self, member_id: str) -> Dict[str, Any]:
+        """Get a member's processed memberships, as returned by get_member_memberships"""
+        record = self._get_record(member_id)
+        if record is None:
+            return self.client.get_member_memberships(member_id)
+
+        memberships = [
+            self.client._process_membership_data(membership)
+            for membership in record.member.get('memberships', [])
+        ]
+        return {
+            'memberships': memberships,
+            'total_count': len(memberships),
+            'member_id': member_id,
+            'retrieved_at': record.verified_at.isoformat()
+        }
+
+    def lookup_member_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a member by email, or None if JustGo does not know the address
+
+        Known volunteers are answered from their mapping; unknown addresses
+        are negatively cached.
+        """
+        key = _email_key(email)
+        unknown_until = self.lru.get(key)
+        if unknown_until is not None and timezone.now() < unknown_until:
+            return None
+        if cache.get(key):
+            return None
+
+        mapping = JustGoMemberMapping.objects.filter(
+            local_user__email__iexact=email
+        ).only('justgo_member_id').first()
+        if mapping:
+            member, _credentials = self.get_member(mapping.justgo_member_id)
+            if member:
+                return self._summarise_member(member)
+
+        results = self.client.find_member_by_email(email).get('data') or []
+        if not results:
+            self.lru.set(key, timezone.now() + timedelta(seconds=self.options['NEGATIVE_TTL']))
+            cache.set(key, True, self.options['NEGATIVE_TTL'])
+            return None
+        return self._summarise_member(results[0])
+
+    def invalidate(self, member_id: str):
+        """Drop a member from the in-process LRU"""
+        self.lru.delete(('member', member_id))
+
+    # Records
+
+    def _get_record(self, member_id: str) -> Optional[MemberRecord]:
+        """Serve a record from the LRU or database, refreshing it if stale or expired"""
+        now = timezone.now()
+        record = self.lru.get(('member', member_id))
+        if record is None:
+            mapping = self._get_mapping(member_id)
+            if mapping is None:
+                return None
+            record = self._load(mapping, member_id)
+            if record is None or not record.is_usable(now):
+                return self.refresh(member_id, mapping)
+            self.lru.set(('member', member_id), record)
+        elif not record.is_usable(now):
+            return self.refresh(member_id)
+
+        if not record.is_fresh(now):
+            self._refresh_in_background(member_id)
+        return record
+
+    def refresh(self, member_id: str, mapping: Optional[JustGoMemberMapping] = None) -> Optional[MemberRecord]:
+        """Fetch a member from JustGo and store the record"""
+        mapping = mapping or self._get_mapping(member_id)
+        if mapping is None:
+            self.lru.delete(('member', member_id))
+            return None
+
+        member, credentials = self.client._fetch_member_record(mapping.justgo_member_id)
+        record = self.store(mapping, member_id, member, credentials)
+        self.lru.set(('member', member_id), record)
+        return record
+
+    def _get_mapping(self, member_id: str) -> Optional[JustGoMemberMapping]:
+        lookup = {'justgo_mid': member_id} if len(member_id) < 10 else {'justgo_member_id': member_id}
+        return JustGoMemberMapping.objects.filter(**lookup).first()
+
+    def _load(self, mapping: JustGoMemberMapping, member_id: str) -> Optional[MemberRecord]:
+        """Rebuild a record from the database, or None if it was never cached"""
+        cached = mapping.mapping_metadata.get('justgo_cache')
+        if not cached:
+            return None
+
+        rows = list(mapping.cached_credentials.all())
+        verified_times = [row.last_verified_at for row in rows if row.last_verified_at]
+        if len(verified_times) < len(rows):
+            return None
+        verified_at = min(verified_times) if verified_times else datetime.fromisoformat(cached['verified_at'])
+
+        credentials = {'data': [row.credential_data for row in rows]}
+        return MemberRecord.build(member_id, cached['member'], credentials, verified_at, self.options)
+
+    def store(self, mapping: JustGoMemberMapping, member_id: str, member: Dict[str, Any],
+               credentials: Dict[str, Any], verified_at: Optional[datetime] = None) -> MemberRecord:
+        """Replace the mapping's cached credentials and member details"""
+        verified_at = verified_at or timezone.now()
+        rows = {}
+        for credential in credentials.get('data', []):
+            credential_id = str(credential.get('credentialId', ''))
+            rows[credential_id] = JustGoCredentialCache(
+                member_mapping=mapping,
+                justgo_credential_id=credential_id,
+                credential_type=credential.get('type', 'Unknown')[:100],
+                credential_name=credential.get('name', '')[:255],
+                status=str(credential.get('status', '')).upper()[:15],
+                issued_date=(credential.get('issuedDate') or '')[:10] or None,
+                expiry_date=(credential.get('expiryDate') or '')[:10] or None,
+                last_verified_at=verified_at,
+                credential_data=credential
+            )
+
+        with transaction.atomic():
+            JustGoCredentialCache.objects.filter(member_mapping=mapping).delete()
+            JustGoCredentialCache.objects.bulk_create(rows.values())
+            mapping.mapping_metadata = {
+                **mapping.mapping_metadata,
+                'justgo_cache': {'member': member, 'verified_at': verified_at.isoformat()}
+            }
+            mapping.save(update_fields=['mapping_metadata', 'updated_at'])
+
+        return MemberRecord.build(member_id, member, credentials, verified_at, self.options)
+
+    def mark_verified(self, mapping: JustGoMemberMapping, verified_at: Optional[datetime] = None):
+        """Record that the cached data still matches JustGo without rewriting it"""
+        verified_at = verified_at or timezone.now()
+        cached = mapping.mapping_metadata.get('justgo_cache')
+        if not cached:
+            return
+
+        with transaction.atomic():
+            JustGoCredentialCache.objects.filter(member_mapping=mapping).update(last_verified_at=verified_at)
+            mapping.mapping_metadata = {
+                **mapping.mapping_metadata,
+                'justgo_cache': {**cached, 'verified_at': verified_at.isoformat()}
+            }
+            mapping.save(update_fields=['mapping_metadata', 'updated_at'])
+
+    def _refresh_in_background(self, member_id: str):
+        """Queue one refresh per stale member on the shared refresh pool"""
+        global _refresh_executor
+        with _refresh_lock:
+            if member_id in _refreshing:
+                return
+            _refreshing.add(member_id)
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=self.options['REFRESH_WORKERS'], thread_name_prefix='justgo-cache'
+                )
+        _refresh_executor.submit(self._run_refresh, member_id)
+
+    def _run_refresh(self, member_id: str):
+        close_old_connections()
+        try:
+            self.refresh(member_id)
+        except Exception as e:
+            logger.warning(f"Background refresh of JustGo member {member_id} failed: {e}")
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(member_id)
+            close_old_connections()
+
+    @staticmethod
+    def _summarise_member(member: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape JustGo member data for EOI pre-fill"""
+        active = [m for m in member.get('memberships', []) if m.get('status') == 'Active']
+        emergency = (member.get('emergencyContacts') or [{}])[0]
+        return {
+            'member_id': member.get('memberId'),
+            'mid': member.get('mid'),
+            'membership_type': active[0].get('membershipType') if active else None,
+            'personal_details': {
+                'first_name': member.get('firstName'),
+                'last_name': member.get('lastName'),
+                'date_of_birth': member.get('dob'),
+                'phone': member.get('phoneNumber'),
+                'address_line_1': member.get('address1'),
+                'city': member.get('town'),
+                'state': member.get('county'),
+                'postal_code': member.get('postCode'),
+            },
+            'emergency_contact': {
+                'name': emergency.get('name'),
+                'phone': emergency.get('phone'),
+                'relationship': emergency.get('relationship'),
+            },
+        }
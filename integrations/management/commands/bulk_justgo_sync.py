@@ -6,14 +6,26 @@ Usage:
     python manage.py bulk_justgo_sync --sync-type justgo_to_local --filter-active-only
     python manage.py bulk_justgo_sync --sync-type bidirectional --dry-run
     python manage.py bulk_justgo_sync --sync-type credential_sync --member-ids ME000001,ME000002
+    python manage.py bulk_justgo_sync --sync-type justgo_to_local --workers 4 --stale-after 24
+    python manage.py bulk_justgo_sync --sync-type justgo_to_local --resume
+
+Syncs are incremental: members whose JustGo data hashes to the value stored on
+their mapping are skipped, and ``--stale-after`` skips members synced recently.
+The work list and finished batches are checkpointed on the JustGoSync record
+after every batch, so ``--resume`` continues an interrupted run where it
+stopped.
 """
 
+import hashlib
+import json
 import time
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Tuple
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import connection
 from django.utils import timezone
 from django.db import models
 from integrations.justgo import JustGoAPIClient, JustGoAPIError
@@ -22,6 +34,18 @@ from integrations.models import JustGoSync, JustGoMemberMapping, IntegrationLog
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+RESUMABLE_STATUSES = [
+    JustGoSync.SyncStatus.IN_PROGRESS,
+    JustGoSync.SyncStatus.FAILED,
+    JustGoSync.SyncStatus.CANCELLED,
+]
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable hash of JSON-serialisable JustGo data"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
 
 class Command(BaseCommand):
     help = 'Perform bulk synchronization operations with JustGo API'
@@ -35,77 +59,112 @@ class Command(BaseCommand):
             required=True,
             help='Type of synchronization to perform'
         )
-        
+
         parser.add_argument(
             '--batch-size',
             type=int,
             default=50,
             help='Number of records to process in each batch (default: 50)'
         )
-        
+
         parser.add_argument(
             '--member-ids',
             type=str,
             help='Comma-separated list of specific member IDs to sync (MIDs or member GUIDs)'
         )
-        
+
         parser.add_argument(
             '--filter-active-only',
             action='store_true',
             help='Only sync active members/mappings'
         )
-        
+
         parser.add_argument(
             '--filter-modified-since',
             type=str,
             help='Only sync records modified since date (YYYY-MM-DD format)'
         )
-        
+
         parser.add_argument(
             '--dry-run',
             action='store_true',
             help='Perform a dry run without making actual changes'
         )
-        
+
         parser.add_argument(
             '--force-override',
             action='store_true',
             help='Force sync with admin override (bypasses read-only mode)'
         )
-        
+
         parser.add_argument(
             '--override-justification',
             type=str,
             default='Bulk sync operation via management command',
             help='Justification for admin override if --force-override is used'
         )
-        
+
         parser.add_argument(
             '--max-errors',
             type=int,
             default=10,
             help='Maximum number of errors before stopping (default: 10)'
         )
-        
+
         parser.add_argument(
             '--delay-between-batches',
             type=float,
             default=1.0,
             help='Delay in seconds between batches (default: 1.0)'
         )
-        
+
         parser.add_argument(
             '--create-missing',
             action='store_true',
             help='Create missing profiles during sync'
         )
-        
+
         parser.add_argument(
             '--update-credentials',
             action='store_true',
             help='Update credential cache during sync'
         )
 
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of batches to process in parallel (default: 1)'
+        )
+
+        parser.add_argument(
+            '--stale-after',
+            type=float,
+            default=0,
+            help='Skip mappings synced within this many hours (default: 0, sync all)'
+        )
+
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Apply JustGo data even when it is unchanged since the last sync'
+        )
+
+        parser.add_argument(
+            '--resume',
+            nargs='?',
+            const='latest',
+            metavar='SYNC_ID',
+            help='Resume an interrupted sync from its checkpoint (default: the latest of this type)'
+        )
+
+        parser.add_argument(
+            '--progress-interval',
+            type=float,
+            default=5.0,
+            help='Minimum seconds between progress updates (default: 5.0)'
+        )
+
     def handle(self, *args, **options):
         """Main command handler"""
         self.options = options
@@ -114,26 +173,34 @@ class Command(BaseCommand):
         self.dry_run = options['dry_run']
         self.force_override = options['force_override']
         self.max_errors = options['max_errors']
-        
+        self.workers = max(options['workers'], 1)
+        self.full = options['full']
+        self.progress_interval = options['progress_interval']
+        self.error_count = 0
+        self._last_progress_at = 0.0
+
         # Initialize JustGo client
         try:
             self.client = JustGoAPIClient()
         except Exception as e:
             raise CommandError(f"Failed to initialize JustGo client: {e}")
-        
-        # Create sync operation record
-        self.sync_operation = self.create_sync_operation()
-        
+
+        # Create or resume the sync operation record
+        if options.get('resume'):
+            self.sync_operation = self.resume_sync_operation(options['resume'])
+        else:
+            self.sync_operation = self.create_sync_operation()
+
         try:
             self.stdout.write(
                 self.style.SUCCESS(f"Starting bulk {self.sync_type} synchronization...")
             )
-            
+
             if self.dry_run:
                 self.stdout.write(
                     self.style.WARNING("DRY RUN MODE - No actual changes will be made")
                 )
-            
+
             # Perform the sync based on type
             if self.sync_type == 'local_to_justgo':
                 self.sync_local_to_justgo()
@@ -143,20 +210,28 @@ class Command(BaseCommand):
                 self.sync_bidirectional()
             elif self.sync_type == 'credential_sync':
                 self.sync_credentials()
-            
+
             # Complete the sync operation
             self.sync_operation.complete(JustGoSync.SyncStatus.COMPLETED)
-            
+            skipped = sum(counts['skipped'] for counts in self.sync_operation.sync_results.values())
+
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Bulk synchronization completed successfully!\n"
                     f"Processed: {self.sync_operation.processed_records}\n"
                     f"Successful: {self.sync_operation.successful_records}\n"
+                    f"Skipped (unchanged): {skipped}\n"
                     f"Failed: {self.sync_operation.failed_records}\n"
                     f"Success Rate: {self.sync_operation.success_rate:.1f}%"
                 )
             )
-            
+
+        except KeyboardInterrupt:
+            self.sync_operation.complete(JustGoSync.SyncStatus.CANCELLED)
+            raise CommandError(
+                f"Bulk synchronization interrupted; resume with --resume {self.sync_operation.id}"
+            )
+
         except Exception as e:
             self.sync_operation.complete(JustGoSync.SyncStatus.FAILED)
             self.sync_operation.error_details.append({
@@ -164,9 +239,11 @@ class Command(BaseCommand):
                 'timestamp': timezone.now().isoformat()
             })
             self.sync_operation.save()
-            
+
             logger.error(f"Bulk sync failed: {e}")
-            raise CommandError(f"Bulk synchronization failed: {e}")
+            raise CommandError(
+                f"Bulk synchronization failed: {e} (resume with --resume {self.sync_operation.id})"
+            )
 
     def create_sync_operation(self) -> JustGoSync:
         """Create a sync operation record"""
@@ -176,7 +253,7 @@ class Command(BaseCommand):
             'bidirectional': JustGoSync.SyncType.BIDIRECTIONAL,
             'credential_sync': JustGoSync.SyncType.CREDENTIAL_SYNC
         }
-        
+
         return JustGoSync.objects.create(
             sync_type=sync_type_mapping[self.sync_type],
             status=JustGoSync.SyncStatus.IN_PROGRESS,
@@ -190,25 +267,49 @@ class Command(BaseCommand):
                 'filter_modified_since': self.options.get('filter_modified_since'),
                 'member_ids': self.options.get('member_ids'),
                 'create_missing': self.options.get('create_missing', False),
-                'update_credentials': self.options.get('update_credentials', False)
+                'update_credentials': self.options.get('update_credentials', False),
+                'workers': self.workers,
+                'stale_after': self.options.get('stale_after', 0),
+                'full': self.full
             }
         )
 
-    def get_local_users_to_sync(self) -> List[User]:
-        """Get local users that need to be synced"""
+    def resume_sync_operation(self, sync_id: str) -> JustGoSync:
+        """Reopen an interrupted sync operation that has a checkpoint"""
+        operations = JustGoSync.objects.filter(
+            sync_type=self.sync_type.upper(),
+            status__in=RESUMABLE_STATUSES
+        ).exclude(checkpoint={})
+
+        if sync_id != 'latest':
+            operations = operations.filter(id=sync_id)
+
+        sync_operation = operations.order_by('-started_at').first()
+        if not sync_operation:
+            raise CommandError(f"No interrupted {self.sync_type} sync found to resume")
+
+        sync_operation.status = JustGoSync.SyncStatus.IN_PROGRESS
+        sync_operation.completed_at = None
+        sync_operation.save(update_fields=['status', 'completed_at'])
+
+        self.stdout.write(f"Resuming sync {sync_operation.id} started {sync_operation.started_at}")
+        return sync_operation
+
+    def get_local_users_to_sync(self) -> List[int]:
+        """Get IDs of local users that need to be synced"""
         queryset = User.objects.all()
-        
+
         # Apply filters
         if self.options.get('filter_active_only'):
             queryset = queryset.filter(is_active=True)
-        
+
         if self.options.get('filter_modified_since'):
             from datetime import datetime
             modified_since = datetime.strptime(
                 self.options['filter_modified_since'], '%Y-%m-%d'
             ).date()
             queryset = queryset.filter(updated_at__date__gte=modified_since)
-        
+
         if self.options.get('member_ids'):
             member_ids = [mid.strip() for mid in self.options['member_ids'].split(',')]
             # Filter by email or existing JustGo mappings
@@ -217,270 +318,324 @@ class Command(BaseCommand):
                 models.Q(justgo_mapping__justgo_mid__in=member_ids) |
                 models.Q(justgo_mapping__justgo_member_id__in=member_ids)
             )
-        
-        return list(queryset)
+
+        return list(queryset.order_by('pk').values_list('pk', flat=True).distinct())
+
+    def get_mappings_to_sync(self):
+        """Get mapped members, leaving out ones synced within --stale-after hours"""
+        mappings = JustGoMemberMapping.objects.order_by('justgo_member_id')
+
+        if self.options.get('stale_after'):
+            synced_since = timezone.now() - timedelta(hours=self.options['stale_after'])
+            mappings = mappings.exclude(last_synced_at__gte=synced_since)
+
+        return mappings
 
     def get_justgo_members_to_sync(self) -> List[str]:
-        """Get JustGo member IDs that need to be synced"""
+        """Get JustGo member IDs (MIDs where known) that need to be synced"""
         if self.options.get('member_ids'):
             return [mid.strip() for mid in self.options['member_ids'].split(',')]
-        
+
         # Get all mapped members
-        mappings = JustGoMemberMapping.objects.all()
-        
+        mappings = self.get_mappings_to_sync()
+
         if self.options.get('filter_active_only'):
             mappings = mappings.filter(status=JustGoMemberMapping.MappingStatus.ACTIVE)
-        
-        return [mapping.justgo_member_id for mapping in mappings]
+
+        return [mid or member_id for mid, member_id in mappings.values_list('justgo_mid', 'justgo_member_id')]
+
+    # Batch processing
+
+    def run_batches(self, phase: str, get_items: Callable[[], List[Any]],
+                    process_item: Callable[[Any], Tuple[str, str]]):
+        """
+        Process items in checkpointed batches, several batches at a time
+
+        The work list is fixed when the phase first starts, so a resumed run
+        processes exactly the batches that had not finished.
+        """
+        checkpoint = self.sync_operation.checkpoint.get(phase)
+        if checkpoint is None:
+            checkpoint = {
+                'items': get_items(),
+                'batch_size': self.batch_size,
+                'completed_batches': [],
+                'counts': {'processed': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+            }
+            self.save_checkpoint(phase, checkpoint)
+        elif checkpoint['completed_batches']:
+            self.stdout.write(
+                f"Resuming {phase}: {len(checkpoint['completed_batches'])} batches already done"
+            )
+
+        items, batch_size = checkpoint['items'], checkpoint['batch_size']
+        total_batches = (len(items) + batch_size - 1) // batch_size
+        completed = set(checkpoint['completed_batches'])
+        pending = [
+            (number, items[number * batch_size:(number + 1) * batch_size])
+            for number in range(total_batches) if number not in completed
+        ]
+
+        self.sync_operation.total_records = len(items)
+        self.sync_operation.save(update_fields=['total_records'])
+
+        if self.workers == 1:
+            for number, batch in pending:
+                self.stdout.write(f"Processing batch {number + 1}/{total_batches}...")
+                results = self.process_batch(batch, process_item)
+                if not self.record_batch(phase, checkpoint, number, total_batches, results):
+                    break
+        else:
+            self.stdout.write(f"Processing {len(pending)} batches with {self.workers} workers...")
+            self.run_batches_in_parallel(phase, checkpoint, pending, total_batches, process_item)
+
+        self.report_progress(checkpoint['counts'], f"Finished {phase}", force=True)
+        self.sync_operation.sync_results[phase] = checkpoint['counts']
+        self.sync_operation.save(update_fields=['sync_results'])
+
+        if self.error_count >= self.max_errors:
+            raise CommandError(f"Too many errors ({self.error_count}), stopping sync")
+
+    def run_batches_in_parallel(self, phase, checkpoint, pending, total_batches, process_item):
+        """Keep up to --workers batches running, recording each as it finishes"""
+        pending = iter(pending)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='justgo-sync') as executor:
+            running = {}
+
+            def submit_next():
+                number, batch = next(pending, (None, None))
+                if batch is not None:
+                    running[executor.submit(self.process_batch_in_thread, batch, process_item)] = number
+
+            for _ in range(self.workers):
+                submit_next()
+
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    number = running.pop(future)
+                    if self.record_batch(phase, checkpoint, number, total_batches, future.result()):
+                        submit_next()
+
+    def process_batch(self, batch: List[Any], process_item) -> List[Tuple[Any, str, str]]:
+        """Process one batch, returning ``(item, outcome, message)`` per item"""
+        results = []
+        for item in batch:
+            try:
+                outcome, message = process_item(item)
+            except Exception as e:
+                logger.error(f"Failed to sync {item}: {e}")
+                outcome, message = 'error', str(e)
+            results.append((item, outcome, message))
+
+        # Delay between batches
+        if self.options['delay_between_batches'] > 0:
+            time.sleep(self.options['delay_between_batches'])
+
+        return results
+
+    def process_batch_in_thread(self, batch, process_item):
+        """Process a batch on a worker thread with its own database connection"""
+        try:
+            return self.process_batch(batch, process_item)
+        finally:
+            connection.close()
+
+    def record_batch(self, phase, checkpoint, number, total_batches, results) -> bool:
+        """
+        Count a finished batch's results and checkpoint it
+
+        Returns:
+            False once --max-errors is reached and no more batches should start
+        """
+        counts = checkpoint['counts']
+        for item, outcome, message in results:
+            counts['processed'] += 1
+            if outcome == 'success':
+                counts['successful'] += 1
+                self.stdout.write(f"  ✓ {message}")
+            elif outcome == 'skipped':
+                counts['successful'] += 1
+                counts['skipped'] += 1
+                if self.options.get('verbosity', 1) > 1:
+                    self.stdout.write(f"  - Unchanged: {item}")
+            elif outcome == 'failed':
+                counts['failed'] += 1
+                self.stdout.write(self.style.ERROR(f"  ✗ Failed: {item} - {message}"))
+            else:
+                counts['failed'] += 1
+                self.error_count += 1
+                self.stdout.write(self.style.ERROR(f"  ✗ Error syncing {item}: {message}"))
+
+        checkpoint['completed_batches'].append(number)
+        self.save_checkpoint(phase, checkpoint)
+        self.report_progress(counts, f"Processed batch {number + 1}/{total_batches} ({phase})")
+
+        return self.error_count < self.max_errors
+
+    def save_checkpoint(self, phase: str, checkpoint: Dict[str, Any]):
+        """Persist a phase's checkpoint on the sync operation"""
+        self.sync_operation.save_checkpoint({**self.sync_operation.checkpoint, phase: checkpoint})
+
+    def report_progress(self, counts: Dict[str, int], current_op: str, force: bool = False):
+        """Update the sync operation's progress at most once per --progress-interval"""
+        now = time.monotonic()
+        if not force and now - self._last_progress_at < self.progress_interval:
+            return
+
+        self._last_progress_at = now
+        self.sync_operation.update_progress(
+            counts['processed'], counts['successful'], counts['failed'], current_op
+        )
+
+    # Sync phases
 
     def sync_local_to_justgo(self):
         """Sync local users to JustGo"""
-        users = self.get_local_users_to_sync()
-        self.sync_operation.total_records = len(users)
-        self.sync_operation.save()
-        
-        self.stdout.write(f"Syncing {len(users)} local users to JustGo...")
-        
-        error_count = 0
-        processed = 0
-        successful = 0
-        failed = 0
-        
-        # Process in batches
-        for i in range(0, len(users), self.batch_size):
-            batch = users[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
-            total_batches = (len(users) + self.batch_size - 1) // self.batch_size
-            
-            self.stdout.write(f"Processing batch {batch_num}/{total_batches}...")
-            
-            for user in batch:
-                try:
-                    if self.dry_run:
-                        self.stdout.write(f"  [DRY RUN] Would sync user: {user.email}")
-                        successful += 1
-                    else:
-                        if self.force_override:
-                            # Use admin override
-                            admin_user = self.get_admin_user()
-                            result = self.client.sync_with_override(
-                                'local_to_justgo',
-                                admin_user,
-                                self.options['override_justification'],
-                                user=user,
-                                create_if_missing=self.options.get('create_missing', False)
-                            )
-                        else:
-                            # Regular sync
-                            result = self.client.sync_local_to_justgo(
-                                user, 
-                                create_if_missing=self.options.get('create_missing', False)
-                            )
-                        
-                        if result.get('status') == 'success':
-                            successful += 1
-                            self.stdout.write(f"  ✓ Synced: {user.email}")
-                        else:
-                            failed += 1
-                            self.stdout.write(
-                                self.style.ERROR(f"  ✗ Failed: {user.email} - {result.get('message', 'Unknown error')}")
-                            )
-                    
-                    processed += 1
-                    
-                except Exception as e:
-                    failed += 1
-                    error_count += 1
-                    logger.error(f"Failed to sync user {user.email}: {e}")
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Error syncing {user.email}: {e}")
-                    )
-                    
-                    if error_count >= self.max_errors:
-                        raise CommandError(f"Too many errors ({error_count}), stopping sync")
-                
-                # Update progress
-                self.sync_operation.update_progress(
-                    processed, successful, failed, f"Processing user: {user.email}"
-                )
-            
-            # Delay between batches
-            if self.options['delay_between_batches'] > 0:
-                time.sleep(self.options['delay_between_batches'])
+        self.stdout.write("Syncing local users to JustGo...")
+        self.run_batches('local_to_justgo', self.get_local_users_to_sync, self.sync_local_user)
+
+    def sync_local_user(self, user_id: int) -> Tuple[str, str]:
+        """Sync one local user to JustGo"""
+        user = User.objects.get(pk=user_id)
+
+        if self.dry_run:
+            return 'success', f"[DRY RUN] Would sync user: {user.email}"
+
+        if self.force_override:
+            # Use admin override
+            admin_user = self.get_admin_user()
+            result = self.client.sync_with_override(
+                'local_to_justgo',
+                admin_user,
+                self.options['override_justification'],
+                user=user,
+                create_if_missing=self.options.get('create_missing', False)
+            )
+        else:
+            # Regular sync
+            result = self.client.sync_local_to_justgo(
+                user,
+                create_if_missing=self.options.get('create_missing', False)
+            )
+
+        if result.get('status') == 'success':
+            return 'success', f"Synced: {user.email}"
+        return 'failed', result.get('message', 'Unknown error')
 
     def sync_justgo_to_local(self):
         """Sync JustGo members to local database"""
-        member_ids = self.get_justgo_members_to_sync()
-        self.sync_operation.total_records = len(member_ids)
-        self.sync_operation.save()
-        
-        self.stdout.write(f"Syncing {len(member_ids)} JustGo members to local database...")
-        
-        error_count = 0
-        processed = 0
-        successful = 0
-        failed = 0
-        
-        # Process in batches
-        for i in range(0, len(member_ids), self.batch_size):
-            batch = member_ids[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
-            total_batches = (len(member_ids) + self.batch_size - 1) // self.batch_size
-            
-            self.stdout.write(f"Processing batch {batch_num}/{total_batches}...")
-            
-            for member_id in batch:
-                try:
-                    if self.dry_run:
-                        self.stdout.write(f"  [DRY RUN] Would sync member: {member_id}")
-                        successful += 1
-                    else:
-                        # Get member data from JustGo
-                        member_data = self.client.get_member_by_id(member_id)
-                        
-                        if member_data.get('data'):
-                            # Sync to local database
-                            result = self.client.sync_member_to_local(
-                                member_id, User
-                            )
-                            
-                            if result.get('status') == 'success':
-                                successful += 1
-                                self.stdout.write(f"  ✓ Synced: {member_id}")
-                                
-                                # Update credentials if requested
-                                if self.options.get('update_credentials'):
-                                    self.update_member_credentials(member_id)
-                            else:
-                                failed += 1
-                                self.stdout.write(
-                                    self.style.ERROR(f"  ✗ Failed: {member_id} - {result.get('message', 'Unknown error')}")
-                                )
-                        else:
-                            failed += 1
-                            self.stdout.write(
-                                self.style.ERROR(f"  ✗ No data found for member: {member_id}")
-                            )
-                    
-                    processed += 1
-                    
-                except Exception as e:
-                    failed += 1
-                    error_count += 1
-                    logger.error(f"Failed to sync member {member_id}: {e}")
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Error syncing {member_id}: {e}")
-                    )
-                    
-                    if error_count >= self.max_errors:
-                        raise CommandError(f"Too many errors ({error_count}), stopping sync")
-                
-                # Update progress
-                self.sync_operation.update_progress(
-                    processed, successful, failed, f"Processing member: {member_id}"
-                )
-            
-            # Delay between batches
-            if self.options['delay_between_batches'] > 0:
-                time.sleep(self.options['delay_between_batches'])
+        self.stdout.write("Syncing JustGo members to local database...")
+        self.run_batches('justgo_to_local', self.get_justgo_members_to_sync, self.sync_member)
+
+    def sync_member(self, member_id: str) -> Tuple[str, str]:
+        """Sync one JustGo member locally, skipping members whose data is unchanged"""
+        if self.dry_run:
+            return 'success', f"[DRY RUN] Would sync member: {member_id}"
+
+        member_journey = self.client.get_member_journey(member_id)
+        member_basic = member_journey['search_result']['data'][0]
+        justgo_member_id = member_basic.get('memberId')
+        digest = content_hash(member_basic, member_journey.get('detailed_info', {}).get('data'))
+
+        mappings = JustGoMemberMapping.objects.filter(justgo_member_id=justgo_member_id)
+        unchanged = not self.full and mappings.filter(content_hash=digest).exists()
+
+        if not unchanged:
+            result = self.client.sync_member_to_local(member_id, User, member_journey=member_journey)
+            if result.get('status') != 'success':
+                return 'failed', result.get('message') or result.get('error', 'Unknown error')
+
+        mappings.update(
+            content_hash=digest,
+            last_synced_at=timezone.now(),
+            last_sync_direction='justgo_to_local'
+        )
+
+        # Update credentials if requested
+        if self.options.get('update_credentials'):
+            self.update_member_credentials(justgo_member_id)
+
+        if unchanged:
+            return 'skipped', member_id
+        return 'success', f"Synced: {member_id}"
 
     def sync_bidirectional(self):
         """Perform bidirectional synchronization"""
         self.stdout.write("Performing bidirectional synchronization...")
-        
+
         # First sync local to JustGo
         self.stdout.write("Phase 1: Syncing local users to JustGo...")
         self.sync_local_to_justgo()
-        
+
         # Then sync JustGo to local
         self.stdout.write("Phase 2: Syncing JustGo members to local...")
         self.sync_justgo_to_local()
 
     def sync_credentials(self):
         """Sync credentials for existing mappings"""
-        mappings = JustGoMemberMapping.objects.filter(
+        self.stdout.write("Syncing member credentials...")
+        self.run_batches('credential_sync', self.get_credential_members_to_sync, self.sync_member_credentials)
+
+    def get_credential_members_to_sync(self) -> List[str]:
+        """Get member GUIDs of active mappings whose credentials need syncing"""
+        mappings = self.get_mappings_to_sync().filter(
             status=JustGoMemberMapping.MappingStatus.ACTIVE
         )
-        
+
         if self.options.get('member_ids'):
             member_ids = [mid.strip() for mid in self.options['member_ids'].split(',')]
             mappings = mappings.filter(
                 models.Q(justgo_mid__in=member_ids) |
                 models.Q(justgo_member_id__in=member_ids)
             )
-        
-        self.sync_operation.total_records = mappings.count()
-        self.sync_operation.save()
-        
-        self.stdout.write(f"Syncing credentials for {mappings.count()} members...")
-        
-        error_count = 0
-        processed = 0
-        successful = 0
-        failed = 0
-        
-        for mapping in mappings:
-            try:
-                if self.dry_run:
-                    self.stdout.write(f"  [DRY RUN] Would sync credentials for: {mapping.justgo_member_id}")
-                    successful += 1
-                else:
-                    self.update_member_credentials(mapping.justgo_member_id)
-                    successful += 1
-                    self.stdout.write(f"  ✓ Updated credentials: {mapping.justgo_member_id}")
-                
-                processed += 1
-                
-            except Exception as e:
-                failed += 1
-                error_count += 1
-                logger.error(f"Failed to sync credentials for {mapping.justgo_member_id}: {e}")
-                self.stdout.write(
-                    self.style.ERROR(f"  ✗ Error syncing credentials {mapping.justgo_member_id}: {e}")
-                )
-                
-                if error_count >= self.max_errors:
-                    raise CommandError(f"Too many errors ({error_count}), stopping sync")
-            
-            # Update progress
-            self.sync_operation.update_progress(
-                processed, successful, failed, f"Processing credentials: {mapping.justgo_member_id}"
-            )
 
-    def update_member_credentials(self, member_id: str):
-        """Update cached credentials for a member"""
-        from integrations.models import JustGoCredentialCache
-        
+        return list(mappings.values_list('justgo_member_id', flat=True))
+
+    def sync_member_credentials(self, member_id: str) -> Tuple[str, str]:
+        """Sync one member's cached credentials"""
+        if self.dry_run:
+            return 'success', f"[DRY RUN] Would sync credentials for: {member_id}"
+
+        if self.update_member_credentials(member_id):
+            return 'success', f"Updated credentials: {member_id}"
+        return 'skipped', member_id
+
+    def update_member_credentials(self, member_id: str) -> bool:
+        """
+        Update cached credentials for a member
+
+        Returns:
+            Whether the cached data changed
+        """
         try:
-            # Get mapping
             mapping = JustGoMemberMapping.objects.get(justgo_member_id=member_id)
-            
-            # Get credentials from JustGo
-            credentials_data = self.client.get_member_credentials(member_id)
-            
-            if credentials_data.get('data'):
-                # Clear existing cached credentials
-                JustGoCredentialCache.objects.filter(member_mapping=mapping).delete()
-                
-                # Cache new credentials
-                for cred in credentials_data['data']:
-                    JustGoCredentialCache.objects.create(
-                        member_mapping=mapping,
-                        justgo_credential_id=cred.get('credentialId', ''),
-                        credential_type=cred.get('type', 'Unknown'),
-                        credential_name=cred.get('name', ''),
-                        status=cred.get('status', 'Unknown'),
-                        issued_date=cred.get('issuedDate'),
-                        expiry_date=cred.get('expiryDate'),
-                        credential_data=cred
-                    )
-                
-                self.stdout.write(f"    Cached {len(credentials_data['data'])} credentials")
-            
         except JustGoMemberMapping.DoesNotExist:
             self.stdout.write(
                 self.style.WARNING(f"    No mapping found for member: {member_id}")
             )
+            return False
+
+        try:
+            member, credentials_data = self.client._fetch_member_record(member_id)
+            digest = content_hash(member, credentials_data)
+            member_cache = self.client.member_cache
+
+            changed = self.full or mapping.credentials_hash != digest
+            if changed:
+                member_cache.store(mapping, member_id, member, credentials_data)
+            else:
+                member_cache.mark_verified(mapping)
+
+            JustGoMemberMapping.objects.filter(pk=mapping.pk).update(
+                credentials_hash=digest,
+                last_synced_at=timezone.now()
+            )
+            for key in filter(None, [member_id, mapping.justgo_mid]):
+                member_cache.invalidate(key)
+
+            return changed
+
         except Exception as e:
             raise Exception(f"Failed to update credentials: {e}")
 
@@ -489,4 +644,4 @@ class Command(BaseCommand):
         admin_user = User.objects.filter(is_staff=True, is_active=True).first()
         if not admin_user:
             raise CommandError("No active admin user found for override operations")
-        return admin_user 
\ No newline at end of file
+        return admin_user
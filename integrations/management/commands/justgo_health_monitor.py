@@ -13,7 +13,7 @@ import time
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
-from django.core.mail import send_mail
+from common.email_outbox import queue_email
 from django.conf import settings
 from integrations.justgo import JustGoAPIClient, JustGoAPIError
 from integrations.models import IntegrationLog, JustGoMemberMapping, JustGoCredentialCache
@@ -557,15 +557,15 @@ SUMMARY:
                 for rec in report['recommendations']:
                     body += f"\n[{rec['priority'].upper()}] {rec['message']}\n"
             
-            send_mail(
+            queue_email(
                 subject=subject,
-                message=body,
+                body=body,
                 from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com'),
-                recipient_list=recipients,
-                fail_silently=False
+                to=recipients,
+                category='justgo_health_report'
             )
             
-            self.stdout.write(f"Health report sent to: {', '.join(recipients)}")
+            self.stdout.write(f"Health report queued for: {', '.join(recipients)}")
             
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f"Failed to send email: {e}")) 
\ No newline at end of file
+            self.stdout.write(self.style.ERROR(f"Failed to queue email: {e}")) 
\ No newline at end of file
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='justgomembermapping',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='Hash of the JustGo member data last applied locally', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='justgomembermapping',
+            name='credentials_hash',
+            field=models.CharField(blank=True, help_text='Hash of the JustGo member data last written to the credential cache', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='justgosync',
+            name='checkpoint',
+            field=models.JSONField(blank=True, default=dict, help_text='Work list and completed batches, used to resume an interrupted sync'),
+        ),
+    ]
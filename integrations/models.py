@@ -118,6 +118,11 @@ class JustGoSync(models.Model):
         blank=True,
         help_text=_('Description of current operation')
     )
+    checkpoint = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_('Work list and completed batches, used to resume an interrupted sync')
+    )
     
     class Meta:
         ordering = ['-started_at']
@@ -161,6 +166,11 @@ class JustGoSync(models.Model):
             'progress_percentage', 'current_operation'
         ])
     
+    def save_checkpoint(self, checkpoint: dict):
+        """Persist resumable progress"""
+        self.checkpoint = checkpoint
+        self.save(update_fields=['checkpoint'])
+    
     def complete(self, status: SyncStatus = None):
         """Mark sync as completed"""
         self.status = status or self.SyncStatus.COMPLETED
@@ -233,6 +243,16 @@ class JustGoMemberMapping(models.Model):
         blank=True,
         help_text=_('Direction of last sync (local_to_justgo, justgo_to_local)')
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text=_('Hash of the JustGo member data last applied locally')
+    )
+    credentials_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text=_('Hash of the JustGo member data last written to the credential cache')
+    )
     sync_conflicts = models.JSONField(
         default=list,
         blank=True,
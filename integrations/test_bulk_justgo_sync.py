@@ -0,0 +1,124 @@
+"""
+Tests for incremental, resumable bulk JustGo synchronization.
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from .justgo import JustGoAPIClient
+from .models import JustGoCredentialCache, JustGoMemberMapping, JustGoSync
+
+User = get_user_model()
+
+
+class BulkJustGoSyncTest(TestCase):
+    """Test delta sync, checkpoints and parallel batches"""
+
+    def setUp(self):
+        """Set up mapped members"""
+        self.mappings = []
+        for index in range(4):
+            user = User.objects.create_user(
+                username=f'member{index}',
+                email=f'member{index}@test.com',
+                password='testpass123'
+            )
+            self.mappings.append(JustGoMemberMapping.objects.create(
+                local_user=user,
+                justgo_member_id=f'member-guid-{index:04d}',
+                justgo_mid=f'150{index}',
+                status=JustGoMemberMapping.MappingStatus.ACTIVE
+            ))
+        self.guids = {mapping.justgo_mid: mapping.justgo_member_id for mapping in self.mappings}
+
+        journey = patch.object(JustGoAPIClient, 'get_member_journey', side_effect=self.member_journey)
+        self.get_member_journey = journey.start()
+        self.addCleanup(journey.stop)
+
+        sync = patch.object(JustGoAPIClient, 'sync_member_to_local', return_value={'status': 'success'})
+        self.sync_member_to_local = sync.start()
+        self.addCleanup(sync.stop)
+
+    def member_journey(self, mid):
+        return {
+            'search_result': {'data': [{'memberId': self.guids[mid], 'mid': mid, 'firstName': 'Member'}]},
+            'detailed_info': {'data': {'memberId': self.guids[mid], 'memberships': []}},
+            'credentials': {'data': []}
+        }
+
+    def run_sync(self, *args, batch_size=2):
+        call_command(
+            'bulk_justgo_sync', '--batch-size', str(batch_size), '--delay-between-batches', '0', *args,
+            stdout=StringIO()
+        )
+        return JustGoSync.objects.order_by('-started_at').first()
+
+    def test_unchanged_members_are_skipped(self):
+        """Test a second run does not re-apply members whose data is unchanged"""
+        first = self.run_sync('--sync-type', 'justgo_to_local')
+        self.assertEqual(self.sync_member_to_local.call_count, 4)
+        self.assertEqual(first.sync_results['justgo_to_local']['skipped'], 0)
+
+        self.mappings[0].content_hash = 'outdated'
+        self.mappings[0].save(update_fields=['content_hash'])
+
+        second = self.run_sync('--sync-type', 'justgo_to_local')
+        self.assertEqual(self.sync_member_to_local.call_count, 5)
+        self.assertEqual(second.sync_results['justgo_to_local']['skipped'], 3)
+        self.assertEqual(second.successful_records, 4)
+        self.assertFalse(JustGoMemberMapping.objects.filter(last_synced_at__isnull=True).exists())
+
+        self.run_sync('--sync-type', 'justgo_to_local', '--stale-after', '1')
+        self.assertEqual(self.get_member_journey.call_count, 8)
+
+    def test_interrupted_sync_resumes_from_checkpoint(self):
+        """Test --resume only processes batches that had not finished"""
+        self.sync_member_to_local.side_effect = [Exception('JustGo unavailable'), {'status': 'success'}]
+
+        with self.assertRaises(CommandError):
+            self.run_sync('--sync-type', 'justgo_to_local', '--max-errors', '1')
+
+        failed = JustGoSync.objects.get()
+        self.assertEqual(failed.status, JustGoSync.SyncStatus.FAILED)
+        self.assertEqual(failed.checkpoint['justgo_to_local']['completed_batches'], [0])
+
+        self.get_member_journey.reset_mock()
+        self.sync_member_to_local.side_effect = None
+
+        resumed = self.run_sync('--sync-type', 'justgo_to_local', '--resume')
+
+        self.assertEqual(resumed.id, failed.id)
+        self.assertEqual(resumed.status, JustGoSync.SyncStatus.COMPLETED)
+        self.assertEqual([call.args[0] for call in self.get_member_journey.call_args_list], ['1502', '1503'])
+        self.assertEqual(resumed.processed_records, 4)
+        self.assertEqual(resumed.failed_records, 1)
+
+    def test_credential_sync_writes_cache_only_when_changed(self):
+        """Test credential sync fills the credential cache and skips unchanged members"""
+        credentials = {'data': [{'credentialId': 'cred-1', 'name': 'Garda Vetting', 'status': 'Active'}]}
+        with patch.object(JustGoAPIClient, '_fetch_member_record', return_value=({'firstName': 'Member'}, credentials)):
+            self.run_sync('--sync-type', 'credential_sync')
+            self.assertEqual(JustGoCredentialCache.objects.count(), 4)
+
+            with patch('integrations.justgo_cache.JustGoMemberCache.store') as store:
+                second = self.run_sync('--sync-type', 'credential_sync', '--member-ids', '1500,1501')
+
+        store.assert_not_called()
+        self.assertEqual(second.sync_results['credential_sync']['skipped'], 2)
+
+    def test_parallel_batches_throttle_progress(self):
+        """Test batches run on several workers and progress is saved at most once per interval"""
+        with patch.object(JustGoSync, 'update_progress') as update_progress:
+            sync = self.run_sync(
+                '--sync-type', 'justgo_to_local', '--dry-run', '--workers', '2',
+                '--progress-interval', '60', batch_size=1
+            )
+
+        self.assertEqual(sync.sync_results['justgo_to_local']['processed'], 4)
+        self.assertEqual(sorted(sync.checkpoint['justgo_to_local']['completed_batches']), [0, 1, 2, 3])
+        self.assertEqual(update_progress.call_count, 2)
@@ -0,0 +1,135 @@
+"""
+Tests for the read-through JustGo member cache.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from .justgo import JustGoAPIClient, JustGoCredentials
+from .justgo_cache import get_lru
+from .models import JustGoCredentialCache, JustGoMemberMapping
+
+User = get_user_model()
+
+MEMBER_ID = 'member-guid-0001'
+
+
+def credential(name, expiry_date, status='Active'):
+    return {
+        'credentialId': f'cred-{name}',
+        'name': name,
+        'type': 'Vetting',
+        'status': status,
+        'expiryDate': expiry_date.isoformat()
+    }
+
+
+class JustGoMemberCacheTest(TestCase):
+    """Test credential and membership lookups are served from the cache"""
+
+    def setUp(self):
+        """Set up a mapped member"""
+        get_lru().clear()
+        self.addCleanup(get_lru().clear)
+
+        user = User.objects.create_user(
+            username='volunteer',
+            email='volunteer@test.com',
+            password='testpass123'
+        )
+        self.mapping = JustGoMemberMapping.objects.create(
+            local_user=user,
+            justgo_member_id=MEMBER_ID,
+            justgo_mid='1500482'
+        )
+        self.client = JustGoAPIClient(JustGoCredentials(secret='test-secret'))
+        self.member = {
+            'memberId': MEMBER_ID,
+            'firstName': 'Jane',
+            'lastName': 'Doe',
+            'dob': '1990-01-01',
+            'memberships': [{'membershipId': 'm-1', 'membershipType': 'Volunteer Membership', 'status': 'Active'}]
+        }
+        self.credentials = {'data': [credential('Garda Vetting', date.today() + timedelta(days=365))]}
+        self.requirements = {'required_credentials': ['Garda Vetting'], 'minimum_age': 18}
+
+        patcher = patch.object(JustGoAPIClient, '_fetch_member_record',
+                               return_value=(self.member, self.credentials))
+        self.fetch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validation_reads_through_the_cache(self):
+        """Test only the first validation reaches JustGo"""
+        first = self.client.validate_member_credentials_for_role(MEMBER_ID, self.requirements)
+        second = self.client.validate_member_credentials_for_role(MEMBER_ID, self.requirements)
+
+        self.assertEqual(first['overall_status'], 'pass')
+        self.assertEqual(second['overall_status'], 'pass')
+        self.fetch.assert_called_once_with(MEMBER_ID)
+
+        cached = JustGoCredentialCache.objects.get(member_mapping=self.mapping)
+        self.assertEqual(cached.status, JustGoCredentialCache.CredentialStatus.ACTIVE)
+        self.assertIsNotNone(cached.last_verified_at)
+
+    def test_database_serves_other_processes(self):
+        """Test a cold LRU is filled from JustGoCredentialCache, by GUID or MID"""
+        self.client.member_cache.refresh(MEMBER_ID)
+        get_lru().clear()
+
+        result = self.client.validate_membership_for_role('1500482', {'required_membership_types': ['Volunteer']})
+
+        self.assertTrue(result['validation_passed'])
+        self.fetch.assert_called_once_with(MEMBER_ID)
+
+    def test_stale_records_are_served_and_refreshed_in_background(self):
+        """Test a record past its fresh TTL is served while a refresh is queued"""
+        self.client.member_cache.refresh(MEMBER_ID)
+        get_lru().clear()
+        JustGoCredentialCache.objects.update(last_verified_at=timezone.now() - timedelta(days=1))
+
+        with patch('integrations.justgo_cache.JustGoMemberCache._refresh_in_background') as refresh:
+            result = self.client.validate_member_credentials_for_role(MEMBER_ID, self.requirements)
+
+        self.assertEqual(result['overall_status'], 'pass')
+        refresh.assert_called_once_with(MEMBER_ID)
+        self.assertEqual(self.fetch.call_count, 1)
+
+    def test_credential_expiry_forces_a_refresh(self):
+        """Test a record is not served past an active credential's expiry date"""
+        self.credentials['data'] = [credential('Garda Vetting', date.today() - timedelta(days=1))]
+        self.client.member_cache.refresh(MEMBER_ID)
+
+        self.client.validate_member_credentials_for_role(MEMBER_ID, self.requirements)
+
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_unknown_emails_are_negatively_cached(self):
+        """Test JustGo is asked about an unknown email once"""
+        with patch.object(JustGoAPIClient, 'find_member_by_email', return_value={'data': []}) as find:
+            self.assertIsNone(self.client.lookup_member_by_email('new@test.com'))
+            self.assertIsNone(self.client.lookup_member_by_email('New@Test.com'))
+
+            member = self.client.lookup_member_by_email('volunteer@test.com')
+
+        find.assert_called_once_with('new@test.com')
+        self.assertEqual(member['member_id'], MEMBER_ID)
+        self.assertEqual(member['membership_type'], 'Volunteer Membership')
+        self.assertEqual(member['personal_details']['first_name'], 'Jane')
+
+    def test_negative_email_entries_expire(self):
+        """Test an unknown email is asked about again once NEGATIVE_TTL has passed"""
+        found = {'data': [self.member]}
+        with patch.object(JustGoAPIClient, 'find_member_by_email', side_effect=[{'data': []}, found]) as find:
+            self.assertIsNone(self.client.lookup_member_by_email('new@test.com'))
+
+            later = timezone.now() + timedelta(seconds=self.client.member_cache.options['NEGATIVE_TTL'] + 1)
+            with patch('integrations.justgo_cache.timezone.now', return_value=later), \
+                    patch('integrations.justgo_cache.cache.get', return_value=None):
+                member = self.client.lookup_member_by_email('new@test.com')
+
+        self.assertEqual(find.call_count, 2)
+        self.assertEqual(member['member_id'], MEMBER_ID)
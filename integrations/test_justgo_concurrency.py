@@ -0,0 +1,143 @@
+"""
+Tests for concurrent JustGo lookups against a local stub server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase
+
+from .justgo import JustGoAPIClient, JustGoCredentials, TokenBucket
+
+
+class StubJustGoHandler(BaseHTTPRequestHandler):
+    """Minimal JustGo API: auth, member details and credentials"""
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_json(200, {'accessToken': 'stub-token', 'expiresIn': 3600})
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            throttle = server.throttle_next
+            server.throttle_next = False
+        try:
+            if throttle:
+                self.send_json(429, {'message': 'Too many requests'}, {'Retry-After': '1'})
+                return
+
+            time.sleep(0.05)
+            url = urlparse(self.path)
+            if url.path.endswith('/Credentials/FindByAttributes'):
+                member_id = parse_qs(url.query)['memberId'][0]
+                self.send_json(200, {'statusCode': 200, 'data': [
+                    {'credentialId': f'cred-{member_id}', 'status': 'Active', 'type': 'Vetting',
+                     'expiryDate': '2000-01-01'}
+                ]})
+            else:
+                member_id = url.path.rsplit('/', 1)[-1]
+                self.send_json(200, {'statusCode': 200, 'data': {
+                    'memberId': member_id, 'firstName': 'Member', 'lastName': member_id[-2:], 'memberships': []
+                }})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class JustGoConcurrencyTest(SimpleTestCase):
+    """Test bulk lookups run concurrently within the shared limits"""
+
+    def setUp(self):
+        """Start the stub server"""
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubJustGoHandler)
+        self.server.lock = threading.Lock()
+        self.server.in_flight = self.server.peak = 0
+        self.server.throttle_next = False
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.client = JustGoAPIClient(JustGoCredentials(
+            secret='stub-secret',
+            base_url=f'http://127.0.0.1:{self.server.server_port}',
+            rate_limit_delay=0,
+            max_workers=3
+        ))
+        self.member_ids = [f'member-guid-{index:02d}' for index in range(6)]
+
+    def test_bulk_credentials_run_with_bounded_concurrency(self):
+        """Test lookups overlap but never exceed max_workers"""
+        results = self.client.get_many_member_credentials(self.member_ids)
+
+        self.assertEqual(list(results), self.member_ids)
+        self.assertEqual(results['member-guid-03']['member_name'], 'Member 03')
+        self.assertEqual(results['member-guid-03']['credentials']['data'][0]['credentialId'],
+                         'cred-member-guid-03')
+        self.assertGreater(self.server.peak, 1)
+        self.assertLessEqual(self.server.peak, 3)
+
+    def test_expiry_report_uses_bulk_lookups(self):
+        """Test the expiry report covers every member and records failures"""
+        fetch_credentials = self.client.get_member_credentials
+
+        def get_member_credentials(member_id):
+            if member_id == 'member-guid-05':
+                raise Exception('boom')
+            return fetch_credentials(member_id)
+
+        with patch.object(self.client, 'get_member_credentials', side_effect=get_member_credentials):
+            report = self.client.get_credential_expiry_report(self.member_ids)
+
+        self.assertEqual(report['members_processed'], 5)
+        self.assertEqual(report['members_with_expiring_credentials'], 5)
+        self.assertEqual(report['errors'], [{'member_id': 'member-guid-05', 'error': 'boom'}])
+
+    def test_retry_after_pauses_all_workers(self):
+        """Test a 429 holds back every worker for the Retry-After period"""
+        self.server.throttle_next = True
+
+        started = time.monotonic()
+        results = self.client.get_many_member_credentials(self.member_ids)
+
+        self.assertGreaterEqual(time.monotonic() - started, 1)
+        self.assertFalse(any(isinstance(result, Exception) for result in results.values()))
+
+
+class TokenBucketTest(SimpleTestCase):
+    """Test the shared token bucket"""
+
+    def test_bursts_then_spaces_requests(self):
+        """Test bursts are allowed up to capacity and pauses delay everyone"""
+        now = [100.0]
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+
+        with patch('integrations.justgo.time.sleep') as sleep:
+            waits = [bucket.acquire() for _ in range(3)]
+            self.assertEqual(waits[:2], [0.0, 0.0])
+            self.assertAlmostEqual(waits[2], 0.1)
+
+            now[0] += 1
+            bucket.pause(5)
+            self.assertAlmostEqual(bucket.acquire(), 5)
+            self.assertEqual(sleep.call_count, 2)
@@ -9,7 +9,7 @@ from django.shortcuts import redirect
 import csv
 from datetime import datetime
 
-from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare
+from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare, ReportJob, AnalyticsWatermark
 
 
 @admin.register(Report)
@@ -816,3 +816,86 @@ class ReportShareAdmin(admin.ModelAdmin):
             obj.created_by = request.user
         
         super().save_model(request, obj, form, change)
+
+
+@admin.register(ReportJob)
+class ReportJobAdmin(admin.ModelAdmin):
+    """
+    Admin interface for the background report generation queue.
+    """
+    
+    # List display configuration
+    list_display = (
+        'report', 'status', 'priority', 'attempts', 'worker_id',
+        'available_at', 'heartbeat_at', 'finished_at', 'created_at'
+    )
+    
+    # Filtering
+    list_filter = (
+        'status', 'priority',
+        ('created_at', admin.DateFieldListFilter)
+    )
+    
+    # Search fields
+    search_fields = ('report__name', 'worker_id', 'requested_by__username')
+    
+    # Ordering
+    ordering = ('-created_at',)
+    
+    # Read-only fields (jobs are managed by the workers)
+    readonly_fields = (
+        'report', 'requested_by', 'attempts', 'worker_id', 'error_message',
+        'claimed_at', 'heartbeat_at', 'finished_at', 'created_at', 'updated_at'
+    )
+    
+    # Bulk actions
+    actions = ['retry_jobs', 'cancel_jobs']
+    
+    def retry_jobs(self, request, queryset):
+        """Return failed or cancelled jobs to the queue"""
+        updated = queryset.filter(
+            status__in=[ReportJob.Status.FAILED, ReportJob.Status.CANCELLED]
+        ).update(
+            status=ReportJob.Status.QUEUED,
+            attempts=0,
+            available_at=timezone.now(),
+            finished_at=None
+        )
+        
+        self.message_user(
+            request,
+            f'{updated} job(s) were queued for retry.',
+            messages.SUCCESS
+        )
+    retry_jobs.short_description = _('Retry selected jobs')
+    
+    def cancel_jobs(self, request, queryset):
+        """Cancel queued jobs"""
+        updated = queryset.filter(status=ReportJob.Status.QUEUED).update(
+            status=ReportJob.Status.CANCELLED,
+            finished_at=timezone.now()
+        )
+        
+        self.message_user(
+            request,
+            f'{updated} job(s) were cancelled.',
+            messages.SUCCESS
+        )
+    cancel_jobs.short_description = _('Cancel selected queued jobs')
+
+
+@admin.register(AnalyticsWatermark)
+class AnalyticsWatermarkAdmin(admin.ModelAdmin):
+    """
+    Admin interface for analytics snapshot refresh positions.
+    """
+    
+    list_display = (
+        'name', 'watermark', 'last_full_refresh_at', 'rows_refreshed', 'duration_ms', 'updated_at'
+    )
+    ordering = ('name',)
+    
+    # Watermarks are managed by refresh_analytics_snapshots
+    readonly_fields = (
+        'name', 'last_full_refresh_at', 'rows_refreshed', 'duration_ms', 'updated_at'
+    )
@@ -40,13 +40,17 @@ class BaseReportGenerator:
                 'warning_count': 0
             }
         )
+        
+        self._publish_progress("Generation started")
     
     def update_progress(self, percentage: int, message: str = ""):
-        """Update generation progress"""
+        """Update generation progress and notify progress subscribers"""
         self.report.progress_percentage = min(100, max(0, percentage))
         if message:
             self.report.error_message = message
-        self.report.save()
+        self.report.save(update_fields=['progress_percentage', 'error_message'])
+        
+        self._publish_progress(message)
     
     def complete_generation(self, file_path: str, file_size: int, total_records: int):
         """Complete report generation"""
@@ -60,6 +64,8 @@ class BaseReportGenerator:
         self.report.generation_time = end_time - self.start_time
         self.report.save()
         
+        self._publish_progress("Report completed")
+        
         # Update metrics
         if self.metrics:
             self.metrics.rows_processed = total_records
@@ -76,6 +82,14 @@ class BaseReportGenerator:
         if self.metrics:
             self.metrics.error_count += 1
             self.metrics.save()
+        
+        self._publish_progress(error_message)
+    
+    def _publish_progress(self, message: str = ""):
+        """Publish the current report state to progress subscribers"""
+        from .job_queue import publish_progress
+        
+        publish_progress(self.report, message)
     
     def get_queryset(self) -> QuerySet:
         """Get the base queryset for the report - to be implemented by subclasses"""
@@ -0,0 +1,91 @@
+"""
+WebSocket consumers for real-time report generation progress
+"""
+
+import json
+import logging
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+from django.contrib.auth.models import AnonymousUser
+
+from .models import Report
+from .job_queue import get_progress_group_name
+
+logger = logging.getLogger(__name__)
+
+
+class ReportProgressConsumer(AsyncWebsocketConsumer):
+    """WebSocket consumer streaming progress events for a single report"""
+
+    async def connect(self):
+        """Handle WebSocket connection"""
+        try:
+            self.user = self.scope.get('user')
+
+            if not self.user or isinstance(self.user, AnonymousUser):
+                logger.warning("Unauthenticated report progress connection attempt")
+                await self.close()
+                return
+
+            report_id = self.scope['url_route']['kwargs']['report_id']
+            report = await database_sync_to_async(self.get_report)(report_id)
+
+            if report is None:
+                await self.close()
+                return
+
+            self.group_name = get_progress_group_name(report.id)
+            await self.channel_layer.group_add(
+                self.group_name,
+                self.channel_name
+            )
+
+            await self.accept()
+
+            # Send current state so late subscribers don't miss completion
+            await self.send(text_data=json.dumps({
+                'type': 'report_progress',
+                'report_id': str(report.id),
+                'status': report.status,
+                'progress_percentage': report.progress_percentage,
+                'message': '',
+            }))
+
+        except Exception as e:
+            logger.error(f"Report progress WebSocket connection error: {str(e)}")
+            await self.close()
+
+    async def disconnect(self, close_code):
+        """Handle WebSocket disconnection"""
+        try:
+            if hasattr(self, 'group_name'):
+                await self.channel_layer.group_discard(
+                    self.group_name,
+                    self.channel_name
+                )
+
+        except Exception as e:
+            logger.error(f"Report progress WebSocket disconnect error: {str(e)}")
+
+    def get_report(self, report_id):
+        """Get the report if the connected user may follow its progress"""
+        try:
+            report = Report.objects.get(id=report_id)
+        except (Report.DoesNotExist, ValueError):
+            return None
+
+        if (self.user.is_staff or
+            self.user.user_type in ['VMT', 'CVT', 'GOC', 'ADMIN'] or
+            report.created_by_id == self.user.id):
+            return report
+
+        return None
+
+    # Group message handlers
+    async def report_progress(self, event):
+        """Forward report progress event to the client"""
+        try:
+            await self.send(text_data=json.dumps(event))
+
+        except Exception as e:
+            logger.error(f"Failed to send report progress event: {str(e)}")
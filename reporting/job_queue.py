@@ -0,0 +1,287 @@
+"""
+Background job queue for report generation.
+
+Report requests are persisted as ``ReportJob`` rows and returned to the client
+immediately. Worker processes started with ``manage.py run_report_workers``
+claim queued jobs using ``SELECT ... FOR UPDATE SKIP LOCKED`` and run the
+existing report generators, publishing progress to the ``report_<id>``
+channel group as they go.
+"""
+
+import logging
+import os
+import socket
+import time
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from channels.layers import get_channel_layer
+from asgiref.sync import async_to_sync
+
+from .models import Report, ReportJob
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_QUEUE_SETTINGS = {
+    'WORKERS': 2,
+    'POLL_INTERVAL': 2.0,
+    'MAX_ATTEMPTS': 3,
+    'RETRY_DELAY': 30,
+    'STALE_AFTER': 600,
+    'RUN_INLINE': False,
+}
+
+
+def get_queue_settings() -> dict:
+    """Get report queue settings merged with defaults"""
+    return {**DEFAULT_QUEUE_SETTINGS, **getattr(settings, 'REPORT_JOB_QUEUE', {})}
+
+
+def get_progress_group_name(report_id) -> str:
+    """Get the channel group that receives progress events for a report"""
+    return f"report_{report_id}"
+
+
+def publish_progress(report: Report, message: str = ''):
+    """
+    Publish report progress to WebSocket subscribers and refresh the
+    heartbeat of the running job so stale-job recovery leaves it alone.
+    """
+    now = timezone.now()
+    ReportJob.objects.filter(
+        report_id=report.id,
+        status=ReportJob.Status.RUNNING
+    ).update(heartbeat_at=now)
+
+    try:
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+
+        async_to_sync(channel_layer.group_send)(
+            get_progress_group_name(report.id),
+            {
+                'type': 'report_progress',
+                'report_id': str(report.id),
+                'status': report.status,
+                'progress_percentage': report.progress_percentage,
+                'message': message,
+                'timestamp': now.isoformat(),
+            }
+        )
+    except Exception as e:
+        logger.debug(f"Could not publish progress for report {report.id}: {str(e)}")
+
+
+def enqueue_report(report: Report, requested_by=None, priority: int = 5) -> ReportJob:
+    """
+    Queue a report for background generation.
+
+    An already queued or running job for the same report is reused, so
+    repeated regenerate requests do not pile up duplicate work.
+    """
+    queue_settings = get_queue_settings()
+
+    with transaction.atomic():
+        job = ReportJob.objects.select_for_update().filter(
+            report=report,
+            status__in=ReportJob.ACTIVE_STATUSES
+        ).first()
+
+        if job is None:
+            job = ReportJob.objects.create(
+                report=report,
+                requested_by=requested_by,
+                priority=priority,
+                max_attempts=queue_settings['MAX_ATTEMPTS']
+            )
+            logger.info(f"Queued report job {job.id} for report {report.id}")
+
+    if queue_settings['RUN_INLINE']:
+        # Development fallback when no workers are running
+        claimed = claim_job(job, worker_id=get_worker_id('inline'))
+        if claimed:
+            run_job(claimed)
+            job.refresh_from_db()
+
+    return job
+
+
+def get_worker_id(suffix: str = '') -> str:
+    """Build a worker identifier from host and process id"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    return f"{worker_id}:{suffix}" if suffix else worker_id
+
+
+def claim_job(job: ReportJob, worker_id: str) -> Optional[ReportJob]:
+    """Mark a specific queued job as running; returns None if already taken"""
+    now = timezone.now()
+    claimed = ReportJob.objects.filter(
+        pk=job.pk,
+        status=ReportJob.Status.QUEUED
+    ).update(
+        status=ReportJob.Status.RUNNING,
+        worker_id=worker_id,
+        attempts=F('attempts') + 1,
+        claimed_at=now,
+        heartbeat_at=now,
+        updated_at=now
+    )
+
+    if not claimed:
+        return None
+
+    job.refresh_from_db()
+    return job
+
+
+def claim_next_job(worker_id: str) -> Optional[ReportJob]:
+    """
+    Claim the next available job.
+
+    Candidate rows are locked with SKIP LOCKED so concurrent workers never
+    block on each other; the conditional update in ``claim_job`` guards
+    backends without row locking.
+    """
+    with transaction.atomic():
+        job = ReportJob.objects.select_for_update(skip_locked=True).filter(
+            status=ReportJob.Status.QUEUED,
+            available_at__lte=timezone.now()
+        ).order_by('-priority', 'available_at').first()
+
+        if job is None:
+            return None
+
+        return claim_job(job, worker_id)
+
+
+def run_job(job: ReportJob) -> ReportJob:
+    """Run a claimed job and record the outcome, retrying on failure"""
+    from .services import generate_report, ReportGenerationError
+
+    queue_settings = get_queue_settings()
+
+    try:
+        generate_report(str(job.report_id))
+    except ReportGenerationError as e:
+        job.error_message = str(e)
+
+        if job.attempts < job.max_attempts:
+            # Linear backoff between attempts
+            job.status = ReportJob.Status.QUEUED
+            job.available_at = timezone.now() + timedelta(
+                seconds=queue_settings['RETRY_DELAY'] * job.attempts
+            )
+            Report.objects.filter(pk=job.report_id).update(status=Report.Status.PENDING)
+            logger.warning(f"Report job {job.id} failed (attempt {job.attempts}), retrying: {str(e)}")
+        else:
+            job.status = ReportJob.Status.FAILED
+            job.finished_at = timezone.now()
+            logger.error(f"Report job {job.id} failed permanently: {str(e)}")
+
+        job.save(update_fields=['status', 'error_message', 'available_at', 'finished_at', 'updated_at'])
+        return job
+
+    job.status = ReportJob.Status.COMPLETED
+    job.error_message = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error_message', 'finished_at', 'updated_at'])
+    logger.info(f"Report job {job.id} completed")
+    return job
+
+
+def requeue_stale_jobs(stale_after: Optional[int] = None) -> int:
+    """
+    Return running jobs whose worker stopped sending heartbeats to the queue.
+    Jobs that have used all their attempts are marked as failed instead.
+    """
+    if stale_after is None:
+        stale_after = get_queue_settings()['STALE_AFTER']
+
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=stale_after)
+    stale_jobs = ReportJob.objects.filter(
+        status=ReportJob.Status.RUNNING,
+        heartbeat_at__lt=cutoff
+    )
+
+    requeued = 0
+    with transaction.atomic():
+        for job in stale_jobs.select_for_update(skip_locked=True):
+            if job.attempts < job.max_attempts:
+                job.status = ReportJob.Status.QUEUED
+                job.available_at = now
+            else:
+                job.status = ReportJob.Status.FAILED
+                job.finished_at = now
+                Report.objects.filter(pk=job.report_id).update(
+                    status=Report.Status.FAILED,
+                    error_message='Report worker stopped responding'
+                )
+            job.error_message = f"Worker {job.worker_id} stopped responding"
+            job.save(update_fields=['status', 'available_at', 'finished_at', 'error_message', 'updated_at'])
+            requeued += 1
+
+    if requeued:
+        logger.warning(f"Recovered {requeued} stale report job(s)")
+
+    return requeued
+
+
+class ReportWorker:
+    """
+    Claims and runs report jobs until stopped.
+    One instance runs in each worker process.
+    """
+
+    def __init__(self, worker_id: Optional[str] = None, poll_interval: Optional[float] = None,
+                 max_jobs: Optional[int] = None):
+        queue_settings = get_queue_settings()
+        self.worker_id = worker_id or get_worker_id()
+        self.poll_interval = poll_interval if poll_interval is not None else queue_settings['POLL_INTERVAL']
+        self.max_jobs = max_jobs
+        self.processed = 0
+        self.should_stop = False
+
+    def stop(self, *args):
+        """Request a graceful stop after the current job"""
+        self.should_stop = True
+
+    def run_once(self) -> int:
+        """Run jobs until the queue is empty; returns the number processed"""
+        processed = 0
+        while not self.should_stop:
+            job = claim_next_job(self.worker_id)
+            if job is None:
+                break
+            run_job(job)
+            processed += 1
+            self.processed += 1
+            if self.max_jobs and self.processed >= self.max_jobs:
+                break
+        return processed
+
+    def run_forever(self):
+        """Poll the queue until stopped or the job limit is reached"""
+        logger.info(f"Report worker {self.worker_id} started")
+
+        while not self.should_stop:
+            try:
+                processed = self.run_once()
+            except DatabaseError as e:
+                # Drop the broken connection and retry after the poll interval
+                logger.error(f"Report worker {self.worker_id} database error: {str(e)}")
+                close_old_connections()
+                processed = 0
+
+            if self.max_jobs and self.processed >= self.max_jobs:
+                break
+            if not processed:
+                time.sleep(self.poll_interval)
+
+        logger.info(f"Report worker {self.worker_id} stopped after {self.processed} job(s)")
@@ -0,0 +1 @@
+# Reporting app management commands
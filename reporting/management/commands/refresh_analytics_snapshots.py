@@ -0,0 +1,56 @@
+"""
+Django management command for refreshing the analytics snapshot tables.
+
+Usage:
+    python manage.py refresh_analytics_snapshots
+    python manage.py refresh_analytics_snapshots --full
+    python manage.py refresh_analytics_snapshots --only assignments tasks
+    python manage.py refresh_analytics_snapshots --interval 300
+"""
+
+import time
+from django.core.management.base import BaseCommand
+
+from reporting.snapshots import SNAPSHOT_NAMES, refresh_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Fold recent volunteer, assignment and task changes into the analytics snapshot tables'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Rebuild the snapshots from scratch instead of from the watermarks'
+        )
+
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            choices=SNAPSHOT_NAMES,
+            help='Only refresh these snapshots'
+        )
+
+        parser.add_argument(
+            '--interval',
+            type=int,
+            help='Keep running and refresh every this many seconds'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        full = options['full']
+        while True:
+            results = refresh_snapshots(names=options['only'], full=full)
+            for name, rows in results.items():
+                self.stdout.write(self.style.SUCCESS(f"Refreshed {name}: {rows} rows"))
+
+            if not options['interval']:
+                return
+            # Only the first pass is a full rebuild
+            full = False
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
@@ -0,0 +1,140 @@
+"""
+Django management command for running background report generation workers.
+
+Usage:
+    python manage.py run_report_workers
+    python manage.py run_report_workers --workers 4 --poll-interval 1
+    python manage.py run_report_workers --once
+"""
+
+import logging
+import multiprocessing
+import signal
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from reporting.job_queue import ReportWorker, get_queue_settings, get_worker_id, requeue_stale_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def _run_worker_process(index, poll_interval, max_jobs):
+    """Entry point for a forked worker process"""
+    # Never share the parent's database connections across fork
+    connections.close_all()
+
+    worker = ReportWorker(
+        worker_id=get_worker_id(f"w{index}"),
+        poll_interval=poll_interval,
+        max_jobs=max_jobs
+    )
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
+
+
+class Command(BaseCommand):
+    help = 'Run a pool of worker processes that generate queued reports'
+
+    def add_arguments(self, parser):
+        """Add command line arguments"""
+        queue_settings = get_queue_settings()
+
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=queue_settings['WORKERS'],
+            help=f"Number of worker processes (default: {queue_settings['WORKERS']})"
+        )
+
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=queue_settings['POLL_INTERVAL'],
+            help=f"Seconds to wait when the queue is empty (default: {queue_settings['POLL_INTERVAL']})"
+        )
+
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Recycle a worker process after this many jobs'
+        )
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue in this process and exit'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler"""
+        workers = options['workers']
+        poll_interval = options['poll_interval']
+        max_jobs = options['max_jobs']
+
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
+
+        recovered = requeue_stale_jobs()
+        if recovered:
+            self.stdout.write(self.style.WARNING(f"Recovered {recovered} stale job(s)"))
+
+        if options['once']:
+            worker = ReportWorker(poll_interval=poll_interval, max_jobs=max_jobs)
+            processed = worker.run_once()
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} report job(s)"))
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Starting {workers} report worker(s) (poll interval {poll_interval}s)")
+        )
+        self.supervise(workers, poll_interval, max_jobs)
+
+    def supervise(self, workers, poll_interval, max_jobs):
+        """Start worker processes, restart any that exit and recover stale jobs"""
+        stale_check_interval = max(poll_interval * 10, 30)
+        self.stopping = False
+
+        def request_stop(*args):
+            self.stopping = True
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        connections.close_all()
+        processes = {index: self.start_worker(index, poll_interval, max_jobs) for index in range(workers)}
+        last_stale_check = time.monotonic()
+
+        while not self.stopping:
+            time.sleep(1)
+
+            for index, process in list(processes.items()):
+                if not process.is_alive() and not self.stopping:
+                    logger.info(f"Report worker {index} exited with code {process.exitcode}, restarting")
+                    processes[index] = self.start_worker(index, poll_interval, max_jobs)
+
+            if time.monotonic() - last_stale_check >= stale_check_interval:
+                requeue_stale_jobs()
+                connections.close_all()
+                last_stale_check = time.monotonic()
+
+        self.stdout.write("Stopping report workers, waiting for running jobs to finish...")
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join()
+
+        self.stdout.write(self.style.SUCCESS("Report workers stopped"))
+
+    def start_worker(self, index, poll_interval, max_jobs):
+        """Start a single worker process"""
+        process = multiprocessing.Process(
+            target=_run_worker_process,
+            args=(index, poll_interval, max_jobs),
+            name=f"report-worker-{index}"
+        )
+        process.start()
+        return process
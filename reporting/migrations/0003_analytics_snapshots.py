@@ -0,0 +1,97 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('events', '0004_assigned_volunteer_counts'),
+        ('reporting', '0002_reportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('watermark', models.DateTimeField(blank=True, help_text='Source rows updated after this time have not been folded in yet', null=True)),
+                ('last_full_refresh_at', models.DateTimeField(blank=True, null=True)),
+                ('rows_refreshed', models.PositiveIntegerField(default=0, help_text='Rows written by the last refresh')),
+                ('duration_ms', models.PositiveIntegerField(default=0, help_text='Duration of the last refresh')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='VolunteerSnapshot',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='analytics_snapshot', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('status', models.CharField(max_length=20)),
+                ('experience_level', models.CharField(blank=True, max_length=20)),
+                ('availability_level', models.CharField(blank=True, max_length=20)),
+                ('preferred_communication_method', models.CharField(blank=True, max_length=20)),
+                ('background_check_status', models.CharField(blank=True, max_length=20)),
+                ('transport_method', models.CharField(blank=True, max_length=30)),
+                ('is_corporate_volunteer', models.BooleanField(default=False)),
+                ('performance_rating', models.DecimalField(blank=True, decimal_places=2, max_digits=3, null=True)),
+                ('application_date', models.DateTimeField(blank=True, null=True)),
+                ('approval_date', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(help_text='When the volunteer profile was created')),
+                ('date_of_birth', models.DateField(blank=True, null=True)),
+                ('city', models.CharField(blank=True, max_length=100)),
+                ('county', models.CharField(blank=True, max_length=100)),
+                ('postal_code', models.CharField(blank=True, max_length=20)),
+                ('assignment_total', models.PositiveIntegerField(default=0)),
+                ('assignment_completed', models.PositiveIntegerField(default=0)),
+                ('assignment_active', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status'], name='reporting_v_status_8282cb_idx'), models.Index(fields=['created_at'], name='reporting_v_created_466cda_idx'), models.Index(fields=['application_date'], name='reporting_v_applica_ff8a37_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssignmentDailyFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Date the assignments were created')),
+                ('role_type', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=20)),
+                ('performance_rating', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('assignment_count', models.PositiveIntegerField(default=0)),
+                ('hours_worked', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.event')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.role')),
+                ('venue', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.venue')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='reporting_a_date_0143a6_idx'), models.Index(fields=['event', 'status'], name='reporting_a_event_i_8e09c1_idx'), models.Index(fields=['role', 'status'], name='reporting_a_role_id_f0644a_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskDailyFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Date the task completions were created')),
+                ('category', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=20)),
+                ('completion_count', models.PositiveIntegerField(default=0)),
+                ('time_spent_minutes', models.PositiveBigIntegerField(default=0, help_text='Sum of recorded time spent')),
+                ('timed_count', models.PositiveIntegerField(default=0, help_text='Completions with time spent recorded')),
+                ('quality_score_total', models.PositiveIntegerField(default=0)),
+                ('quality_scored_count', models.PositiveIntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.event')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='events.role')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='reporting_t_date_58f88c_idx'), models.Index(fields=['event', 'status'], name='reporting_t_event_i_be3a62_idx')],
+            },
+        ),
+    ]
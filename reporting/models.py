@@ -440,3 +440,211 @@ class ReportShare(models.Model):
         """Increment download count"""
         self.download_count += 1
         self.save(update_fields=['download_count'])
+
+
+class ReportJob(models.Model):
+    """
+    Persistent queue entry for background report generation.
+    Jobs are claimed by ``run_report_workers`` using row-level locking.
+    """
+    
+    class Status(models.TextChoices):
+        QUEUED = 'QUEUED', _('Queued')
+        RUNNING = 'RUNNING', _('Running')
+        COMPLETED = 'COMPLETED', _('Completed')
+        FAILED = 'FAILED', _('Failed')
+        CANCELLED = 'CANCELLED', _('Cancelled')
+    
+    ACTIVE_STATUSES = (Status.QUEUED, Status.RUNNING)
+    
+    # Basic Information
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    report = models.ForeignKey(
+        Report,
+        on_delete=models.CASCADE,
+        related_name='jobs'
+    )
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    priority = models.PositiveSmallIntegerField(
+        default=5,
+        help_text=_('Higher priority jobs are claimed first')
+    )
+    
+    # Execution Tracking
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    worker_id = models.CharField(max_length=100, blank=True, help_text=_('Worker that claimed the job'))
+    error_message = models.TextField(blank=True)
+    
+    # Management
+    requested_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='requested_report_jobs'
+    )
+    
+    # Timestamps
+    available_at = models.DateTimeField(default=timezone.now, help_text=_('Earliest time the job may run'))
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-priority', 'available_at']
+        indexes = [
+            models.Index(fields=['status', 'priority', 'available_at']),
+            models.Index(fields=['report', 'status']),
+            models.Index(fields=['status', 'heartbeat_at']),
+        ]
+    
+    def __str__(self):
+        return f"Job for {self.report.name} ({self.get_status_display()})"
+    
+    @property
+    def is_active(self):
+        """Check if the job is still waiting or running"""
+        return self.status in self.ACTIVE_STATUSES
+    
+    def get_queue_position(self):
+        """Get the number of queued jobs that will be claimed before this one"""
+        if self.status != self.Status.QUEUED:
+            return 0
+        
+        return ReportJob.objects.filter(
+            status=self.Status.QUEUED,
+        ).filter(
+            models.Q(priority__gt=self.priority) |
+            models.Q(priority=self.priority, available_at__lt=self.available_at)
+        ).count()
+
+
+class AnalyticsWatermark(models.Model):
+    """
+    Refresh position of an analytics snapshot table.
+    Source rows updated after ``watermark`` are folded in by ``refresh_analytics_snapshots``.
+    """
+    
+    name = models.CharField(max_length=50, unique=True)
+    watermark = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('Source rows updated after this time have not been folded in yet')
+    )
+    last_full_refresh_at = models.DateTimeField(null=True, blank=True)
+    rows_refreshed = models.PositiveIntegerField(default=0, help_text=_('Rows written by the last refresh'))
+    duration_ms = models.PositiveIntegerField(default=0, help_text=_('Duration of the last refresh'))
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self):
+        return f"{self.name} @ {self.watermark}"
+
+
+class VolunteerSnapshot(models.Model):
+    """
+    Denormalized volunteer profile with assignment totals, one row per volunteer.
+    Field names follow ``VolunteerProfile`` so analytics can query either table.
+    """
+    
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='analytics_snapshot'
+    )
+    
+    # Profile
+    status = models.CharField(max_length=20)
+    experience_level = models.CharField(max_length=20, blank=True)
+    availability_level = models.CharField(max_length=20, blank=True)
+    preferred_communication_method = models.CharField(max_length=20, blank=True)
+    background_check_status = models.CharField(max_length=20, blank=True)
+    transport_method = models.CharField(max_length=30, blank=True)
+    is_corporate_volunteer = models.BooleanField(default=False)
+    performance_rating = models.DecimalField(max_digits=3, decimal_places=2, null=True, blank=True)
+    application_date = models.DateTimeField(null=True, blank=True)
+    approval_date = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(help_text=_('When the volunteer profile was created'))
+    
+    # User
+    date_of_birth = models.DateField(null=True, blank=True)
+    city = models.CharField(max_length=100, blank=True)
+    county = models.CharField(max_length=100, blank=True)
+    postal_code = models.CharField(max_length=20, blank=True)
+    
+    # Assignment totals
+    assignment_total = models.PositiveIntegerField(default=0)
+    assignment_completed = models.PositiveIntegerField(default=0)
+    assignment_active = models.PositiveIntegerField(default=0)
+    
+    refreshed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['application_date']),
+        ]
+    
+    def __str__(self):
+        return f"Snapshot for {self.user_id} ({self.status})"
+
+
+class AssignmentDailyFact(models.Model):
+    """
+    Assignments grouped by creation date, event, venue, role, status and rating.
+    """
+    
+    date = models.DateField(help_text=_('Date the assignments were created'))
+    event = models.ForeignKey('events.Event', on_delete=models.CASCADE, related_name='+')
+    venue = models.ForeignKey('events.Venue', on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    role = models.ForeignKey('events.Role', on_delete=models.CASCADE, related_name='+')
+    role_type = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    performance_rating = models.PositiveSmallIntegerField(null=True, blank=True)
+    
+    assignment_count = models.PositiveIntegerField(default=0)
+    hours_worked = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['date']),
+            models.Index(fields=['event', 'status']),
+            models.Index(fields=['role', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.status}: {self.assignment_count}"
+
+
+class TaskDailyFact(models.Model):
+    """
+    Task completions grouped by creation date, event, role, category and status.
+    """
+    
+    date = models.DateField(help_text=_('Date the task completions were created'))
+    event = models.ForeignKey('events.Event', on_delete=models.CASCADE, related_name='+')
+    role = models.ForeignKey('events.Role', on_delete=models.CASCADE, related_name='+')
+    category = models.CharField(max_length=20)
+    status = models.CharField(max_length=20)
+    
+    completion_count = models.PositiveIntegerField(default=0)
+    time_spent_minutes = models.PositiveBigIntegerField(default=0, help_text=_('Sum of recorded time spent'))
+    timed_count = models.PositiveIntegerField(default=0, help_text=_('Completions with time spent recorded'))
+    quality_score_total = models.PositiveIntegerField(default=0)
+    quality_scored_count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['date']),
+            models.Index(fields=['event', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.category} {self.status}: {self.completion_count}"
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.db.models import Count, Avg, Sum, Q
-from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare
+from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare, ReportJob
 from volunteers.models import VolunteerProfile
 from events.models import Event, Assignment
 from tasks.models import TaskCompletion
@@ -349,6 +349,22 @@ class ReportGenerationRequestSerializer(serializers.Serializer):
         return data
 
 
+class ReportJobSerializer(serializers.ModelSerializer):
+    """Serializer for background report generation jobs"""
+    
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    queue_position = serializers.IntegerField(source='get_queue_position', read_only=True)
+    
+    class Meta:
+        model = ReportJob
+        fields = [
+            'id', 'report', 'status', 'status_display', 'priority',
+            'attempts', 'max_attempts', 'queue_position', 'error_message',
+            'available_at', 'claimed_at', 'finished_at', 'created_at'
+        ]
+        read_only_fields = fields
+
+
 class ReportProgressSerializer(serializers.Serializer):
     """Serializer for report generation progress"""
     
@@ -358,6 +374,7 @@ class ReportProgressSerializer(serializers.Serializer):
     current_step = serializers.CharField()
     estimated_completion = serializers.DateTimeField(required=False, allow_null=True)
     error_message = serializers.CharField(required=False, allow_blank=True)
+    job = ReportJobSerializer(required=False, allow_null=True)
 
 
 class ReportExportSerializer(serializers.Serializer):
@@ -0,0 +1,267 @@
+"""
+Materialized analytics snapshots.
+
+Dashboards and PowerBI read these summary tables instead of scanning the
+live volunteer, assignment and task tables. ``refresh_snapshots`` folds in
+source rows updated since each table's watermark:
+
+- volunteer snapshots are rebuilt for volunteers whose profile, user record
+  or assignments changed
+- daily assignment and task facts are rebuilt for every creation date that
+  has a changed row
+
+Deleted assignments and task completions are only removed by a full refresh.
+"""
+
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from events.assignment_stats import get_volunteer_assignment_totals
+from events.models import Assignment
+from tasks.models import TaskCompletion
+from volunteers.models import VolunteerProfile
+
+from .models import AnalyticsWatermark, AssignmentDailyFact, TaskDailyFact, VolunteerSnapshot
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+VOLUNTEERS = 'volunteers'
+ASSIGNMENTS = 'assignments'
+TASKS = 'tasks'
+SNAPSHOT_NAMES = [VOLUNTEERS, ASSIGNMENTS, TASKS]
+
+CHUNK_SIZE = 1000
+
+# Re-read rows slightly older than the watermark so transactions that
+# committed late are not missed; rebuilding a row twice is harmless
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+PROFILE_FIELDS = [
+    'user_id', 'status', 'experience_level', 'availability_level', 'preferred_communication_method',
+    'background_check_status', 'transport_method', 'is_corporate_volunteer', 'performance_rating',
+    'application_date', 'approval_date', 'created_at',
+    'user__date_of_birth', 'user__city', 'user__county', 'user__postal_code',
+]
+
+
+def get_watermarks() -> Dict[str, Any]:
+    """Get the watermark of every snapshot that has been refreshed, in one query"""
+    return dict(
+        AnalyticsWatermark.objects.filter(watermark__isnull=False)
+        .values_list('name', 'watermark')
+    )
+
+
+def snapshot_watermark(*names: str):
+    """
+    Get the oldest watermark of the named snapshots.
+
+    Returns None unless every one of them has been refreshed, in which case
+    readers should fall back to the live tables.
+    """
+    watermarks = get_watermarks()
+    if not all(name in watermarks for name in names):
+        return None
+    return min(watermarks[name] for name in names)
+
+
+def _chunks(values: List[Any], size: int = CHUNK_SIZE) -> Iterable[List[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _build_volunteer_snapshots(user_ids: List[Any]) -> List[VolunteerSnapshot]:
+    """Build snapshot rows for a chunk of volunteers"""
+    totals = get_volunteer_assignment_totals(Assignment.objects.filter(volunteer_id__in=user_ids))
+    snapshots = []
+    for row in VolunteerProfile.objects.filter(user_id__in=user_ids).order_by().values_list(*PROFILE_FIELDS):
+        values = dict(zip(PROFILE_FIELDS, row))
+        total, completed, active = totals.get(values['user_id'], (0, 0, 0))
+        snapshots.append(VolunteerSnapshot(
+            user_id=values['user_id'],
+            status=values['status'],
+            experience_level=values['experience_level'] or '',
+            availability_level=values['availability_level'] or '',
+            preferred_communication_method=values['preferred_communication_method'] or '',
+            background_check_status=values['background_check_status'] or '',
+            transport_method=values['transport_method'] or '',
+            is_corporate_volunteer=values['is_corporate_volunteer'],
+            performance_rating=values['performance_rating'],
+            application_date=values['application_date'],
+            approval_date=values['approval_date'],
+            created_at=values['created_at'],
+            date_of_birth=values['user__date_of_birth'],
+            city=values['user__city'] or '',
+            county=values['user__county'] or '',
+            postal_code=values['user__postal_code'] or '',
+            assignment_total=total,
+            assignment_completed=completed,
+            assignment_active=active,
+        ))
+    return snapshots
+
+
+def refresh_volunteer_snapshots(since=None) -> int:
+    """Rebuild volunteer snapshots changed since ``since``, or all of them"""
+    if since is None:
+        VolunteerSnapshot.objects.all().delete()
+        user_ids = list(VolunteerProfile.objects.order_by().values_list('user_id', flat=True))
+    else:
+        user_ids = set(
+            VolunteerProfile.objects.filter(updated_at__gt=since).values_list('user_id', flat=True)
+        )
+        user_ids |= set(
+            VolunteerProfile.objects.filter(user__updated_at__gt=since).values_list('user_id', flat=True)
+        )
+        user_ids |= set(
+            Assignment.objects.filter(updated_at__gt=since).order_by().values_list('volunteer_id', flat=True)
+        )
+        user_ids = list(user_ids)
+        # Profiles that no longer exist
+        VolunteerSnapshot.objects.exclude(
+            user_id__in=VolunteerProfile.objects.values('user_id')
+        ).delete()
+
+    written = 0
+    for chunk in _chunks(user_ids):
+        snapshots = _build_volunteer_snapshots(chunk)
+        if since is not None:
+            VolunteerSnapshot.objects.filter(user_id__in=chunk).delete()
+        VolunteerSnapshot.objects.bulk_create(snapshots, batch_size=CHUNK_SIZE)
+        written += len(snapshots)
+    return written
+
+
+def _changed_dates(queryset, since) -> List[Any]:
+    """Creation dates of rows updated since ``since``"""
+    return list(
+        queryset.filter(updated_at__gt=since).order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values_list('day', flat=True)
+        .distinct()
+    )
+
+
+def refresh_assignment_facts(since=None) -> int:
+    """Rebuild daily assignment facts for dates changed since ``since``, or all of them"""
+    source = Assignment.objects.order_by()
+    facts = AssignmentDailyFact.objects.all()
+    if since is not None:
+        dates = _changed_dates(Assignment.objects, since)
+        if not dates:
+            return 0
+        source = source.filter(created_at__date__in=dates)
+        facts = facts.filter(date__in=dates)
+
+    grouped = (
+        source.annotate(day=TruncDate('created_at'))
+        .values('day', 'event_id', 'venue_id', 'role_id', 'role__role_type', 'status', 'performance_rating')
+        .annotate(count=Count('pk'), hours=Sum('actual_hours_worked'))
+    )
+    rows = [
+        AssignmentDailyFact(
+            date=group['day'],
+            event_id=group['event_id'],
+            venue_id=group['venue_id'],
+            role_id=group['role_id'],
+            role_type=group['role__role_type'],
+            status=group['status'],
+            performance_rating=group['performance_rating'],
+            assignment_count=group['count'],
+            hours_worked=group['hours'] or 0,
+        )
+        for group in grouped
+    ]
+    facts.delete()
+    AssignmentDailyFact.objects.bulk_create(rows, batch_size=CHUNK_SIZE)
+    return len(rows)
+
+
+def refresh_task_facts(since=None) -> int:
+    """Rebuild daily task completion facts for dates changed since ``since``, or all of them"""
+    source = TaskCompletion.objects.order_by()
+    facts = TaskDailyFact.objects.all()
+    if since is not None:
+        dates = _changed_dates(TaskCompletion.objects, since)
+        if not dates:
+            return 0
+        source = source.filter(created_at__date__in=dates)
+        facts = facts.filter(date__in=dates)
+
+    grouped = (
+        source.annotate(day=TruncDate('created_at'))
+        .values('day', 'task__event_id', 'task__role_id', 'task__category', 'status')
+        .annotate(
+            count=Count('pk'),
+            time_spent=Sum('time_spent_minutes'),
+            timed=Count('time_spent_minutes'),
+            quality_total=Sum('quality_score'),
+            quality_scored=Count('quality_score'),
+        )
+    )
+    rows = [
+        TaskDailyFact(
+            date=group['day'],
+            event_id=group['task__event_id'],
+            role_id=group['task__role_id'],
+            category=group['task__category'],
+            status=group['status'],
+            completion_count=group['count'],
+            time_spent_minutes=group['time_spent'] or 0,
+            timed_count=group['timed'],
+            quality_score_total=group['quality_total'] or 0,
+            quality_scored_count=group['quality_scored'],
+        )
+        for group in grouped
+    ]
+    facts.delete()
+    TaskDailyFact.objects.bulk_create(rows, batch_size=CHUNK_SIZE)
+    return len(rows)
+
+
+REFRESHERS = {
+    VOLUNTEERS: refresh_volunteer_snapshots,
+    ASSIGNMENTS: refresh_assignment_facts,
+    TASKS: refresh_task_facts,
+}
+
+
+def refresh_snapshots(names: Optional[Iterable[str]] = None, full: bool = False) -> Dict[str, int]:
+    """
+    Refresh the named snapshots (default all), incrementally unless ``full``.
+
+    Each snapshot is rebuilt and its watermark advanced in one transaction,
+    so readers never see a half-refreshed table. Returns rows written per snapshot.
+    """
+    results = {}
+    for name in names or SNAPSHOT_NAMES:
+        started = timezone.now()
+        clock = time.monotonic()
+        watermark, _created = AnalyticsWatermark.objects.get_or_create(name=name)
+        since = None if full or watermark.watermark is None else watermark.watermark - WATERMARK_OVERLAP
+
+        with transaction.atomic():
+            rows = REFRESHERS[name](since)
+            watermark.watermark = started
+            if since is None:
+                watermark.last_full_refresh_at = started
+            watermark.rows_refreshed = rows
+            watermark.duration_ms = int((time.monotonic() - clock) * 1000)
+            watermark.save()
+
+        logger.info(
+            f"Refreshed {name} snapshot ({'full' if since is None else 'incremental'}): "
+            f"{rows} rows in {watermark.duration_ms}ms"
+        )
+        results[name] = rows
+    return results
@@ -0,0 +1,150 @@
+"""
+Tests for the materialized analytics snapshot tables and their readers.
+"""
+
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from common.dashboard_service import DashboardService
+from common.powerbi_service import PowerBIService
+from events.models import Event, Venue, Role, Assignment
+from volunteers.models import VolunteerProfile
+
+from .models import AnalyticsWatermark, AssignmentDailyFact, VolunteerSnapshot
+from .snapshots import ASSIGNMENTS, VOLUNTEERS, refresh_snapshots, snapshot_watermark
+
+User = get_user_model()
+
+
+class AnalyticsSnapshotTest(TestCase):
+    """Test cases for analytics snapshots"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+
+        self.event = Event.objects.create(
+            name='Snapshot Event',
+            slug='snapshot-event',
+            event_type=Event.EventType.INTERNATIONAL_GAMES,
+            start_date=date(2026, 7, 1),
+            end_date=date(2026, 7, 15),
+            host_city='Dublin',
+            created_by=self.admin_user
+        )
+
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Snapshot Venue',
+            slug='snapshot-venue',
+            venue_type=Venue.VenueType.SPORTS_FACILITY,
+            address_line_1='1 Test Street',
+            city='Dublin',
+            country='Ireland',
+            volunteer_capacity=10,
+            created_by=self.admin_user
+        )
+
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Snapshot Role',
+            slug='snapshot-role',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            description='Snapshot role',
+            total_positions=10,
+            created_by=self.admin_user
+        )
+
+        self.volunteers = []
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f'volunteer{index}',
+                email=f'volunteer{index}@test.com',
+                password='testpass123',
+                user_type=User.UserType.VOLUNTEER,
+                county='Galway'
+            )
+            VolunteerProfile.objects.create(user=user, status=VolunteerProfile.VolunteerStatus.ACTIVE)
+            self.volunteers.append(user)
+
+        self.assignments = [
+            Assignment.objects.create(
+                volunteer=volunteer,
+                role=self.role,
+                status=Assignment.AssignmentStatus.COMPLETED,
+                performance_rating=5
+            )
+            for volunteer in self.volunteers
+        ]
+
+    def test_readers_fall_back_until_first_refresh(self):
+        """Test datasets read the live tables before any snapshot exists"""
+        self.assertIsNone(snapshot_watermark(VOLUNTEERS))
+
+        dataset = PowerBIService.get_volunteer_analytics_dataset()
+        self.assertEqual(dataset['metadata']['data_freshness'], 'real_time')
+        self.assertEqual(dataset['summary_metrics']['total_volunteers'], 3)
+
+    def test_full_refresh_builds_snapshots(self):
+        """Test a full refresh materializes volunteers and daily assignment facts"""
+        results = refresh_snapshots(full=True)
+
+        self.assertEqual(results[VOLUNTEERS], 3)
+        self.assertEqual(VolunteerSnapshot.objects.get(user=self.volunteers[0]).assignment_completed, 1)
+        fact = AssignmentDailyFact.objects.get()
+        self.assertEqual(fact.assignment_count, 3)
+        self.assertEqual(fact.performance_rating, 5)
+        self.assertIsNotNone(AnalyticsWatermark.objects.get(name=ASSIGNMENTS).last_full_refresh_at)
+
+    def test_incremental_refresh_folds_in_changes(self):
+        """Test only changed rows are rebuilt, and a status change moves between facts"""
+        # Existing rows were last touched well before the first refresh
+        yesterday = timezone.now() - timedelta(days=1)
+        Assignment.objects.update(updated_at=yesterday)
+        VolunteerProfile.objects.update(updated_at=yesterday)
+        User.objects.update(updated_at=yesterday)
+        refresh_snapshots()
+
+        assignment = self.assignments[0]
+        assignment.status = Assignment.AssignmentStatus.NO_SHOW
+        assignment.save()
+
+        results = refresh_snapshots()
+
+        self.assertEqual(results[VOLUNTEERS], 1)
+        facts = dict(AssignmentDailyFact.objects.values_list('status', 'assignment_count'))
+        self.assertEqual(facts, {'COMPLETED': 2, 'NO_SHOW': 1})
+        self.assertEqual(VolunteerSnapshot.objects.get(user=self.volunteers[0]).assignment_completed, 0)
+
+    def test_readers_use_snapshots(self):
+        """Test PowerBI and dashboard read the snapshot tables once refreshed"""
+        call_command('refresh_analytics_snapshots', '--full', stdout=StringIO())
+        # Live changes are not visible until the next refresh
+        Assignment.objects.filter(pk=self.assignments[0].pk).delete()
+
+        with self.assertNumQueries(3):
+            dataset = PowerBIService.get_volunteer_analytics_dataset()
+        self.assertEqual(dataset['metadata']['data_freshness'], 'snapshot')
+        self.assertEqual(dataset['summary_metrics']['total_volunteers'], 3)
+        self.assertEqual(dataset['summary_metrics']['satisfaction_score'], 5.0)
+        self.assertEqual(dataset['demographics']['location_distribution'][0]['county'], 'Galway')
+
+        events = PowerBIService.get_event_analytics_dataset()
+        self.assertEqual(events['performance']['completion_rates'][0]['completed'], 3)
+
+        metrics = DashboardService.get_assignment_metrics()
+        self.assertEqual(metrics['total_assignments'], 3)
+        self.assertEqual(metrics['status_distribution'], {'COMPLETED': 3})
+        self.assertEqual(DashboardService.get_volunteer_metrics()['total_volunteers'], 3)
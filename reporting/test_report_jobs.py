@@ -0,0 +1,200 @@
+"""
+Tests for the background report generation queue.
+Covers enqueueing, claiming, retries, stale job recovery and the 202 API flow.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from .models import Report, ReportJob
+from .base import BaseReportGenerator
+from .services import ReportGenerationError
+from .job_queue import (
+    enqueue_report, claim_next_job, run_job, requeue_stale_jobs, ReportWorker
+)
+
+User = get_user_model()
+
+
+class ReportJobQueueTest(TestCase):
+    """Test cases for the report job queue"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+
+        self.report = Report.objects.create(
+            name='Queued Report',
+            report_type=Report.ReportType.VOLUNTEER_SUMMARY,
+            export_format=Report.ExportFormat.CSV,
+            created_by=self.admin_user
+        )
+
+    def test_enqueue_creates_queued_job(self):
+        """Test enqueueing creates a queued job without generating the report"""
+        job = enqueue_report(self.report, requested_by=self.admin_user)
+
+        self.assertEqual(job.status, ReportJob.Status.QUEUED)
+        self.assertEqual(job.requested_by, self.admin_user)
+        self.assertEqual(job.attempts, 0)
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, Report.Status.PENDING)
+
+    def test_enqueue_reuses_active_job(self):
+        """Test duplicate requests reuse the active job"""
+        first = enqueue_report(self.report)
+        second = enqueue_report(self.report)
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(ReportJob.objects.filter(report=self.report).count(), 1)
+
+    def test_claim_next_job_respects_priority(self):
+        """Test higher priority jobs are claimed first and only once"""
+        other_report = Report.objects.create(
+            name='Urgent Report',
+            report_type=Report.ReportType.EVENT_SUMMARY,
+            created_by=self.admin_user
+        )
+        enqueue_report(self.report, priority=1)
+        urgent = enqueue_report(other_report, priority=9)
+
+        claimed = claim_next_job('worker-1')
+        self.assertEqual(claimed.id, urgent.id)
+        self.assertEqual(claimed.status, ReportJob.Status.RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertEqual(claimed.worker_id, 'worker-1')
+
+        second = claim_next_job('worker-2')
+        self.assertEqual(second.report, self.report)
+        self.assertIsNone(claim_next_job('worker-3'))
+
+    def test_claim_skips_jobs_not_yet_available(self):
+        """Test jobs scheduled for retry are not claimed early"""
+        job = enqueue_report(self.report)
+        job.available_at = timezone.now() + timedelta(minutes=5)
+        job.save()
+
+        self.assertIsNone(claim_next_job('worker-1'))
+
+    @patch('reporting.services.generate_report')
+    def test_run_job_success(self, mock_generate):
+        """Test successful job completion"""
+        enqueue_report(self.report)
+        job = run_job(claim_next_job('worker-1'))
+
+        mock_generate.assert_called_once_with(str(self.report.id))
+        self.assertEqual(job.status, ReportJob.Status.COMPLETED)
+        self.assertIsNotNone(job.finished_at)
+
+    @patch('reporting.services.generate_report')
+    def test_run_job_retries_then_fails(self, mock_generate):
+        """Test failed jobs are retried with backoff until attempts run out"""
+        mock_generate.side_effect = ReportGenerationError('boom')
+        job = enqueue_report(self.report)
+        job.max_attempts = 2
+        job.save()
+
+        job = run_job(claim_next_job('worker-1'))
+        self.assertEqual(job.status, ReportJob.Status.QUEUED)
+        self.assertGreater(job.available_at, timezone.now())
+        self.assertEqual(job.error_message, 'boom')
+
+        ReportJob.objects.filter(pk=job.pk).update(available_at=timezone.now())
+        job = run_job(claim_next_job('worker-1'))
+        self.assertEqual(job.status, ReportJob.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_requeue_stale_jobs(self):
+        """Test running jobs without a recent heartbeat are returned to the queue"""
+        enqueue_report(self.report)
+        job = claim_next_job('worker-1')
+        ReportJob.objects.filter(pk=job.pk).update(
+            heartbeat_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(requeue_stale_jobs(stale_after=60), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ReportJob.Status.QUEUED)
+
+    def test_progress_updates_refresh_heartbeat(self):
+        """Test generator progress updates keep the running job alive"""
+        enqueue_report(self.report)
+        job = claim_next_job('worker-1')
+        old_heartbeat = timezone.now() - timedelta(hours=1)
+        ReportJob.objects.filter(pk=job.pk).update(heartbeat_at=old_heartbeat)
+
+        generator = BaseReportGenerator(self.report)
+        generator.update_progress(50, 'Halfway')
+
+        job.refresh_from_db()
+        self.assertGreater(job.heartbeat_at, old_heartbeat)
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.progress_percentage, 50)
+
+    @patch('reporting.services.generate_report')
+    def test_worker_drains_queue(self, mock_generate):
+        """Test a worker processes every available job"""
+        for index in range(3):
+            report = Report.objects.create(
+                name=f'Report {index}',
+                report_type=Report.ReportType.VOLUNTEER_SUMMARY,
+                created_by=self.admin_user
+            )
+            enqueue_report(report)
+
+        worker = ReportWorker(worker_id='test-worker', poll_interval=0)
+        self.assertEqual(worker.run_once(), 3)
+        self.assertEqual(mock_generate.call_count, 3)
+        self.assertFalse(ReportJob.objects.filter(status=ReportJob.Status.QUEUED).exists())
+
+
+class ReportJobAPITest(APITestCase):
+    """Test cases for the asynchronous report API"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            user_type=User.UserType.ADMIN,
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+
+    @patch('reporting.services.generate_report')
+    def test_create_returns_accepted_without_generating(self, mock_generate):
+        """Test report creation queues generation and returns 202"""
+        url = reverse('reporting:report-list')
+        data = {
+            'name': 'Async Report',
+            'report_type': 'VOLUNTEER_SUMMARY',
+            'export_format': 'CSV'
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_generate.assert_not_called()
+        self.assertEqual(response.data['job']['status'], ReportJob.Status.QUEUED)
+        self.assertIn('progress_url', response.data)
+        self.assertIn('websocket_url', response.data)
+
+        progress = self.client.get(response.data['progress_url'])
+        self.assertEqual(progress.status_code, status.HTTP_200_OK)
+        self.assertEqual(progress.data['current_step'], 'Queued')
+        self.assertEqual(progress.data['job']['status'], ReportJob.Status.QUEUED)
@@ -1,4 +1,5 @@
 from django.shortcuts import render, get_object_or_404
+from django.urls import reverse
 from django.http import HttpResponse, Http404, FileResponse
 from django.utils import timezone
 from django.db.models import Count, Avg, Sum, Q, F
@@ -16,13 +17,13 @@ import os
 import json
 import logging
 
-from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare
+from .models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare, ReportJob
 from .serializers import (
     ReportListSerializer, ReportDetailSerializer, ReportCreateSerializer,
     ReportTemplateSerializer, ReportScheduleSerializer, ReportShareSerializer,
     AnalyticsSerializer, DashboardStatsSerializer, ReportTypeInfoSerializer,
     BulkReportOperationSerializer, ReportGenerationRequestSerializer,
-    ReportProgressSerializer, ReportExportSerializer
+    ReportProgressSerializer, ReportExportSerializer, ReportJobSerializer
 )
 from .permissions import (
     ReportPermission, ReportTemplatePermission, ReportSchedulePermission,
@@ -30,7 +31,7 @@ from .permissions import (
     ReportDownloadPermission, SystemStatsPermission, ReportMetricsPermission,
     CustomReportPermission, ReportExportPermission, DashboardPermission
 )
-from .services import generate_report, ReportGenerationError
+from .job_queue import enqueue_report
 from common.audit_service import AdminAuditService
 from volunteers.models import VolunteerProfile
 from events.models import Event, Assignment
@@ -40,6 +41,15 @@ from accounts.models import User
 logger = logging.getLogger(__name__)
 
 
+def get_job_tracking_data(report, job):
+    """Get the queued job and the endpoints clients use to follow its progress"""
+    return {
+        'job': ReportJobSerializer(job).data,
+        'progress_url': reverse('reporting:report-progress', kwargs={'pk': report.id}),
+        'websocket_url': f"/ws/reports/{report.id}/progress/",
+    }
+
+
 class ReportPagination(PageNumberPagination):
     """Custom pagination for reports"""
     page_size = 25
@@ -119,8 +129,21 @@ class ReportViewSet(viewsets.ModelViewSet):
         # Regular users can only see their own reports
         return queryset.filter(created_by=self.request.user).select_related('created_by')
     
+    def create(self, request, *args, **kwargs):
+        """Create report and queue it for generation, returning 202 Accepted"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        
+        report = serializer.instance
+        data = ReportDetailSerializer(report).data
+        if self.report_job:
+            data.update(get_job_tracking_data(report, self.report_job))
+        
+        return Response(data, status=status.HTTP_202_ACCEPTED)
+    
     def perform_create(self, serializer):
-        """Create report and start generation"""
+        """Create report and queue generation"""
         report = serializer.save(created_by=self.request.user)
         
         # Log report creation
@@ -131,11 +154,12 @@ class ReportViewSet(viewsets.ModelViewSet):
             parameters=report.parameters
         )
         
-        # Start report generation asynchronously
+        # Queue report generation for the background workers
+        self.report_job = None
         try:
-            generate_report(str(report.id))
+            self.report_job = enqueue_report(report, requested_by=self.request.user)
         except Exception as e:
-            logger.error(f"Failed to start report generation for {report.id}: {str(e)}")
+            logger.error(f"Failed to queue report generation for {report.id}: {str(e)}")
             report.status = Report.Status.FAILED
             report.error_message = f"Failed to start generation: {str(e)}"
             report.save()
@@ -195,13 +219,23 @@ class ReportViewSet(viewsets.ModelViewSet):
                 total_estimated = elapsed * (100 / report.progress_percentage)
                 estimated_completion = report.started_at + total_estimated
         
+        job = report.jobs.order_by('-created_at').first()
+        
+        if report.status == Report.Status.FAILED:
+            current_step = report.error_message
+        elif job and job.status == ReportJob.Status.QUEUED:
+            current_step = 'Queued'
+        else:
+            current_step = 'Processing...'
+        
         serializer = ReportProgressSerializer({
             'report_id': report.id,
             'status': report.status,
             'progress_percentage': report.progress_percentage,
-            'current_step': report.error_message if report.status == Report.Status.FAILED else 'Processing...',
+            'current_step': current_step,
             'estimated_completion': estimated_completion,
-            'error_message': report.error_message if report.status == Report.Status.FAILED else ''
+            'error_message': report.error_message if report.status == Report.Status.FAILED else '',
+            'job': job
         })
         
         return Response(serializer.data)
@@ -229,10 +263,13 @@ class ReportViewSet(viewsets.ModelViewSet):
             parameters=report.parameters
         )
         
-        # Start generation
+        # Queue generation
         try:
-            generate_report(str(report.id))
-            return Response({'message': 'Report regeneration started'})
+            job = enqueue_report(report, requested_by=request.user)
+            return Response(
+                {'message': 'Report regeneration queued', **get_job_tracking_data(report, job)},
+                status=status.HTTP_202_ACCEPTED
+            )
         except Exception as e:
             report.status = Report.Status.FAILED
             report.error_message = f"Failed to start regeneration: {str(e)}"
@@ -296,6 +333,7 @@ class ReportViewSet(viewsets.ModelViewSet):
             return Response({'error': 'No reports found'}, status=status.HTTP_404_NOT_FOUND)
         
         results = []
+        response_status = status.HTTP_200_OK
         
         if action == 'delete':
             count = reports.count()
@@ -303,14 +341,15 @@ class ReportViewSet(viewsets.ModelViewSet):
             results.append(f"Deleted {count} reports")
             
         elif action == 'regenerate':
+            response_status = status.HTTP_202_ACCEPTED
             for report in reports:
                 try:
                     report.status = Report.Status.PENDING
                     report.progress_percentage = 0
                     report.error_message = ''
                     report.save()
-                    generate_report(str(report.id))
-                    results.append(f"Started regeneration for {report.name}")
+                    enqueue_report(report, requested_by=request.user)
+                    results.append(f"Queued regeneration for {report.name}")
                 except Exception as e:
                     results.append(f"Failed to regenerate {report.name}: {str(e)}")
         
@@ -332,7 +371,7 @@ class ReportViewSet(viewsets.ModelViewSet):
             operation_details={'action': action, 'parameters': parameters}
         )
         
-        return Response({'results': results})
+        return Response({'results': results}, status=response_status)
     
     @action(detail=False, methods=['get'])
     def types(self, request):
@@ -458,10 +497,13 @@ class ReportTemplateViewSet(viewsets.ModelViewSet):
                 created_by=request.user
             )
             
-            # Start generation
+            # Queue generation
             try:
-                generate_report(str(report.id))
-                return Response(ReportDetailSerializer(report).data, status=status.HTTP_201_CREATED)
+                job = enqueue_report(report, requested_by=request.user)
+                return Response(
+                    {**ReportDetailSerializer(report).data, **get_job_tracking_data(report, job)},
+                    status=status.HTTP_202_ACCEPTED
+                )
             except Exception as e:
                 report.delete()
                 return Response(
@@ -503,10 +545,13 @@ class ReportScheduleViewSet(viewsets.ModelViewSet):
             created_by=request.user
         )
         
-        # Start generation
+        # Queue generation
         try:
-            generate_report(str(report.id))
-            return Response(ReportDetailSerializer(report).data, status=status.HTTP_201_CREATED)
+            job = enqueue_report(report, requested_by=request.user)
+            return Response(
+                {**ReportDetailSerializer(report).data, **get_job_tracking_data(report, job)},
+                status=status.HTTP_202_ACCEPTED
+            )
         except Exception as e:
             report.delete()
             return Response(
@@ -176,7 +176,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'accounts.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -322,12 +322,93 @@ JUSTGO_API = {
     'TIMEOUT': config('JUSTGO_API_TIMEOUT', default=30, cast=int),
     'MAX_RETRIES': config('JUSTGO_API_MAX_RETRIES', default=3, cast=int),
     'RATE_LIMIT_DELAY': config('JUSTGO_API_RATE_LIMIT_DELAY', default=0.5, cast=float),
+    'RATE_LIMIT_BURST': config('JUSTGO_API_RATE_LIMIT_BURST', default=1, cast=int),
+    'MAX_WORKERS': config('JUSTGO_API_MAX_WORKERS', default=8, cast=int),
+}
+
+# JustGo Member Cache
+# Credential and membership lookups for mapped members are served from
+# JustGoCredentialCache; stale records are refreshed in the background
+JUSTGO_CACHE = {
+    'FRESH_TTL': config('JUSTGO_CACHE_FRESH_TTL', default=6 * 3600, cast=int),
+    'MAX_STALE': config('JUSTGO_CACHE_MAX_STALE', default=7 * 86400, cast=int),
+    'NEGATIVE_TTL': config('JUSTGO_CACHE_NEGATIVE_TTL', default=15 * 60, cast=int),
+    'LRU_SIZE': config('JUSTGO_CACHE_LRU_SIZE', default=1024, cast=int),
+    'REFRESH_WORKERS': config('JUSTGO_CACHE_REFRESH_WORKERS', default=2, cast=int),
 }
 
 # JustGo Safety Settings
 # Set to False ONLY in development/testing to enable write operations
 JUSTGO_READONLY_MODE = config('JUSTGO_READONLY_MODE', default=True, cast=bool)
 
+# API Authentication
+# Token lookups are cached for TOKEN_CACHE_TTL seconds; users' last_activity
+# is buffered and written in bulk every ACTIVITY_FLUSH_INTERVAL seconds
+API_AUTH = {
+    'TOKEN_CACHE_TTL': config('API_TOKEN_CACHE_TTL', default=300, cast=int),
+    'ACTIVITY_FLUSH_INTERVAL': config('API_ACTIVITY_FLUSH_INTERVAL', default=60, cast=int),
+}
+
+# Search Index
+# Volunteers, profiles, events and assignments are matched through
+# common.SearchDocument; run `python manage.py rebuild_search_index` to backfill
+SEARCH = {
+    'BATCH_SIZE': config('SEARCH_BATCH_SIZE', default=500, cast=int),
+    'MAX_QUERY_WORDS': config('SEARCH_MAX_QUERY_WORDS', default=10, cast=int),
+}
+
+# Keyset Pagination
+# High-volume list endpoints page by cursor with ?pagination=keyset
+KEYSET_PAGINATION = {
+    'PAGE_SIZE': config('KEYSET_PAGE_SIZE', default=20, cast=int),
+    'MAX_PAGE_SIZE': config('KEYSET_MAX_PAGE_SIZE', default=100, cast=int),
+}
+
+# Background Report Generation Queue
+# Reports are generated by `python manage.py run_report_workers`
+REPORT_JOB_QUEUE = {
+    'WORKERS': config('REPORT_WORKERS', default=2, cast=int),
+    'POLL_INTERVAL': config('REPORT_WORKER_POLL_INTERVAL', default=2.0, cast=float),
+    'MAX_ATTEMPTS': config('REPORT_JOB_MAX_ATTEMPTS', default=3, cast=int),
+    'RETRY_DELAY': config('REPORT_JOB_RETRY_DELAY', default=30, cast=int),  # seconds, multiplied by attempt
+    'STALE_AFTER': config('REPORT_JOB_STALE_AFTER', default=600, cast=int),  # seconds without a heartbeat
+    'RUN_INLINE': config('REPORT_JOBS_RUN_INLINE', default=False, cast=bool),  # generate in-request (dev only)
+}
+
+# Audit Log Writer
+# Audit records are buffered in-process and written in batches by a background
+# thread; batches that cannot reach the database are spooled to SPOOL_PATH
+AUDIT_LOG_WRITER = {
+    'ASYNC': config('AUDIT_LOG_ASYNC', default=True, cast=bool),
+    'BATCH_SIZE': config('AUDIT_LOG_BATCH_SIZE', default=200, cast=int),
+    'FLUSH_INTERVAL_MS': config('AUDIT_LOG_FLUSH_INTERVAL_MS', default=500, cast=int),
+    'BUFFER_SIZE': config('AUDIT_LOG_BUFFER_SIZE', default=10000, cast=int),
+    'SPOOL_PATH': config('AUDIT_LOG_SPOOL_PATH', default=os.path.join(BASE_DIR, 'logs', 'audit_spool.jsonl')),
+}
+
+# Outbound Email
+# Email is queued in the outbox and sent by ``manage.py run_mail_worker``;
+# domain rate limits are messages per minute per worker process
+EMAIL_OUTBOX = {
+    'BATCH_SIZE': config('EMAIL_OUTBOX_BATCH_SIZE', default=100, cast=int),
+    'POLL_INTERVAL': config('EMAIL_OUTBOX_POLL_INTERVAL', default=5.0, cast=float),
+    'MAX_ATTEMPTS': config('EMAIL_OUTBOX_MAX_ATTEMPTS', default=6, cast=int),
+    'RETRY_DELAY': config('EMAIL_OUTBOX_RETRY_DELAY', default=60, cast=int),  # seconds, doubled per attempt
+    'MAX_RETRY_DELAY': config('EMAIL_OUTBOX_MAX_RETRY_DELAY', default=3600, cast=int),
+    'STALE_AFTER': config('EMAIL_OUTBOX_STALE_AFTER', default=600, cast=int),  # seconds before a claim is retaken
+    'DOMAIN_RATE_LIMIT': config('EMAIL_OUTBOX_DOMAIN_RATE_LIMIT', default=120, cast=int),
+    'DOMAIN_RATE_LIMITS': {},
+}
+
+# Scheduled Notifications
+# ``manage.py run_notification_dispatcher`` sends notifications deferred by
+# template delays or quiet hours and expires old ones every CLEANUP_INTERVAL
+NOTIFICATION_DISPATCHER = {
+    'BATCH_SIZE': config('NOTIFICATION_DISPATCH_BATCH_SIZE', default=100, cast=int),
+    'POLL_INTERVAL': config('NOTIFICATION_DISPATCH_POLL_INTERVAL', default=5.0, cast=float),
+    'CLEANUP_INTERVAL': config('NOTIFICATION_CLEANUP_INTERVAL', default=300, cast=int),  # seconds
+}
+
 # SOI Branding Configuration
 SOI_BRAND_COLORS = {
     'PRIMARY_GREEN': '#228B22',
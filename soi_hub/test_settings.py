@@ -49,10 +49,20 @@ CACHES = {
     }
 }
 
+# Use in-memory channel layer during tests
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+    }
+}
+
 # Test-specific settings
 SECRET_KEY = 'test-secret-key-for-testing-only'
 DEBUG = False
 ALLOWED_HOSTS = ['testserver']
 
+# Write audit records synchronously so tests can read them back
+AUDIT_LOG_WRITER = {**AUDIT_LOG_WRITER, 'ASYNC': False}
+
 # Disable email sending during tests
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend' 
\ No newline at end of file
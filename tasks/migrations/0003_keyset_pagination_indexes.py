@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_keyset_pagination_indexes'),
+        ('tasks', '0002_taskcompletion_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskcompletion',
+            index=models.Index(fields=['created_at', 'id'], name='tasks_taskc_created_ba4836_idx'),
+        ),
+    ]
@@ -370,32 +370,11 @@ class Task(models.Model):
     def _validate_prerequisites(self):
         """Validate that prerequisite tasks don't create circular dependencies"""
         if self.pk:
-            # Check for circular dependencies
-            visited = set()
-            
-            def has_circular_dependency(task_id, path):
-                if task_id in path:
-                    return True
-                if task_id in visited:
-                    return False
-                
-                visited.add(task_id)
-                path.add(task_id)
-                
-                try:
-                    task = Task.objects.get(pk=task_id)
-                    for prereq in task.prerequisite_tasks.all():
-                        if has_circular_dependency(prereq.pk, path.copy()):
-                            return True
-                except Task.DoesNotExist:
-                    pass
-                
-                path.remove(task_id)
-                return False
-            
-            for prereq in self.prerequisite_tasks.all():
-                if has_circular_dependency(prereq.pk, {self.pk}):
-                    raise ValidationError(_('Circular dependency detected in prerequisite tasks'))
+            from .task_graph import TaskGraph
+
+            # Cycles can run through other events' tasks, so check the full graph
+            if TaskGraph.for_all_tasks().find_cycle(self.pk):
+                raise ValidationError(_('Circular dependency detected in prerequisite tasks'))
     
     # Status management methods
     def activate(self, activated_by=None, reason=''):
@@ -480,36 +459,24 @@ class Task(models.Model):
     # Prerequisite and dependency methods
     def are_prerequisites_met(self, volunteer=None):
         """Check if all prerequisite tasks are completed"""
-        if not self.prerequisite_tasks.exists():
-            return True
-        
-        if volunteer:
-            # Check if volunteer has completed all prerequisites
-            for prereq in self.prerequisite_tasks.all():
-                if not prereq.completions.filter(
-                    volunteer=volunteer,
-                    status__in=[TaskCompletion.CompletionStatus.APPROVED, TaskCompletion.CompletionStatus.VERIFIED]
-                ).exists():
-                    return False
-            return True
-        
-        # General check - all prerequisites must be active
-        return all(prereq.is_active() for prereq in self.prerequisite_tasks.all())
+        return not self._missing_prerequisite_ids(volunteer)
     
     def get_missing_prerequisites(self, volunteer=None):
         """Get list of missing prerequisite tasks"""
+        missing = self._missing_prerequisite_ids(volunteer)
+        if not missing:
+            return []
+        return list(Task.objects.filter(id__in=missing))
+    
+    def _missing_prerequisite_ids(self, volunteer=None):
+        """Prerequisite ids the volunteer hasn't completed, or that aren't active"""
+        from .task_graph import TaskGraph
+
+        graph = TaskGraph.for_event(self.event_id)
         if not volunteer:
-            return list(self.prerequisite_tasks.exclude(status=self.TaskStatus.ACTIVE))
-        
-        # Return prerequisites that volunteer hasn't completed
-        missing = []
-        for prereq in self.prerequisite_tasks.all():
-            if not prereq.completions.filter(
-                volunteer=volunteer,
-                status__in=[TaskCompletion.CompletionStatus.APPROVED, TaskCompletion.CompletionStatus.VERIFIED]
-            ).exists():
-                missing.append(prereq)
-        return missing
+            return graph.inactive_prerequisites(self.pk)
+        missing = graph.missing_prerequisites([self.pk], [volunteer.pk])
+        return missing[str(volunteer.pk)][str(self.pk)]
     
     # Configuration and validation methods
     def get_configuration(self, key=None, default=None):
@@ -898,6 +865,7 @@ class TaskCompletion(models.Model):
             models.Index(fields=['submitted_at']),
             models.Index(fields=['completed_at']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['created_at', 'id']),
         ]
         constraints = [
             models.CheckConstraint(
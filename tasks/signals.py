@@ -0,0 +1,32 @@
+"""
+Signal receivers for the tasks app
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Task
+from .task_graph import invalidate_task_graphs
+
+# Task fields held in the cached prerequisite graph
+GRAPH_FIELDS = {'status', 'event', 'event_id', 'role', 'role_id'}
+
+
+@receiver(m2m_changed, sender=Task.prerequisite_tasks.through)
+def prerequisites_changed(sender, action, **kwargs):
+    """Drop cached prerequisite graphs when prerequisite edges change"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_task_graphs()
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Drop cached prerequisite graphs when a task is added or its status changes"""
+    if created or update_fields is None or GRAPH_FIELDS & set(update_fields):
+        invalidate_task_graphs()
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    """Drop cached prerequisite graphs when a task is removed"""
+    invalidate_task_graphs()
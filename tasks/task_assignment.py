@@ -0,0 +1,280 @@
+"""
+Set-based bulk assignment of tasks to volunteers.
+
+Assigning T tasks to V volunteers loads everything it needs up front instead
+of checking each of the T x V pairs with its own queries:
+
+1. tasks (with role and event) and volunteers - one query each
+2. confirmed role assignments for every volunteer - one query
+3. prerequisite edges for every task - one query
+4. existing completions of the tasks and their prerequisites - one query
+
+Eligible pairs are then worked out in memory, the ``TaskCompletion`` rows
+are written with ``bulk_create`` and the assignment emails are queued in the
+outbox with one more insert.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils import timezone
+
+from common.email_outbox import build_email, queue_emails
+from events.models import Assignment
+
+from .models import Task, TaskCompletion
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+# Completions that block a new assignment of the same task. A rejected or
+# cancelled completion does not, unless it was recorded against the same role
+# assignment: completions are unique per task, volunteer and assignment.
+OPEN_STATUSES = {
+    TaskCompletion.CompletionStatus.PENDING,
+    TaskCompletion.CompletionStatus.SUBMITTED,
+    TaskCompletion.CompletionStatus.UNDER_REVIEW,
+    TaskCompletion.CompletionStatus.REVISION_REQUIRED,
+}
+
+# Completions that satisfy a prerequisite
+DONE_STATUSES = {
+    TaskCompletion.CompletionStatus.APPROVED,
+    TaskCompletion.CompletionStatus.VERIFIED,
+}
+
+COMPLETION_TYPES = {
+    Task.TaskType.CHECKBOX: TaskCompletion.CompletionType.CHECKBOX,
+    Task.TaskType.PHOTO: TaskCompletion.CompletionType.PHOTO_UPLOAD,
+    Task.TaskType.TEXT: TaskCompletion.CompletionType.TEXT_SUBMISSION,
+    Task.TaskType.CUSTOM: TaskCompletion.CompletionType.CUSTOM_FIELDS,
+}
+
+EMAIL_TEMPLATE = 'tasks/task_assignment_email.html'
+
+
+class BulkTaskAssignment:
+    """
+    Assign many tasks to many volunteers in a fixed number of queries.
+
+    ``run`` returns the same result dictionary as
+    ``TaskManagementService.bulk_assign_tasks``.
+    """
+
+    def __init__(self, assigned_by: User, batch_size: int = BATCH_SIZE, notify: bool = True):
+        self.assigned_by = assigned_by
+        self.batch_size = batch_size
+        self.notify = notify
+
+    def run(self, task_ids: Iterable[Any], volunteer_ids: Iterable[Any]) -> Dict[str, Any]:
+        task_ids = list(dict.fromkeys(str(task_id) for task_id in task_ids))
+        volunteer_ids = list(dict.fromkeys(str(volunteer_id) for volunteer_id in volunteer_ids))
+
+        tasks = {
+            str(task.id): task
+            for task in Task.objects.filter(id__in=task_ids).select_related('role', 'event')
+        }
+        volunteers = {
+            str(user.id): user
+            for user in User.objects.filter(id__in=volunteer_ids).only(
+                'id', 'username', 'email', 'first_name', 'last_name'
+            )
+        }
+        assignments = self._load_assignments(tasks.values(), volunteers)
+        prerequisites = self._load_prerequisites(tasks)
+        completions, recorded = self._load_completions(tasks, prerequisites, volunteers)
+
+        results = {
+            'successful_assignments': [],
+            'failed_assignments': [],
+            'total_attempted': len(task_ids) * len(volunteer_ids),
+            'total_successful': 0,
+            'total_failed': 0
+        }
+
+        new_completions = []
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            for volunteer_id in volunteer_ids:
+                volunteer = volunteers.get(volunteer_id)
+                error = self._check_pair(
+                    task, volunteer, assignments, prerequisites.get(task_id, ()), completions, recorded
+                )
+                if error:
+                    results['failed_assignments'].append({
+                        'task_id': task_id,
+                        'volunteer_id': volunteer_id,
+                        'error': error
+                    })
+                    continue
+
+                new_completions.append(TaskCompletion(
+                    task=task,
+                    volunteer=volunteer,
+                    assignment_id=assignments[(volunteer_id, task.role_id)],
+                    completion_type=COMPLETION_TYPES.get(task.task_type, TaskCompletion.CompletionType.CHECKBOX),
+                    requires_verification=task.requires_verification,
+                    status=TaskCompletion.CompletionStatus.PENDING
+                ))
+
+        with transaction.atomic():
+            TaskCompletion.objects.bulk_create(new_completions, batch_size=self.batch_size)
+            if self.notify:
+                self._queue_notifications(new_completions)
+
+        results['successful_assignments'] = [
+            {
+                'task_id': str(completion.task_id),
+                'volunteer_id': str(completion.volunteer_id),
+                'completion_id': str(completion.id)
+            }
+            for completion in new_completions
+        ]
+        results['total_successful'] = len(new_completions)
+        results['total_failed'] = len(results['failed_assignments'])
+        return results
+
+    # Loading
+
+    def _load_assignments(self, tasks, volunteers) -> Dict[tuple, Any]:
+        """Confirmed assignment id per ``(volunteer_id, role_id)``"""
+        role_ids = {task.role_id for task in tasks}
+        rows = Assignment.objects.filter(
+            role_id__in=role_ids,
+            volunteer_id__in=list(volunteers),
+            status=Assignment.AssignmentStatus.CONFIRMED
+        ).values_list('volunteer_id', 'role_id', 'id')
+        return {(str(volunteer_id), role_id): assignment_id for volunteer_id, role_id, assignment_id in rows}
+
+    def _load_prerequisites(self, tasks) -> Dict[str, List[str]]:
+        """Prerequisite task ids per task id"""
+        prerequisites = defaultdict(list)
+        edges = Task.prerequisite_tasks.through.objects.filter(
+            from_task_id__in=list(tasks)
+        ).values_list('from_task_id', 'to_task_id')
+        for task_id, prerequisite_id in edges:
+            prerequisites[str(task_id)].append(str(prerequisite_id))
+        return prerequisites
+
+    def _load_completions(self, tasks, prerequisites, volunteers) -> Tuple[Dict[tuple, str], Dict[tuple, str]]:
+        """
+        Status of the most relevant completion per ``(task_id, volunteer_id)``,
+        and the status of every completion per ``(task_id, volunteer_id, assignment_id)``
+        """
+        task_ids = set(tasks)
+        for prerequisite_ids in prerequisites.values():
+            task_ids.update(prerequisite_ids)
+
+        completions, recorded = {}, {}
+        rows = TaskCompletion.objects.filter(
+            task_id__in=task_ids,
+            volunteer_id__in=list(volunteers)
+        ).values_list('task_id', 'volunteer_id', 'assignment_id', 'status')
+        for task_id, volunteer_id, assignment_id, status in rows:
+            key = (str(task_id), str(volunteer_id))
+            recorded[key + (assignment_id,)] = status
+            # A finished completion wins over an open one, which wins over a closed one
+            current = completions.get(key)
+            if current in DONE_STATUSES:
+                continue
+            if current in OPEN_STATUSES and status not in DONE_STATUSES:
+                continue
+            completions[key] = status
+        return completions, recorded
+
+    # Eligibility
+
+    def _check_pair(self, task: Optional[Task], volunteer: Optional[User], assignments,
+                    prerequisite_ids, completions, recorded) -> Optional[str]:
+        """Reason the task cannot be assigned to the volunteer, or None"""
+        if task is None:
+            return 'Task not found'
+        if volunteer is None:
+            return 'Volunteer not found'
+
+        task_id, volunteer_id = str(task.id), str(volunteer.id)
+        name = volunteer.get_full_name() or volunteer.username
+
+        assignment_id = assignments.get((volunteer_id, task.role_id))
+        if assignment_id is None:
+            return f"Volunteer {name} is not assigned to role {task.role.name}"
+
+        status = completions.get((task_id, volunteer_id))
+        if status in DONE_STATUSES:
+            return f"Task '{task.title}' has already been completed by {name}"
+        if status in OPEN_STATUSES:
+            return f"Task '{task.title}' is already assigned to {name}"
+        if (task_id, volunteer_id, assignment_id) in recorded:
+            return f"Task '{task.title}' already has a completion for {name} under this role assignment"
+
+        for prerequisite_id in prerequisite_ids:
+            if completions.get((prerequisite_id, volunteer_id)) not in DONE_STATUSES:
+                return f"Volunteer {name} does not meet task prerequisites"
+
+        return None
+
+    # Notifications
+
+    def _queue_notifications(self, completions: List[TaskCompletion]) -> None:
+        """Queue one assignment email per new completion with a single insert"""
+        try:
+            template = get_template(EMAIL_TEMPLATE)
+        except TemplateDoesNotExist:
+            template = None
+
+        emails = []
+        for completion in completions:
+            task, volunteer = completion.task, completion.volunteer
+            if not volunteer.email:
+                continue
+
+            context = {
+                'volunteer_name': volunteer.get_full_name(),
+                'task_title': task.title,
+                'task_description': task.description,
+                'due_date': task.due_date,
+                'role_name': task.role.name,
+                'event_name': task.event.name,
+                'instructions': task.instructions
+            }
+            if template is not None:
+                body = html_body = template.render(context)
+            else:
+                body, html_body = self._plain_text_body(context), ''
+
+            emails.append(build_email(
+                subject=f"New Task Assignment: {task.title}",
+                body=body,
+                html_body=html_body,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[volunteer.email],
+                category='task_assignment',
+                related_object=completion
+            ))
+
+        queue_emails(emails)
+        logger.info(f"Queued {len(emails)} task assignment emails")
+
+    @staticmethod
+    def _plain_text_body(context: Dict[str, Any]) -> str:
+        lines = [
+            f"Hello {context['volunteer_name']},",
+            '',
+            f"You have been assigned a new task for {context['role_name']} at {context['event_name']}:",
+            '',
+            context['task_title'],
+            context['task_description'],
+        ]
+        if context['due_date']:
+            lines.append(f"Due: {timezone.localtime(context['due_date']):%d %B %Y %H:%M}")
+        if context['instructions']:
+            lines += ['', context['instructions']]
+        return '\n'.join(lines)
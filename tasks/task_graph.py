@@ -0,0 +1,238 @@
+"""
+Task prerequisite graph.
+
+The whole prerequisite edge set for an event or role (or for every task) is loaded
+in at most three queries and kept in the cache, so cycle detection,
+topological ordering and prerequisite checks run in memory. Answering which
+tasks are unlocked for any number of volunteers needs one completion query.
+
+Cached graphs are keyed by a version that ``invalidate_task_graphs`` replaces
+whenever a task is saved or deleted or its prerequisites change (see
+``tasks.signals``).
+"""
+
+import uuid
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.core.cache import cache
+
+from .models import Task, TaskCompletion
+
+CACHE_TIMEOUT = 3600
+VERSION_KEY = 'tasks:prerequisite_graph:version'
+
+# Completion statuses that satisfy a prerequisite
+DONE_STATUSES = [TaskCompletion.CompletionStatus.APPROVED, TaskCompletion.CompletionStatus.VERIFIED]
+
+
+class PrerequisiteCycleError(ValueError):
+    """The prerequisite edges contain a cycle"""
+
+
+def invalidate_task_graphs() -> None:
+    """Make every cached prerequisite graph stale"""
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _get_version() -> str:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.add(VERSION_KEY, version, None)
+        version = cache.get(VERSION_KEY, version)
+    return version
+
+
+class TaskGraph:
+    """
+    Prerequisite edges between tasks and each task's status
+
+    Usage:
+        graph = TaskGraph.for_event(event_id)
+        graph.unlocked_tasks(volunteer_ids)
+    """
+
+    def __init__(self, statuses: Dict[str, str], prerequisites: Dict[str, List[str]]):
+        self.statuses = statuses
+        self.prerequisites = {task_id: list(prereqs) for task_id, prereqs in prerequisites.items()}
+
+    @classmethod
+    def for_event(cls, event_id: Any) -> 'TaskGraph':
+        """Graph of one event's tasks and their prerequisites"""
+        return cls._load_cached(f"event:{event_id}", {'event_id': event_id})
+
+    @classmethod
+    def for_role(cls, role_id: Any) -> 'TaskGraph':
+        """Graph of one role's tasks and their prerequisites"""
+        return cls._load_cached(f"role:{role_id}", {'role_id': role_id})
+
+    @classmethod
+    def for_all_tasks(cls) -> 'TaskGraph':
+        """Graph of every task"""
+        return cls._load_cached('all', {})
+
+    @classmethod
+    def _load_cached(cls, scope: str, filters: Dict[str, Any]) -> 'TaskGraph':
+        key = f"tasks:prerequisite_graph:{_get_version()}:{scope}"
+        data = cache.get(key)
+        if data is None:
+            data = cls._load(filters)
+            cache.set(key, data, CACHE_TIMEOUT)
+        return cls(data['statuses'], data['prerequisites'])
+
+    @staticmethod
+    def _load(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Read a scope's tasks, their edges and any prerequisites outside the scope"""
+        statuses = {
+            str(task_id): status
+            for task_id, status in Task.objects.filter(**filters).values_list('id', 'status')
+        }
+
+        through = Task.prerequisite_tasks.through
+        edges = through.objects.all()
+        if filters:
+            edges = edges.filter(**{f"from_task__{field}": value for field, value in filters.items()})
+
+        prerequisites = defaultdict(list)
+        for task_id, prerequisite_id in edges.values_list('from_task_id', 'to_task_id'):
+            prerequisites[str(task_id)].append(str(prerequisite_id))
+
+        outside = {
+            prerequisite_id
+            for prereqs in prerequisites.values()
+            for prerequisite_id in prereqs
+            if prerequisite_id not in statuses
+        }
+        if outside:
+            statuses.update(
+                (str(task_id), status)
+                for task_id, status in Task.objects.filter(id__in=outside).values_list('id', 'status')
+            )
+
+        return {'statuses': statuses, 'prerequisites': dict(prerequisites)}
+
+    # Structure
+
+    def get_prerequisites(self, task_id: Any) -> List[str]:
+        """Direct prerequisite ids of a task"""
+        return self.prerequisites.get(str(task_id), [])
+
+    def find_cycle(self, task_id: Any, prerequisite_ids: Optional[Iterable[Any]] = None) -> Optional[List[str]]:
+        """
+        Cycle through ``task_id``, if there is one
+
+        Args:
+            task_id: Task to check
+            prerequisite_ids: Prerequisites to check in place of the task's current ones
+
+        Returns:
+            Task ids along the cycle, starting and ending with ``task_id``, or None
+        """
+        start = str(task_id)
+        first = [str(p) for p in prerequisite_ids] if prerequisite_ids is not None else self.get_prerequisites(start)
+
+        # Iterative DFS for a path from the task's prerequisites back to the task
+        parents = {}
+        stack = [(prereq, start) for prereq in first]
+        while stack:
+            node, parent = stack.pop()
+            if node in parents:
+                continue
+            parents[node] = parent
+            if node == start:
+                path = [start]
+                node = parent
+                while node != start:
+                    path.append(node)
+                    node = parents[node]
+                path.append(start)
+                return list(reversed(path))
+            stack.extend((prereq, node) for prereq in self.get_prerequisites(node))
+        return None
+
+    def topological_order(self, task_ids: Optional[Iterable[Any]] = None) -> List[str]:
+        """
+        Task ids ordered so every task comes after its prerequisites
+
+        Raises:
+            PrerequisiteCycleError: if the tasks' prerequisites contain a cycle
+        """
+        nodes = set(self.statuses) if task_ids is None else {str(task_id) for task_id in task_ids}
+        indegree = {node: 0 for node in nodes}
+        dependents = defaultdict(list)
+        for node in nodes:
+            for prereq in self.get_prerequisites(node):
+                if prereq in nodes:
+                    indegree[node] += 1
+                    dependents[prereq].append(node)
+
+        queue = deque(sorted(node for node, degree in indegree.items() if degree == 0))
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for dependent in dependents[node]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) < len(nodes):
+            raise PrerequisiteCycleError('Circular dependency detected in prerequisite tasks')
+        return order
+
+    # Prerequisite checks
+
+    def inactive_prerequisites(self, task_id: Any) -> List[str]:
+        """Prerequisite ids of a task that are not active"""
+        return [
+            prereq for prereq in self.get_prerequisites(task_id)
+            if self.statuses.get(prereq) != Task.TaskStatus.ACTIVE
+        ]
+
+    def missing_prerequisites(self, task_ids: Iterable[Any], volunteer_ids: Iterable[Any]) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Prerequisites each volunteer has not completed, with one query
+
+        Returns:
+            ``{volunteer_id: {task_id: {missing prerequisite ids}}}``
+        """
+        task_ids = [str(task_id) for task_id in task_ids]
+        volunteer_ids = [str(volunteer_id) for volunteer_id in volunteer_ids]
+        required = {prereq for task_id in task_ids for prereq in self.get_prerequisites(task_id)}
+
+        completed = defaultdict(set)
+        if required and volunteer_ids:
+            rows = TaskCompletion.objects.filter(
+                task_id__in=required,
+                volunteer_id__in=volunteer_ids,
+                status__in=DONE_STATUSES
+            ).values_list('volunteer_id', 'task_id').distinct()
+            for volunteer_id, task_id in rows:
+                completed[str(volunteer_id)].add(str(task_id))
+
+        return {
+            volunteer_id: {
+                task_id: set(self.get_prerequisites(task_id)) - completed[volunteer_id]
+                for task_id in task_ids
+            }
+            for volunteer_id in volunteer_ids
+        }
+
+    def unlocked_tasks(self, volunteer_ids: Iterable[Any], task_ids: Optional[Iterable[Any]] = None) -> Dict[str, List[str]]:
+        """
+        Tasks each volunteer has completed every prerequisite of
+
+        Args:
+            volunteer_ids: Volunteers to check
+            task_ids: Tasks to consider (default: every task in the graph)
+
+        Returns:
+            ``{volunteer_id: [task ids in topological order]}``
+        """
+        order = self.topological_order(task_ids)
+        missing = self.missing_prerequisites(order, volunteer_ids)
+        return {
+            volunteer_id: [task_id for task_id in order if not by_task[task_id]]
+            for volunteer_id, by_task in missing.items()
+        }
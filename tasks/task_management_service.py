@@ -12,13 +12,13 @@ from django.db.models import Count, Q, Avg, Sum, Max, Min, F, Case, When, Intege
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db import transaction
 from django.core.exceptions import ValidationError
 from django.template.loader import render_to_string
-from django.core.mail import send_mail
+from common.email_outbox import queue_email
 from django.conf import settings
 
 from .models import Task, TaskCompletion
+from .task_assignment import BulkTaskAssignment
 from events.models import Event, Role, Assignment
 from volunteers.models import VolunteerProfile
 from common.audit_service import AdminAuditService
@@ -210,6 +210,10 @@ class TaskManagementService:
         """
         Bulk assign multiple tasks to multiple volunteers.
         
+        Eligibility for every task and volunteer pair is worked out from a
+        fixed number of queries, the completions are bulk-created and the
+        assignment emails are queued together (see ``BulkTaskAssignment``).
+        
         Args:
             task_ids: List of task IDs to assign
             volunteer_ids: List of volunteer IDs to assign to
@@ -218,44 +222,16 @@ class TaskManagementService:
         Returns:
             Dictionary with assignment results
         """
-        results = {
-            'successful_assignments': [],
-            'failed_assignments': [],
-            'total_attempted': len(task_ids) * len(volunteer_ids),
-            'total_successful': 0,
-            'total_failed': 0
-        }
-        
-        with transaction.atomic():
-            for task_id in task_ids:
-                for volunteer_id in volunteer_ids:
-                    try:
-                        completion = cls.assign_task_to_volunteer(
-                            task_id, volunteer_id, assigned_by
-                        )
-                        results['successful_assignments'].append({
-                            'task_id': task_id,
-                            'volunteer_id': volunteer_id,
-                            'completion_id': completion.id
-                        })
-                        results['total_successful'] += 1
-                        
-                    except Exception as e:
-                        results['failed_assignments'].append({
-                            'task_id': task_id,
-                            'volunteer_id': volunteer_id,
-                            'error': str(e)
-                        })
-                        results['total_failed'] += 1
+        results = BulkTaskAssignment(assigned_by).run(task_ids, volunteer_ids)
         
         # Log bulk assignment
         AdminAuditService.log_bulk_operation(
-            operation='bulk_task_assignment',
+            operation_type='bulk_task_assignment',
             user=assigned_by,
             affected_count=results['total_successful'],
             details={
-                'task_ids': task_ids,
-                'volunteer_ids': volunteer_ids,
+                'task_ids': [str(task_id) for task_id in task_ids],
+                'volunteer_ids': [str(volunteer_id) for volunteer_id in volunteer_ids],
                 'successful_count': results['total_successful'],
                 'failed_count': results['total_failed']
             }
@@ -638,12 +614,14 @@ class TaskManagementService:
             subject = f"New Task Assignment: {completion.task.title}"
             message = render_to_string('tasks/task_assignment_email.html', context)
             
-            send_mail(
+            queue_email(
                 subject=subject,
-                message=message,
+                body=message,
+                html_body=message,
                 from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[completion.volunteer.user.email],
-                html_message=message
+                to=[completion.volunteer.user.email],
+                category='task_assignment',
+                related_object=completion
             )
         except Exception:
             pass  # Don't fail task assignment if email fails
@@ -0,0 +1,178 @@
+"""
+Tests for set-based bulk task assignment.
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User
+from common.notification_models import OutboundEmail
+from events.models import Event, Venue, Role, Assignment
+from tasks.models import Task, TaskCompletion
+from tasks.task_assignment import BulkTaskAssignment
+from tasks.task_management_service import TaskManagementService
+
+
+class BulkTaskAssignmentTest(TestCase):
+    """Test bulk assignment eligibility, writes and query count"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.staff_user = User.objects.create_user(
+            username='staff_user',
+            email='staff@test.com',
+            password='testpass123',
+            user_type=User.UserType.STAFF
+        )
+
+        self.event = Event.objects.create(
+            name='Test Event 2026',
+            slug='test-event-2026',
+            start_date=timezone.now().date() + timedelta(days=30),
+            end_date=timezone.now().date() + timedelta(days=35),
+            created_by=self.staff_user
+        )
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Test Venue',
+            slug='test-venue',
+            address_line_1='123 Test Street',
+            city='Test City',
+            created_by=self.staff_user
+        )
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Test Role',
+            description='Test role description',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            total_positions=100,
+            created_by=self.staff_user
+        )
+
+        self.training = self.create_task('Training')
+        self.induction = self.create_task('Induction')
+        self.induction.prerequisite_tasks.add(self.training)
+
+        self.volunteers = [self.create_volunteer(index) for index in range(3)]
+        self.unassigned = User.objects.create_user(
+            username='unassigned',
+            email='unassigned@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+
+    def create_task(self, title):
+        return Task.objects.create(
+            role=self.role,
+            event=self.event,
+            venue=self.venue,
+            title=title,
+            description=f'{title} description',
+            task_type=Task.TaskType.CHECKBOX,
+            created_by=self.staff_user
+        )
+
+    def create_volunteer(self, index):
+        volunteer = User.objects.create_user(
+            username=f'volunteer{index}',
+            email=f'volunteer{index}@test.com',
+            password='testpass123',
+            first_name='Volunteer',
+            last_name=str(index),
+            user_type=User.UserType.VOLUNTEER
+        )
+        Assignment.objects.create(
+            volunteer=volunteer,
+            role=self.role,
+            event=self.event,
+            venue=self.venue,
+            start_date=timezone.now() + timedelta(days=30),
+            end_date=timezone.now() + timedelta(days=32),
+            assigned_by=self.staff_user,
+            status=Assignment.AssignmentStatus.CONFIRMED
+        )
+        return volunteer
+
+    def test_eligible_pairs_are_assigned(self):
+        """Test assignments respect role membership, existing completions and prerequisites"""
+        finished, fresh, busy = self.volunteers
+        TaskCompletion.objects.create(
+            task=self.training, volunteer=finished, status=TaskCompletion.CompletionStatus.APPROVED
+        )
+        TaskCompletion.objects.create(task=self.induction, volunteer=busy)
+
+        results = TaskManagementService.bulk_assign_tasks(
+            [self.training.id, self.induction.id],
+            [volunteer.id for volunteer in self.volunteers + [self.unassigned]],
+            self.staff_user
+        )
+
+        assigned = {(a['task_id'], a['volunteer_id']) for a in results['successful_assignments']}
+        self.assertEqual(assigned, {
+            (str(self.induction.id), str(finished.id)),
+            (str(self.training.id), str(fresh.id)),
+            (str(self.training.id), str(busy.id)),
+        })
+        self.assertEqual(results['total_attempted'], 8)
+        self.assertEqual(results['total_failed'], 5)
+
+        errors = {(f['task_id'], f['volunteer_id']): f['error'] for f in results['failed_assignments']}
+        self.assertIn('already been completed', errors[(str(self.training.id), str(finished.id))])
+        self.assertIn('prerequisites', errors[(str(self.induction.id), str(fresh.id))])
+        self.assertIn('already assigned', errors[(str(self.induction.id), str(busy.id))])
+        self.assertIn('not assigned to role', errors[(str(self.training.id), str(self.unassigned.id))])
+
+        completion = TaskCompletion.objects.get(task=self.training, volunteer=fresh)
+        self.assertEqual(completion.assignment.role, self.role)
+        self.assertEqual(completion.completion_type, TaskCompletion.CompletionType.CHECKBOX)
+        self.assertEqual(OutboundEmail.objects.filter(category='task_assignment').count(), 3)
+
+    def test_closed_completions_can_be_reassigned(self):
+        """Test a rejected completion only blocks reassignment under the same role assignment"""
+        retry, same_assignment = self.volunteers[:2]
+        TaskCompletion.objects.create(
+            task=self.training, volunteer=retry, status=TaskCompletion.CompletionStatus.REJECTED
+        )
+        TaskCompletion.objects.create(
+            task=self.training,
+            volunteer=same_assignment,
+            assignment=Assignment.objects.get(volunteer=same_assignment, role=self.role),
+            status=TaskCompletion.CompletionStatus.REJECTED
+        )
+
+        results = BulkTaskAssignment(self.staff_user).run(
+            [self.training.id], [retry.id, same_assignment.id]
+        )
+
+        assigned = {a['volunteer_id'] for a in results['successful_assignments']}
+        self.assertEqual(assigned, {str(retry.id)})
+        self.assertIn('under this role assignment', results['failed_assignments'][0]['error'])
+        self.assertEqual(
+            TaskCompletion.objects.filter(
+                task=self.training, volunteer=retry, status=TaskCompletion.CompletionStatus.PENDING
+            ).count(),
+            1
+        )
+
+    def test_query_count_does_not_grow_with_volunteers(self):
+        """Test the number of queries is the same for few and many volunteers"""
+        # Warm the content type cache used when queueing emails
+        BulkTaskAssignment(self.staff_user).run([self.training.id], [self.volunteers[0].id])
+
+        def count_queries(volunteers):
+            TaskCompletion.objects.all().delete()
+            with CaptureQueriesContext(connection) as queries:
+                results = BulkTaskAssignment(self.staff_user).run(
+                    [self.training.id], [volunteer.id for volunteer in volunteers]
+                )
+            self.assertEqual(results['total_successful'], len(volunteers))
+            return len(queries)
+
+        few = count_queries(self.volunteers[:1])
+        many = count_queries(self.volunteers + [self.create_volunteer(index) for index in range(3, 20)])
+        self.assertEqual(few, many)
@@ -0,0 +1,145 @@
+"""
+Tests for the cached task prerequisite graph.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User
+from events.models import Event, Venue, Role
+from tasks.models import Task, TaskCompletion
+from tasks.task_graph import PrerequisiteCycleError, TaskGraph
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class TaskGraphTest(TestCase):
+    """Test cycle detection, ordering, unlocked tasks and cache invalidation"""
+
+    def setUp(self):
+        """Set up a chain of tasks: training -> induction -> shift briefing"""
+        self.staff_user = User.objects.create_user(
+            username='staff_user',
+            email='staff@test.com',
+            password='testpass123',
+            user_type=User.UserType.STAFF
+        )
+        self.event = Event.objects.create(
+            name='Test Event 2026',
+            slug='test-event-2026',
+            start_date=timezone.now().date() + timedelta(days=30),
+            end_date=timezone.now().date() + timedelta(days=35),
+            created_by=self.staff_user
+        )
+        self.venue = Venue.objects.create(
+            event=self.event,
+            name='Test Venue',
+            slug='test-venue',
+            address_line_1='123 Test Street',
+            city='Test City',
+            created_by=self.staff_user
+        )
+        self.role = Role.objects.create(
+            event=self.event,
+            venue=self.venue,
+            name='Test Role',
+            description='Test role description',
+            role_type=Role.RoleType.GENERAL_VOLUNTEER,
+            total_positions=100,
+            created_by=self.staff_user
+        )
+
+        self.training = self.create_task('Training')
+        self.induction = self.create_task('Induction')
+        self.briefing = self.create_task('Shift Briefing')
+        self.induction.prerequisite_tasks.add(self.training)
+        self.briefing.prerequisite_tasks.add(self.induction)
+
+    def create_task(self, title):
+        return Task.objects.create(
+            role=self.role,
+            event=self.event,
+            venue=self.venue,
+            title=title,
+            description=f'{title} description',
+            task_type=Task.TaskType.CHECKBOX,
+            status=Task.TaskStatus.ACTIVE,
+            created_by=self.staff_user
+        )
+
+    def create_volunteer(self, index):
+        return User.objects.create_user(
+            username=f'volunteer{index}',
+            email=f'volunteer{index}@test.com',
+            password='testpass123',
+            user_type=User.UserType.VOLUNTEER
+        )
+
+    def test_cycle_detection_and_topological_order(self):
+        """Test the graph orders tasks after their prerequisites and reports cycles"""
+        graph = TaskGraph.for_event(self.event.id)
+        self.assertEqual(
+            graph.topological_order(),
+            [str(self.training.id), str(self.induction.id), str(self.briefing.id)]
+        )
+        self.assertIsNone(graph.find_cycle(self.training.id))
+        self.assertEqual(
+            graph.find_cycle(self.training.id, [self.briefing.id]),
+            [str(self.training.id), str(self.briefing.id), str(self.induction.id), str(self.training.id)]
+        )
+
+        self.training.prerequisite_tasks.add(self.briefing)
+        with self.assertRaises(PrerequisiteCycleError):
+            TaskGraph.for_event(self.event.id).topological_order()
+        with self.assertRaises(ValidationError):
+            self.training.clean()
+
+    def test_unlocked_tasks_use_one_completion_query(self):
+        """Test unlocked tasks for many volunteers come from a single completion query"""
+        volunteers = [self.create_volunteer(index) for index in range(10)]
+        for volunteer in volunteers[:5]:
+            TaskCompletion.objects.create(
+                task=self.training, volunteer=volunteer, status=TaskCompletion.CompletionStatus.APPROVED
+            )
+        TaskCompletion.objects.create(
+            task=self.induction, volunteer=volunteers[0], status=TaskCompletion.CompletionStatus.VERIFIED
+        )
+        TaskCompletion.objects.create(
+            task=self.induction, volunteer=volunteers[1], status=TaskCompletion.CompletionStatus.SUBMITTED
+        )
+
+        graph = TaskGraph.for_event(self.event.id)
+        with CaptureQueriesContext(connection) as queries:
+            unlocked = graph.unlocked_tasks([volunteer.id for volunteer in volunteers])
+        self.assertEqual(len(queries), 1)
+
+        self.assertEqual(
+            unlocked[str(volunteers[0].id)],
+            [str(self.training.id), str(self.induction.id), str(self.briefing.id)]
+        )
+        self.assertEqual(unlocked[str(volunteers[1].id)], [str(self.training.id), str(self.induction.id)])
+        self.assertEqual(unlocked[str(volunteers[9].id)], [str(self.training.id)])
+
+        self.assertTrue(self.induction.are_prerequisites_met(volunteers[1]))
+        self.assertEqual(self.briefing.get_missing_prerequisites(volunteers[1]), [self.induction])
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_cached_graph_is_invalidated_on_change(self):
+        """Test the cached graph is reused until prerequisites or statuses change"""
+        cache.clear()
+        TaskGraph.for_event(self.event.id)
+        with self.assertNumQueries(0):
+            self.assertTrue(self.briefing.are_prerequisites_met())
+
+        self.induction.suspend()
+        self.assertFalse(self.briefing.are_prerequisites_met())
+
+        self.briefing.prerequisite_tasks.remove(self.induction)
+        self.assertTrue(self.briefing.are_prerequisites_met())
+        self.assertEqual(TaskGraph.for_event(self.event.id).get_prerequisites(self.briefing.id), [])
@@ -21,6 +21,7 @@ from .permissions import TaskManagementPermission
 from accounts.permissions import CanManageEvents
 from common.permissions import TaskManagementPermission as CommonTaskPermission
 from common.audit_service import AdminAuditService
+from common.pagination import KeysetPageNumberPagination
 from .task_management_service import TaskManagementService
 
 # Initialize audit service
@@ -480,6 +481,7 @@ class TaskCompletionViewSet(viewsets.ModelViewSet):
         'quality_score', 'time_spent_minutes'
     ]
     ordering = ['-created_at', 'task__priority']
+    pagination_class = KeysetPageNumberPagination
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
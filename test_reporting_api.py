@@ -11,7 +11,7 @@ from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 
-from reporting.models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare
+from reporting.models import Report, ReportTemplate, ReportSchedule, ReportMetrics, ReportShare, ReportJob
 from reporting.services import generate_report
 from volunteers.models import VolunteerProfile
 from events.models import Event, Venue, Assignment
@@ -130,10 +130,9 @@ class ReportAPITestCase(APITestCase):
             'parameters': {'status_filter': 'ACTIVE'}
         }
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertEqual(Report.objects.count(), 3)
         
         # Check created report
@@ -141,8 +140,8 @@ class ReportAPITestCase(APITestCase):
         self.assertEqual(new_report.created_by, self.admin_user)
         self.assertEqual(new_report.status, 'PENDING')
         
-        # Check that generation was started
-        mock_generate.assert_called_once()
+        # Check that generation was queued
+        self.assertTrue(ReportJob.objects.filter(report=new_report, status='QUEUED').exists())
     
     def test_report_create_volunteer_forbidden(self):
         """Test that volunteers cannot create reports"""
@@ -192,18 +191,17 @@ class ReportAPITestCase(APITestCase):
         
         url = f'/api/reporting/reports/{self.report1.id}/regenerate/'
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(url)
+        response = self.client.post(url)
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         
         # Check that report was reset
         self.report1.refresh_from_db()
         self.assertEqual(self.report1.status, 'PENDING')
         self.assertEqual(self.report1.progress_percentage, 0)
         
-        # Check that generation was started
-        mock_generate.assert_called_once()
+        # Check that generation was queued
+        self.assertTrue(ReportJob.objects.filter(report=self.report1, status='QUEUED').exists())
     
     @patch('os.path.exists')
     @patch('builtins.open')
@@ -300,11 +298,10 @@ class ReportAPITestCase(APITestCase):
             'action': 'regenerate'
         }
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        mock_generate.assert_called_once()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(ReportJob.objects.filter(report=self.report1, status='QUEUED').exists())
     
     def test_report_types(self):
         """Test report types endpoint"""
@@ -429,10 +426,9 @@ class ReportTemplateAPITestCase(APITestCase):
             'parameters': {'additional_param': 'value'}
         }
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         
         # Check that template usage was incremented
         self.template.refresh_from_db()
@@ -652,10 +648,9 @@ class ReportIntegrationTestCase(APITestCase):
             'export_format': 'CSV'
         }
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         report_id = response.data['id']
         
         # 2. Check progress
@@ -713,10 +708,9 @@ class ReportIntegrationTestCase(APITestCase):
             'parameters': {'additional_filter': 'test'}
         }
         
-        with patch('reporting.views.generate_report') as mock_generate:
-            response = self.client.post(use_url, use_data, format='json')
+        response = self.client.post(use_url, use_data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         
         # Check that report was created with merged parameters
         report = Report.objects.get(name='Report from Integration Template')
@@ -17,7 +17,6 @@ from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.core.exceptions import ValidationError
-from django.utils import timezone
 from django.conf import settings
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
@@ -764,12 +763,14 @@ def _get_dynamic_form_context(volunteer_type):
 
 def _send_confirmation_email(eoi_submission):
     """
-    Send confirmation email to volunteer
+    Queue confirmation email to volunteer.
+    The submission is marked as confirmed once the mail worker has sent it.
     """
     try:
-        from django.core.mail import EmailMultiAlternatives
         from django.template.loader import render_to_string
         from django.conf import settings
+        from common.email_outbox import queue_email
+        from .signals import EOI_CONFIRMATION_EMAIL
         
         profile_info = eoi_submission.profile_information
         if not profile_info or not profile_info.email:
@@ -795,28 +796,22 @@ def _send_confirmation_email(eoi_submission):
         text_content = render_to_string('emails/volunteers/eoi_confirmation.txt', context)
         html_content = render_to_string('emails/volunteers/eoi_confirmation.html', context)
         
-        # Create email message
-        email = EmailMultiAlternatives(
+        # Queue email for the mail worker
+        queue_email(
             subject=subject,
             body=text_content,
+            html_body=html_content,
             from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'volunteers@isg2026.ie'),
             to=[profile_info.email],
-            reply_to=['volunteers@isg2026.ie']
+            reply_to=['volunteers@isg2026.ie'],
+            category=EOI_CONFIRMATION_EMAIL,
+            related_object=eoi_submission
         )
-        email.attach_alternative(html_content, "text/html")
         
-        # Send email
-        email.send()
-        
-        # Mark confirmation email as sent
-        eoi_submission.confirmation_email_sent = True
-        eoi_submission.confirmation_email_sent_at = timezone.now()
-        eoi_submission.save(update_fields=['confirmation_email_sent', 'confirmation_email_sent_at'])
-        
-        logger.info(f"Confirmation email sent to {profile_info.email} for EOI {eoi_submission.id}")
+        logger.info(f"Confirmation email queued to {profile_info.email} for EOI {eoi_submission.id}")
         
     except Exception as e:
-        logger.error(f"Error sending confirmation email for EOI {eoi_submission.id}: {str(e)}")
+        logger.error(f"Error queueing confirmation email for EOI {eoi_submission.id}: {str(e)}")
         # Don't raise the exception to avoid breaking the submission process
 
 
@@ -370,11 +370,19 @@ class JustGoIntegrationRouter:
         self.eoi_submission = eoi_submission
         self.user = request.user if request.user.is_authenticated else None
         self.justgo_client = JustGoAPIClient()
+        self._member_lookups = {}
     
     def check_existing_member(self, email):
         """
         Check if volunteer exists in JustGo system
+        
+        Lookups go through the JustGo member cache and are remembered for
+        the rest of the request.
         """
+        if email in self._member_lookups:
+            return self._member_lookups[email]
+        
+        self._member_lookups[email] = None
         try:
             member_data = self.justgo_client.lookup_member_by_email(email)
             if member_data:
@@ -389,6 +397,7 @@ class JustGoIntegrationRouter:
                         'membership_type': member_data.get('membership_type')
                     }
                 )
+                self._member_lookups[email] = member_data
                 return member_data
         except Exception as e:
             logger.warning(f"Error checking JustGo member: {e}")
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('volunteers', '0002_eoisubmission_eoirecruitmentpreferences_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='volunteerprofile',
+            index=models.Index(fields=['created_at', 'id'], name='volunteers__created_704056_idx'),
+        ),
+    ]
@@ -450,6 +450,7 @@ class VolunteerProfile(models.Model):
             models.Index(fields=['reviewed_by', 'review_date']),
             models.Index(fields=['application_date']),
             models.Index(fields=['approval_date']),
+            models.Index(fields=['created_at', 'id']),
         ]
         constraints = [
             models.CheckConstraint(
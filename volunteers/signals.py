@@ -0,0 +1,28 @@
+"""
+Signal receivers for the volunteers app
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.dispatch import receiver
+from django.utils import timezone
+
+from common.email_outbox import email_sent
+
+EOI_CONFIRMATION_EMAIL = 'eoi_confirmation'
+
+
+@receiver(email_sent)
+def mark_confirmation_emails_sent(sender, emails, **kwargs):
+    """Mark EOI submissions whose confirmation email has been delivered"""
+    from .eoi_models import EOISubmission
+
+    content_type = ContentType.objects.get_for_model(EOISubmission)
+    submission_ids = [
+        email.object_id for email in emails
+        if email.category == EOI_CONFIRMATION_EMAIL and email.content_type_id == content_type.id
+    ]
+    if submission_ids:
+        EOISubmission.objects.filter(id__in=submission_ids).update(
+            confirmation_email_sent=True,
+            confirmation_email_sent_at=timezone.now()
+        )
@@ -25,11 +25,14 @@ from .permissions import IsStaffOrVMTOrCVT, VolunteerProfilePermission
 from events.models import Assignment, Event, Role
 from tasks.models import TaskCompletion
 from common.audit import log_audit_event
+from common.models import SearchDocument
+from common.pagination import KeysetModeMixin
+from common.search import IndexedSearchFilter
 
 logger = logging.getLogger(__name__)
 
 
-class VolunteerProfilePagination(PageNumberPagination):
+class VolunteerProfilePagination(KeysetModeMixin, PageNumberPagination):
     """Custom pagination for volunteer profiles"""
     page_size = 25
     page_size_query_param = 'page_size'
@@ -47,15 +50,12 @@ class VolunteerProfileViewSet(viewsets.ModelViewSet):
     ).order_by('-application_date')
     
     pagination_class = VolunteerProfilePagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_fields = [
         'status', 'experience_level', 'availability_level', 'is_corporate_volunteer',
         'background_check_status', 'reference_check_status', 'reviewed_by'
     ]
-    search_fields = [
-        'user__first_name', 'user__last_name', 'user__email', 'preferred_name',
-        'corporate_group_name', 'special_skills', 'previous_events'
-    ]
+    search_document_type = SearchDocument.DocumentType.VOLUNTEER_PROFILE
     ordering_fields = [
         'application_date', 'review_date', 'approval_date', 'performance_rating',
         'user__last_name', 'status_changed_at'